@@ -200,6 +200,11 @@ def main():
     if not run_command_with_retry(['python', 'manage.py', 'migrate', '--verbosity=2'], max_retries=5, retry_delay=15):
         logger.error("❌ Migration failed after all retries. Deployment failed.")
         sys.exit(1)
+
+    # Table of the database-backed shared cache (no-op when it exists)
+    if not run_command_with_retry(['python', 'manage.py', 'createcachetable'], max_retries=3, retry_delay=5):
+        logger.error("❌ Cache table creation failed. Deployment failed.")
+        sys.exit(1)
     
     # Step 3: Collect static files with Railway optimization
     logger.info("✅ STEP 3: Static File Collection")
@@ -0,0 +1,13 @@
+"""
+Gunicorn settings loaded from the working directory.
+
+Each worker warms the caches of the most used rules in the background once
+the application is loaded (see master_data.services.rule_cache_warmer), so
+the first requests after a deploy or restart are served warm.
+"""
+
+
+def post_worker_init(worker):
+    from master_data.services.rule_cache_warmer import RuleCacheWarmer
+
+    RuleCacheWarmer.warm_on_startup()
@@ -4,6 +4,7 @@ when you are in your local environment.
 """
 
 import os
+import sys
 from os import getenv, path
 from pathlib import Path
 from django.core.management.utils import get_random_secret_key
@@ -11,6 +12,9 @@ import dotenv
 
 from datetime import timedelta
 
+# Running under "manage.py test"
+TESTING = len(sys.argv) > 1 and sys.argv[1] == "test"
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -41,6 +45,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "corsheaders",
     "rest_framework",
     'djoser',
@@ -111,6 +116,31 @@ DATABASES = {
     }
 }
 
+# The database cache writes through its own connection to the same database,
+# outside request transactions, so other workers see its entries (and rebuild
+# locks) at once. Tests keep it on "default", inside the test transaction.
+if not TESTING:
+    DATABASES["shared_cache"] = {**DATABASES["default"], "ATOMIC_REQUESTS": False}
+DATABASE_ROUTERS = ["master_data.db_routers.SharedCacheRouter"]
+
+# Caches
+# "default" stays process-local; "shared" is read and written by every worker
+# process (rule payload caches and their generation counters). The database
+# cache needs its table: python manage.py createcachetable
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "shared": {
+        "BACKEND": getenv("SHARED_CACHE_BACKEND", "master_data.cache_backends.DatabaseCache"),
+        "LOCATION": getenv("SHARED_CACHE_LOCATION", "master_data_shared_cache"),
+        "TIMEOUT": 30 * 60,
+        "OPTIONS": {
+            "MAX_ENTRIES": 50000,
+        },
+    },
+}
+
 # Email settings - Resend configuration
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'  # Console for local dev
 DEFAULT_FROM_EMAIL = getenv("FROM_EMAIL", "noreply@tuxonomy.com")
@@ -340,6 +370,8 @@ MASTER_DATA_CONFIG = {
     'STRICT_AUTO_REGENERATION': False,
     'ENABLE_INHERITANCE_PROPAGATION': True,  # Propagate changes to child strings
     'MAX_INHERITANCE_DEPTH': 5,  # Maximum depth for inheritance propagation
+    # Rebuild rule caches in the background after writes and at startup
+    'WARM_RULE_CACHES': getenv('WARM_RULE_CACHES', 'False').lower() == 'true',
 }
 
 # Logging Configuration
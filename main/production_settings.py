@@ -6,12 +6,15 @@ Designed for Railway (TLS terminated at the edge) + Vercel-hosted front-end.
 from pathlib import Path
 from datetime import timedelta
 import os
+import sys
 from os import getenv, path
 
 # ────────────────────────────────────────────────────────────────
 # Core paths / DEBUG
 # ────────────────────────────────────────────────────────────────
 BASE_DIR = Path(__file__).resolve().parent.parent
+# Running under "manage.py test"
+TESTING = len(sys.argv) > 1 and sys.argv[1] == "test"
 SECRET_KEY = os.environ["SECRET_KEY"]
 DEBUG = False
 
@@ -110,6 +113,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "corsheaders",
     "rest_framework",
     'djoser',
@@ -226,6 +230,34 @@ DATABASES = {
     "default": get_railway_db_config()
 }
 
+# The database cache writes through its own connection to the same database,
+# outside request transactions, so other workers see its entries (and rebuild
+# locks) at once. Tests keep it on "default", inside the test transaction.
+if not TESTING:
+    DATABASES["shared_cache"] = {**DATABASES["default"], "ATOMIC_REQUESTS": False}
+DATABASE_ROUTERS = ["master_data.db_routers.SharedCacheRouter"]
+
+# ────────────────────────────────────────────────────────────────
+# Caches
+# ────────────────────────────────────────────────────────────────
+# "default" stays process-local; "shared" is read and written by every
+# gunicorn worker (rule payload caches and their generation counters).
+# Point SHARED_CACHE_BACKEND/SHARED_CACHE_LOCATION at Redis or Memcached
+# to move it off the database; deploy.py creates the database cache table.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "shared": {
+        "BACKEND": getenv("SHARED_CACHE_BACKEND", "master_data.cache_backends.DatabaseCache"),
+        "LOCATION": getenv("SHARED_CACHE_LOCATION", "master_data_shared_cache"),
+        "TIMEOUT": 30 * 60,
+        "OPTIONS": {
+            "MAX_ENTRIES": 50000,
+        },
+    },
+}
+
 # ────────────────────────────────────────────────────────────────
 # Password validation / default PK type
 # ────────────────────────────────────────────────────────────────
@@ -553,6 +585,8 @@ MASTER_DATA_CONFIG = {
     'STRICT_AUTO_REGENERATION': os.getenv('STRICT_AUTO_REGENERATION', 'False').lower() == 'true',
     'ENABLE_INHERITANCE_PROPAGATION': os.getenv('ENABLE_INHERITANCE_PROPAGATION', 'True').lower() == 'true',
     'MAX_INHERITANCE_DEPTH': int(os.getenv('MAX_INHERITANCE_DEPTH', '5')),
+    # Rebuild rule caches in the background after writes and at startup
+    'WARM_RULE_CACHES': os.getenv('WARM_RULE_CACHES', 'True').lower() == 'true',
 }
 
 # ────────────────────────────────────────────────────────────────
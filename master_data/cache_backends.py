@@ -0,0 +1,57 @@
+"""
+Cache backends for master_data.
+
+DatabaseCache is Django's database cache with an atomic incr(). Django's
+default incr() is a get followed by a set, so two workers incrementing the
+same key at once can lose an increment. The shared cache tier relies on
+incr() for its generation counters, so here the row is locked (SELECT ...
+FOR UPDATE) for the read-modify-write and its expiry is left untouched.
+
+The cache table is read and written on the connection chosen by
+db_routers.SharedCacheRouter, which keeps it out of request transactions.
+"""
+
+import base64
+import pickle
+
+from django.conf import settings
+from django.core.cache.backends.db import DatabaseCache as DjangoDatabaseCache
+from django.db import connections, router, transaction
+from django.utils.timezone import now as tz_now
+
+
+class DatabaseCache(DjangoDatabaseCache):
+    """Database cache whose incr() is safe across processes."""
+
+    def incr(self, key, delta=1, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        db = router.db_for_write(self.cache_model_class)
+        connection = connections[db]
+        quote_name = connection.ops.quote_name
+        table = quote_name(self._table)
+        lock = " FOR UPDATE" if connection.features.has_select_for_update else ""
+        now = tz_now()
+        if not settings.USE_TZ:
+            now = now.replace(tzinfo=None)
+        now = now.replace(microsecond=0)
+
+        with transaction.atomic(using=db):
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT {quote_name('value')} FROM {table} "
+                    f"WHERE {quote_name('cache_key')} = %s AND {quote_name('expires')} > %s{lock}",
+                    [key, connection.ops.adapt_datetimefield_value(now)],
+                )
+                row = cursor.fetchone()
+                if row is None:
+                    raise ValueError("Key '%s' not found" % key)
+
+                value = connection.ops.process_clob(row[0])
+                new_value = pickle.loads(base64.b64decode(value.encode())) + delta
+                pickled = pickle.dumps(new_value, self.pickle_protocol)
+                cursor.execute(
+                    f"UPDATE {table} SET {quote_name('value')} = %s "
+                    f"WHERE {quote_name('cache_key')} = %s",
+                    [base64.b64encode(pickled).decode("latin1"), key],
+                )
+        return new_value
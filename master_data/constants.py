@@ -35,3 +35,7 @@ class DimensionTypeChoices(models.TextChoices):
 # File upload paths
 WORKSPACE_LOGO_UPLOAD_PATH = 'workspaces/logos/'
 DEFAULT_WORKSPACE_LOGO = "workspaces/default/default-workspace-logo.png"
+
+# Materialized hierarchy paths ("/<root id>/.../<parent id>/")
+HIERARCHY_PATH_SEPARATOR = '/'
+HIERARCHY_PATH_LENGTH = 1000
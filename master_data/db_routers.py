@@ -0,0 +1,28 @@
+"""
+Database routers for master_data.
+
+SharedCacheRouter gives the database cache backend its own connection.
+Requests run in a transaction (ATOMIC_REQUESTS), so cache rows written on
+the 'default' connection would stay invisible to other workers until the
+request commits, be lost if it rolls back, and hold row locks that block
+concurrent writers of the same key meanwhile. On the SHARED_CACHE_DATABASE
+alias every cache write is committed at once.
+"""
+
+from django.conf import settings
+
+from .services.constants import SHARED_CACHE_DATABASE
+
+# App label of django.core.cache.backends.db.CacheEntry
+CACHE_APP_LABEL = 'django_cache'
+
+
+class SharedCacheRouter:
+    """Route database cache reads and writes to SHARED_CACHE_DATABASE when configured."""
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label == CACHE_APP_LABEL and SHARED_CACHE_DATABASE in settings.DATABASES:
+            return SHARED_CACHE_DATABASE
+        return None
+
+    db_for_write = db_for_read
@@ -0,0 +1,132 @@
+"""
+Management command to backfill materialized hierarchy paths.
+
+Walks String and ProjectString trees level by level from their roots and
+writes ancestor_path/depth in chunks, touching only rows whose stored path
+is wrong. Safe to re-run; use it after deploying the hierarchy path
+migration or after bulk parent updates that bypassed save().
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from master_data.constants import HIERARCHY_PATH_SEPARATOR
+from master_data.models import ProjectString, String
+from master_data.models.base import child_hierarchy_path
+
+
+MODELS = {
+    'string': String,
+    'project-string': ProjectString,
+}
+
+
+class Command(BaseCommand):
+    help = 'Backfill materialized ancestor paths for String and ProjectString'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            choices=sorted(MODELS) + ['all'],
+            default='all',
+            help='Model to backfill (default: all)'
+        )
+        parser.add_argument(
+            '--workspace-id',
+            type=int,
+            help='Backfill only rows in a specific workspace (optional)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Rows read and written per query (default: 1000)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Count rows that would change without writing'
+        )
+
+    def handle(self, *args, **options):
+        model_names = sorted(MODELS) if options['model'] == 'all' else [options['model']]
+        chunk_size = max(1, options['chunk_size'])
+
+        if options['dry_run']:
+            self.stdout.write(
+                self.style.NOTICE("DRY RUN - No changes will be made"))
+
+        for model_name in model_names:
+            model_class = MODELS[model_name]
+            queryset = model_class.objects.all_workspaces()
+            if options['workspace_id']:
+                queryset = queryset.filter(workspace_id=options['workspace_id'])
+
+            self.stdout.write(f"Backfilling {model_class.__name__} paths...")
+            visited, updated = self.backfill(
+                model_class, queryset, chunk_size, options['dry_run'])
+            total = queryset.count()
+
+            self.stdout.write(self.style.SUCCESS(
+                f"  {model_class.__name__}: {updated} of {visited} rows "
+                f"{'would be ' if options['dry_run'] else ''}updated"
+            ))
+            if visited < total:
+                self.stdout.write(self.style.WARNING(
+                    f"  {total - visited} rows are not reachable from a root "
+                    f"(parent cycle) and were left unchanged"
+                ))
+
+    def backfill(self, model_class, queryset, chunk_size, dry_run):
+        """
+        Walk the trees breadth-first, one level at a time.
+
+        Only the current level's paths are kept in memory. Returns
+        (rows visited, rows updated).
+        """
+        visited = updated = 0
+        level = {}
+
+        roots = queryset.filter(parent__isnull=True).values_list(
+            'id', 'ancestor_path', 'depth').order_by('id')
+        stale = []
+        for row_id, ancestor_path, depth in roots.iterator(chunk_size=chunk_size):
+            level[row_id] = (HIERARCHY_PATH_SEPARATOR, 0)
+            if (ancestor_path, depth) != level[row_id]:
+                stale.append(row_id)
+        visited += len(level)
+        if stale and not dry_run:
+            for chunk in self.chunks(stale, chunk_size):
+                queryset.filter(id__in=chunk).update(
+                    ancestor_path=HIERARCHY_PATH_SEPARATOR, depth=0)
+        updated += len(stale)
+
+        while level:
+            next_level = {}
+            changed = []
+            for parent_chunk in self.chunks(list(level), chunk_size):
+                children = queryset.filter(parent_id__in=parent_chunk).values_list(
+                    'id', 'parent_id', 'ancestor_path', 'depth')
+                for row_id, parent_id, ancestor_path, depth in children:
+                    expected = child_hierarchy_path(*level[parent_id], parent_id)
+                    next_level[row_id] = expected
+                    if (ancestor_path, depth) != expected:
+                        changed.append(model_class(
+                            id=row_id, ancestor_path=expected[0], depth=expected[1]))
+
+            if changed and not dry_run:
+                for chunk in self.chunks(changed, chunk_size):
+                    with transaction.atomic():
+                        model_class.objects.all_workspaces().bulk_update(
+                            chunk, ['ancestor_path', 'depth'])
+
+            visited += len(next_level)
+            updated += len(changed)
+            level = next_level
+
+        return visited, updated
+
+    @staticmethod
+    def chunks(items, size):
+        for start in range(0, len(items), size):
+            yield items[start:start + size]
@@ -0,0 +1,47 @@
+"""
+Management command to purge old project string deletion tombstones.
+
+Tombstones let "changed since" sync exports report deleted strings. Sync
+watermarks older than the retention window are rejected, so tombstones
+older than it can be dropped. Run it periodically (e.g. daily).
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from master_data.models import ProjectStringTombstone
+from master_data.services import ProjectStringSyncService
+from master_data.services.constants import SYNC_TOMBSTONE_RETENTION_DAYS
+
+
+class Command(BaseCommand):
+    help = 'Delete project string tombstones older than the sync retention window'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=SYNC_TOMBSTONE_RETENTION_DAYS,
+            help=f'Keep tombstones from the last N days (default: {SYNC_TOMBSTONE_RETENTION_DAYS})'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Count tombstones that would be deleted without deleting'
+        )
+
+    def handle(self, *args, **options):
+        older_than = timezone.now() - timedelta(days=max(0, options['days']))
+
+        if options['dry_run']:
+            count = ProjectStringTombstone.objects.all_workspaces().filter(
+                deleted_at__lt=older_than).count()
+            self.stdout.write(self.style.NOTICE(
+                f"DRY RUN - {count} tombstones would be deleted"))
+            return
+
+        deleted = ProjectStringSyncService.purge_tombstones(older_than)
+        self.stdout.write(self.style.SUCCESS(
+            f"Deleted {deleted} tombstones older than {older_than.isoformat()}"))
@@ -0,0 +1,47 @@
+"""
+Management command to reconcile denormalized project statistics.
+
+ProjectStats counters are maintained incrementally by the string, member,
+platform and activity write paths. Writes that bypass them (raw SQL,
+QuerySet.update(), platform.projects.clear()) can leave them wrong; this
+command recomputes every project's statistics from the source tables and
+fixes the rows that drifted. Safe to re-run.
+"""
+
+from django.core.management.base import BaseCommand
+
+from master_data.models import Project, ProjectStats
+
+
+class Command(BaseCommand):
+    help = 'Recompute ProjectStats from the source tables and fix drifted rows'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workspace-id',
+            type=int,
+            help='Reconcile only projects in a specific workspace (optional)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Count projects with wrong statistics without fixing them'
+        )
+
+    def handle(self, *args, **options):
+        project_ids = None
+        if options['workspace_id']:
+            project_ids = Project.objects.for_workspace(
+                options['workspace_id']).values_list('id', flat=True)
+
+        if options['dry_run']:
+            self.stdout.write(
+                self.style.NOTICE("DRY RUN - No changes will be made"))
+
+        fixed = ProjectStats.objects.reconcile(
+            project_ids=project_ids, dry_run=options['dry_run'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{fixed} projects had missing or wrong statistics"
+            f"{'' if options['dry_run'] else ' and were fixed'}"
+        ))
@@ -0,0 +1,68 @@
+"""
+Management command that processes queued bulk string jobs.
+
+Bulk create, bulk update and multi-operation requests that are too large to
+run inside an HTTP request are stored as BulkStringJob rows. This worker
+claims them one at a time and processes them in committed chunks. Run one
+or more as long-lived processes (see the Procfile worker entry), or with
+--once from a scheduler.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from master_data.services.bulk_job_service import BulkJobService, default_worker_name
+from master_data.services.constants import BULK_JOB_POLL_SECONDS
+
+
+class Command(BaseCommand):
+    help = 'Process queued bulk string jobs in chunks'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Exit when the queue is empty instead of polling'
+        )
+        parser.add_argument(
+            '--job-id',
+            help='Process only this job (UUID)'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=BULK_JOB_POLL_SECONDS,
+            help=f'Seconds to sleep when the queue is empty (default: {BULK_JOB_POLL_SECONDS})'
+        )
+        parser.add_argument(
+            '--worker-name',
+            default=None,
+            help='Name recorded on claimed jobs (default: host:pid)'
+        )
+
+    def handle(self, *args, **options):
+        worker = options['worker_name'] or default_worker_name()
+        once = options['once'] or options['job_id']
+        self.stdout.write(f"Bulk string job worker {worker} started")
+
+        try:
+            while True:
+                close_old_connections()
+                job = BulkJobService.claim_next(worker, job_id=options['job_id'])
+                if job is None:
+                    if once:
+                        break
+                    time.sleep(options['poll_interval'])
+                    continue
+
+                self.stdout.write(
+                    f"Processing job {job.job_id} ({job.operation}, {job.total_rows} rows)")
+                job = BulkJobService.run(job)
+                style = self.style.SUCCESS if job.status == 'completed' else self.style.WARNING
+                self.stdout.write(style(
+                    f"Job {job.job_id} {job.status}: {job.processed_rows} applied, "
+                    f"{job.failed_rows} rejected"))
+        except KeyboardInterrupt:
+            self.stdout.write("Worker stopped")
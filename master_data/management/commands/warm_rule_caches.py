@@ -0,0 +1,47 @@
+"""
+Management command to pre-warm rule configuration caches.
+
+Builds the complete rule data, rule configuration payload and rendered
+configuration response of the most used rules of each workspace (ranked by
+recorded configuration accesses), so the first requests after a deploy or
+a cache flush are served warm. Safe to re-run.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from master_data.models import Workspace
+from master_data.services.constants import RULE_WARM_TOP_N
+from master_data.services.rule_cache_warmer import RuleCacheWarmer
+
+
+class Command(BaseCommand):
+    help = 'Pre-warm caches of the most used rules of each workspace'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workspace-id',
+            type=int,
+            help='Warm only rules of a specific workspace (optional)'
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=RULE_WARM_TOP_N,
+            help=f'Rules to warm per workspace (default: {RULE_WARM_TOP_N})'
+        )
+
+    def handle(self, *args, **options):
+        if options['workspace_id']:
+            workspace_ids = [options['workspace_id']]
+        else:
+            workspace_ids = list(Workspace.objects.values_list('id', flat=True))
+
+        start = time.perf_counter()
+        warmed = RuleCacheWarmer.warm_workspaces(workspace_ids, options['limit'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Warmed {warmed} rules across {len(workspace_ids)} workspaces "
+            f"in {round(time.perf_counter() - start, 2)}s"
+        ))
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.5 on 2026-10-16 19:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('master_data', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='projectstring',
+            name='ancestor_path',
+            field=models.CharField(default='/', editable=False, help_text="Materialized path of ancestor IDs, root first (e.g. '/12/57/')", max_length=1000),
+        ),
+        migrations.AddField(
+            model_name='projectstring',
+            name='depth',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of ancestors above this record'),
+        ),
+        migrations.AddField(
+            model_name='string',
+            name='ancestor_path',
+            field=models.CharField(default='/', editable=False, help_text="Materialized path of ancestor IDs, root first (e.g. '/12/57/')", max_length=1000),
+        ),
+        migrations.AddField(
+            model_name='string',
+            name='depth',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of ancestors above this record'),
+        ),
+        migrations.AddIndex(
+            model_name='projectstring',
+            index=models.Index(fields=['ancestor_path'], name='projstring_ancestor_path_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='string',
+            index=models.Index(fields=['ancestor_path'], name='string_ancestor_path_idx', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.5 on 2026-10-16 20:15
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_entity_levels(apps, schema_editor):
+    ProjectString = apps.get_model('master_data', 'ProjectString')
+    Entity = apps.get_model('master_data', 'Entity')
+    ProjectString.objects.update(entity_level=Subquery(
+        Entity.objects.filter(id=OuterRef('entity_id')).values('entity_level')[:1]
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('master_data', '0003_hierarchy_paths'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='projectstring',
+            name='entity_level',
+            field=models.SmallIntegerField(default=0, editable=False, help_text='Copy of entity.entity_level, kept for keyset pagination'),
+        ),
+        migrations.RunPython(copy_entity_levels, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='projectstring',
+            index=models.Index(fields=['project', 'platform', 'entity_level', 'value', 'id'], name='projstring_keyset_idx'),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.5 on 2026-10-16 20:24
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('master_data', '0004_projectstring_entity_level'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectStringTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('string_id', models.IntegerField(help_text='ID of the deleted string')),
+                ('string_uuid', models.UUIDField(help_text='UUID of the deleted string')),
+                ('deleted_at', models.DateTimeField(default=django.utils.timezone.now, help_text='When the string was deleted')),
+            ],
+            options={
+                'verbose_name': 'Project String Tombstone',
+                'verbose_name_plural': 'Project String Tombstones',
+                'ordering': ['deleted_at', 'id'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='projectstring',
+            index=models.Index(fields=['workspace', 'project', 'platform', 'last_updated'], name='projstring_sync_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectstringdetail',
+            index=models.Index(fields=['workspace', 'last_updated'], name='projstringdetail_sync_idx'),
+        ),
+        migrations.AddField(
+            model_name='projectstringtombstone',
+            name='platform',
+            field=models.ForeignKey(help_text='Platform the deleted string belonged to', on_delete=django.db.models.deletion.CASCADE, related_name='project_string_tombstones', to='master_data.platform'),
+        ),
+        migrations.AddField(
+            model_name='projectstringtombstone',
+            name='project',
+            field=models.ForeignKey(help_text='Project the deleted string belonged to', on_delete=django.db.models.deletion.CASCADE, related_name='string_tombstones', to='master_data.project'),
+        ),
+        migrations.AddField(
+            model_name='projectstringtombstone',
+            name='workspace',
+            field=models.ForeignKey(help_text='Workspace this record belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='%(app_label)s_%(class)s_set', to='master_data.workspace'),
+        ),
+        migrations.AddIndex(
+            model_name='projectstringtombstone',
+            index=models.Index(fields=['workspace', 'project', 'platform', 'deleted_at'], name='projstring_tombstone_sync_idx'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+"""
+Trigram GIN indexes on String.value and ProjectString.value.
+
+PostgreSQL only: enables pg_trgm and indexes value with gin_trgm_ops so
+that ILIKE substring filters and % similarity searches use the index.
+Other backends use the in-process n-gram index of
+master_data.services.string_search instead, so the migration is a no-op
+there. The indexes are not declared in model Meta because GinIndex cannot
+be created on those backends.
+"""
+
+from django.db import migrations
+
+
+TRIGRAM_INDEXES = [
+    ('master_data_string', 'string_value_trgm_idx'),
+    ('master_data_projectstring', 'projstring_value_trgm_idx'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table, name in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin (value gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for _, name in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('master_data', '0005_projectstring_sync'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
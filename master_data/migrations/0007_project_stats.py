@@ -0,0 +1,60 @@
+# Generated by Django 5.2.5 on 2026-10-16 20:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def create_project_stats(apps, schema_editor):
+    Project = apps.get_model('master_data', 'Project')
+    ProjectStats = apps.get_model('master_data', 'ProjectStats')
+    ProjectString = apps.get_model('master_data', 'ProjectString')
+    ProjectMember = apps.get_model('master_data', 'ProjectMember')
+    ProjectActivity = apps.get_model('master_data', 'ProjectActivity')
+
+    def count(model):
+        return Coalesce(Subquery(
+            model.objects.filter(project_id=OuterRef('pk')).order_by().values(
+                'project_id').annotate(total=Count('pk')).values('total'),
+            output_field=IntegerField()
+        ), 0)
+
+    rows = Project.objects.order_by().values('id').annotate(
+        total_strings=count(ProjectString),
+        platforms_count=count(Project.platforms.through),
+        team_members_count=count(ProjectMember),
+        last_activity=Subquery(
+            ProjectActivity.objects.filter(project_id=OuterRef('pk')).order_by().values(
+                'project_id').annotate(latest=Max('created')).values('latest')
+        ),
+    )
+    ProjectStats.objects.bulk_create(
+        [ProjectStats(project_id=row.pop('id'), **row) for row in rows.iterator()],
+        batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('master_data', '0006_string_value_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectStats',
+            fields=[
+                ('project', models.OneToOneField(help_text='Project these statistics belong to', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='master_data.project')),
+                ('total_strings', models.PositiveIntegerField(default=0, help_text='Number of strings in the project')),
+                ('platforms_count', models.PositiveIntegerField(default=0, help_text='Number of platforms assigned to the project')),
+                ('team_members_count', models.PositiveIntegerField(default=0, help_text='Number of team members')),
+                ('last_activity', models.DateTimeField(blank=True, help_text='When the latest project activity was recorded', null=True)),
+            ],
+            options={
+                'verbose_name': 'Project Stats',
+                'verbose_name_plural': 'Project Stats',
+            },
+        ),
+        migrations.RunPython(create_project_stats, migrations.RunPython.noop),
+    ]
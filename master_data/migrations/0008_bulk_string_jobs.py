@@ -0,0 +1,79 @@
+# Generated by Django 5.2.5 on 2026-10-16 20:50
+
+import django.core.serializers.json
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('master_data', '0007_project_stats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BulkStringJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True, help_text='When this record was created')),
+                ('last_updated', models.DateTimeField(auto_now=True, help_text='When this record was last updated')),
+                ('job_id', models.UUIDField(default=uuid.uuid4, help_text='Public identifier of the job', unique=True)),
+                ('operation', models.CharField(choices=[('project_strings_create', 'Project Strings Bulk Create'), ('project_strings_update', 'Project Strings Bulk Update'), ('multi_operations', 'Multi-Operations')], help_text='Bulk operation to run', max_length=30)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('completed', 'Completed'), ('partial_failure', 'Partial Failure'), ('failed', 'Failed'), ('cancelled', 'Cancelled')], default='pending', help_text='Current status of the job', max_length=20)),
+                ('payload', models.JSONField(default=dict, help_text='Request body of the bulk operation')),
+                ('total_rows', models.PositiveIntegerField(default=0, help_text='Number of rows (or operations) in the payload')),
+                ('processed_rows', models.PositiveIntegerField(default=0, help_text='Number of rows applied successfully')),
+                ('failed_rows', models.PositiveIntegerField(default=0, help_text='Number of rows rejected')),
+                ('next_row', models.PositiveIntegerField(default=0, help_text='Position of the first row not yet committed')),
+                ('chunk_size', models.PositiveIntegerField(default=1000, help_text='Rows processed per transaction')),
+                ('worker', models.CharField(blank=True, default='', help_text='Worker that claimed the job', max_length=100)),
+                ('heartbeat_at', models.DateTimeField(blank=True, help_text='When the worker last reported progress', null=True)),
+                ('started_at', models.DateTimeField(blank=True, help_text='When processing started', null=True)),
+                ('completed_at', models.DateTimeField(blank=True, help_text='When the job finished', null=True)),
+                ('error_message', models.TextField(blank=True, help_text='Error that stopped the job', null=True)),
+                ('created_by', models.ForeignKey(blank=True, editable=False, help_text='User who created this record', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_created', to=settings.AUTH_USER_MODEL)),
+                ('platform', models.ForeignKey(blank=True, help_text='Platform the strings belong to (project string operations)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='bulk_jobs', to='master_data.platform')),
+                ('project', models.ForeignKey(blank=True, help_text='Project the strings belong to (project string operations)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='bulk_jobs', to='master_data.project')),
+                ('triggered_by', models.ForeignKey(blank=True, help_text='User who submitted the job', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='triggered_bulk_string_jobs', to=settings.AUTH_USER_MODEL)),
+                ('workspace', models.ForeignKey(help_text='Workspace this record belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='%(app_label)s_%(class)s_set', to='master_data.workspace')),
+            ],
+            options={
+                'verbose_name': 'Bulk String Job',
+                'verbose_name_plural': 'Bulk String Jobs',
+                'ordering': ['-created'],
+            },
+        ),
+        migrations.CreateModel(
+            name='BulkStringJobChunk',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField(help_text='Chunk number within the job, from 0')),
+                ('row_count', models.PositiveIntegerField(help_text='Number of payload rows in the chunk')),
+                ('results', models.JSONField(default=list, encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='Compact result per applied row')),
+                ('errors', models.JSONField(default=list, encoder=django.core.serializers.json.DjangoJSONEncoder, help_text="{'index', 'errors'} per rejected row; index refers to the payload")),
+                ('created', models.DateTimeField(auto_now_add=True, help_text='When the chunk was committed')),
+                ('job', models.ForeignKey(help_text='Job this chunk belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='chunks', to='master_data.bulkstringjob')),
+            ],
+            options={
+                'verbose_name': 'Bulk String Job Chunk',
+                'verbose_name_plural': 'Bulk String Job Chunks',
+                'ordering': ['job', 'position'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='bulkstringjob',
+            index=models.Index(fields=['status', 'created'], name='bulkjob_claim_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bulkstringjob',
+            index=models.Index(fields=['workspace', '-created'], name='bulkjob_workspace_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='bulkstringjobchunk',
+            constraint=models.UniqueConstraint(fields=('job', 'position'), name='unique_bulkjob_chunk'),
+        ),
+    ]
@@ -14,13 +14,20 @@ from .project import (
     ProjectMember,
     ProjectActivity,
     ApprovalHistory,
+    ProjectStats,
     ProjectStatusChoices,
     ApprovalStatusChoices,
     ProjectMemberRoleChoices,
     ProjectActivityTypeChoices,
     ApprovalActionChoices,
 )
-from .project_string import ProjectString, ProjectStringDetail
+from .project_string import ProjectString, ProjectStringDetail, ProjectStringTombstone
+from .bulk_job import (
+    BulkStringJob,
+    BulkStringJobChunk,
+    BulkStringJobOperationChoices,
+    BulkStringJobStatusChoices,
+)
 
 # Import constants for external use
 from ..constants import (
@@ -58,8 +65,12 @@ __all__ = [
     'ProjectMember',
     'ProjectActivity',
     'ApprovalHistory',
+    'ProjectStats',
     'ProjectString',
     'ProjectStringDetail',
+    'ProjectStringTombstone',
+    'BulkStringJob',
+    'BulkStringJobChunk',
 
     # Constants
     'StatusChoices',
@@ -72,6 +83,8 @@ __all__ = [
     'ProjectMemberRoleChoices',
     'ProjectActivityTypeChoices',
     'ApprovalActionChoices',
+    'BulkStringJobOperationChoices',
+    'BulkStringJobStatusChoices',
     'STANDARD_NAME_LENGTH',
     'SLUG_LENGTH',
     'DESCRIPTION_LENGTH',
@@ -3,10 +3,16 @@ Base models and utilities for master_data app.
 """
 
 from django.db import models
+from django.db.models.functions import Concat, Substr
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from threading import local
 
-from ..constants import DEFAULT_WORKSPACE_LOGO
+from ..constants import (
+    DEFAULT_WORKSPACE_LOGO,
+    HIERARCHY_PATH_LENGTH,
+    HIERARCHY_PATH_SEPARATOR,
+)
 
 
 def default_workspace_logo():
@@ -107,3 +113,235 @@ class TimeStampModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class ChangeTrackingMixin(models.Model):
+    """
+    Abstract mixin that snapshots selected field values when a row is loaded.
+
+    Subclasses list the attnames to track in ``tracked_fields``. The snapshot
+    is taken in from_db() and refreshed after save() and refresh_from_db(),
+    so changed_fields() compares against the last known database state
+    without a query. Instances that were not loaded from the database (new
+    or hand-built ones) have no snapshot.
+    """
+
+    tracked_fields = ()
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = {
+            name: value for name, value in zip(field_names, values)
+            if name in cls.tracked_fields
+        }
+        return instance
+
+    @property
+    def has_loaded_values(self):
+        """Whether a database snapshot is available for change detection."""
+        return getattr(self, '_loaded_values', None) is not None
+
+    @property
+    def loaded_values(self):
+        """Tracked field values as last loaded from or saved to the database."""
+        return dict(getattr(self, '_loaded_values', None) or {})
+
+    def changed_fields(self):
+        """
+        Return {attname: (old, new)} for tracked fields changed since load.
+
+        Fields that were deferred at load time are not reported.
+        """
+        loaded = getattr(self, '_loaded_values', None) or {}
+        changes = {}
+        for name, old in loaded.items():
+            new = getattr(self, name)
+            if new != old:
+                changes[name] = (old, new)
+        return changes
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # post_save receivers have seen the changes; the saved state is the new baseline
+        self._snapshot_tracked_fields()
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self._snapshot_tracked_fields()
+
+    def _snapshot_tracked_fields(self):
+        deferred = self.get_deferred_fields()
+        self._loaded_values = {
+            name: getattr(self, name)
+            for name in self.tracked_fields if name not in deferred
+        }
+
+
+def deletion_origin_label(origin):
+    """Model label of the object (or queryset) whose delete() started a cascade."""
+    if origin is None:
+        return None
+    model = getattr(origin, 'model', None) or type(origin)
+    return getattr(getattr(model, '_meta', None), 'label', None)
+
+
+def child_hierarchy_path(ancestor_path, depth, parent_id):
+    """Return the (ancestor_path, depth) of a direct child of parent_id."""
+    return f"{ancestor_path}{parent_id}{HIERARCHY_PATH_SEPARATOR}", depth + 1
+
+
+class HierarchyPathMixin(ChangeTrackingMixin):
+    """
+    Abstract mixin that materializes a self-referential parent chain.
+
+    ancestor_path holds the IDs of all ancestors, root first, e.g. "/12/57/"
+    for a string whose parent is 57 and grandparent 12; roots have "/".
+    depth is the number of ancestors. With these, ancestors are a single
+    primary key lookup and descendants/subtree counts a single prefix match
+    on ancestor_path.
+
+    The concrete model must define a ``parent`` foreign key to itself and
+    should declare a prefix index on ancestor_path. Paths are maintained by
+    save(): on insert from the parent, and on reparent by rewriting the
+    moved subtree with one UPDATE. Deleting cascades to the subtree, so no
+    maintenance is needed there. QuerySet.update(parent=...) bypasses
+    save(); run the backfill_hierarchy_paths command after such updates.
+
+    The parent and path are tracked (see ChangeTrackingMixin): saving a
+    loaded record whose parent did not change keeps its path without a
+    query. Like any other field, that path is written back as loaded.
+    """
+    tracked_fields = ('parent_id', 'ancestor_path', 'depth')
+
+    ancestor_path = models.CharField(
+        max_length=HIERARCHY_PATH_LENGTH,
+        default=HIERARCHY_PATH_SEPARATOR,
+        editable=False,
+        help_text="Materialized path of ancestor IDs, root first (e.g. '/12/57/')"
+    )
+    depth = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of ancestors above this record"
+    )
+
+    class Meta:
+        abstract = True
+
+    @property
+    def is_hierarchy_materialized(self):
+        """False for children whose path has not been backfilled yet."""
+        return self.parent_id is None or self.depth > 0
+
+    @property
+    def ancestor_ids(self):
+        """IDs of all ancestors, root first."""
+        return [int(part) for part in self.ancestor_path.split(HIERARCHY_PATH_SEPARATOR) if part]
+
+    @property
+    def descendant_path_prefix(self):
+        """ancestor_path prefix shared by every descendant of this record."""
+        return child_hierarchy_path(self.ancestor_path, self.depth, self.pk)[0]
+
+    def _hierarchy_queryset(self):
+        return type(self).objects.all_workspaces().filter(workspace_id=self.workspace_id)
+
+    def get_ancestors(self):
+        """Return all ancestors ordered from the root down."""
+        if self.is_hierarchy_materialized:
+            ancestor_ids = self.ancestor_ids
+        else:
+            # Not backfilled yet: walk the parent chain
+            ancestor_ids = []
+            current = self.parent
+            while current is not None and current.pk not in ancestor_ids:
+                ancestor_ids.append(current.pk)
+                current = current.parent
+        return self._hierarchy_queryset().filter(pk__in=ancestor_ids).order_by('depth')
+
+    def get_descendants(self):
+        """Return every record below this one in a single prefix query."""
+        return self._hierarchy_queryset().filter(
+            ancestor_path__startswith=self.descendant_path_prefix)
+
+    def get_subtree_count(self):
+        """Count the records below this one."""
+        return self.get_descendants().count()
+
+    def save(self, *args, **kwargs):
+        """Maintain ancestor_path and depth, rewriting the subtree on reparent."""
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and not {'parent', 'parent_id'} & set(update_fields):
+            super().save(*args, **kwargs)
+            return
+
+        if self._hierarchy_path_unchanged():
+            super().save(*args, **kwargs)
+            return
+
+        previous = self._refresh_hierarchy_path()
+        if update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | {'ancestor_path', 'depth'}
+
+        super().save(*args, **kwargs)
+
+        if previous is not None and previous[0] != self.ancestor_path:
+            self._move_descendants(*previous)
+
+    def _hierarchy_path_unchanged(self):
+        """Whether the loaded snapshot shows a materialized path and an unchanged parent."""
+        loaded = self.loaded_values
+        return (
+            self.pk is not None
+            and set(HierarchyPathMixin.tracked_fields) <= loaded.keys()
+            and self.is_hierarchy_materialized
+            and not set(HierarchyPathMixin.tracked_fields) & self.changed_fields().keys()
+        )
+
+    def _refresh_hierarchy_path(self):
+        """
+        Recompute this record's path from its parent's stored path.
+
+        Returns the previously stored (ancestor_path, depth), or None for
+        new records.
+        """
+        lookup_ids = [pk for pk in (self.pk, self.parent_id) if pk is not None]
+        stored = {}
+        if lookup_ids:
+            stored = {
+                pk: (path, depth)
+                for pk, path, depth in type(self)._base_manager.filter(
+                    pk__in=lookup_ids).values_list('pk', 'ancestor_path', 'depth')
+            }
+
+        if self.parent_id is None:
+            self.ancestor_path, self.depth = HIERARCHY_PATH_SEPARATOR, 0
+        else:
+            parent_path, parent_depth = stored.get(
+                self.parent_id, (HIERARCHY_PATH_SEPARATOR, 0))
+            path, depth = child_hierarchy_path(parent_path, parent_depth, self.parent_id)
+            if self.pk is not None and (
+                    f"{HIERARCHY_PATH_SEPARATOR}{self.pk}{HIERARCHY_PATH_SEPARATOR}" in path):
+                raise ValidationError(
+                    "A string cannot be moved under itself or one of its descendants")
+            self.ancestor_path, self.depth = path, depth
+
+        return stored.get(self.pk) if self.pk is not None else None
+
+    def _move_descendants(self, old_path, old_depth):
+        """Rewrite the subtree's paths after this record moved."""
+        old_prefix = child_hierarchy_path(old_path, old_depth, self.pk)[0]
+        type(self)._base_manager.filter(
+            ancestor_path__startswith=old_prefix
+        ).update(
+            ancestor_path=Concat(
+                models.Value(self.descendant_path_prefix),
+                Substr('ancestor_path', len(old_prefix) + 1),
+                output_field=models.CharField(),
+            ),
+            depth=models.F('depth') + (self.depth - old_depth),
+        )
@@ -0,0 +1,210 @@
+"""
+Background jobs for large bulk string operations.
+
+Bulk create, bulk update and multi-operation requests above a size
+threshold (or with ?async=true) are stored as a BulkStringJob and processed
+in chunks by the run_bulk_string_jobs worker instead of inside the HTTP
+request. Each processed chunk is committed together with its
+BulkStringJobChunk results and the job's progress, so a job interrupted by
+a worker restart resumes after its last committed chunk.
+"""
+
+import uuid
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+from .base import TimeStampModel, WorkspaceMixin
+
+
+class BulkStringJobOperationChoices(models.TextChoices):
+    PROJECT_STRINGS_CREATE = 'project_strings_create', 'Project Strings Bulk Create'
+    PROJECT_STRINGS_UPDATE = 'project_strings_update', 'Project Strings Bulk Update'
+    MULTI_OPERATIONS = 'multi_operations', 'Multi-Operations'
+
+
+class BulkStringJobStatusChoices(models.TextChoices):
+    PENDING = 'pending', 'Pending'
+    RUNNING = 'running', 'Running'
+    COMPLETED = 'completed', 'Completed'
+    PARTIAL_FAILURE = 'partial_failure', 'Partial Failure'
+    FAILED = 'failed', 'Failed'
+    CANCELLED = 'cancelled', 'Cancelled'
+
+
+class BulkStringJob(TimeStampModel, WorkspaceMixin):
+    """
+    A bulk string operation queued for the background worker.
+
+    The payload is the request body; next_row is the position (in
+    processing order) of the first row not yet committed.
+    """
+
+    FINISHED_STATUSES = (
+        BulkStringJobStatusChoices.COMPLETED,
+        BulkStringJobStatusChoices.PARTIAL_FAILURE,
+        BulkStringJobStatusChoices.FAILED,
+        BulkStringJobStatusChoices.CANCELLED,
+    )
+
+    job_id = models.UUIDField(
+        default=uuid.uuid4,
+        unique=True,
+        help_text="Public identifier of the job"
+    )
+    operation = models.CharField(
+        max_length=30,
+        choices=BulkStringJobOperationChoices.choices,
+        help_text="Bulk operation to run"
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=BulkStringJobStatusChoices.choices,
+        default=BulkStringJobStatusChoices.PENDING,
+        help_text="Current status of the job"
+    )
+    project = models.ForeignKey(
+        "master_data.Project",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="bulk_jobs",
+        help_text="Project the strings belong to (project string operations)"
+    )
+    platform = models.ForeignKey(
+        "master_data.Platform",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="bulk_jobs",
+        help_text="Platform the strings belong to (project string operations)"
+    )
+    triggered_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="triggered_bulk_string_jobs",
+        help_text="User who submitted the job"
+    )
+    payload = models.JSONField(
+        default=dict,
+        help_text="Request body of the bulk operation"
+    )
+
+    # Progress tracking
+    total_rows = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of rows (or operations) in the payload"
+    )
+    processed_rows = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of rows applied successfully"
+    )
+    failed_rows = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of rows rejected"
+    )
+    next_row = models.PositiveIntegerField(
+        default=0,
+        help_text="Position of the first row not yet committed"
+    )
+    chunk_size = models.PositiveIntegerField(
+        default=1000,
+        help_text="Rows processed per transaction"
+    )
+
+    # Worker bookkeeping
+    worker = models.CharField(
+        max_length=100,
+        blank=True,
+        default='',
+        help_text="Worker that claimed the job"
+    )
+    heartbeat_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the worker last reported progress"
+    )
+    started_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When processing started"
+    )
+    completed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the job finished"
+    )
+    error_message = models.TextField(
+        null=True,
+        blank=True,
+        help_text="Error that stopped the job"
+    )
+
+    class Meta:
+        verbose_name = "Bulk String Job"
+        verbose_name_plural = "Bulk String Jobs"
+        ordering = ['-created']
+        indexes = [
+            # Claiming: oldest pending / stale running job first
+            models.Index(fields=['status', 'created'], name='bulkjob_claim_idx'),
+            models.Index(fields=['workspace', '-created'], name='bulkjob_workspace_idx'),
+        ]
+
+    def __str__(self):
+        return f"BulkStringJob {self.job_id} - {self.operation} ({self.status})"
+
+    @property
+    def is_finished(self):
+        return self.status in self.FINISHED_STATUSES
+
+    @property
+    def progress_percentage(self):
+        """Share of the payload that has been committed."""
+        if self.total_rows == 0:
+            return 100 if self.is_finished else 0
+        return (self.next_row / self.total_rows) * 100
+
+
+class BulkStringJobChunk(models.Model):
+    """Per-row results of one committed chunk of a BulkStringJob."""
+
+    job = models.ForeignKey(
+        BulkStringJob,
+        on_delete=models.CASCADE,
+        related_name="chunks",
+        help_text="Job this chunk belongs to"
+    )
+    position = models.PositiveIntegerField(
+        help_text="Chunk number within the job, from 0"
+    )
+    row_count = models.PositiveIntegerField(
+        help_text="Number of payload rows in the chunk"
+    )
+    results = models.JSONField(
+        default=list,
+        encoder=DjangoJSONEncoder,
+        help_text="Compact result per applied row"
+    )
+    errors = models.JSONField(
+        default=list,
+        encoder=DjangoJSONEncoder,
+        help_text="{'index', 'errors'} per rejected row; index refers to the payload"
+    )
+    created = models.DateTimeField(
+        auto_now_add=True,
+        help_text="When the chunk was committed"
+    )
+
+    class Meta:
+        verbose_name = "Bulk String Job Chunk"
+        verbose_name_plural = "Bulk String Job Chunks"
+        ordering = ['job', 'position']
+        constraints = [
+            models.UniqueConstraint(fields=['job', 'position'], name='unique_bulkjob_chunk'),
+        ]
+
+    def __str__(self):
+        return f"{self.job} - chunk {self.position}"
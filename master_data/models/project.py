@@ -7,6 +7,8 @@ import uuid
 from django.db import models
 from django.core.exceptions import ValidationError
 from django.conf import settings
+from django.db.models import Count, F, IntegerField, Max, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 
 from .base import TimeStampModel, WorkspaceMixin
 from ..constants import STANDARD_NAME_LENGTH, DESCRIPTION_LENGTH, SLUG_LENGTH
@@ -308,3 +310,148 @@ class ApprovalHistory(TimeStampModel):
 
     def __str__(self):
         return f"{self.project} - {self.action} by {self.user} ({self.timestamp})"
+
+
+class ProjectStatsManager(models.Manager):
+    """Incremental maintenance and reconciliation of ProjectStats."""
+
+    COUNTER_FIELDS = ('total_strings', 'platforms_count', 'team_members_count')
+
+    def adjust(self, project_id, **deltas):
+        """
+        Add deltas to counters with a single UPDATE (e.g. total_strings=5).
+
+        Creates the row from a full count if the project has none yet.
+        """
+        updated = self.filter(project_id=project_id).update(**{
+            field: F(field) + delta for field, delta in deltas.items()
+        })
+        if not updated:
+            self.reconcile(project_ids=[project_id])
+
+    def record_activity(self, project_id, when):
+        """Move last_activity forward to `when`."""
+        updated = self.filter(project_id=project_id).filter(
+            Q(last_activity__isnull=True) | Q(last_activity__lt=when)
+        ).update(last_activity=when)
+        if not updated and not self.filter(project_id=project_id).exists():
+            self.reconcile(project_ids=[project_id])
+
+    def recount(self, project_id, *fields):
+        """Recompute some fields of one project from the source tables."""
+        values = self.expected_values(
+            Project.objects.all_workspaces().filter(id=project_id)).first()
+        if values is None:
+            return
+        self.filter(project_id=project_id).update(**{field: values[field] for field in fields})
+
+    @staticmethod
+    def expected_values(projects):
+        """Annotate a Project queryset with the true statistics values."""
+        from .project_string import ProjectString
+
+        def count(queryset):
+            return Coalesce(Subquery(
+                queryset.filter(project_id=OuterRef('pk')).order_by().values(
+                    'project_id').annotate(total=Count('pk')).values('total'),
+                output_field=IntegerField()
+            ), 0)
+
+        return projects.order_by().values('id').annotate(
+            total_strings=count(ProjectString.objects.all_workspaces()),
+            platforms_count=count(Project.platforms.through.objects.all()),
+            team_members_count=count(ProjectMember.objects.all()),
+            last_activity=Subquery(
+                ProjectActivity.objects.filter(project_id=OuterRef('pk'))
+                .order_by().values('project_id').annotate(latest=Max('created'))
+                .values('latest')
+            ),
+        )
+
+    def reconcile(self, project_ids=None, dry_run=False):
+        """
+        Compare stats with the source tables and fix rows that drifted.
+
+        Args:
+            project_ids: Projects to check (default: all)
+            dry_run: Only report
+
+        Returns:
+            Number of projects whose stats were missing or wrong
+        """
+        projects = Project.objects.all_workspaces()
+        if project_ids is not None:
+            projects = projects.filter(id__in=project_ids)
+
+        current = {
+            row['project_id']: row
+            for row in self.filter(project__in=projects).values(
+                'project_id', 'last_activity', *self.COUNTER_FIELDS)
+        }
+        fixed = 0
+        for expected in self.expected_values(projects).iterator():
+            project_id = expected.pop('id')
+            existing = current.get(project_id)
+            if existing is not None and all(
+                existing[field] == value for field, value in expected.items()
+            ):
+                continue
+            fixed += 1
+            if dry_run:
+                continue
+            if existing is None:
+                self.get_or_create(project_id=project_id, defaults=expected)
+            else:
+                self.filter(project_id=project_id).update(**expected)
+        return fixed
+
+
+class ProjectStats(models.Model):
+    """
+    Denormalized per-project counters shown on project lists.
+
+    Kept up to date by the string, member, platform and activity write
+    paths (including bulk ingest); reconcile_project_stats repairs drift.
+    """
+
+    project = models.OneToOneField(
+        Project,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="stats",
+        help_text="Project these statistics belong to"
+    )
+    total_strings = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of strings in the project"
+    )
+    platforms_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of platforms assigned to the project"
+    )
+    team_members_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of team members"
+    )
+    last_activity = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the latest project activity was recorded"
+    )
+
+    objects = ProjectStatsManager()
+
+    class Meta:
+        verbose_name = "Project Stats"
+        verbose_name_plural = "Project Stats"
+
+    def __str__(self):
+        return f"Stats for project {self.project_id}"
+
+    def as_dict(self):
+        return {
+            'total_strings': self.total_strings,
+            'platforms_count': self.platforms_count,
+            'team_members_count': self.team_members_count,
+            'last_activity': self.last_activity,
+        }
@@ -6,8 +6,11 @@ Handles string generation within projects (replacing submission-based strings).
 import uuid
 from django.db import models
 from django.core.exceptions import ValidationError
+from django.utils import timezone
 
-from .base import TimeStampModel, WorkspaceMixin
+from .base import (
+    ChangeTrackingMixin, HierarchyPathMixin, TimeStampModel, WorkspaceMixin
+)
 from ..constants import STRING_VALUE_LENGTH, FREETEXT_LENGTH
 
 
@@ -56,8 +59,28 @@ class ProjectStringManager(models.Manager):
     def for_entity_level(self, level):
         return self.get_queryset().for_entity_level(level)
 
+    def bulk_ingest(self, project, platform, rule, rows, created_by=None, **kwargs):
+        """
+        Create many project strings (and their details) without per-row save().
 
-class ProjectString(TimeStampModel, WorkspaceMixin):
+        See BulkIngestService.ingest_project_strings for the accepted row format.
+        """
+        from ..services.bulk_ingest_service import BulkIngestService
+        return BulkIngestService.ingest_project_strings(
+            project, platform, rule, rows, created_by=created_by, **kwargs)
+
+    def bulk_edit(self, project, platform, rows, updated_by=None, **kwargs):
+        """
+        Update the values and details of many project strings without per-row save().
+
+        See BulkIngestService.update_project_strings for the accepted row format.
+        """
+        from ..services.bulk_ingest_service import BulkIngestService
+        return BulkIngestService.update_project_strings(
+            project, platform, rows, updated_by=updated_by, **kwargs)
+
+
+class ProjectString(TimeStampModel, WorkspaceMixin, HierarchyPathMixin):
     """
     Represents a generated naming string within a project.
 
@@ -122,6 +145,11 @@ class ProjectString(TimeStampModel, WorkspaceMixin):
         blank=True,
         help_text="UUID of parent string for hierarchical linking"
     )
+    entity_level = models.SmallIntegerField(
+        default=0,
+        editable=False,
+        help_text="Copy of entity.entity_level, kept for keyset pagination"
+    )
 
     # Custom manager
     objects = ProjectStringManager()
@@ -135,6 +163,22 @@ class ProjectString(TimeStampModel, WorkspaceMixin):
             models.Index(fields=['workspace', 'string_uuid']),
             models.Index(fields=['workspace', 'parent_uuid']),
             models.Index(fields=['project', 'platform', 'entity']),
+            # "Changed since" sync exports
+            models.Index(
+                fields=['workspace', 'project', 'platform', 'last_updated'],
+                name='projstring_sync_idx',
+            ),
+            # Keyset pagination on (entity_level, value, id) within a platform
+            models.Index(
+                fields=['project', 'platform', 'entity_level', 'value', 'id'],
+                name='projstring_keyset_idx',
+            ),
+            # Prefix (LIKE 'x%') lookups for descendant queries
+            models.Index(
+                fields=['ancestor_path'],
+                name='projstring_ancestor_path_idx',
+                opclasses=['varchar_pattern_ops'],
+            ),
         ]
         constraints = [
             # Unique constraint for strings WITH a parent
@@ -204,26 +248,29 @@ class ProjectString(TimeStampModel, WorkspaceMixin):
         if not self.string_uuid:
             self.string_uuid = uuid.uuid4()
 
+        if self.entity_id:
+            self.entity_level = self.entity.entity_level
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None and 'entity' in update_fields:
+                kwargs['update_fields'] = set(update_fields) | {'entity_level'}
+
         # Full clean to run validation
         self.full_clean()
 
         super().save(*args, **kwargs)
 
     def get_hierarchy_path(self):
-        """Get the full hierarchy path for this string."""
-        path = []
-        current = self
-        max_depth = 10  # Prevent infinite loops
-
-        while current and max_depth > 0:
-            path.insert(0, {
-                'id': current.id,
-                'value': current.value,
-                'entity_level': current.entity.entity_level
-            })
-            current = current.parent
-            max_depth -= 1
-
+        """Get the full hierarchy path for this string, root first."""
+        path = [
+            {'id': ancestor_id, 'value': value, 'entity_level': entity_level}
+            for ancestor_id, value, entity_level in self.get_ancestors().values_list(
+                'id', 'value', 'entity__entity_level')
+        ]
+        path.append({
+            'id': self.id,
+            'value': self.value,
+            'entity_level': self.entity.entity_level
+        })
         return path
 
     def get_child_strings(self):
@@ -240,7 +287,7 @@ class ProjectString(TimeStampModel, WorkspaceMixin):
         return self.entity.next_entity
 
 
-class ProjectStringDetail(TimeStampModel, WorkspaceMixin):
+class ProjectStringDetail(TimeStampModel, WorkspaceMixin, ChangeTrackingMixin):
     """
     Represents dimension values used in project string generation.
 
@@ -282,6 +329,12 @@ class ProjectStringDetail(TimeStampModel, WorkspaceMixin):
         help_text="Whether this value was inherited from parent string"
     )
 
+    # Original values compared by changed_fields() and propagation signals
+    tracked_fields = (
+        'string_id', 'dimension_id', 'dimension_value_id', 'dimension_value_freetext',
+        'is_inherited',
+    )
+
     class Meta:
         verbose_name = "Project String Detail"
         verbose_name_plural = "Project String Details"
@@ -290,6 +343,11 @@ class ProjectStringDetail(TimeStampModel, WorkspaceMixin):
         ordering = ['workspace', 'string', 'dimension']
         indexes = [
             models.Index(fields=['string', 'dimension']),
+            # Details changed since a sync watermark
+            models.Index(
+                fields=['workspace', 'last_updated'],
+                name='projstringdetail_sync_idx',
+            ),
         ]
 
     def __str__(self):
@@ -329,3 +387,50 @@ class ProjectStringDetail(TimeStampModel, WorkspaceMixin):
         if self.dimension_value:
             return self.dimension_value.value
         return self.dimension_value_freetext
+
+
+class ProjectStringTombstone(WorkspaceMixin):
+    """
+    Record of a deleted project string.
+
+    Lets "changed since" sync exports report deletions; rows older than
+    SYNC_TOMBSTONE_RETENTION_DAYS are purged by
+    purge_project_string_tombstones.
+    """
+
+    project = models.ForeignKey(
+        "master_data.Project",
+        on_delete=models.CASCADE,
+        related_name="string_tombstones",
+        help_text="Project the deleted string belonged to"
+    )
+    platform = models.ForeignKey(
+        "master_data.Platform",
+        on_delete=models.CASCADE,
+        related_name="project_string_tombstones",
+        help_text="Platform the deleted string belonged to"
+    )
+    string_id = models.IntegerField(
+        help_text="ID of the deleted string"
+    )
+    string_uuid = models.UUIDField(
+        help_text="UUID of the deleted string"
+    )
+    deleted_at = models.DateTimeField(
+        default=timezone.now,
+        help_text="When the string was deleted"
+    )
+
+    class Meta:
+        verbose_name = "Project String Tombstone"
+        verbose_name_plural = "Project String Tombstones"
+        ordering = ['deleted_at', 'id']
+        indexes = [
+            models.Index(
+                fields=['workspace', 'project', 'platform', 'deleted_at'],
+                name='projstring_tombstone_sync_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.string_uuid} deleted at {self.deleted_at}"
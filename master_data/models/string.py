@@ -11,7 +11,9 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.utils import timezone
 
-from .base import TimeStampModel, WorkspaceMixin
+from .base import (
+    ChangeTrackingMixin, HierarchyPathMixin, TimeStampModel, WorkspaceMixin
+)
 from ..constants import STRING_VALUE_LENGTH, FREETEXT_LENGTH
 
 
@@ -59,8 +61,18 @@ class StringManager(models.Manager):
     def for_entity_level(self, level):
         return self.get_queryset().for_entity_level(level)
 
+    def bulk_ingest(self, workspace, rows, created_by=None, **kwargs):
+        """
+        Create many strings (and their details) without per-row save().
+
+        See BulkIngestService.ingest_strings for the accepted row format.
+        """
+        from ..services.bulk_ingest_service import BulkIngestService
+        return BulkIngestService.ingest_strings(
+            workspace, rows, created_by=created_by, **kwargs)
 
-class String(TimeStampModel, WorkspaceMixin):
+
+class String(TimeStampModel, WorkspaceMixin, HierarchyPathMixin):
     """
     Represents a generated naming string based on rule configuration.
 
@@ -148,6 +160,12 @@ class String(TimeStampModel, WorkspaceMixin):
             models.Index(fields=['workspace', 'rule', 'entity']),
             models.Index(fields=['workspace', 'string_uuid']),
             models.Index(fields=['workspace', 'value']),
+            # Prefix (LIKE 'x%') lookups for descendant queries
+            models.Index(
+                fields=['ancestor_path'],
+                name='string_ancestor_path_idx',
+                opclasses=['varchar_pattern_ops'],
+            ),
         ]
 
     def __str__(self):
@@ -227,40 +245,36 @@ class String(TimeStampModel, WorkspaceMixin):
     def get_dimension_values(self):
         """Get current dimension values as a dictionary ordered by rule configuration."""
         from collections import OrderedDict
-        from .rule import RuleDetail
-        
-        # Get rule details to determine the correct order
-        rule_details = RuleDetail.objects.filter(
-            rule=self.rule,
-            entity=self.entity
-        ).select_related('dimension').order_by('dimension_order')
-        
+        from ..services.naming_template import NamingConventionError, get_naming_template
+
+        # Use the compiled naming template to determine the correct order
+        try:
+            dimension_order = get_naming_template(self.rule, self.entity).dimension_names
+        except NamingConventionError:
+            dimension_order = ()
+
+        # Load all details in a single query
+        detail_values = {}
+        for detail in self.string_details.select_related('dimension', 'dimension_value'):
+            if detail.dimension_value:
+                detail_values[detail.dimension.name] = detail.dimension_value.value
+            else:
+                detail_values[detail.dimension.name] = detail.dimension_value_freetext
+
         # Create ordered dictionary following rule order
         values = OrderedDict()
-        
+
         # First pass: add values in rule order
-        for rule_detail in rule_details:
-            dimension_name = rule_detail.dimension.name
-            
-            # Find the corresponding string detail
-            try:
-                string_detail = self.string_details.get(dimension=rule_detail.dimension)
-                if string_detail.dimension_value:
-                    values[dimension_name] = string_detail.dimension_value.value
-                else:
-                    values[dimension_name] = string_detail.dimension_value_freetext
-            except self.string_details.model.DoesNotExist:
-                # If string detail doesn't exist, skip this dimension
-                continue
-        
+        for dimension_name in dimension_order:
+            # If string detail doesn't exist, skip this dimension
+            if dimension_name in detail_values:
+                values[dimension_name] = detail_values[dimension_name]
+
         # Second pass: add any remaining dimensions not in rule (shouldn't happen in normal cases)
-        for detail in self.string_details.select_related('dimension', 'dimension_value'):
-            if detail.dimension.name not in values:
-                if detail.dimension_value:
-                    values[detail.dimension.name] = detail.dimension_value.value
-                else:
-                    values[detail.dimension.name] = detail.dimension_value_freetext
-        
+        for dimension_name, value in detail_values.items():
+            if dimension_name not in values:
+                values[dimension_name] = value
+
         return values
 
     def check_naming_conflicts(self, exclude_self=True):
@@ -290,15 +304,8 @@ class String(TimeStampModel, WorkspaceMixin):
         return conflicts
 
     def get_hierarchy_path(self):
-        """Get the full hierarchy path for this string."""
-        path = []
-        current = self
-
-        while current:
-            path.insert(0, current)
-            current = current.parent
-
-        return path
+        """Get the full hierarchy path for this string, root first."""
+        return list(self.get_ancestors()) + [self]
 
     def get_child_strings(self):
         """Get all direct child strings."""
@@ -369,8 +376,18 @@ class StringDetailManager(models.Manager):
         """Filter queryset by specific workspace"""
         return super().get_queryset().filter(workspace_id=workspace_id)
 
+    def bulk_ingest(self, workspace, rows, created_by=None, **kwargs):
+        """
+        Create many string details for existing strings without per-row save().
 
-class StringDetail(TimeStampModel, WorkspaceMixin):
+        See BulkIngestService.ingest_string_details for the accepted row format.
+        """
+        from ..services.bulk_ingest_service import BulkIngestService
+        return BulkIngestService.ingest_string_details(
+            workspace, rows, created_by=created_by, **kwargs)
+
+
+class StringDetail(TimeStampModel, WorkspaceMixin, ChangeTrackingMixin):
     """
     Represents dimension values used in string generation.
 
@@ -411,6 +428,11 @@ class StringDetail(TimeStampModel, WorkspaceMixin):
     # Custom manager
     objects = StringDetailManager()
 
+    # Original values compared by changed_fields() and propagation signals
+    tracked_fields = (
+        'string_id', 'dimension_id', 'dimension_value_id', 'dimension_value_freetext',
+    )
+
     class Meta:
         verbose_name = "String Detail"
         verbose_name_plural = "String Details"
@@ -2,10 +2,112 @@
 Custom pagination classes for master_data API endpoints.
 
 This module provides pagination classes with configurable limits to prevent
-DoS attacks via excessive data requests.
+DoS attacks via excessive data requests, and keyset (cursor) helpers for
+lists that are too large for COUNT(*) + OFFSET paging.
 """
 
+import base64
+import json
+from typing import Any, List, Optional, Sequence, Tuple
+
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class InvalidCursor(ValueError):
+    """Raised when a keyset cursor cannot be decoded."""
+    pass
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the ordering values of the last row as an opaque cursor."""
+    payload = json.dumps(list(values), separators=(',', ':'), default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Decode a cursor produced by encode_cursor() for an ordering of size fields."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (ValueError, TypeError, UnicodeDecodeError):
+        raise InvalidCursor("Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursor("Invalid cursor")
+    return values
+
+
+def keyset_filter(ordering: Sequence[str], values: Sequence[Any]) -> Q:
+    """
+    Build the "after this row" condition for an ordering.
+
+    For ascending (a, b, c) this is a > x OR (a = x AND b > y) OR
+    (a = x AND b = y AND c > z); fields prefixed with '-' compare with lt.
+    The last field must be unique (usually id).
+    """
+    condition = Q()
+    equal = Q()
+    for field, value in zip(ordering, values):
+        name = field.lstrip('-')
+        lookup = 'lt' if field.startswith('-') else 'gt'
+        condition |= equal & Q(**{f'{name}__{lookup}': value})
+        equal &= Q(**{name: value})
+    return condition
+
+
+def keyset_values(obj, ordering: Sequence[str]) -> List[Any]:
+    """Read the ordering values (following '__' paths) from a row."""
+    values = []
+    for field in ordering:
+        value = obj
+        for part in field.lstrip('-').split('__'):
+            value = getattr(value, part)
+        values.append(value)
+    return values
+
+
+def estimate_count(queryset) -> Tuple[Optional[int], bool]:
+    """
+    Return (count, is_estimate) for a queryset.
+
+    On PostgreSQL the planner's row estimate is read with EXPLAIN, which
+    costs no table scan; other backends fall back to an exact COUNT(*).
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return queryset.count(), False
+
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows']), True
+
+
+def paginate_keyset(queryset, ordering: Sequence[str], cursor: Optional[str], page_size: int):
+    """
+    Fetch one keyset page.
+
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    Raises InvalidCursor for malformed cursors.
+    """
+    queryset = queryset.order_by(*ordering)
+    if cursor:
+        queryset = queryset.filter(
+            keyset_filter(ordering, decode_cursor(cursor, len(ordering))))
+
+    rows = list(queryset[:page_size + 1])
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = encode_cursor(keyset_values(rows[-1], ordering))
+    return rows, next_cursor
 
 
 class StandardResultsSetPagination(PageNumberPagination):
@@ -16,10 +118,15 @@ class StandardResultsSetPagination(PageNumberPagination):
     - Default page size: 100 items
     - Configurable via 'page_size' query parameter
     - Maximum page size: 1000 items (hard limit to prevent DoS)
+    - Keyset mode via 'pagination=cursor' or 'cursor': no COUNT(*) or
+      OFFSET; rows are ordered by the view's keyset_ordering (default id)
+      and 'estimate_count=true' adds the planner's row estimate
 
     Usage:
         GET /api/v1/endpoint/?page=2
         GET /api/v1/endpoint/?page=2&page_size=50
+        GET /api/v1/endpoint/?pagination=cursor&page_size=50
+        GET /api/v1/endpoint/?cursor=<next_cursor>&page_size=50
     """
     page_size = 100
     page_size_query_param = 'page_size'
@@ -27,12 +134,47 @@ class StandardResultsSetPagination(PageNumberPagination):
 
     # More descriptive query parameters
     page_query_param = 'page'
+    cursor_query_param = 'cursor'
+    mode_query_param = 'pagination'
+    estimate_count_query_param = 'estimate_count'
+
+    # Ordering used in keyset mode; views override with keyset_ordering
+    keyset_ordering = ('id',)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = self.is_keyset_request(request)
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.page_size_value = self.get_page_size(request)
+        self.estimated_count = None
+        if request.query_params.get(self.estimate_count_query_param, '').lower() in ('1', 'true'):
+            self.estimated_count = estimate_count(queryset)
+
+        ordering = getattr(view, 'keyset_ordering', None) or self.keyset_ordering
+        try:
+            rows, self.next_cursor = paginate_keyset(
+                queryset, ordering, request.query_params.get(self.cursor_query_param),
+                self.page_size_value)
+        except InvalidCursor:
+            raise NotFound("Invalid cursor")
+        return rows
+
+    def is_keyset_request(self, request):
+        return (
+            self.cursor_query_param in request.query_params
+            or request.query_params.get(self.mode_query_param) == 'cursor'
+        )
 
     # Custom response format
     def get_paginated_response(self, data):
         """
         Return paginated response with additional metadata.
         """
+        if getattr(self, 'keyset', False):
+            return Response(self.get_keyset_response_data(data))
+
         response = super().get_paginated_response(data)
 
         # Add additional metadata
@@ -40,3 +182,51 @@ class StandardResultsSetPagination(PageNumberPagination):
         response.data['total_pages'] = self.page.paginator.num_pages
 
         return response
+
+    def get_keyset_response_data(self, data):
+        next_url = None
+        if self.next_cursor:
+            url = remove_query_param(
+                self.request.build_absolute_uri(), self.estimate_count_query_param)
+            next_url = replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+        response_data = {
+            'next': next_url,
+            'next_cursor': self.next_cursor,
+            'page_size': self.page_size_value,
+            'results': data,
+        }
+        if self.estimated_count is not None:
+            response_data['count'], response_data['count_is_estimate'] = self.estimated_count
+        return response_data
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties']['next_cursor'] = {
+            'type': 'string',
+            'nullable': True,
+            'description': "Cursor for the next page in keyset mode",
+        }
+        return response_schema
+
+
+class KeysetPagination(StandardResultsSetPagination):
+    """
+    Pagination that is always in keyset mode.
+
+    For sub-resources whose size is unbounded: pages are fetched by cursor
+    only, so there is no COUNT(*) unless estimate_count is requested.
+
+    Usage:
+        paginator = KeysetPagination(('-created', '-id'), page_size=50)
+        rows = paginator.paginate_queryset(queryset, request)
+        return paginator.get_paginated_response(serializer(rows, many=True).data)
+    """
+
+    def __init__(self, ordering: Sequence[str], page_size: Optional[int] = None):
+        self.keyset_ordering = tuple(ordering)
+        if page_size is not None:
+            self.page_size = page_size
+
+    def is_keyset_request(self, request):
+        return True
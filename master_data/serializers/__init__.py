@@ -30,6 +30,8 @@ from .rule import (
     GenerationPreviewSerializer,
     ValidationSummarySerializer,
     GenerationPreviewRequestSerializer,
+    BatchGenerationRequestSerializer,
+    NameParseRequestSerializer,
     CacheInvalidationRequestSerializer,
     InheritanceLookupSerializer,
     DimensionRelationshipMapsSerializer,
@@ -101,6 +103,7 @@ from .project import (
     ApproveSerializer,
     RejectSerializer,
 )
+from .bulk_job import BulkStringJobSerializer, BulkStringJobChunkSerializer
 from .project_string import (
     ProjectStringReadSerializer,
     ProjectStringExpandedSerializer,
@@ -139,6 +142,8 @@ __all__ = [
     'GenerationPreviewSerializer',
     'ValidationSummarySerializer',
     'GenerationPreviewRequestSerializer',
+    'BatchGenerationRequestSerializer',
+    'NameParseRequestSerializer',
     'CacheInvalidationRequestSerializer',
     'InheritanceLookupSerializer',
     'DimensionRelationshipMapsSerializer',
@@ -227,4 +232,8 @@ __all__ = [
     'ProjectStringDetailNestedSerializer',
     'ProjectStringDetailWriteSerializer',
     'ListProjectStringsSerializer',
+
+    # Bulk job serializers
+    'BulkStringJobSerializer',
+    'BulkStringJobChunkSerializer',
 ]
@@ -0,0 +1,39 @@
+"""
+Serializers for background bulk string jobs.
+"""
+
+from rest_framework import serializers
+
+from .. import models
+
+
+class BulkStringJobSerializer(serializers.ModelSerializer):
+    """Status and progress of a bulk string job (the payload is not returned)."""
+
+    triggered_by_name = serializers.SerializerMethodField()
+    progress_percentage = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = models.BulkStringJob
+        fields = [
+            'job_id', 'operation', 'status', 'workspace', 'project', 'platform',
+            'triggered_by', 'triggered_by_name',
+            'total_rows', 'processed_rows', 'failed_rows', 'progress_percentage',
+            'chunk_size', 'started_at', 'completed_at', 'error_message',
+            'created', 'last_updated'
+        ]
+        read_only_fields = fields
+
+    def get_triggered_by_name(self, obj) -> str:
+        if obj.triggered_by:
+            return obj.triggered_by.get_full_name()
+        return "System"
+
+
+class BulkStringJobChunkSerializer(serializers.ModelSerializer):
+    """Per-row results of one committed chunk."""
+
+    class Meta:
+        model = models.BulkStringJobChunk
+        fields = ['position', 'row_count', 'results', 'errors', 'created']
+        read_only_fields = fields
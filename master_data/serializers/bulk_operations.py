@@ -88,11 +88,9 @@ class BulkStringDetailUpdateSerializer(serializers.Serializer):
                 # Update detail fields
                 for field, value in detail_data.items():
                     setattr(detail, field, value)
+                # The string is regenerated once when the transaction commits
                 detail.save()
 
-                # Trigger string regeneration
-                detail.string.regenerate_value()
-
                 updated_details.append(detail)
 
             except models.StringDetail.DoesNotExist:
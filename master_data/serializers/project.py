@@ -4,10 +4,16 @@ Serializers for Project models.
 
 from rest_framework import serializers
 from django.db import transaction
+from django.urls import reverse
 from django.utils import timezone
 from .. import models
 
 
+def _split_param(value):
+    """Split a comma-separated query parameter into its non-empty items."""
+    return [item.strip() for item in (value or '').split(',') if item.strip()]
+
+
 # =============================================================================
 # USER SERIALIZERS
 # =============================================================================
@@ -115,53 +121,109 @@ class ProjectListSerializer(serializers.ModelSerializer):
         ]
 
     def get_team_members(self, obj):
-        """Get team members for this project."""
-        members = obj.team_members.all().select_related('user')
-        return ProjectMemberReadSerializer(members, many=True).data
+        """Get team members for this project (uses team_members__user prefetch)."""
+        return ProjectMemberReadSerializer(obj.team_members.all(), many=True).data
 
     def get_stats(self, obj):
-        """Get project statistics."""
-        total_strings = models.ProjectString.objects.filter(project=obj).count()
-        platforms_count = obj.platforms.count()
-        team_members_count = obj.team_members.count()
-
-        # Get last activity
-        last_activity = obj.activities.order_by('-created').first()
-        last_activity_date = last_activity.created if last_activity else None
-
-        return {
-            'total_strings': total_strings,
-            'platforms_count': platforms_count,
-            'team_members_count': team_members_count,
-            'last_activity': last_activity_date
-        }
+        """Get project statistics from the denormalized ProjectStats row."""
+        try:
+            stats = obj.stats
+        except models.ProjectStats.DoesNotExist:
+            models.ProjectStats.objects.reconcile(project_ids=[obj.pk])
+            stats = models.ProjectStats.objects.get(project_id=obj.pk)
+        return stats.as_dict()
 
 
 class ProjectDetailSerializer(ProjectListSerializer):
-    """Serializer for project detail with full data."""
+    """
+    Serializer for project detail.
+
+    Strings and activities are unbounded, so they are returned as section
+    summaries (count and sub-resource URL); ?include=strings,activities
+    embeds the first rows of a section with the cursor of the next page.
+    ?fields= limits the response to the listed fields (id is always kept).
+    """
     strings = serializers.SerializerMethodField()
     activities = serializers.SerializerMethodField()
     approval_history = serializers.SerializerMethodField()
 
+    SECTIONS = ('strings', 'activities')
+    STRINGS_ORDERING = ('platform_id', 'entity_level', 'value', 'id')
+    ACTIVITIES_ORDERING = ('-created', '-id')
+
     class Meta(ProjectListSerializer.Meta):
         fields = ProjectListSerializer.Meta.fields + ['strings', 'activities', 'approval_history']
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        query_params = getattr(request, 'query_params', {})
+
+        self.included_sections = set(_split_param(query_params.get('include')))
+        unknown = self.included_sections - set(self.SECTIONS)
+        if unknown:
+            raise serializers.ValidationError({
+                'include': f"Unknown sections: {', '.join(sorted(unknown))}. "
+                           f"Choose from: {', '.join(self.SECTIONS)}"
+            })
+
+        requested_fields = set(_split_param(query_params.get('fields')))
+        if requested_fields:
+            requested_fields.add('id')
+            for field_name in set(self.fields) - requested_fields:
+                self.fields.pop(field_name)
+
+    @staticmethod
+    def strings_queryset(project):
+        """Strings of a project, ready for ProjectStringReadSerializer."""
+        return models.ProjectString.objects.for_workspace(project.workspace_id).filter(
+            project=project
+        ).select_related(
+            'project', 'platform', 'entity', 'rule', 'created_by'
+        ).prefetch_related('details__dimension', 'details__dimension_value')
+
+    @staticmethod
+    def activities_queryset(project):
+        """Activities of a project, newest first."""
+        return models.ProjectActivity.objects.filter(project=project).select_related('user')
+
+    def get_section(self, obj, name, count, queryset, ordering, serializer_class):
+        """Summary of a section, with its first rows if it was included."""
+        from ..pagination import paginate_keyset
+        from ..services.constants import PROJECT_DETAIL_PREVIEW_SIZE
+
+        section = {'count': count, 'url': self.get_section_url(obj, name)}
+        if name in self.included_sections:
+            rows, next_cursor = paginate_keyset(
+                queryset, ordering, None, PROJECT_DETAIL_PREVIEW_SIZE)
+            section['results'] = serializer_class(rows, many=True).data
+            section['next_cursor'] = next_cursor
+        return section
+
+    def get_section_url(self, obj, name):
+        request = self.context.get('request')
+        if request is None:
+            return None
+        path = reverse(f'project-{name}', kwargs={
+            'version': request.version or 'v1',
+            'workspace_id': obj.workspace_id,
+            'id': obj.pk,
+        })
+        return request.build_absolute_uri(path)
+
     def get_strings(self, obj):
-        """Get strings for this project (using ProjectStringReadSerializer)."""
+        """Strings section; rows come from the strings sub-resource."""
         from .project_string import ProjectStringReadSerializer
-        # Use for_workspace to explicitly filter by the project's workspace
-        # This ensures we get strings for the correct workspace
-        strings = models.ProjectString.objects.for_workspace(obj.workspace_id).filter(
-            project=obj
-        ).select_related(
-            'platform', 'entity', 'rule', 'created_by'
-        ).prefetch_related('details')
-        return ProjectStringReadSerializer(strings, many=True).data
+        return self.get_section(
+            obj, 'strings', self.get_stats(obj)['total_strings'],
+            self.strings_queryset(obj), self.STRINGS_ORDERING, ProjectStringReadSerializer)
 
     def get_activities(self, obj):
-        """Get activities for this project."""
-        activities = obj.activities.all().select_related('user').order_by('-created')
-        return ProjectActivitySerializer(activities, many=True).data
+        """Activities section; rows come from the activities sub-resource."""
+        queryset = self.activities_queryset(obj)
+        return self.get_section(
+            obj, 'activities', queryset.count(),
+            queryset, self.ACTIVITIES_ORDERING, ProjectActivitySerializer)
 
     def get_approval_history(self, obj):
         """Get approval history for this project."""
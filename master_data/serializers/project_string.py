@@ -210,111 +210,37 @@ class BulkProjectStringCreateSerializer(serializers.Serializer):
 
     @transaction.atomic
     def create(self, validated_data):
-        """Create project strings in bulk."""
+        """
+        Create project strings in bulk.
+
+        Validation and inserts are set-based (see ProjectString.objects.bulk_ingest);
+        nothing is created if any string is invalid.
+        """
+        from ..services.bulk_ingest_service import BulkIngestError
+
         project = self.context['project']
         platform = self.context['platform']
-        rule_id = validated_data['rule']
         strings_data = validated_data['strings']
 
         request = self.context.get('request')
         user = request.user if request and hasattr(request, 'user') else None
 
-        rule = models.Rule.objects.get(id=rule_id)
-
-        created_strings = []
-        string_uuid_map = {}  # Map UUIDs to created string instances
-
-        # Sort strings by entity level to ensure parents are created first
-        strings_by_level = {}
-        for string_data in strings_data:
-            entity = models.Entity.objects.get(id=string_data['entity'])
-            level = entity.entity_level
-            if level not in strings_by_level:
-                strings_by_level[level] = []
-            strings_by_level[level].append(string_data)
-
-        # Create strings level by level
-        for level in sorted(strings_by_level.keys()):
-            for string_data in strings_by_level[level]:
-                entity = models.Entity.objects.get(id=string_data['entity'])
-                details_data = string_data.pop('details')
-
-                # Get parent if parent_uuid is provided
-                parent = None
-                parent_uuid = string_data.get('parent_uuid')
-                if parent_uuid:
-                    # Check if parent was just created in this batch
-                    if parent_uuid in string_uuid_map:
-                        parent = string_uuid_map[parent_uuid]
-                    else:
-                        # Look for existing parent
-                        try:
-                            parent = models.ProjectString.objects.get(
-                                string_uuid=parent_uuid,
-                                platform=platform
-                            )
-                        except models.ProjectString.DoesNotExist:
-                            raise serializers.ValidationError(
-                                f"Parent string with UUID {parent_uuid} not found in platform {platform.name}"
-                            )
-
-                # Create string
-                project_string = models.ProjectString.objects.create(
-                    project=project,
-                    platform=platform,
-                    entity=entity,
-                    rule=rule,
-                    parent=parent,
-                    string_uuid=string_data['string_uuid'],
-                    parent_uuid=parent_uuid,
-                    value=string_data['value'],
-                    created_by=user,
-                    workspace=project.workspace
-                )
+        try:
+            result = models.ProjectString.objects.bulk_ingest(
+                project, platform, validated_data['rule'], strings_data,
+                created_by=user, partial=False
+            )
+        except BulkIngestError as e:
+            raise serializers.ValidationError(str(e))
+
+        if result.errors:
+            raise serializers.ValidationError({
+                'strings': {
+                    error['index']: error['errors'] for error in result.errors
+                }
+            })
 
-                # Store in map for parent lookups
-                string_uuid_map[project_string.string_uuid] = project_string
-
-                # Create string details
-                for detail_data in details_data:
-                    dimension = models.Dimension.objects.get(
-                        id=detail_data['dimension'])
-                    dimension_value = None
-                    dimension_value_freetext = None
-
-                    if 'dimension_value' in detail_data and detail_data['dimension_value']:
-                        dimension_value = models.DimensionValue.objects.get(
-                            id=detail_data['dimension_value']
-                        )
-                    else:
-                        dimension_value_freetext = detail_data.get(
-                            'dimension_value_freetext')
-
-                    # Check if inherited from parent
-                    is_inherited = False
-                    if parent:
-                        # Check if parent has same dimension value
-                        parent_detail = models.ProjectStringDetail.objects.filter(
-                            string=parent,
-                            dimension=dimension
-                        ).first()
-
-                        if parent_detail:
-                            if dimension_value and parent_detail.dimension_value == dimension_value:
-                                is_inherited = True
-                            elif dimension_value_freetext and parent_detail.dimension_value_freetext == dimension_value_freetext:
-                                is_inherited = True
-
-                    models.ProjectStringDetail.objects.create(
-                        string=project_string,
-                        dimension=dimension,
-                        dimension_value=dimension_value,
-                        dimension_value_freetext=dimension_value_freetext,
-                        is_inherited=is_inherited,
-                        workspace=project.workspace
-                    )
-
-                created_strings.append(project_string)
+        created_strings = result.created
 
         # Create project activity
         models.ProjectActivity.objects.create(
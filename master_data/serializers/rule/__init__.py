@@ -52,6 +52,8 @@ from .request import (
     RulePreviewRequestSerializer,
     DefaultRuleRequestSerializer,
     GenerationPreviewRequestSerializer,
+    BatchGenerationRequestSerializer,
+    NameParseRequestSerializer,
     CacheInvalidationRequestSerializer,
 )
 
@@ -142,6 +144,8 @@ __all__ = [
     'RulePreviewRequestSerializer',
     'DefaultRuleRequestSerializer',
     'GenerationPreviewRequestSerializer',
+    'BatchGenerationRequestSerializer',
+    'NameParseRequestSerializer',
     'CacheInvalidationRequestSerializer',
 
     # Response serializers
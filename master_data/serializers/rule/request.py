@@ -7,6 +7,7 @@ incoming API requests related to rules.
 
 from rest_framework import serializers
 from ...models import Entity, Rule
+from ...services.constants import BATCH_GENERATION_MAX_ROWS, NAME_PARSE_MAX_NAMES
 
 
 class RulePreviewRequestSerializer(serializers.Serializer):
@@ -46,6 +47,56 @@ class GenerationPreviewRequestSerializer(serializers.Serializer):
     entity_id = serializers.IntegerField(required=False)
 
 
+class BatchGenerationRequestSerializer(serializers.Serializer):
+    """Serializer for batch string generation requests."""
+    rule_id = serializers.IntegerField()
+    entity_id = serializers.IntegerField()
+    rows = serializers.JSONField(
+        help_text=(
+            "Either a list of {dimension_name: value} objects, or a columnar "
+            "object mapping dimension names to equal-length lists of values"
+        )
+    )
+    validate_values = serializers.BooleanField(default=True, required=False)
+
+    def validate_rows(self, value):
+        """Validate row shape and size."""
+        if isinstance(value, list):
+            if not all(isinstance(row, dict) for row in value):
+                raise serializers.ValidationError(
+                    "Each row must be an object of dimension values")
+            row_count = len(value)
+        elif isinstance(value, dict):
+            if not all(isinstance(column, list) for column in value.values()):
+                raise serializers.ValidationError(
+                    "Each column must be a list of dimension values")
+            lengths = {len(column) for column in value.values()}
+            if len(lengths) > 1:
+                raise serializers.ValidationError(
+                    "All columns must have the same length")
+            row_count = lengths.pop() if lengths else 0
+        else:
+            raise serializers.ValidationError(
+                "Rows must be a list of objects or an object of lists")
+
+        if row_count > BATCH_GENERATION_MAX_ROWS:
+            raise serializers.ValidationError(
+                f"Too many rows: {row_count} (maximum {BATCH_GENERATION_MAX_ROWS})")
+        return value
+
+
+class NameParseRequestSerializer(serializers.Serializer):
+    """Serializer for reverse parsing names into dimension values."""
+    rule_id = serializers.IntegerField()
+    entity_id = serializers.IntegerField()
+    names = serializers.ListField(
+        child=serializers.CharField(trim_whitespace=False),
+        allow_empty=False,
+        max_length=NAME_PARSE_MAX_NAMES,
+        help_text="Names to decompose according to the rule's naming pattern"
+    )
+
+
 class CacheInvalidationRequestSerializer(serializers.Serializer):
     """Serializer for cache invalidation requests."""
     rule_ids = serializers.ListField(
@@ -7,6 +7,17 @@ from .rule_validation_service import RuleValidationService
 from .rule_metrics_service import RuleMetricsService
 from .string_generation_service import StringGenerationService, NamingConventionError
 from .naming_pattern_validator import NamingPatternValidator
+from .naming_template import NamingTemplate, NamingTemplateCache, get_naming_template
+from .name_parser import NameParser, ParseResult, get_name_parser
+from .workspace_value_index import WorkspaceValueIndex, get_workspace_value_index
+from .bulk_ingest_service import (
+    BulkIngestService, BulkIngestResult, BulkIngestError, BulkUpdateResult
+)
+from .hierarchy_loader import HierarchyLoader, HierarchyIndex, HierarchyNode
+from .project_string_sync import ProjectStringSyncService, SyncWatermarkError
+from .project_string_export import ProjectStringExportService
+from .project_string_tree import ProjectStringTree, ProjectStringTreeService
+from .string_search import NgramIndex, SearchMatch, StringSearchService
 from . import constants
 
 __all__ = [
@@ -20,5 +31,28 @@ __all__ = [
     'StringGenerationService',
     'NamingConventionError',
     'NamingPatternValidator',
+    'NamingTemplate',
+    'NamingTemplateCache',
+    'get_naming_template',
+    'NameParser',
+    'ParseResult',
+    'get_name_parser',
+    'WorkspaceValueIndex',
+    'get_workspace_value_index',
+    'BulkIngestService',
+    'BulkIngestResult',
+    'BulkIngestError',
+    'BulkUpdateResult',
+    'HierarchyLoader',
+    'HierarchyIndex',
+    'HierarchyNode',
+    'ProjectStringSyncService',
+    'SyncWatermarkError',
+    'ProjectStringExportService',
+    'ProjectStringTree',
+    'ProjectStringTreeService',
+    'NgramIndex',
+    'SearchMatch',
+    'StringSearchService',
     'constants',
 ]
@@ -48,7 +48,7 @@ class BatchUpdateService:
             strings = String.objects.filter(
                 id__in=string_ids,
                 workspace=workspace
-            ).select_related('field', 'rule', 'parent')
+            ).select_related('entity', 'rule', 'parent')
 
             if len(strings) != len(string_ids):
                 found_ids = {s.id for s in strings}
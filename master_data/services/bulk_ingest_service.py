@@ -0,0 +1,993 @@
+"""
+Bulk ingestion of strings and string details.
+
+The regular String.save() path runs full_clean(), a conflict query and two
+post_save receivers per row. Bulk ingestion validates a whole batch with
+set-based lookups instead, resolves parents in bulk, inserts with
+bulk_create in chunks, and emits one aggregated log event.
+
+Entry points are String.objects.bulk_ingest(),
+StringDetail.objects.bulk_ingest() and ProjectString.objects.bulk_ingest();
+ProjectString.objects.bulk_edit() applies updates to existing project
+strings the same way.
+"""
+
+import logging
+import time
+import uuid
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from django.db import transaction
+from django.utils import timezone
+
+from ..constants import FREETEXT_LENGTH, HIERARCHY_PATH_SEPARATOR, STRING_VALUE_LENGTH
+from ..models import (
+    Entity, ProjectStats, ProjectString, ProjectStringDetail, Rule, String, StringDetail
+)
+from ..models.base import child_hierarchy_path
+from .constants import BULK_INGEST_CHUNK_SIZE, BULK_INGEST_LOOKUP_CHUNK_SIZE
+from .naming_template import NamingConventionError, get_naming_template
+from .string_search import bump_search_index_version
+from .workspace_value_index import WorkspaceValueIndex, get_workspace_value_index
+
+# Same logger as the per-row post_save audit log
+logger = logging.getLogger('master_data.string_generation')
+
+
+class BulkIngestError(Exception):
+    """Raised when a bulk ingestion batch cannot be processed at all."""
+    pass
+
+
+class BulkIngestResult(NamedTuple):
+    """
+    Outcome of a bulk ingestion.
+
+    Attributes:
+        created: Created objects in input order (rejected rows omitted)
+        errors: List of {'index': row index, 'errors': [messages]}
+        details_created: Number of StringDetail rows created
+    """
+    created: List[Any]
+    errors: List[Dict[str, Any]]
+    details_created: int = 0
+
+    @property
+    def created_count(self) -> int:
+        return len(self.created)
+
+    @property
+    def error_count(self) -> int:
+        return len(self.errors)
+
+
+class BulkUpdateResult(NamedTuple):
+    """
+    Outcome of a bulk update.
+
+    Attributes:
+        updated: {'id', 'value', 'last_updated'} per updated string, in input order
+        errors: List of {'index': row index, 'string_id': id, 'errors': [messages]}
+        details_written: Number of detail rows created, changed or deleted
+    """
+    updated: List[Dict[str, Any]]
+    errors: List[Dict[str, Any]]
+    details_written: int = 0
+
+    @property
+    def updated_count(self) -> int:
+        return len(self.updated)
+
+    @property
+    def error_count(self) -> int:
+        return len(self.errors)
+
+
+def _pk(value) -> Optional[int]:
+    """Accept a model instance or a primary key."""
+    if value is None or value == '':
+        return None
+    return getattr(value, 'pk', value)
+
+
+def _as_uuid(value) -> Optional[uuid.UUID]:
+    if value is None or value == '':
+        return None
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+
+
+def _chunks(items: List, size: int) -> Iterable[List]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class BulkIngestService:
+    """Set-based bulk creation of String and StringDetail rows, and bulk project string updates."""
+
+    @staticmethod
+    def ingest_strings(workspace, rows: List[Dict[str, Any]], created_by=None,
+                       chunk_size: int = BULK_INGEST_CHUNK_SIZE) -> BulkIngestResult:
+        """
+        Validate and create many strings, optionally with their details.
+
+        Each row accepts: rule, entity (instances or IDs), value, string_uuid,
+        parent (instance or ID) or parent_uuid, submission, is_auto_generated,
+        generation_metadata, and details (a list of {dimension,
+        dimension_value, dimension_value_freetext}). When value is omitted it
+        is generated from the details.
+
+        Parents are resolved from the batch itself or from existing strings
+        in the workspace; children are inserted after their parents. Invalid
+        rows are skipped and reported, valid rows are inserted atomically.
+        """
+        start_time = time.time()
+        workspace_id = _pk(workspace)
+        if workspace_id is None:
+            raise BulkIngestError("Workspace is required")
+        created_by_id = _pk(created_by)
+
+        rows = list(rows)
+        errors: Dict[int, List[str]] = {}
+
+        def reject(index, message):
+            errors.setdefault(index, []).append(message)
+
+        normalized = []
+        for index, row in enumerate(rows):
+            try:
+                string_uuid = _as_uuid(row.get('string_uuid')) or uuid.uuid4()
+                parent_uuid = _as_uuid(row.get('parent_uuid'))
+            except (TypeError, ValueError, AttributeError):
+                reject(index, "Invalid UUID")
+                string_uuid, parent_uuid = uuid.uuid4(), None
+            normalized.append({
+                'rule_id': _pk(row.get('rule')),
+                'entity_id': _pk(row.get('entity')),
+                'submission_id': _pk(row.get('submission')),
+                'parent_id': _pk(row.get('parent')),
+                'parent_uuid': parent_uuid,
+                'string_uuid': string_uuid,
+                'value': row.get('value'),
+                'is_auto_generated': row.get('is_auto_generated', False),
+                'generation_metadata': row.get('generation_metadata') or {},
+                'details': row.get('details') or [],
+            })
+
+        # Rules and entities: one query each
+        rule_ids = {row['rule_id'] for row in normalized if row['rule_id']}
+        entity_ids = {row['entity_id'] for row in normalized if row['entity_id']}
+        rules = {
+            rule.id: rule for rule in
+            Rule.objects.for_workspace(workspace_id).filter(id__in=rule_ids)
+        }
+        entities = {
+            entity.id: entity for entity in Entity.objects.filter(id__in=entity_ids)
+        }
+
+        value_index = get_workspace_value_index(workspace_id)
+
+        for index, row in enumerate(normalized):
+            rule = rules.get(row['rule_id'])
+            if rule is None:
+                reject(index, f"Rule {row['rule_id']} not found in workspace")
+            entity = entities.get(row['entity_id'])
+            if entity is None:
+                reject(index, f"Entity {row['entity_id']} not found")
+            elif rule is not None and rule.platform_id != entity.platform_id:
+                reject(index, "Rule and entity must belong to the same platform")
+
+            detail_errors, details = BulkIngestService._validate_details(
+                row['details'], value_index)
+            for message in detail_errors:
+                reject(index, message)
+            row['details'] = details
+
+            if not row['value'] and details and index not in errors:
+                try:
+                    row['value'] = BulkIngestService._render_value(
+                        rule, entity, details, value_index)
+                except NamingConventionError as e:
+                    reject(index, str(e))
+
+            if not row['value'] or not str(row['value']).strip():
+                reject(index, "String value cannot be empty")
+            elif len(str(row['value'])) > STRING_VALUE_LENGTH:
+                reject(index, f"String value cannot be longer than {STRING_VALUE_LENGTH} characters")
+
+        # Intra-batch duplicates of string_uuid and of the conflict key
+        seen_uuids: Dict[uuid.UUID, int] = {}
+        seen_keys: Dict[Tuple[int, int, str], int] = {}
+        for index, row in enumerate(normalized):
+            if row['string_uuid'] in seen_uuids:
+                reject(index, f"Duplicate string_uuid {row['string_uuid']} in batch")
+            else:
+                seen_uuids[row['string_uuid']] = index
+            key = (row['rule_id'], row['entity_id'], row['value'])
+            if key in seen_keys:
+                reject(index, f"Duplicate string value '{row['value']}' in batch (row {seen_keys[key]})")
+            else:
+                seen_keys[key] = index
+
+        # Conflicts with existing strings (same check as String.check_naming_conflicts)
+        existing_keys = BulkIngestService._existing_conflict_keys(
+            workspace_id, list(seen_keys.keys()))
+        for index, row in enumerate(normalized):
+            if (row['rule_id'], row['entity_id'], row['value']) in existing_keys:
+                reject(index, f"Duplicate string value '{row['value']}' exists in this workspace")
+
+        levels = BulkIngestService._resolve_parents(
+            String.objects.for_workspace(workspace_id), normalized, seen_uuids, reject, errors)
+
+        created_by_index: Dict[int, String] = {}
+        details_created = 0
+
+        with transaction.atomic():
+            for level_indexes in levels:
+                objects = []
+                object_indexes = []
+                for index in level_indexes:
+                    if index in errors:
+                        continue
+                    row = normalized[index]
+                    parent_index = row.get('parent_index')
+                    if parent_index is not None:
+                        parent = created_by_index.get(parent_index)
+                        if parent is None:
+                            reject(index, f"Parent row {parent_index} was rejected")
+                            continue
+                        row['parent_id'] = parent.id
+                        row['parent_path'] = (parent.ancestor_path, parent.depth)
+                    if row['parent_id']:
+                        ancestor_path, depth = child_hierarchy_path(
+                            *row['parent_path'], row['parent_id'])
+                    else:
+                        ancestor_path, depth = HIERARCHY_PATH_SEPARATOR, 0
+                    objects.append(String(
+                        workspace_id=workspace_id,
+                        rule_id=row['rule_id'],
+                        entity_id=row['entity_id'],
+                        submission_id=row['submission_id'],
+                        parent_id=row['parent_id'],
+                        parent_uuid=row['parent_uuid'] if row['parent_id'] else None,
+                        string_uuid=row['string_uuid'],
+                        value=row['value'],
+                        is_auto_generated=row['is_auto_generated'],
+                        generation_metadata=row['generation_metadata'],
+                        created_by_id=created_by_id,
+                        ancestor_path=ancestor_path,
+                        depth=depth,
+                    ))
+                    object_indexes.append(index)
+
+                String.objects.bulk_create(objects, batch_size=chunk_size)
+                bump_search_index_version(String, workspace_id)
+                for index, obj in zip(object_indexes, objects):
+                    created_by_index[index] = obj
+
+            detail_objects = [
+                StringDetail(
+                    workspace_id=workspace_id,
+                    string_id=string.id,
+                    dimension_id=dimension_id,
+                    dimension_value_id=dimension_value_id,
+                    dimension_value_freetext=freetext,
+                    created_by_id=created_by_id,
+                )
+                for index, string in created_by_index.items()
+                for dimension_id, dimension_value_id, freetext in normalized[index]['details']
+            ]
+            StringDetail.objects.bulk_create(detail_objects, batch_size=chunk_size)
+            details_created = len(detail_objects)
+
+        created = [created_by_index[index] for index in sorted(created_by_index)]
+        error_list = [
+            {'index': index, 'errors': messages}
+            for index, messages in sorted(errors.items())
+        ]
+
+        logger.info(
+            f"Bulk ingested {len(created)} strings ({details_created} details) "
+            f"into workspace {workspace_id}; {len(error_list)} rows rejected "
+            f"in {(time.time() - start_time) * 1000:.0f}ms"
+        )
+
+        return BulkIngestResult(created, error_list, details_created)
+
+    @staticmethod
+    def ingest_string_details(workspace, rows: List[Dict[str, Any]], created_by=None,
+                              chunk_size: int = BULK_INGEST_CHUNK_SIZE) -> BulkIngestResult:
+        """
+        Validate and create many string details for existing strings.
+
+        Each row accepts: string (instance or ID), dimension, dimension_value
+        and dimension_value_freetext. Rows that duplicate an existing
+        (string, dimension) detail are rejected.
+        """
+        start_time = time.time()
+        workspace_id = _pk(workspace)
+        if workspace_id is None:
+            raise BulkIngestError("Workspace is required")
+        created_by_id = _pk(created_by)
+
+        rows = list(rows)
+        errors: Dict[int, List[str]] = {}
+        value_index = get_workspace_value_index(workspace_id)
+
+        string_ids = list({_pk(row.get('string')) for row in rows if _pk(row.get('string'))})
+        known_strings: Set[int] = set()
+        for chunk in _chunks(string_ids, BULK_INGEST_LOOKUP_CHUNK_SIZE):
+            known_strings.update(
+                String.objects.for_workspace(workspace_id)
+                .filter(id__in=chunk).values_list('id', flat=True)
+            )
+
+        existing: Set[Tuple[int, int]] = set()
+        for chunk in _chunks(string_ids, BULK_INGEST_LOOKUP_CHUNK_SIZE):
+            existing.update(
+                StringDetail.objects.for_workspace(workspace_id)
+                .filter(string_id__in=chunk).values_list('string_id', 'dimension_id')
+            )
+
+        objects = []
+        for index, row in enumerate(rows):
+            string_id = _pk(row.get('string'))
+            row_errors, details = BulkIngestService._validate_details([row], value_index)
+            if string_id not in known_strings:
+                row_errors.append(f"String {string_id} not found in workspace")
+            if details:
+                dimension_id, dimension_value_id, freetext = details[0]
+                key = (string_id, dimension_id)
+                if key in existing:
+                    row_errors.append(
+                        f"String {string_id} already has a detail for dimension {dimension_id}")
+            if row_errors:
+                errors[index] = row_errors
+                continue
+            existing.add(key)
+            objects.append(StringDetail(
+                workspace_id=workspace_id,
+                string_id=string_id,
+                dimension_id=dimension_id,
+                dimension_value_id=dimension_value_id,
+                dimension_value_freetext=freetext,
+                created_by_id=created_by_id,
+            ))
+
+        with transaction.atomic():
+            StringDetail.objects.bulk_create(objects, batch_size=chunk_size)
+
+        error_list = [
+            {'index': index, 'errors': messages}
+            for index, messages in sorted(errors.items())
+        ]
+
+        logger.info(
+            f"Bulk ingested {len(objects)} string details into workspace "
+            f"{workspace_id}; {len(error_list)} rows rejected "
+            f"in {(time.time() - start_time) * 1000:.0f}ms"
+        )
+
+        return BulkIngestResult(objects, error_list, len(objects))
+
+    @staticmethod
+    def ingest_project_strings(project, platform, rule, rows: List[Dict[str, Any]],
+                               created_by=None, chunk_size: int = BULK_INGEST_CHUNK_SIZE,
+                               partial: bool = True) -> BulkIngestResult:
+        """
+        Validate and create many project strings with their details.
+
+        Each row accepts: entity (instance or ID), value, string_uuid,
+        parent_uuid and details (a list of {dimension, dimension_value,
+        dimension_value_freetext}).
+
+        Entities, dimension values and parents (from the batch or existing
+        strings of the platform) are preloaded, is_inherited is computed
+        against the parent's details in memory, and both partial unique
+        constraints are checked with one query per lookup chunk. Strings are
+        inserted level by level, then details in chunks. With partial=False
+        nothing is written when any row is invalid.
+        """
+        start_time = time.time()
+        workspace_id = project.workspace_id
+        platform_id = _pk(platform)
+        created_by_id = _pk(created_by)
+        # Keep the user instance on created rows so callers can serialize them
+        creator = {'created_by': created_by} if hasattr(created_by, '_meta') else {}
+
+        rule = rule if isinstance(rule, Rule) else (
+            Rule.objects.for_workspace(workspace_id).filter(id=_pk(rule)).first())
+        if rule is None:
+            raise BulkIngestError("Rule not found in workspace")
+        if not project.platforms.filter(id=platform_id).exists():
+            raise BulkIngestError("Platform must be assigned to this project")
+
+        rows = list(rows)
+        errors: Dict[int, List[str]] = {}
+
+        def reject(index, message):
+            errors.setdefault(index, []).append(message)
+
+        normalized = []
+        for index, row in enumerate(rows):
+            try:
+                string_uuid = _as_uuid(row.get('string_uuid')) or uuid.uuid4()
+                parent_uuid = _as_uuid(row.get('parent_uuid'))
+            except (TypeError, ValueError, AttributeError):
+                reject(index, "Invalid UUID")
+                string_uuid, parent_uuid = uuid.uuid4(), None
+            normalized.append({
+                'entity_id': _pk(row.get('entity')),
+                'parent_id': None,
+                'parent_uuid': parent_uuid,
+                'string_uuid': string_uuid,
+                'value': row.get('value'),
+                'details': row.get('details') or [],
+            })
+
+        entity_ids = {row['entity_id'] for row in normalized if row['entity_id']}
+        entities = {
+            entity.id: entity for entity in Entity.objects.filter(id__in=entity_ids)
+        }
+        value_index = get_workspace_value_index(workspace_id)
+
+        seen_uuids: Dict[uuid.UUID, int] = {}
+        for index, row in enumerate(normalized):
+            entity = entities.get(row['entity_id'])
+            if entity is None:
+                reject(index, f"Entity {row['entity_id']} not found")
+            elif rule.platform_id != entity.platform_id:
+                reject(index, "Rule and entity must belong to the same platform")
+
+            detail_errors, row['details'] = BulkIngestService._validate_details(
+                row['details'], value_index)
+            for message in detail_errors:
+                reject(index, message)
+
+            if not row['value'] or not str(row['value']).strip():
+                reject(index, "String value cannot be empty")
+            elif len(str(row['value'])) > STRING_VALUE_LENGTH:
+                reject(index, f"String value cannot be longer than {STRING_VALUE_LENGTH} characters")
+
+            if row['string_uuid'] in seen_uuids:
+                reject(index, f"Duplicate string_uuid {row['string_uuid']} in batch")
+            else:
+                seen_uuids[row['string_uuid']] = index
+
+        # string_uuid is unique across all workspaces
+        for chunk in _chunks(list(seen_uuids), BULK_INGEST_LOOKUP_CHUNK_SIZE):
+            for string_uuid in ProjectString.objects.all_workspaces().filter(
+                string_uuid__in=chunk
+            ).values_list('string_uuid', flat=True):
+                reject(seen_uuids[string_uuid], f"String UUID {string_uuid} already exists")
+
+        levels = BulkIngestService._resolve_parents(
+            ProjectString.objects.for_workspace(workspace_id).filter(platform_id=platform_id),
+            normalized, seen_uuids, reject, errors)
+
+        # unique_with_parent / unique_without_parent, within the batch ...
+        seen_keys: Dict[Tuple[int, Any, str], int] = {}
+        for index, row in enumerate(normalized):
+            parent_key = row['parent_id'] or (
+                ('row', row['parent_index']) if row['parent_index'] is not None else None)
+            key = (row['entity_id'], parent_key, row['value'])
+            if key in seen_keys:
+                reject(index, f"Duplicate string value '{row['value']}' in batch (row {seen_keys[key]})")
+            else:
+                seen_keys[key] = index
+
+        # ... and against existing strings (rows under new parents cannot collide)
+        existing_keys = BulkIngestService._existing_project_conflict_keys(
+            project, platform_id,
+            [key for key in seen_keys if not isinstance(key[1], tuple)])
+        for index, row in enumerate(normalized):
+            if row['parent_index'] is None and (
+                    (row['entity_id'], row['parent_id'], row['value']) in existing_keys):
+                reject(index, f"Duplicate string value '{row['value']}' exists in this project and platform")
+
+        parent_details = BulkIngestService._project_parent_details(
+            workspace_id, {row['parent_id'] for row in normalized if row['parent_id']})
+
+        if errors and not partial:
+            return BulkIngestResult([], [
+                {'index': index, 'errors': messages}
+                for index, messages in sorted(errors.items())
+            ])
+
+        created_by_index: Dict[int, ProjectString] = {}
+
+        with transaction.atomic():
+            for level_indexes in levels:
+                objects = []
+                object_indexes = []
+                for index in level_indexes:
+                    if index in errors:
+                        continue
+                    row = normalized[index]
+                    parent_index = row.get('parent_index')
+                    if parent_index is not None:
+                        parent = created_by_index.get(parent_index)
+                        if parent is None:
+                            reject(index, f"Parent row {parent_index} was rejected")
+                            continue
+                        row['parent_id'] = parent.id
+                        row['parent_path'] = (parent.ancestor_path, parent.depth)
+                    if row['parent_id']:
+                        ancestor_path, depth = child_hierarchy_path(
+                            *row['parent_path'], row['parent_id'])
+                    else:
+                        ancestor_path, depth = HIERARCHY_PATH_SEPARATOR, 0
+                    objects.append(ProjectString(
+                        workspace_id=workspace_id,
+                        project=project,
+                        platform_id=platform_id,
+                        entity=entities[row['entity_id']],
+                        entity_level=entities[row['entity_id']].entity_level,
+                        rule=rule,
+                        parent_id=row['parent_id'],
+                        parent_uuid=row['parent_uuid'] if row['parent_id'] else None,
+                        string_uuid=row['string_uuid'],
+                        value=row['value'],
+                        created_by_id=created_by_id,
+                        ancestor_path=ancestor_path,
+                        depth=depth,
+                        **creator
+                    ))
+                    object_indexes.append(index)
+
+                ProjectString.objects.bulk_create(objects, batch_size=chunk_size)
+                for index, obj in zip(object_indexes, objects):
+                    created_by_index[index] = obj
+
+            # bulk_create sends no post_save signals
+            bump_search_index_version(ProjectString, workspace_id)
+            if created_by_index:
+                ProjectStats.objects.adjust(project.id, total_strings=len(created_by_index))
+
+            detail_objects = []
+            for index, string in created_by_index.items():
+                row = normalized[index]
+                if row['parent_index'] is not None:
+                    inherited_from = {
+                        dimension_id: (dimension_value_id, freetext)
+                        for dimension_id, dimension_value_id, freetext
+                        in normalized[row['parent_index']]['details']
+                    }
+                else:
+                    inherited_from = parent_details.get(row['parent_id'], {})
+                for dimension_id, dimension_value_id, freetext in row['details']:
+                    parent_value = inherited_from.get(dimension_id)
+                    detail_objects.append(ProjectStringDetail(
+                        workspace_id=workspace_id,
+                        string=string,
+                        dimension_id=dimension_id,
+                        dimension_value_id=dimension_value_id,
+                        dimension_value_freetext=freetext,
+                        is_inherited=parent_value is not None and bool(
+                            (dimension_value_id and parent_value[0] == dimension_value_id)
+                            or (freetext and parent_value[1] == freetext)
+                        ),
+                        created_by_id=created_by_id,
+                    ))
+            ProjectStringDetail.objects.bulk_create(detail_objects, batch_size=chunk_size)
+
+        created = [created_by_index[index] for index in sorted(created_by_index)]
+        error_list = [
+            {'index': index, 'errors': messages}
+            for index, messages in sorted(errors.items())
+        ]
+
+        logger.info(
+            f"Bulk ingested {len(created)} project strings ({len(detail_objects)} details) "
+            f"into project {project.id}, platform {platform_id}; {len(error_list)} rows "
+            f"rejected in {(time.time() - start_time) * 1000:.0f}ms"
+        )
+
+        return BulkIngestResult(created, error_list, len(detail_objects))
+
+    @staticmethod
+    def update_project_strings(project, platform, rows: List[Dict[str, Any]],
+                               updated_by=None, chunk_size: int = BULK_INGEST_CHUNK_SIZE,
+                               partial: bool = True) -> BulkUpdateResult:
+        """
+        Validate and apply many project string updates.
+
+        Each row accepts: id (required), value and details (a list of
+        {dimension, dimension_value, dimension_value_freetext} that replaces
+        the string's details). Omitted fields are left unchanged.
+
+        The targeted strings and their details are loaded with one query
+        each, rows are validated in memory, uniqueness of changed values is
+        checked with one query per lookup chunk, and the writes are one
+        bulk_update for strings plus one delete, bulk_update and bulk_create
+        for details. A value may not move onto the current value of another
+        string, including one renamed in the same batch; swaps take two
+        requests. With partial=False nothing is written when any row is
+        invalid.
+        """
+        start_time = time.time()
+        workspace_id = project.workspace_id
+        platform_id = _pk(platform)
+        updated_by_id = _pk(updated_by)
+
+        rows = list(rows)
+        errors: Dict[int, List[str]] = {}
+
+        def reject(index, message):
+            errors.setdefault(index, []).append(message)
+
+        string_ids: Dict[int, int] = {}
+        for index, row in enumerate(rows):
+            try:
+                string_id = int(row.get('id'))
+            except (TypeError, ValueError):
+                reject(index, "Missing string ID")
+                continue
+            if string_id in string_ids:
+                reject(index, f"Duplicate update for string {string_id} (row {string_ids[string_id]})")
+            else:
+                string_ids[string_id] = index
+
+        strings: Dict[int, Dict[str, Any]] = {}
+        details: Dict[int, Dict[int, Dict[str, Any]]] = {}
+        for chunk in _chunks(list(string_ids), BULK_INGEST_LOOKUP_CHUNK_SIZE):
+            strings.update(
+                (row['id'], row) for row in ProjectString.objects.for_workspace(workspace_id).filter(
+                    project=project, platform_id=platform_id, id__in=chunk
+                ).values('id', 'entity_id', 'parent_id', 'value')
+            )
+            for detail in ProjectStringDetail.objects.for_workspace(workspace_id).filter(
+                string_id__in=chunk
+            ).values('id', 'string_id', 'dimension_id', 'dimension_value_id',
+                     'dimension_value_freetext', 'is_inherited'):
+                details.setdefault(detail['string_id'], {})[detail['dimension_id']] = detail
+
+        value_index = get_workspace_value_index(workspace_id)
+        changes: Dict[int, Dict[str, Any]] = {}
+        for string_id, index in string_ids.items():
+            string = strings.get(string_id)
+            if string is None:
+                reject(index, "String not found")
+                continue
+            row = rows[index]
+            change = {'value': string['value'], 'details': None}
+
+            if 'value' in row:
+                value = row['value']
+                if not isinstance(value, str) or not value.strip():
+                    reject(index, "String value cannot be empty")
+                elif len(value) > STRING_VALUE_LENGTH:
+                    reject(index, f"String value cannot be longer than {STRING_VALUE_LENGTH} characters")
+                else:
+                    change['value'] = value
+
+            if row.get('details') is not None:
+                if not isinstance(row['details'], list):
+                    reject(index, "details must be a list")
+                else:
+                    detail_errors, change['details'] = BulkIngestService._validate_details(
+                        row['details'], value_index)
+                    for message in detail_errors:
+                        reject(index, message)
+
+            if index not in errors:
+                changes[string_id] = change
+
+        # Changed values must not collide with another string's current
+        # value, nor with another row of the batch
+        renamed = [
+            string_id for string_id, change in changes.items()
+            if change['value'] != strings[string_id]['value']
+        ]
+        claimed: Dict[Tuple[int, Optional[int], str], int] = {}
+        for string_id in renamed:
+            string = strings[string_id]
+            key = (string['entity_id'], string['parent_id'], changes[string_id]['value'])
+            if key in claimed:
+                reject(string_ids[string_id],
+                       f"Duplicate string value '{key[2]}' in batch (row {string_ids[claimed[key]]})")
+            else:
+                claimed[key] = string_id
+        for chunk in _chunks(list(claimed), BULK_INGEST_LOOKUP_CHUNK_SIZE):
+            for existing_id, entity_id, parent_id, value in (
+                ProjectString.objects.for_workspace(workspace_id).filter(
+                    project=project,
+                    platform_id=platform_id,
+                    entity_id__in={key[0] for key in chunk},
+                    value__in={key[2] for key in chunk},
+                ).values_list('id', 'entity_id', 'parent_id', 'value')
+            ):
+                string_id = claimed.get((entity_id, parent_id, value))
+                if string_id is not None and string_id != existing_id:
+                    reject(string_ids[string_id],
+                           f"Duplicate string value '{value}' exists in this project and platform")
+
+        for string_id in list(changes):
+            if string_ids[string_id] in errors:
+                del changes[string_id]
+
+        if errors and not partial:
+            return BulkUpdateResult([], BulkIngestService._update_errors(rows, errors))
+
+        # is_inherited compares with the parent's details as they will be
+        # after this batch
+        parent_ids = {
+            strings[string_id]['parent_id'] for string_id, change in changes.items()
+            if change['details'] is not None and strings[string_id]['parent_id']
+        }
+        parent_details = BulkIngestService._project_parent_details(
+            workspace_id, parent_ids - set(changes))
+        for parent_id in parent_ids & set(changes):
+            if changes[parent_id]['details'] is not None:
+                parent_details[parent_id] = {
+                    dimension_id: (dimension_value_id, freetext)
+                    for dimension_id, dimension_value_id, freetext in changes[parent_id]['details']
+                }
+            else:
+                parent_details[parent_id] = {
+                    dimension_id: (detail['dimension_value_id'], detail['dimension_value_freetext'])
+                    for dimension_id, detail in details.get(parent_id, {}).items()
+                }
+
+        now = timezone.now()
+        string_objects = []
+        detail_updates = []
+        detail_creates = []
+        detail_deletes = []
+        for string_id, change in changes.items():
+            string_objects.append(ProjectString(id=string_id, value=change['value'], last_updated=now))
+            if change['details'] is None:
+                continue
+
+            current = details.get(string_id, {})
+            inherited_from = parent_details.get(strings[string_id]['parent_id'], {})
+            for dimension_id, dimension_value_id, freetext in change['details']:
+                parent_value = inherited_from.get(dimension_id)
+                is_inherited = parent_value is not None and bool(
+                    (dimension_value_id and parent_value[0] == dimension_value_id)
+                    or (freetext and parent_value[1] == freetext)
+                )
+                existing = current.pop(dimension_id, None)
+                if existing is None:
+                    detail_creates.append(ProjectStringDetail(
+                        workspace_id=workspace_id,
+                        string_id=string_id,
+                        dimension_id=dimension_id,
+                        dimension_value_id=dimension_value_id,
+                        dimension_value_freetext=freetext,
+                        is_inherited=is_inherited,
+                        created_by_id=updated_by_id,
+                    ))
+                elif (existing['dimension_value_id'], existing['dimension_value_freetext'],
+                      existing['is_inherited']) != (dimension_value_id, freetext, is_inherited):
+                    detail_updates.append(ProjectStringDetail(
+                        id=existing['id'],
+                        dimension_value_id=dimension_value_id,
+                        dimension_value_freetext=freetext,
+                        is_inherited=is_inherited,
+                        last_updated=now,
+                    ))
+            detail_deletes.extend(detail['id'] for detail in current.values())
+
+        with transaction.atomic():
+            ProjectString.objects.bulk_update(
+                string_objects, ['value', 'last_updated'], batch_size=chunk_size)
+            for chunk in _chunks(detail_deletes, chunk_size):
+                # The strings' last_updated is set above, so the per-detail
+                # post_delete receiver that would touch them is skipped
+                ProjectStringDetail.objects.all_workspaces().filter(id__in=chunk)._raw_delete(
+                    ProjectStringDetail.objects.db)
+            ProjectStringDetail.objects.bulk_update(
+                detail_updates,
+                ['dimension_value', 'dimension_value_freetext', 'is_inherited', 'last_updated'],
+                batch_size=chunk_size)
+            ProjectStringDetail.objects.bulk_create(detail_creates, batch_size=chunk_size)
+
+            # bulk_update sends no post_save signals
+            if renamed:
+                bump_search_index_version(ProjectString, workspace_id)
+
+        updated = [
+            {'id': obj.id, 'value': obj.value, 'last_updated': now}
+            for obj in sorted(string_objects, key=lambda obj: string_ids[obj.id])
+        ]
+        details_written = len(detail_deletes) + len(detail_updates) + len(detail_creates)
+
+        logger.info(
+            f"Bulk updated {len(updated)} project strings ({details_written} detail writes) "
+            f"in project {project.id}, platform {platform_id}; {len(errors)} rows rejected "
+            f"in {(time.time() - start_time) * 1000:.0f}ms"
+        )
+
+        return BulkUpdateResult(updated, BulkIngestService._update_errors(rows, errors), details_written)
+
+    @staticmethod
+    def _update_errors(rows: List[Dict[str, Any]], errors: Dict[int, List[str]]) -> List[Dict[str, Any]]:
+        return [
+            {'index': index, 'string_id': rows[index].get('id'), 'errors': messages}
+            for index, messages in sorted(errors.items())
+        ]
+
+    @staticmethod
+    def _validate_details(details: List[Dict[str, Any]], value_index: WorkspaceValueIndex):
+        """
+        Validate detail dicts against the value index.
+
+        Returns (errors, [(dimension_id, dimension_value_id, freetext), ...]).
+        """
+        errors = []
+        normalized = []
+        seen_dimensions = set()
+
+        for detail in details:
+            dimension_id = _pk(detail.get('dimension'))
+            dimension_value_id = _pk(detail.get('dimension_value'))
+            freetext = detail.get('dimension_value_freetext') or None
+
+            entry = value_index.get_dimension(dimension_id) if dimension_id else None
+            if entry is None:
+                errors.append(f"Dimension {dimension_id} not found in workspace")
+                continue
+            if not dimension_value_id and not freetext:
+                errors.append(
+                    f"Either dimension value or freetext value must be provided for dimension '{entry.name}'")
+                continue
+            if dimension_value_id and freetext:
+                errors.append(
+                    f"Cannot specify both dimension value and freetext value for dimension '{entry.name}'")
+                continue
+            if freetext and len(str(freetext)) > FREETEXT_LENGTH:
+                errors.append(
+                    f"Freetext value for dimension '{entry.name}' cannot be longer than "
+                    f"{FREETEXT_LENGTH} characters")
+                continue
+            if dimension_value_id and dimension_value_id not in entry.value_ids:
+                errors.append(
+                    f"Dimension value {dimension_value_id} does not belong to dimension '{entry.name}'")
+                continue
+            if dimension_id in seen_dimensions:
+                errors.append(f"Duplicate detail for dimension '{entry.name}'")
+                continue
+
+            seen_dimensions.add(dimension_id)
+            normalized.append((dimension_id, dimension_value_id, freetext))
+
+        return errors, normalized
+
+    @staticmethod
+    def _render_value(rule, entity, details, value_index: WorkspaceValueIndex) -> str:
+        """Generate a string value from validated details."""
+        template = get_naming_template(rule, entity)
+
+        dimension_values = {}
+        for dimension_id, dimension_value_id, freetext in details:
+            entry = value_index.by_id[dimension_id]
+            if dimension_value_id:
+                dimension_values[entry.name] = entry.values_by_id[dimension_value_id]
+            else:
+                dimension_values[entry.name] = freetext
+
+        return template.render(dimension_values)
+
+    @staticmethod
+    def _existing_conflict_keys(workspace_id: int, keys: List[Tuple[int, int, str]]) -> Set[Tuple[int, int, str]]:
+        """Return the (rule_id, entity_id, value) keys that already exist."""
+        existing = set()
+        for chunk in _chunks(keys, BULK_INGEST_LOOKUP_CHUNK_SIZE):
+            existing.update(
+                String.objects.for_workspace(workspace_id).filter(
+                    rule_id__in={key[0] for key in chunk},
+                    entity_id__in={key[1] for key in chunk},
+                    value__in={key[2] for key in chunk},
+                ).values_list('rule_id', 'entity_id', 'value')
+            )
+        return existing
+
+    @staticmethod
+    def _existing_project_conflict_keys(project, platform_id: int,
+                                        keys: List[Tuple[int, Optional[int], str]]) -> Set[Tuple[int, Optional[int], str]]:
+        """
+        Return the (entity_id, parent_id, value) keys that already exist.
+
+        parent_id is None for root strings, so one query covers both the
+        unique_with_parent and unique_without_parent constraints.
+        """
+        existing = set()
+        for chunk in _chunks(keys, BULK_INGEST_LOOKUP_CHUNK_SIZE):
+            existing.update(
+                ProjectString.objects.for_workspace(project.workspace_id).filter(
+                    project=project,
+                    platform_id=platform_id,
+                    entity_id__in={key[0] for key in chunk},
+                    value__in={key[2] for key in chunk},
+                ).values_list('entity_id', 'parent_id', 'value')
+            )
+        return existing
+
+    @staticmethod
+    def _project_parent_details(workspace_id: int, parent_ids: Set[int]) -> Dict[int, Dict[int, Tuple]]:
+        """Return {parent_id: {dimension_id: (dimension_value_id, freetext)}}."""
+        details: Dict[int, Dict[int, Tuple]] = {}
+        for chunk in _chunks(list(parent_ids), BULK_INGEST_LOOKUP_CHUNK_SIZE):
+            for string_id, dimension_id, dimension_value_id, freetext in (
+                ProjectStringDetail.objects.for_workspace(workspace_id)
+                .filter(string_id__in=chunk)
+                .values_list('string_id', 'dimension_id', 'dimension_value_id',
+                             'dimension_value_freetext')
+            ):
+                details.setdefault(string_id, {})[dimension_id] = (dimension_value_id, freetext)
+        return details
+
+    @staticmethod
+    def _resolve_parents(parent_queryset, rows: List[Dict[str, Any]],
+                         batch_uuids: Dict[uuid.UUID, int], reject, errors) -> List[List[int]]:
+        """
+        Resolve parent references and group row indexes by insertion level.
+
+        Parents inside the batch are recorded as parent_index and inserted
+        in an earlier level; other parents are looked up in parent_queryset
+        (the strings a row may be attached to).
+        """
+        external_uuids = list({
+            row['parent_uuid'] for row in rows
+            if row['parent_uuid'] and not row['parent_id'] and row['parent_uuid'] not in batch_uuids
+        })
+        parent_ids = list({row['parent_id'] for row in rows if row['parent_id']})
+
+        ids_by_uuid: Dict[uuid.UUID, int] = {}
+        uuids_by_id: Dict[int, uuid.UUID] = {}
+        paths_by_id: Dict[int, Tuple[str, int]] = {}
+        lookups = [('string_uuid__in', chunk) for chunk in _chunks(external_uuids, BULK_INGEST_LOOKUP_CHUNK_SIZE)]
+        lookups += [('id__in', chunk) for chunk in _chunks(parent_ids, BULK_INGEST_LOOKUP_CHUNK_SIZE)]
+        for lookup, chunk in lookups:
+            for parent_id, string_uuid, ancestor_path, depth in (
+                parent_queryset.filter(**{lookup: chunk})
+                .values_list('id', 'string_uuid', 'ancestor_path', 'depth')
+            ):
+                if lookup == 'id__in':
+                    uuids_by_id[parent_id] = string_uuid
+                else:
+                    ids_by_uuid[string_uuid] = parent_id
+                paths_by_id[parent_id] = (ancestor_path, depth)
+
+        for index, row in enumerate(rows):
+            row['parent_index'] = None
+            if row['parent_id']:
+                if row['parent_id'] not in uuids_by_id:
+                    reject(index, f"Parent string {row['parent_id']} not found in workspace")
+                else:
+                    row['parent_uuid'] = uuids_by_id[row['parent_id']]
+            elif row['parent_uuid']:
+                if row['parent_uuid'] in batch_uuids:
+                    row['parent_index'] = batch_uuids[row['parent_uuid']]
+                elif row['parent_uuid'] in ids_by_uuid:
+                    row['parent_id'] = ids_by_uuid[row['parent_uuid']]
+                else:
+                    reject(index, f"Parent string {row['parent_uuid']} not found")
+            if row['parent_id']:
+                row['parent_path'] = paths_by_id.get(row['parent_id'])
+
+        # Depth of each row within the batch; cycles are rejected
+        depths: Dict[int, int] = {}
+        for index in range(len(rows)):
+            path = []
+            on_path = set()
+            current = index
+            while current is not None and current not in depths:
+                if current in on_path:
+                    for cycle_index in path[path.index(current):]:
+                        reject(cycle_index, "Parent cycle in batch")
+                        depths[cycle_index] = 0
+                    break
+                path.append(current)
+                on_path.add(current)
+                current = rows[current]['parent_index']
+            base = depths.get(current, -1) if current is not None else -1
+            for offset, path_index in enumerate(reversed(path)):
+                depths.setdefault(path_index, base + offset + 1)
+
+        levels: List[List[int]] = [[] for _ in range(max(depths.values(), default=-1) + 1)]
+        for index, depth in depths.items():
+            levels[depth].append(index)
+        for level in levels:
+            level.sort()
+        return levels
@@ -0,0 +1,301 @@
+"""
+Queueing and processing of background bulk string jobs.
+
+Views enqueue large bulk create, bulk update and multi-operation requests
+as BulkStringJob rows; the run_bulk_string_jobs management command claims
+them and processes project string rows in chunks of job.chunk_size. Every
+chunk is committed in one transaction together with its results and the
+job's progress, so progress and partial results are visible while the job
+runs and an interrupted job resumes after its last committed chunk.
+Multi-operations keep their all-or-nothing contract and run as one chunk.
+"""
+
+import logging
+import os
+import socket
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import F, Q, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from ..models import (
+    BulkStringJob, BulkStringJobChunk, ProjectActivity, ProjectString, Rule
+)
+from ..models import BulkStringJobOperationChoices as Operations
+from ..models import BulkStringJobStatusChoices as Statuses
+from ..models.base import set_current_workspace
+from .bulk_ingest_service import BulkIngestError
+from .constants import BULK_JOB_AUTO_ASYNC_ROWS, BULK_JOB_CHUNK_SIZE, BULK_JOB_STALE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class BulkJobCancelled(Exception):
+    """Raised inside a chunk transaction when the job lost its claim or was cancelled."""
+    pass
+
+
+def default_worker_name() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class BulkJobService:
+    """Enqueue, claim and process BulkStringJob rows."""
+
+    @staticmethod
+    def wants_async(query_params, row_count: int) -> bool:
+        """
+        Whether a bulk request should run as a job.
+
+        ?async=true / ?async=false force the mode; otherwise requests with
+        more than BULK_JOB_AUTO_ASYNC_ROWS rows are queued.
+        """
+        value = str(query_params.get('async', '')).lower()
+        if value in ('1', 'true', 'yes'):
+            return True
+        if value in ('0', 'false', 'no'):
+            return False
+        return row_count > BULK_JOB_AUTO_ASYNC_ROWS
+
+    @staticmethod
+    def enqueue(workspace_id: int, operation: str, payload: Dict[str, Any], total_rows: int,
+                user=None, project=None, platform=None,
+                chunk_size: int = BULK_JOB_CHUNK_SIZE) -> BulkStringJob:
+        """Store a bulk request for the worker."""
+        return BulkStringJob.objects.create(
+            workspace_id=workspace_id,
+            operation=operation,
+            payload=payload,
+            total_rows=total_rows,
+            project=project,
+            platform=platform,
+            triggered_by=user if getattr(user, 'is_authenticated', False) else None,
+            chunk_size=chunk_size,
+        )
+
+    @staticmethod
+    def job_summary(job: BulkStringJob) -> Dict[str, Any]:
+        """Body of the 202 response returned when a request is queued."""
+        return {
+            'job_id': str(job.job_id),
+            'status': job.status,
+            'operation': job.operation,
+            'total_rows': job.total_rows,
+        }
+
+    @staticmethod
+    def claim_next(worker: str, job_id=None) -> Optional[BulkStringJob]:
+        """
+        Claim the oldest pending job, or a running job whose worker went silent.
+
+        Claims are conditional UPDATEs, so concurrent workers never process
+        the same job.
+        """
+        now = timezone.now()
+        stale = now - timedelta(seconds=BULK_JOB_STALE_SECONDS)
+        candidates = BulkStringJob.objects.all_workspaces().filter(
+            Q(status=Statuses.PENDING)
+            | Q(status=Statuses.RUNNING, heartbeat_at__lt=stale)
+        )
+        if job_id is not None:
+            candidates = candidates.filter(job_id=job_id)
+
+        for candidate_id, candidate_status, heartbeat_at in candidates.order_by(
+            'created', 'id'
+        ).values_list('id', 'status', 'heartbeat_at')[:10]:
+            claimed = BulkStringJob.objects.all_workspaces().filter(
+                id=candidate_id, status=candidate_status, heartbeat_at=heartbeat_at
+            ).update(
+                status=Statuses.RUNNING,
+                worker=worker,
+                heartbeat_at=now,
+                started_at=Coalesce(F('started_at'), Value(now)),
+            )
+            if claimed:
+                return BulkStringJob.objects.all_workspaces().get(id=candidate_id)
+        return None
+
+    @staticmethod
+    def cancel(job: BulkStringJob) -> bool:
+        """Cancel a pending or running job; committed chunks are kept."""
+        cancelled = BulkStringJob.objects.all_workspaces().filter(
+            id=job.id, status__in=[Statuses.PENDING, Statuses.RUNNING]
+        ).update(status=Statuses.CANCELLED, completed_at=timezone.now())
+        return bool(cancelled)
+
+    @staticmethod
+    def run(job: BulkStringJob) -> BulkStringJob:
+        """Process a claimed job to the end (or until it is cancelled)."""
+        set_current_workspace(job.workspace_id)
+        try:
+            if job.operation == Operations.MULTI_OPERATIONS:
+                BulkJobService._run_multi_operations(job)
+            else:
+                BulkJobService._run_project_strings(job)
+        except BulkJobCancelled:
+            logger.info(f"Bulk job {job.job_id} stopped: cancelled or claimed by another worker")
+        except Exception as e:
+            # SECURITY: Log details; only validation errors are shown to clients
+            logger.error(f"Bulk job {job.job_id} failed: {e}", exc_info=True)
+            if isinstance(e, ValidationError):
+                details = e.detail if isinstance(e.detail, list) else [e.detail]
+                message = '; '.join(str(detail) for detail in details)
+            elif isinstance(e, BulkIngestError):
+                message = str(e)
+            else:
+                message = 'Bulk job failed. Please check the submitted data and try again.'
+            BulkStringJob.objects.all_workspaces().filter(
+                id=job.id, worker=job.worker, status=Statuses.RUNNING
+            ).update(
+                status=Statuses.FAILED, error_message=message, completed_at=timezone.now())
+        finally:
+            set_current_workspace(None)
+        job.refresh_from_db()
+        return job
+
+    @staticmethod
+    def _run_project_strings(job: BulkStringJob):
+        rows = job.payload.get('strings' if job.operation == Operations.PROJECT_STRINGS_CREATE
+                               else 'updates') or []
+        order = BulkJobService._processing_order(job.operation, rows)
+        process_chunk = BulkJobService._chunk_processor(job, rows)
+
+        position = job.chunks.count()
+        while job.next_row < len(order):
+            chunk_indexes = order[job.next_row:job.next_row + job.chunk_size]
+            with transaction.atomic():
+                results, errors = process_chunk(chunk_indexes)
+                BulkJobService._commit_progress(job, position, chunk_indexes, results, errors)
+            job.next_row += len(chunk_indexes)
+            position += 1
+
+        BulkJobService._finish(job)
+
+    @staticmethod
+    def _run_multi_operations(job: BulkStringJob):
+        from ..serializers.batch_operations import MultiOperationSerializer
+
+        with transaction.atomic():
+            serializer = MultiOperationSerializer(data=job.payload)
+            serializer.is_valid(raise_exception=True)
+            result = serializer.execute(job.workspace_id, job.triggered_by)
+            BulkJobService._commit_progress(
+                job, 0, list(range(job.total_rows)), [result], [])
+        job.next_row = job.total_rows
+        BulkJobService._finish(job)
+
+    @staticmethod
+    def _commit_progress(job: BulkStringJob, position: int, chunk_indexes: List[int],
+                         results: List[Dict[str, Any]], errors: List[Dict[str, Any]]):
+        """
+        Store a chunk's results and advance the job, inside the chunk's transaction.
+
+        Raises BulkJobCancelled (rolling the chunk back) when the job is no
+        longer running under this worker.
+        """
+        advanced = BulkStringJob.objects.all_workspaces().filter(
+            id=job.id, worker=job.worker, status=Statuses.RUNNING
+        ).update(
+            next_row=F('next_row') + len(chunk_indexes),
+            processed_rows=F('processed_rows') + (len(chunk_indexes) - len(errors)),
+            failed_rows=F('failed_rows') + len(errors),
+            heartbeat_at=timezone.now(),
+        )
+        if not advanced:
+            raise BulkJobCancelled()
+        BulkStringJobChunk.objects.create(
+            job=job, position=position, row_count=len(chunk_indexes),
+            results=results, errors=errors)
+
+    @staticmethod
+    def _finish(job: BulkStringJob):
+        job.refresh_from_db()
+        status = Statuses.PARTIAL_FAILURE if job.failed_rows else Statuses.COMPLETED
+        finished = BulkStringJob.objects.all_workspaces().filter(
+            id=job.id, worker=job.worker, status=Statuses.RUNNING
+        ).update(status=status, completed_at=timezone.now())
+        if not finished or job.project_id is None:
+            return
+
+        verb = 'created' if job.operation == Operations.PROJECT_STRINGS_CREATE else 'updated'
+        ProjectActivity.objects.create(
+            project_id=job.project_id,
+            user=job.triggered_by,
+            type='strings_generated',
+            description=f"bulk {verb} {job.processed_rows} strings for {job.platform.name}",
+            metadata={
+                'platform_id': job.platform_id,
+                'job_id': str(job.job_id),
+                f'{verb}_count': job.processed_rows,
+                'error_count': job.failed_rows,
+            }
+        )
+
+    @staticmethod
+    def _processing_order(operation: str, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        Row indexes in processing order.
+
+        Created strings are ordered parents first (by depth within the
+        payload), so a child is never in an earlier chunk than its parent.
+        """
+        if operation != Operations.PROJECT_STRINGS_CREATE:
+            return list(range(len(rows)))
+
+        index_by_uuid = {
+            str(row.get('string_uuid')): index
+            for index, row in enumerate(rows) if row.get('string_uuid')
+        }
+        depths: Dict[int, int] = {}
+        for index in range(len(rows)):
+            chain = []
+            current = index
+            while current is not None and current not in depths and len(chain) <= len(rows):
+                chain.append(current)
+                current = index_by_uuid.get(str(rows[current].get('parent_uuid')))
+            depth = depths.get(current, -1) if current is not None else -1
+            for member in reversed(chain):
+                depth += 1
+                depths[member] = depth
+        return sorted(range(len(rows)), key=lambda index: (depths[index], index))
+
+    @staticmethod
+    def _chunk_processor(job: BulkStringJob, rows: List[Dict[str, Any]]):
+        """Return process(chunk_indexes) -> (results, errors) for a project string job."""
+        project, platform, user = job.project, job.platform, job.triggered_by
+
+        if job.operation == Operations.PROJECT_STRINGS_CREATE:
+            rule = Rule.objects.for_workspace(job.workspace_id).get(id=job.payload['rule'])
+
+            def process(chunk_indexes: List[int]) -> Tuple[List, List]:
+                result = ProjectString.objects.bulk_ingest(
+                    project, platform, rule, [rows[index] for index in chunk_indexes],
+                    created_by=user, chunk_size=job.chunk_size)
+                rejected = {error['index'] for error in result.errors}
+                accepted = [index for position, index in enumerate(chunk_indexes)
+                            if position not in rejected]
+                results = [
+                    {'index': index, 'id': string.id, 'string_uuid': string.string_uuid}
+                    for index, string in zip(accepted, result.created)
+                ]
+                return results, BulkJobService._payload_errors(chunk_indexes, result.errors)
+            return process
+
+        def process(chunk_indexes: List[int]) -> Tuple[List, List]:
+            result = ProjectString.objects.bulk_edit(
+                project, platform, [rows[index] for index in chunk_indexes],
+                updated_by=user, chunk_size=job.chunk_size)
+            return result.updated, BulkJobService._payload_errors(chunk_indexes, result.errors)
+        return process
+
+    @staticmethod
+    def _payload_errors(chunk_indexes: List[int], errors: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Translate chunk-relative error indexes to payload indexes."""
+        return [
+            {**error, 'index': chunk_indexes[error['index']]}
+            for error in errors
+        ]
@@ -79,6 +79,304 @@ Long cache timeout for rarely changing data.
 Use for data that is very stable and rarely updated.
 """
 
+SHARED_CACHE_ALIAS = 'shared'
+"""
+Name of the cache (in settings.CACHES) shared by all worker processes.
+
+Rule payload caches and their generation counters live here so that an
+invalidation in one worker is seen by every worker. Falls back to the
+'default' cache when the alias is not configured.
+"""
+
+SHARED_CACHE_DATABASE = 'shared_cache'
+"""
+Database alias (in settings.DATABASES) used by the database cache backend.
+
+The alias points at the same database as 'default' without
+ATOMIC_REQUESTS, so shared cache entries and rebuild locks are committed
+when written instead of with the request transaction (see
+master_data.db_routers.SharedCacheRouter). Without the alias the database
+cache uses 'default', as in tests.
+"""
+
+SHARED_GENERATION_CHECK_SECONDS = 5
+"""
+Seconds a worker reuses a shared generation counter it has read.
+
+In-process caches on hot paths (compiled naming templates and name
+parsers, workspace value indexes) are keyed by shared generations too, so
+a change committed in another worker reaches them within this interval
+without a shared cache read per lookup.
+"""
+
+PAYLOAD_CACHE_LOCAL_SIZE = 256
+"""
+Rule payloads kept in each worker's in-process cache.
+
+Rule configuration and complete rule payloads are held (pickled) in a
+bounded LRU in front of the shared cache; the least recently used payload
+is dropped when the limit is reached.
+"""
+
+PAYLOAD_CACHE_LOCAL_TTL_SECONDS = 300  # 5 minutes
+"""
+Seconds a payload is kept in a worker's in-process cache.
+
+Entries are checked against the rule's generation on every read, so this
+bounds memory held by idle rules rather than staleness.
+"""
+
+PAYLOAD_CACHE_LOCK_SECONDS = 30
+"""
+Lifetime of the cross-worker rebuild lock of a rule payload.
+
+Only the worker holding the lock rebuilds a missing payload. The lock
+expires on its own if that worker dies mid-build.
+"""
+
+PAYLOAD_CACHE_WAIT_SECONDS = 5
+"""
+Seconds a request waits for another worker's rebuild of a payload.
+
+Only requests with no older payload to serve wait; after this they build
+the payload themselves.
+"""
+
+RULE_WARM_TOP_N = 20
+"""
+Most-used rules per workspace pre-warmed at startup.
+
+Rules are ranked by their recorded configuration accesses; workspaces with
+fewer recorded rules are topped up with their most recently updated rules.
+"""
+
+RULE_WARM_MAX_RULES = 200
+"""
+Largest number of invalidated rules rebuilt in the background per commit.
+
+Bounds the work a single large write queues on a worker; rules beyond the
+limit are rebuilt by the next request that needs them.
+"""
+
+RULE_ACCESS_FLUSH_SECONDS = 60
+"""
+Seconds a worker batches rule access counts before adding them to the
+shared cache.
+"""
+
+RULE_ACCESS_COUNT_TIMEOUT = 7 * 24 * 60 * 60  # 7 days
+"""
+Lifetime of a workspace's recorded rule access counts in the shared cache.
+
+Refreshed on every flush, so counts are only lost for idle workspaces.
+"""
+
+# ============================================================================
+# IN-PROCESS CACHE SIZES
+# ============================================================================
+
+NAMING_TEMPLATE_CACHE_SIZE = 2048
+"""
+Maximum number of compiled (rule, entity) naming templates kept per process.
+
+Templates are small (one tuple of parts per entity), so this comfortably
+covers every active rule/entity pair of a typical deployment.
+"""
+
+NAME_PARSER_CACHE_SIZE = 256
+"""
+Maximum number of compiled (rule, entity) name parsers kept per process.
+
+Parsers hold a trie of every list value of the rule's dimensions, so they
+are much larger than naming templates and the bound is lower.
+"""
+
+WORKSPACE_VALUE_INDEX_CACHE_SIZE = 64
+"""
+Maximum number of per-workspace dimension value indexes kept per process.
+"""
+
+# ============================================================================
+# NAME PARSING
+# ============================================================================
+
+NAME_PARSER_MAX_ALTERNATIVES = 5
+"""
+Maximum number of alternative decompositions reported for an ambiguous name.
+
+Parsing stops exploring once this many alternatives have been found, which
+bounds the cost of pathological names against patterns without delimiters.
+"""
+
+NAME_PARSER_FREE_TEXT_CONFIDENCE = 0.75
+"""
+Confidence contributed by a free-text part of a parsed name.
+
+List values are confirmed against the dimension's value set and score 1.0;
+free-text values are only delimited by the pattern and score lower. A name's
+confidence is the mean part score divided by the number of decompositions.
+"""
+
+# ============================================================================
+# BATCH LIMITS
+# ============================================================================
+
+BATCH_GENERATION_MAX_ROWS = 10000
+"""
+Maximum number of rows accepted by a single batch generation request.
+
+Batch generation renders every row in memory against one preloaded rule
+snapshot; the cap keeps a single request's payload and response bounded.
+"""
+
+NAME_PARSE_MAX_NAMES = 50000
+"""
+Maximum number of names accepted by a single name parsing request.
+"""
+
+BULK_INGEST_CHUNK_SIZE = 1000
+"""
+Number of rows per INSERT statement in bulk string ingestion.
+"""
+
+BULK_INGEST_LOOKUP_CHUNK_SIZE = 10000
+"""
+Maximum number of keys per lookup query in bulk string ingestion.
+
+Parent and duplicate lookups use IN lists; psycopg 3 binds every element as
+a server-side parameter and PostgreSQL caps a statement at 65535 of them.
+"""
+
+# ============================================================================
+# HIERARCHY LOADING
+# ============================================================================
+
+HIERARCHY_MAX_DEPTH = 100
+"""
+Hard cap on the number of levels loaded below a subtree root.
+
+Bounds the recursive query even if the parent chain contains a cycle.
+"""
+
+HIERARCHY_LOOKUP_CHUNK_SIZE = 10000
+"""
+Maximum number of string IDs per lookup query when loading subtrees.
+"""
+
+# ============================================================================
+# EXPORT
+# ============================================================================
+
+EXPORT_CHUNK_SIZE = 2000
+"""
+Number of strings fetched per query (and per detail lookup) when streaming
+project string exports.
+
+Bounds both memory use and the size of each chunk written to the response.
+"""
+
+TREE_STREAM_BUFFER_SIZE = 64 * 1024
+"""
+Number of characters of a streamed string tree buffered before a chunk is
+written to the response.
+"""
+
+# ============================================================================
+# STRING SEARCH
+# ============================================================================
+
+STRING_SEARCH_DEFAULT_LIMIT = 20
+"""Number of ranked matches returned by a search when no limit is given."""
+
+STRING_SEARCH_MAX_LIMIT = 200
+"""Upper bound on the limit a search request may ask for."""
+
+STRING_SEARCH_SIMILARITY_THRESHOLD = 0.3
+"""
+Minimum trigram similarity of a 'similar' match.
+
+Matches pg_trgm's default similarity_threshold, which bounds what the GIN
+index returns on PostgreSQL.
+"""
+
+STRING_SEARCH_INDEX_CACHE_SIZE = 16
+"""
+Maximum number of in-process n-gram indexes (model, workspace) kept per
+process on backends without pg_trgm.
+"""
+
+STRING_SEARCH_MAX_FILTER_IDS = 10000
+"""
+Largest number of n-gram index matches passed to the database as an ID
+list; larger result sets fall back to an icontains filter.
+"""
+
+# ============================================================================
+# INCREMENTAL SYNC
+# ============================================================================
+
+SYNC_WATERMARK_OVERLAP_SECONDS = 60
+"""
+How far behind the request time a returned sync watermark is set.
+
+last_updated is stamped when a row is saved, not when its transaction
+commits; the overlap re-sends rows from transactions that were still open
+when the previous sync ran. Clients must apply changes idempotently.
+"""
+
+SYNC_TOMBSTONE_RETENTION_DAYS = 90
+"""
+Number of days deletion tombstones are kept.
+
+Watermarks older than this are rejected; the client must run a full export.
+"""
+
+# ============================================================================
+# PROJECT DETAIL SECTIONS
+# ============================================================================
+
+PROJECT_SECTION_PAGE_SIZE = 50
+"""
+Default page size of the project strings and activities sub-resources.
+"""
+
+PROJECT_DETAIL_PREVIEW_SIZE = 20
+"""
+Rows embedded in the project detail response for a section requested with
+?include=; the rest is read from the section's sub-resource.
+"""
+
+# ============================================================================
+# BULK STRING JOBS
+# ============================================================================
+
+BULK_JOB_AUTO_ASYNC_ROWS = 5000
+"""
+Bulk requests with more rows than this run as a background job unless the
+client passes ?async=false.
+"""
+
+BULK_JOB_CHUNK_SIZE = 1000
+"""
+Rows a bulk string job processes and commits per transaction.
+"""
+
+BULK_JOB_POLL_SECONDS = 2
+"""
+How long an idle run_bulk_string_jobs worker sleeps between queue checks.
+"""
+
+BULK_JOB_STALE_SECONDS = 300
+"""
+A running job whose worker has not reported progress for this long is
+considered abandoned and is resumed by the next worker that polls.
+"""
+
+BULK_JOB_RESULTS_PAGE_SIZE = 10
+"""
+Chunks per page of a bulk job's results endpoint.
+"""
+
 # ============================================================================
 # TIME DURATION FORMATTING
 # ============================================================================
@@ -117,4 +415,42 @@ Quick Reference:
 - CACHE_TIMEOUT_SHORT = 300 (5 minutes)
 - CACHE_TIMEOUT_MEDIUM = 3600 (1 hour)
 - CACHE_TIMEOUT_LONG = 86400 (24 hours)
+- SHARED_CACHE_ALIAS = 'shared' (cross-process cache for rule payloads)
+- SHARED_CACHE_DATABASE = 'shared_cache' (autocommit connection of the database cache)
+- SHARED_GENERATION_CHECK_SECONDS = 5 (reuse of a read shared generation)
+- PAYLOAD_CACHE_LOCAL_SIZE = 256 (rule payloads per process)
+- PAYLOAD_CACHE_LOCAL_TTL_SECONDS = 300 (in-process payload lifetime)
+- PAYLOAD_CACHE_LOCK_SECONDS = 30 (cross-worker rebuild lock lifetime)
+- PAYLOAD_CACHE_WAIT_SECONDS = 5 (wait for another worker's rebuild)
+- RULE_WARM_TOP_N = 20 (most-used rules per workspace warmed at startup)
+- RULE_WARM_MAX_RULES = 200 (invalidated rules rebuilt per commit)
+- RULE_ACCESS_FLUSH_SECONDS = 60 (access counts batched per worker)
+- RULE_ACCESS_COUNT_TIMEOUT = 604800 (7 days of recorded access counts)
+- NAMING_TEMPLATE_CACHE_SIZE = 2048 (compiled templates per process)
+- NAME_PARSER_CACHE_SIZE = 256 (compiled name parsers per process)
+- WORKSPACE_VALUE_INDEX_CACHE_SIZE = 64 (value indexes per process)
+- NAME_PARSER_MAX_ALTERNATIVES = 5 (alternatives per ambiguous name)
+- NAME_PARSER_FREE_TEXT_CONFIDENCE = 0.75 (score of a free-text part)
+- BATCH_GENERATION_MAX_ROWS = 10000 (rows per batch generation request)
+- NAME_PARSE_MAX_NAMES = 50000 (names per name parsing request)
+- BULK_INGEST_CHUNK_SIZE = 1000 (rows per bulk INSERT)
+- BULK_INGEST_LOOKUP_CHUNK_SIZE = 10000 (keys per bulk lookup query)
+- HIERARCHY_MAX_DEPTH = 100 (levels loaded below a subtree root)
+- HIERARCHY_LOOKUP_CHUNK_SIZE = 10000 (IDs per subtree lookup query)
+- EXPORT_CHUNK_SIZE = 2000 (strings per streamed export chunk)
+- TREE_STREAM_BUFFER_SIZE = 65536 (characters per streamed tree chunk)
+- STRING_SEARCH_DEFAULT_LIMIT = 20 (ranked matches per search)
+- STRING_SEARCH_MAX_LIMIT = 200 (largest limit a search may request)
+- STRING_SEARCH_SIMILARITY_THRESHOLD = 0.3 (minimum 'similar' score)
+- STRING_SEARCH_INDEX_CACHE_SIZE = 16 (n-gram indexes per process)
+- STRING_SEARCH_MAX_FILTER_IDS = 10000 (n-gram matches passed as an ID list)
+- SYNC_WATERMARK_OVERLAP_SECONDS = 60 (watermark lag behind request time)
+- SYNC_TOMBSTONE_RETENTION_DAYS = 90 (days deletion tombstones are kept)
+- PROJECT_SECTION_PAGE_SIZE = 50 (rows per project strings/activities page)
+- PROJECT_DETAIL_PREVIEW_SIZE = 20 (rows embedded per included detail section)
+- BULK_JOB_AUTO_ASYNC_ROWS = 5000 (bulk rows above which a job is queued)
+- BULK_JOB_CHUNK_SIZE = 1000 (rows per bulk job transaction)
+- BULK_JOB_POLL_SECONDS = 2 (idle bulk job worker sleep)
+- BULK_JOB_STALE_SECONDS = 300 (silence after which a running job is resumed)
+- BULK_JOB_RESULTS_PAGE_SIZE = 10 (chunks per bulk job results page)
 """
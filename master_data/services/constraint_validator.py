@@ -6,9 +6,9 @@ This service handles validation of dimension values against defined constraints.
 
 import re
 from typing import List, Dict, Any, Optional
-from django.core.cache import cache
 
 from ..models import DimensionConstraint, ConstraintTypeChoices
+from .shared_cache import shared_cache
 
 
 class ValidationResult:
@@ -146,7 +146,7 @@ class ConstraintValidatorService:
         cache_key = f'dimension_constraints:{dimension_id}'
 
         if use_cache:
-            constraints = cache.get(cache_key)
+            constraints = shared_cache.get(cache_key)
         else:
             constraints = None
 
@@ -159,7 +159,7 @@ class ConstraintValidatorService:
                 ).order_by('order')
             )
             # Cache for 15 minutes
-            cache.set(cache_key, constraints, 900)
+            shared_cache.set(cache_key, constraints, 900)
 
         errors = []
 
@@ -203,9 +203,9 @@ class ConstraintValidatorService:
 
     @staticmethod
     def clear_constraint_cache(dimension_id: int):
-        """Clear cached constraints for a dimension."""
+        """Clear cached constraints for a dimension in every worker."""
         cache_key = f'dimension_constraints:{dimension_id}'
-        cache.delete(cache_key)
+        shared_cache.delete(cache_key)
 
     @staticmethod
     def get_constraint_violations(dimension_id: int) -> Dict[str, Any]:
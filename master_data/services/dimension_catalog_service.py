@@ -1,9 +1,9 @@
 from typing import Dict, List, Optional, Set
-from django.core.cache import cache
 from django.utils import timezone
 from django.db.models import QuerySet, Prefetch
 from ..models import Rule, RuleDetail, Dimension, DimensionValue
 from .constants import CACHE_TIMEOUT_DEFAULT
+from .shared_cache import SharedCache, shared_cache
 
 
 class DimensionCatalogService:
@@ -14,10 +14,10 @@ class DimensionCatalogService:
 
     def get_catalog_for_rule(self, rule: int) -> Dict:
         """Main method to get complete catalog for a rule"""
-        cache_key = f"dimension_catalog:{rule}"
+        cache_key = SharedCache.rule_key('dimension_catalog', rule)
 
         # Check cache first
-        cached = cache.get(cache_key)
+        cached = shared_cache.get(cache_key)
         if cached:
             return cached
 
@@ -25,8 +25,8 @@ class DimensionCatalogService:
         try:
             rule = Rule.objects.get(id=rule)
             if hasattr(rule, 'needs_inheritance_refresh') and not rule.needs_inheritance_refresh and hasattr(rule, 'dimension_catalog_cache') and rule.dimension_catalog_cache:
-                cache.set(cache_key, rule.dimension_catalog_cache,
-                          self.cache_timeout)
+                shared_cache.set(cache_key, rule.dimension_catalog_cache,
+                                 self.cache_timeout)
                 return rule.dimension_catalog_cache
         except Rule.DoesNotExist:
             raise ValueError(f"Rule with id {rule} does not exist")
@@ -35,7 +35,7 @@ class DimensionCatalogService:
         catalog = self._build_catalog(rule)
 
         # Cache in both places
-        cache.set(cache_key, catalog, self.cache_timeout)
+        shared_cache.set(cache_key, catalog, self.cache_timeout)
 
         # Only update model cache if the fields exist
         if hasattr(rule, 'dimension_catalog_cache'):
@@ -257,8 +257,7 @@ class DimensionCatalogService:
 
     def invalidate_cache(self, rule: int):
         """Invalidate cache for a specific rule"""
-        cache_key = f"dimension_catalog:{rule}"
-        cache.delete(cache_key)
+        SharedCache.bump_rule_generations([rule])
 
         # Also mark model cache as needing refresh if the field exists
         try:
@@ -279,8 +278,8 @@ class DimensionCatalogService:
         Get optimized dimension catalog with centralized data and improved structure.
         Implements key improvements: centralized values, simplified inheritance, better constraints.
         """
-        cache_key = f"optimized_dimension_catalog:{rule}"
-        cached_result = cache.get(cache_key)
+        cache_key = SharedCache.rule_key('optimized_dimension_catalog', rule)
+        cached_result = shared_cache.get(cache_key)
 
         if cached_result is not None:
             return cached_result
@@ -293,7 +292,7 @@ class DimensionCatalogService:
         catalog = self._build_optimized_catalog(rule)
 
         # Cache for 30 minutes
-        cache.set(cache_key, catalog, self.cache_timeout)
+        shared_cache.set(cache_key, catalog, self.cache_timeout)
         return catalog
 
     def _build_optimized_catalog(self, rule: Rule) -> Dict:
@@ -1,9 +1,9 @@
 from typing import Dict, List, Optional
-from django.core.cache import cache
 from django.utils import timezone
 from django.db.models import QuerySet, Q
 from ..models import Rule, RuleDetail, Entity, Dimension
 from .constants import CACHE_TIMEOUT_DEFAULT
+from .shared_cache import SharedCache, shared_cache
 
 
 class EntityTemplateService:
@@ -14,9 +14,9 @@ class EntityTemplateService:
 
     def get_templates_for_rule(self, rule: Rule) -> List[Dict]:
         """Get entity templates for a rule with comprehensive entity data"""
-        cache_key = f"entity_templates:{rule.id}"
+        cache_key = SharedCache.rule_key('entity_templates', rule.id)
 
-        cached = cache.get(cache_key)
+        cached = shared_cache.get(cache_key)
         if cached:
             return cached
 
@@ -27,7 +27,7 @@ class EntityTemplateService:
 
         templates = self._build_templates(rule)
 
-        cache.set(cache_key, templates, self.cache_timeout)
+        shared_cache.set(cache_key, templates, self.cache_timeout)
 
         return templates
 
@@ -366,8 +366,7 @@ class EntityTemplateService:
 
     def invalidate_cache(self, rule: Rule):
         """Invalidate entity templates cache for a rule"""
-        cache_key = f"entity_templates:{rule.id}"
-        cache.delete(cache_key)
+        SharedCache.bump_rule_generations([rule.id if hasattr(rule, 'id') else rule])
 
     def bulk_invalidate_cache(self, rules: List[Rule]):
         """Invalidate cache for multiple rules"""
@@ -379,8 +378,8 @@ class EntityTemplateService:
         Get optimized entity templates with minimal data duplication.
         Returns dimension references by ID instead of full dimension data.
         """
-        cache_key = f"optimized_entity_templates:{rule.id}"
-        cached_result = cache.get(cache_key)
+        cache_key = SharedCache.rule_key('optimized_entity_templates', rule.id)
+        cached_result = shared_cache.get(cache_key)
 
         if cached_result is not None:
             return cached_result
@@ -393,7 +392,7 @@ class EntityTemplateService:
         templates = self._build_optimized_templates(rule)
 
         # Cache for 30 minutes
-        cache.set(cache_key, templates, self.cache_timeout)
+        shared_cache.set(cache_key, templates, self.cache_timeout)
         return templates
 
     def _build_optimized_templates(self, rule: Rule) -> List[Dict]:
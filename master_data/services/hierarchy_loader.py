@@ -0,0 +1,249 @@
+"""
+Whole-subtree loading for String hierarchies.
+
+HierarchyLoader fetches every string below a set of roots in one query (a
+recursive CTE on PostgreSQL, a materialized-path prefix match elsewhere),
+then their details and dimension values in one more, and returns a
+HierarchyIndex: an in-memory adjacency index that impact analysis walks
+without issuing further queries.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from django.db import connection
+from django.db.models import Q
+
+from ..models import Dimension, DimensionValue, Entity, String, StringDetail
+from ..models.base import child_hierarchy_path
+from .constants import HIERARCHY_LOOKUP_CHUNK_SIZE, HIERARCHY_MAX_DEPTH
+
+
+class HierarchyNode:
+    """A loaded string with its dimension values."""
+
+    __slots__ = (
+        'id', 'parent_id', 'value', 'rule_id', 'entity_id', 'entity_level',
+        'dimension_values',
+    )
+
+    def __init__(self, id, parent_id, value, rule_id, entity_id, entity_level):
+        self.id = id
+        self.parent_id = parent_id
+        self.value = value
+        self.rule_id = rule_id
+        self.entity_id = entity_id
+        self.entity_level = entity_level
+        self.dimension_values: Dict[str, str] = {}
+
+    def __repr__(self):
+        return f"HierarchyNode(id={self.id}, value={self.value!r})"
+
+
+class HierarchyIndex:
+    """
+    In-memory adjacency index over loaded subtrees.
+
+    Children are ordered like String's default ordering (entity level,
+    then value).
+    """
+
+    __slots__ = ('nodes', '_children')
+
+    def __init__(self, nodes: Iterable[HierarchyNode]):
+        self.nodes: Dict[int, HierarchyNode] = {node.id: node for node in nodes}
+        self._children: Dict[int, List[HierarchyNode]] = {}
+        for node in self.nodes.values():
+            if node.parent_id in self.nodes:
+                self._children.setdefault(node.parent_id, []).append(node)
+        for children in self._children.values():
+            children.sort(key=lambda child: (child.entity_level, child.value, child.id))
+
+    def __contains__(self, string_id):
+        return string_id in self.nodes
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def get(self, string_id: int) -> Optional[HierarchyNode]:
+        return self.nodes.get(string_id)
+
+    def children(self, string_id: int) -> List[HierarchyNode]:
+        """Direct children of a string."""
+        return self._children.get(string_id, [])
+
+    def child_count(self, string_id: int) -> int:
+        return len(self._children.get(string_id, ()))
+
+    def has_ancestor(self, string_id: int, ancestor_id: int) -> bool:
+        """Check whether ancestor_id is above string_id in the loaded trees."""
+        seen = set()
+        current = self.nodes.get(string_id)
+        while current is not None and current.parent_id is not None and current.id not in seen:
+            if current.parent_id == ancestor_id:
+                return True
+            seen.add(current.id)
+            current = self.nodes.get(current.parent_id)
+        return False
+
+    def walk(self, root_id: int, max_depth: int = HIERARCHY_MAX_DEPTH) -> Iterator[Tuple[HierarchyNode, int]]:
+        """
+        Yield (node, level) for a subtree in depth-first pre-order.
+
+        Nodes deeper than max_depth are skipped; each node is yielded once.
+        """
+        root = self.nodes.get(root_id)
+        if root is None:
+            return
+        visited = {root_id}
+        stack = [(root, 0)]
+        while stack:
+            node, level = stack.pop()
+            yield node, level
+            if level >= max_depth:
+                continue
+            for child in reversed(self.children(node.id)):
+                if child.id not in visited:
+                    visited.add(child.id)
+                    stack.append((child, level + 1))
+
+
+class HierarchyLoader:
+    """Loads String subtrees into a HierarchyIndex with a fixed number of queries."""
+
+    @staticmethod
+    def load(
+        roots: Iterable[Union[String, int]],
+        workspace,
+        max_depth: int = HIERARCHY_MAX_DEPTH,
+        include_details: bool = True,
+        recursive: Optional[bool] = None
+    ) -> HierarchyIndex:
+        """
+        Load the subtrees below roots (roots included).
+
+        Args:
+            roots: Root strings or string IDs
+            workspace: Workspace instance or ID the strings belong to
+            max_depth: Number of levels to load below each root
+            include_details: Also load each string's dimension values
+            recursive: Use the recursive CTE; defaults to True on PostgreSQL
+
+        Returns:
+            HierarchyIndex over all loaded strings
+        """
+        workspace_id = getattr(workspace, 'pk', workspace)
+        root_ids = list(dict.fromkeys(getattr(root, 'pk', root) for root in roots))
+        max_depth = min(max_depth, HIERARCHY_MAX_DEPTH)
+        if recursive is None:
+            recursive = connection.vendor == 'postgresql'
+
+        nodes: Dict[int, HierarchyNode] = {}
+        for chunk in _chunks(root_ids, HIERARCHY_LOOKUP_CHUNK_SIZE):
+            if recursive:
+                rows, details = HierarchyLoader._fetch_recursive(
+                    chunk, workspace_id, max_depth, include_details)
+            else:
+                rows, details = HierarchyLoader._fetch_by_path(
+                    chunk, workspace_id, max_depth, include_details)
+
+            for row in rows:
+                if row[0] not in nodes:
+                    nodes[row[0]] = HierarchyNode(*row)
+            for string_id, dimension_name, value, freetext in details:
+                nodes[string_id].dimension_values[dimension_name] = (
+                    value if value is not None else freetext
+                )
+
+        return HierarchyIndex(nodes.values())
+
+    @staticmethod
+    def _fetch_recursive(root_ids: List[int], workspace_id: int, max_depth: int,
+                         include_details: bool) -> Tuple[List[tuple], List[tuple]]:
+        """
+        Fetch subtree rows (and detail rows) with a recursive CTE.
+
+        Independent of ancestor_path, so it is also correct for rows that
+        have not been backfilled yet.
+        """
+        quote = connection.ops.quote_name
+        tables = {
+            'string': quote(String._meta.db_table),
+            'entity': quote(Entity._meta.db_table),
+            'detail': quote(StringDetail._meta.db_table),
+            'dimension': quote(Dimension._meta.db_table),
+            'value': quote(DimensionValue._meta.db_table),
+        }
+        placeholders = ', '.join(['%s'] * len(root_ids))
+        subtree = f"""
+            WITH RECURSIVE subtree (id, level) AS (
+                SELECT s.id, 0 FROM {tables['string']} s
+                WHERE s.id IN ({placeholders}) AND s.workspace_id = %s
+                UNION ALL
+                SELECT s.id, t.level + 1 FROM {tables['string']} s
+                INNER JOIN subtree t ON s.parent_id = t.id
+                WHERE s.workspace_id = %s AND t.level < %s
+            )
+        """
+        params = [*root_ids, workspace_id, workspace_id, max_depth]
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"""{subtree}
+                SELECT s.id, s.parent_id, s.value, s.rule_id, s.entity_id, e.entity_level
+                FROM subtree t
+                INNER JOIN {tables['string']} s ON s.id = t.id
+                INNER JOIN {tables['entity']} e ON e.id = s.entity_id
+            """, params)
+            rows = cursor.fetchall()
+
+            details = []
+            if include_details:
+                cursor.execute(f"""{subtree}
+                    SELECT d.string_id, dim.name, v.value, d.dimension_value_freetext
+                    FROM subtree t
+                    INNER JOIN {tables['detail']} d ON d.string_id = t.id
+                    INNER JOIN {tables['dimension']} dim ON dim.id = d.dimension_id
+                    LEFT OUTER JOIN {tables['value']} v ON v.id = d.dimension_value_id
+                """, params)
+                details = cursor.fetchall()
+
+        return rows, details
+
+    @staticmethod
+    def _fetch_by_path(root_ids: List[int], workspace_id: int, max_depth: int,
+                       include_details: bool) -> Tuple[List[tuple], List[tuple]]:
+        """
+        Fetch subtree rows (and detail rows) with a materialized-path prefix match.
+
+        Fallback for other backends; relies on ancestor_path having been
+        backfilled.
+        """
+        queryset = String.objects.for_workspace(workspace_id)
+        condition = Q(id__in=root_ids)
+        roots = queryset.filter(id__in=root_ids).values_list('id', 'ancestor_path', 'depth')
+        for root_id, ancestor_path, depth in roots:
+            condition |= Q(
+                ancestor_path__startswith=child_hierarchy_path(ancestor_path, depth, root_id)[0],
+                depth__lte=depth + max_depth,
+            )
+        subtree = queryset.filter(condition).order_by()
+
+        rows = list(subtree.values_list(
+            'id', 'parent_id', 'value', 'rule_id', 'entity_id', 'entity__entity_level'))
+
+        details = []
+        if include_details:
+            details = list(
+                StringDetail.objects.all_workspaces().filter(
+                    string_id__in=subtree.values('id')
+                ).order_by().values_list(
+                    'string_id', 'dimension__name', 'dimension_value__value',
+                    'dimension_value_freetext'
+                )
+            )
+
+        return rows, details
+
+
+def _chunks(items: List, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
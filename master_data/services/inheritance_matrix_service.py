@@ -1,9 +1,9 @@
 from ..models import Rule, RuleDetail, Entity, Dimension
 from django.db.models import QuerySet
 from django.utils import timezone
-from django.core.cache import cache
 from typing import Dict, List, Optional, Tuple
 from .constants import CACHE_TIMEOUT_DEFAULT
+from .shared_cache import SharedCache, shared_cache
 
 
 class InheritanceMatrixService:
@@ -14,9 +14,9 @@ class InheritanceMatrixService:
 
     def get_matrix_for_rule(self, rule: Rule) -> Dict:
         """Get inheritance matrix for a rule"""
-        cache_key = f"inheritance_matrix:{rule.id}"
+        cache_key = SharedCache.rule_key('inheritance_matrix', rule.id)
 
-        cached = cache.get(cache_key)
+        cached = shared_cache.get(cache_key)
         if cached:
             return cached
 
@@ -26,15 +26,15 @@ class InheritanceMatrixService:
                 not rule.needs_inheritance_refresh and
                 hasattr(rule, 'inheritance_matrix_cache') and
                     rule.inheritance_matrix_cache):
-                cache.set(cache_key, rule.inheritance_matrix_cache,
-                          self.cache_timeout)
+                shared_cache.set(cache_key, rule.inheritance_matrix_cache,
+                                 self.cache_timeout)
                 return rule.inheritance_matrix_cache
         except Rule.DoesNotExist:
             raise ValueError(f"Rule with id {rule.id} does not exist")
 
         matrix = self._build_matrix(rule)
 
-        cache.set(cache_key, matrix, self.cache_timeout)
+        shared_cache.set(cache_key, matrix, self.cache_timeout)
 
         # Update model cache if fields exist
         if hasattr(rule, 'inheritance_matrix_cache'):
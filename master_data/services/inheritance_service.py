@@ -4,13 +4,14 @@ Handles inheritance analysis and propagation in string hierarchies.
 """
 
 import uuid
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, List, Optional, Any
 from django.db import transaction, models
 from django.contrib.auth import get_user_model
 
 from ..models import (
     String, StringDetail, StringModification, StringInheritanceUpdate
 )
+from .hierarchy_loader import HierarchyIndex, HierarchyLoader
 
 User = get_user_model()
 
@@ -53,15 +54,26 @@ class InheritanceService:
                 update['string_id']: update for update in proposed_updates
             }
 
-            for parent_string in parent_strings:
-                if parent_string.id not in update_map:
-                    continue
+            parent_strings = [
+                parent_string for parent_string in parent_strings
+                if parent_string.id in update_map
+            ]
+
+            # Load every affected subtree once per workspace
+            hierarchies = {}
+            for workspace_id in {parent_string.workspace_id for parent_string in parent_strings}:
+                hierarchies[workspace_id] = HierarchyLoader.load(
+                    [s for s in parent_strings if s.workspace_id == workspace_id],
+                    workspace_id, max_depth, include_details=False
+                )
 
+            for parent_string in parent_strings:
                 update_data = update_map[parent_string.id]
-                
+
                 # Analyze this string's impact
                 string_impact = InheritanceService._analyze_single_string_impact(
-                    parent_string, update_data, max_depth
+                    parent_string, update_data, max_depth,
+                    hierarchies[parent_string.workspace_id]
                 )
                 
                 affected_strings.extend(string_impact['affected_strings'])
@@ -92,101 +104,102 @@ class InheritanceService:
         parent_string,
         update_data: Dict[str, Any],
         max_depth: int,
-        current_depth: int = 0,
-        visited: Optional[Set[int]] = None
+        hierarchy: Optional[HierarchyIndex] = None
     ) -> Dict[str, Any]:
         """
         Analyze impact for a single string and its descendants.
+
+        Walks an in-memory HierarchyIndex (loaded here unless supplied)
+        iteratively with one shared visited set.
         """
-        if visited is None:
-            visited = set()
+        if hierarchy is None:
+            hierarchy = HierarchyLoader.load(
+                [parent_string], parent_string.workspace_id, max_depth, include_details=False
+            )
 
-        # Prevent circular references
-        if parent_string.id in visited or current_depth >= max_depth:
+        affected_strings = []
+        warnings = []
+        blockers = []
+        max_actual_depth = 0
+
+        root = hierarchy.get(parent_string.id)
+        if root is None or max_depth <= 0:
             return {
-                'affected_strings': [],
-                'warnings': [],
-                'blockers': [],
-                'max_depth': current_depth
+                'affected_strings': affected_strings,
+                'warnings': warnings,
+                'blockers': blockers,
+                'max_depth': max_actual_depth
             }
 
-        visited.add(parent_string.id)
+        visited = {root.id}
+        stack = [(root, update_data, 0, None)]
+
+        while stack:
+            node, node_update, current_depth, parent_record = stack.pop()
+            max_actual_depth = max(max_actual_depth, current_depth)
+            if parent_record is not None:
+                parent_record['children'].append(node.id)
+            if current_depth >= max_depth:
+                continue
+
+            record = {
+                'string_id': node.id,
+                'string_value': node.value,
+                'parent_string_id': node.parent_id,
+                'level': current_depth,
+                'update_type': 'direct' if current_depth == 0 else 'inherited',
+                'affected_fields': list(node_update.get('field_updates', {}).keys()),
+                'new_values': node_update.get('field_updates', {}),
+                'children': []
+            }
+            affected_strings.append(record)
 
-        affected_strings = []
-        warnings = []
-        blockers = []
-        max_actual_depth = current_depth
-
-        # Add the parent string itself
-        affected_strings.append({
-            'string_id': parent_string.id,
-            'string_value': parent_string.value,
-            'parent_string_id': parent_string.parent.id if parent_string.parent else None,
-            'level': current_depth,
-            'update_type': 'direct' if current_depth == 0 else 'inherited',
-            'affected_fields': list(update_data.get('field_updates', {}).keys()),
-            'new_values': update_data.get('field_updates', {}),
-            'children': []
-        })
-
-        # Get direct children
-        children = String.objects.filter(
-            parent=parent_string,
-            workspace=parent_string.workspace
-        ).select_related('entity', 'parent')
-
-        # Check for warnings
-        if children.count() > 50:
-            warnings.append({
-                'string_id': parent_string.id,
-                'warning_type': 'many_children',
-                'message': f'String has {children.count()} children - large inheritance impact',
-                'severity': 'medium' if children.count() < 100 else 'high'
-            })
+            children = hierarchy.children(node.id)
 
-        if current_depth > 5:
-            warnings.append({
-                'string_id': parent_string.id,
-                'warning_type': 'deep_inheritance',
-                'message': f'Deep inheritance at level {current_depth}',
-                'severity': 'medium' if current_depth < 8 else 'high'
-            })
+            # Check for warnings
+            if len(children) > 50:
+                warnings.append({
+                    'string_id': node.id,
+                    'warning_type': 'many_children',
+                    'message': f'String has {len(children)} children - large inheritance impact',
+                    'severity': 'medium' if len(children) < 100 else 'high'
+                })
+
+            if current_depth > 5:
+                warnings.append({
+                    'string_id': node.id,
+                    'warning_type': 'deep_inheritance',
+                    'message': f'Deep inheritance at level {current_depth}',
+                    'severity': 'medium' if current_depth < 8 else 'high'
+                })
 
-        # Analyze each child
-        for child in children:
-            try:
-                # Check for circular dependencies
-                if InheritanceService._has_circular_dependency(child, parent_string):
+            # Push in reverse so children are analyzed in order
+            for child in reversed(children):
+                if child.id in visited:
+                    continue
+                try:
+                    # Check for circular dependencies
+                    if hierarchy.has_ancestor(node.id, child.id):
+                        blockers.append({
+                            'string_id': child.id,
+                            'blocker': 'circular_reference',
+                            'message': f'Circular dependency detected: {child.value} → {node.value}'
+                        })
+                        continue
+
+                    child_update = InheritanceService._generate_inherited_update(
+                        child, node_update
+                    )
+                except Exception as e:
                     blockers.append({
                         'string_id': child.id,
-                        'blocker': 'circular_reference',
-                        'message': f'Circular dependency detected: {child.value} → {parent_string.value}'
+                        'blocker': 'analysis_error',
+                        'message': f'Error analyzing child: {str(e)}'
                     })
                     continue
 
-                # Recursively analyze child impact
-                child_update = InheritanceService._generate_inherited_update(
-                    child, update_data
-                )
-                
-                child_impact = InheritanceService._analyze_single_string_impact(
-                    child, child_update, max_depth, current_depth + 1, visited.copy()
-                )
-
-                affected_strings.extend(child_impact['affected_strings'])
-                warnings.extend(child_impact['warnings'])
-                blockers.extend(child_impact['blockers'])
-                max_actual_depth = max(max_actual_depth, child_impact['max_depth'])
-
-                # Add child ID to parent's children list
-                affected_strings[0]['children'].append(child.id)
-
-            except Exception as e:
-                blockers.append({
-                    'string_id': child.id,
-                    'blocker': 'analysis_error',
-                    'message': f'Error analyzing child: {str(e)}'
-                })
+                visited.add(child.id)
+                stack.append((child, child_update, current_depth + 1, record))
 
         return {
             'affected_strings': affected_strings,
@@ -239,22 +252,6 @@ class InheritanceService:
 
         return not any(field_key.startswith(prefix) for prefix in non_inheritable_prefixes)
 
-    @staticmethod
-    def _has_circular_dependency(child_string, potential_parent) -> bool:
-        """
-        Check if making potential_parent a parent of child_string would create a circular dependency.
-        """
-        current = potential_parent.parent
-        visited = {child_string.id}
-        
-        while current and current.id not in visited:
-            if current.id == child_string.id:
-                return True
-            visited.add(current.id)
-            current = current.parent
-        
-        return False
-
     @staticmethod
     @transaction.atomic
     def propagate_inheritance_updates(
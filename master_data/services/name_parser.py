@@ -0,0 +1,376 @@
+"""
+Reverse parsing of names into dimension values.
+
+A NameParser is compiled once per (rule, entity) from the rule's naming
+template and the workspace's DimensionValue sets. List dimensions are
+resolved with longest-match lookups in a per-dimension character trie;
+free-text dimensions take the text up to the next literal of the pattern
+(suffix, delimiter, next prefix). Every complete decomposition is explored
+up to a small limit so ambiguous names are reported rather than guessed.
+
+Parsers are cached next to the compiled naming templates and keyed by
+their rule generation together with the workspace value index version, so
+rule changes invalidate both and dimension value changes the parsers.
+"""
+
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from ..constants import DimensionTypeChoices
+from .constants import (
+    NAME_PARSER_CACHE_SIZE,
+    NAME_PARSER_FREE_TEXT_CONFIDENCE,
+    NAME_PARSER_MAX_ALTERNATIVES,
+)
+from .naming_template import (
+    Generation,
+    NamingTemplate,
+    NamingTemplateCache,
+    naming_template_cache,
+)
+from .shared_cache import SharedCache
+from .workspace_value_index import get_workspace_value_index, workspace_value_index_cache
+
+# Trie node key holding (value, dimension_value_id) for a complete value
+_END = None
+
+
+class ParseResult:
+    """
+    Outcome of parsing one name.
+
+    Values, details and alternatives are derived from the raw matches on
+    first access, so streaming callers only pay for what they read.
+
+    Attributes:
+        name: The parsed name
+        confidence: 0.0 for failures, otherwise the mean part score divided
+            by the number of decompositions found
+        ambiguous: Whether more than one decomposition was found
+        error: Error message when the name does not match the pattern
+    """
+
+    __slots__ = ('name', 'confidence', 'ambiguous', 'error', '_parts', '_matches')
+
+    def __init__(self, name: str, parts, matches, confidence: float, error: Optional[str] = None):
+        self.name = name
+        self.confidence = confidence
+        self.ambiguous = len(matches) > 1
+        self.error = error
+        self._parts = parts
+        self._matches = matches
+
+    def __repr__(self):
+        return (
+            f"ParseResult(name={self.name!r}, values={self.values}, "
+            f"confidence={self.confidence}, ambiguous={self.ambiguous})"
+        )
+
+    @property
+    def is_valid(self) -> bool:
+        return bool(self._matches)
+
+    @property
+    def values(self) -> Optional[Dict[str, str]]:
+        """Dimension name -> value for the preferred decomposition."""
+        if not self._matches:
+            return None
+        return {
+            part.dimension_name: match[0]
+            for part, match in zip(self._parts, self._matches[0])
+        }
+
+    @property
+    def details(self) -> Optional[List[Dict]]:
+        """StringDetail-shaped rows for the preferred decomposition."""
+        if not self._matches:
+            return None
+        return [
+            {
+                'dimension': part.dimension_id,
+                'dimension_value': value_id,
+                'dimension_value_freetext': value if value_id is None else None,
+            }
+            for part, (value, value_id, _) in zip(self._parts, self._matches[0])
+        ]
+
+    @property
+    def alternatives(self) -> List[Dict[str, str]]:
+        """Values of every other decomposition found."""
+        return [
+            {part.dimension_name: match[0] for part, match in zip(self._parts, matches)}
+            for matches in self._matches[1:]
+        ]
+
+    def as_dict(self) -> Dict:
+        """Return a JSON-serializable representation."""
+        return {
+            'name': self.name,
+            'values': self.values,
+            'details': self.details,
+            'confidence': self.confidence,
+            'ambiguous': self.ambiguous,
+            'alternatives': self.alternatives,
+            'error': self.error,
+        }
+
+
+class _ParserPart(NamedTuple):
+    """One dimension slot of the parser with its precomputed literals."""
+    dimension_id: int
+    dimension_name: str
+    prefix: str
+    suffix: str
+    tail: str
+    stop: str
+    trie: Optional[dict]
+
+
+def _build_trie(values: Iterable[Tuple[str, int]]) -> dict:
+    """Build a character trie mapping each value to its DimensionValue ID."""
+    root: dict = {}
+    for value, value_id in values:
+        if not value:
+            continue
+        node = root
+        for char in value:
+            node = node.setdefault(char, {})
+        node[_END] = (value, value_id)
+    return root
+
+
+class NameParser:
+    """
+    Compiled reverse parser for a single (rule, entity) pair.
+
+    Attributes:
+        rule_id: ID of the rule the parser was compiled from
+        entity_id: ID of the entity the parser applies to
+        generation: Rule generation and value index version the parser was
+            compiled against
+    """
+
+    __slots__ = ('rule_id', 'entity_id', 'generation', 'parts', 'max_alternatives')
+
+    def __init__(self, template: NamingTemplate, dimension_types: Dict[int, str],
+                 dimension_values: Dict[int, Iterable[Tuple[str, int]]],
+                 max_alternatives: int = NAME_PARSER_MAX_ALTERNATIVES):
+        self.rule_id = template.rule_id
+        self.entity_id = template.entity_id
+        self.generation = template.generation
+        self.max_alternatives = max_alternatives
+
+        template_parts = template.parts
+        parts = []
+        for index, part in enumerate(template_parts):
+            tail = part.suffix + part.delimiter
+            next_prefix = (
+                template_parts[index + 1].prefix
+                if index + 1 < len(template_parts) else ''
+            )
+            trie = None
+            if dimension_types.get(part.dimension_id) == DimensionTypeChoices.LIST:
+                trie = _build_trie(dimension_values.get(part.dimension_id, ()))
+            parts.append(_ParserPart(
+                dimension_id=part.dimension_id,
+                dimension_name=part.dimension_name,
+                prefix=part.prefix,
+                suffix=part.suffix,
+                tail=tail,
+                stop=tail + next_prefix,
+                trie=trie,
+            ))
+        self.parts: Tuple[_ParserPart, ...] = tuple(parts)
+
+    def __repr__(self):
+        return (
+            f"NameParser(rule={self.rule_id}, entity={self.entity_id}, "
+            f"generation={self.generation})"
+        )
+
+    @classmethod
+    def compile(cls, rule, entity, generation: Generation = ()) -> 'NameParser':
+        """
+        Compile a parser for a rule/entity pair.
+
+        Dimension types and values come from the workspace value index, so
+        only a cold template or index costs queries.
+        """
+        template = naming_template_cache.get_template(rule, entity)
+        value_index = get_workspace_value_index(rule.workspace_id)
+
+        dimension_types = {}
+        dimension_values = {}
+        for part in template.parts:
+            entry = value_index.get_dimension(part.dimension_id)
+            if entry is None:
+                continue
+            dimension_types[entry.id] = entry.type
+            dimension_values[entry.id] = entry.value_ids_by_value.items()
+
+        parser = cls(template, dimension_types, dimension_values)
+        parser.generation = generation
+        return parser
+
+    def parse(self, name: str) -> ParseResult:
+        """
+        Decompose a name into dimension values.
+
+        The first decomposition found is the preferred one: list values are
+        tried longest match first and free-text values end at the first
+        occurrence of the following literal. Any further decompositions are
+        returned as alternatives and lower the confidence.
+        """
+        matches: List[List[Tuple[str, Optional[int], int]]] = []
+        self._search(name, 0, 0, [], matches, set())
+
+        if not matches:
+            return ParseResult(
+                name, self.parts, matches, 0.0,
+                error="Name does not match the rule pattern",
+            )
+
+        free_text_parts = sum(1 for match in matches[0] if match[1] is None)
+        score = len(self.parts) - free_text_parts * (1.0 - NAME_PARSER_FREE_TEXT_CONFIDENCE)
+        confidence = round(score / len(self.parts) / len(matches), 4)
+
+        return ParseResult(name, self.parts, matches, confidence)
+
+    def parse_many(self, names: Iterable[str]) -> Iterator[ParseResult]:
+        """Parse a list or stream of names lazily."""
+        parse = self.parse
+        for name in names:
+            yield parse(name)
+
+    def _search(self, name: str, index: int, pos: int,
+                current: List[Tuple[str, Optional[int], int]],
+                matches: List[List[Tuple[str, Optional[int], int]]],
+                failed: Set[Tuple[int, int]]) -> bool:
+        """
+        Depth-first search for decompositions of name[pos:] from part index.
+
+        (index, pos) states without any decomposition are remembered in
+        failed, so a name that does not parse costs a polynomial number of
+        steps instead of trying every combination of free-text ends.
+
+        Returns True once enough decompositions were collected to stop.
+        """
+        if (index, pos) in failed:
+            return False
+        found = len(matches)
+        start = pos
+        parts = self.parts
+        part = parts[index]
+        is_last = index == len(parts) - 1
+
+        if part.prefix:
+            if not name.startswith(part.prefix, pos):
+                return False
+            pos += len(part.prefix)
+
+        trie = part.trie
+        if trie is not None:
+            # Longest match first: walk the trie, then try ends in reverse
+            candidates = []
+            node = trie
+            for i in range(pos, len(name)):
+                node = node.get(name[i])
+                if node is None:
+                    break
+                terminal = node.get(_END)
+                if terminal is not None:
+                    candidates.append((terminal[0], terminal[1], i + 1))
+            candidates.reverse()
+        else:
+            candidates = self._free_text_candidates(name, pos, part, is_last)
+
+        tail = part.tail
+        for candidate in candidates:
+            end = candidate[2]
+            if is_last:
+                # Rendered names end with the last delimiter but legacy
+                # names often drop it, so accept either form
+                rest_length = len(name) - end
+                if not (
+                    (rest_length == len(tail) and name.endswith(tail))
+                    or (rest_length == len(part.suffix) and name.endswith(part.suffix))
+                ):
+                    continue
+                current.append(candidate)
+                matches.append(list(current))
+                current.pop()
+                if len(matches) > self.max_alternatives:
+                    return True
+                continue
+
+            if not name.startswith(tail, end):
+                continue
+            current.append(candidate)
+            done = self._search(name, index + 1, end + len(tail), current, matches, failed)
+            current.pop()
+            if done:
+                return True
+
+        if len(matches) == found:
+            failed.add((index, start))
+        return False
+
+    @staticmethod
+    def _free_text_candidates(name: str, pos: int, part: _ParserPart, is_last: bool):
+        """Return (value, None, end) free-text candidates ending before the next literal."""
+        length = len(name)
+        if is_last:
+            if part.tail and name.endswith(part.tail):
+                end = length - len(part.tail)
+            else:
+                end = length - len(part.suffix)
+            if end > pos:
+                return [(name[pos:end], None, end)]
+            return []
+
+        if not part.stop:
+            return [(name[pos:end], None, end) for end in range(pos + 1, length + 1)]
+
+        candidates = []
+        end = name.find(part.stop, pos + 1)
+        while end != -1:
+            candidates.append((name[pos:end], None, end))
+            end = name.find(part.stop, end + 1)
+        return candidates
+
+
+class NameParserCache(NamingTemplateCache):
+    """
+    Bounded LRU of compiled name parsers keyed by (rule_id, entity_id).
+
+    Generations are read from the naming template cache, so every signal
+    that invalidates a rule's templates also invalidates its parsers, and
+    extended with the version of the rule's workspace value index, so
+    added, renamed or deleted dimension values are recognised.
+    """
+
+    def __init__(self, maxsize: int = NAME_PARSER_CACHE_SIZE):
+        super().__init__(maxsize)
+
+    def get_generation(self, rule_id: int) -> Generation:
+        workspace_id = SharedCache.rule_workspace_id(rule_id)
+        return (*naming_template_cache.get_generation(rule_id),
+                *workspace_value_index_cache.get_version(workspace_id))
+
+    def bump_rule_generation(self, rule_id: int) -> int:
+        return naming_template_cache.bump_rule_generation(rule_id)
+
+    def _compile(self, rule, entity, generation: Generation) -> NameParser:
+        return NameParser.compile(rule, entity, generation)
+
+    def get_parser(self, rule, entity) -> NameParser:
+        """Return the compiled parser for rule/entity, compiling on miss."""
+        return self.get_template(rule, entity)
+
+
+# Process-wide parser cache
+name_parser_cache = NameParserCache()
+
+
+def get_name_parser(rule, entity) -> NameParser:
+    """Return the compiled name parser for a rule/entity pair."""
+    return name_parser_cache.get_parser(rule, entity)
@@ -0,0 +1,223 @@
+"""
+Compiled naming templates for string generation.
+
+A NamingTemplate is the (rule, entity) naming pattern resolved once from
+RuleDetail rows into an ordered, immutable tuple of parts. Rendering a name
+from a template is pure string work and never touches the database.
+
+Compiled templates live in a bounded, process-local LRU. Each entry records
+the rule generation it was compiled against: a process-local counter, which
+the cache invalidation signals bump as soon as a rule changes, together with
+the rule's shared generation (see shared_cache), which other workers see
+within SHARED_GENERATION_CHECK_SECONDS of the change being committed. Stale
+entries are recompiled on next access.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+from .constants import NAMING_TEMPLATE_CACHE_SIZE
+from .shared_cache import rule_generations
+
+# (process-local generation, *shared generations) a template was compiled against
+Generation = Tuple[int, ...]
+
+
+class NamingConventionError(Exception):
+    """Custom exception for naming convention errors."""
+    pass
+
+
+class TemplatePart(NamedTuple):
+    """One dimension slot of a compiled naming template."""
+    dimension_id: int
+    dimension_name: str
+    prefix: str
+    suffix: str
+    delimiter: str
+
+
+class NamingTemplate:
+    """
+    Immutable, compiled naming pattern for a single (rule, entity) pair.
+
+    Attributes:
+        rule_id: ID of the rule the template was compiled from
+        entity_id: ID of the entity the template applies to
+        generation: Rule generation the template was compiled against
+        parts: Ordered tuple of TemplatePart
+    """
+
+    __slots__ = ('rule_id', 'entity_id', 'generation', 'parts', 'dimension_names')
+
+    def __init__(self, rule_id: int, entity_id: int, generation: Generation, parts: Iterable[TemplatePart]):
+        self.rule_id = rule_id
+        self.entity_id = entity_id
+        self.generation = generation
+        self.parts: Tuple[TemplatePart, ...] = tuple(parts)
+        self.dimension_names: Tuple[str, ...] = tuple(
+            part.dimension_name for part in self.parts
+        )
+
+    def __repr__(self):
+        return (
+            f"NamingTemplate(rule={self.rule_id}, entity={self.entity_id}, "
+            f"generation={self.generation}, dimensions={list(self.dimension_names)})"
+        )
+
+    @classmethod
+    def compile(cls, rule, entity, generation: Generation = ()) -> 'NamingTemplate':
+        """
+        Compile the template for a rule/entity pair with a single query.
+
+        Raises:
+            NamingConventionError: If the rule has no details for the entity
+                or the dimension_order sequence is not 1..n
+        """
+        from ..models import RuleDetail
+
+        rows = list(
+            RuleDetail.objects.filter(rule=rule, entity=entity)
+            .order_by('dimension_order')
+            .values_list(
+                'dimension_order', 'dimension_id', 'dimension__name',
+                'prefix', 'suffix', 'delimiter'
+            )
+        )
+
+        if not rows:
+            raise NamingConventionError(
+                f"No rule details found for rule '{rule.name}' and entity '{entity.name}'"
+            )
+
+        # Validate dimension order sequence to ensure data integrity
+        orders = [row[0] for row in rows]
+        expected_orders = list(range(1, len(orders) + 1))
+        if sorted(orders) != expected_orders:
+            raise NamingConventionError(
+                f"Invalid dimension order sequence for rule '{rule.name}' entity '{entity.name}': "
+                f"expected {expected_orders}, got {sorted(orders)}"
+            )
+
+        parts = [
+            TemplatePart(
+                dimension_id=dimension_id,
+                dimension_name=dimension_name,
+                prefix=prefix or '',
+                suffix=suffix or '',
+                delimiter=delimiter or '',
+            )
+            for _, dimension_id, dimension_name, prefix, suffix, delimiter in rows
+        ]
+
+        return cls(rule.id, entity.id, generation, parts)
+
+    def render(self, dimension_values: Dict[str, str]) -> str:
+        """
+        Render a name from dimension values without touching the database.
+
+        Args:
+            dimension_values: Dict mapping dimension names to their values
+
+        Raises:
+            NamingConventionError: If a required dimension value is missing
+        """
+        pieces = []
+        for part in self.parts:
+            try:
+                value = dimension_values[part.dimension_name]
+            except KeyError:
+                raise NamingConventionError(
+                    f"Missing value for required dimension '{part.dimension_name}'"
+                )
+            pieces.append(f"{part.prefix}{value}{part.suffix}{part.delimiter}")
+
+        return ''.join(pieces)
+
+    def missing_dimensions(self, dimension_values: Dict[str, str]):
+        """Return the template dimension names absent from dimension_values."""
+        return [name for name in self.dimension_names if name not in dimension_values]
+
+
+class NamingTemplateCache:
+    """
+    Bounded, thread-safe LRU of compiled templates keyed by (rule_id, entity_id).
+
+    Invalidation is generation based: bump_rule_generation() makes every
+    template compiled for that rule stale without having to find its keys.
+    Entries are keyed by the process-local counter, bumped from the model
+    signals this worker receives, and by the rule's shared generation, so
+    changes committed by other workers invalidate them too.
+    """
+
+    def __init__(self, maxsize: int = NAMING_TEMPLATE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._templates: 'OrderedDict[Tuple[int, int], NamingTemplate]' = OrderedDict()
+        self._generations: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def get_generation(self, rule_id: int) -> Generation:
+        """Return the current generation for a rule."""
+        return (self._generations.get(rule_id, 0), *rule_generations.get(rule_id))
+
+    def bump_rule_generation(self, rule_id: int) -> int:
+        """Invalidate all compiled templates for a rule in this process."""
+        with self._lock:
+            generation = self._generations.get(rule_id, 0) + 1
+            self._generations[rule_id] = generation
+            return generation
+
+    def get_template(self, rule, entity) -> NamingTemplate:
+        """Return the compiled template for rule/entity, compiling on miss."""
+        key = (rule.id, entity.id)
+        generation = self.get_generation(rule.id)
+
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None and template.generation == generation:
+                self._templates.move_to_end(key)
+                return template
+
+        template = self._compile(rule, entity, generation)
+
+        with self._lock:
+            # Another invalidation may have raced the compile; keep the
+            # template usable for this call but do not cache stale data.
+            if self.get_generation(rule.id) == generation:
+                self._templates[key] = template
+                self._templates.move_to_end(key)
+                while len(self._templates) > self.maxsize:
+                    self._templates.popitem(last=False)
+
+        return template
+
+    def _compile(self, rule, entity, generation: Generation) -> NamingTemplate:
+        """Build the cached object for a rule/entity pair."""
+        return NamingTemplate.compile(rule, entity, generation)
+
+    def peek(self, rule_id: int, entity_id: int) -> Optional[NamingTemplate]:
+        """Return a cached template without compiling or touching LRU order."""
+        return self._templates.get((rule_id, entity_id))
+
+    def clear(self):
+        """Drop all compiled templates."""
+        with self._lock:
+            self._templates.clear()
+
+    def __len__(self):
+        return len(self._templates)
+
+
+# Process-wide template cache shared by all generation entry points
+naming_template_cache = NamingTemplateCache()
+
+
+def get_naming_template(rule, entity) -> NamingTemplate:
+    """Return the compiled naming template for a rule/entity pair."""
+    return naming_template_cache.get_template(rule, entity)
+
+
+def bump_rule_generation(rule_id: int) -> int:
+    """Invalidate compiled naming templates for a rule."""
+    return naming_template_cache.bump_rule_generation(rule_id)
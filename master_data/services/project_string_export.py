@@ -0,0 +1,330 @@
+"""
+Streaming export of project strings.
+
+Exports read the strings of a project platform through a values()
+projection with .iterator(chunk_size), fetch the details of one chunk at a
+time, and yield encoded bytes as they go, so memory stays flat regardless
+of project size. Output is CSV, NDJSON or a JSON document, optionally
+gzip-compressed on the fly. With a `since` watermark only the strings
+changed after it are exported, followed by tombstones of deleted strings.
+"""
+
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from itertools import chain, islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from ..models import ProjectString, ProjectStringDetail
+from .constants import EXPORT_CHUNK_SIZE
+from .project_string_sync import ProjectStringSyncService
+
+
+EXPORT_FORMATS = ('csv', 'ndjson', 'json')
+
+EXPORT_CONTENT_TYPES = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+    'json': 'application/json',
+}
+
+CSV_HEADER = [
+    'String ID', 'UUID', 'Project', 'Platform', 'Entity', 'Entity Level',
+    'Value', 'Parent UUID', 'Rule', 'Created By', 'Created', 'Last Updated'
+]
+
+# values() projection of one exported string
+STRING_FIELDS = (
+    'id', 'string_uuid', 'project_id', 'project__name', 'platform_id',
+    'platform__name', 'entity_id', 'entity__name', 'entity_level', 'rule_id',
+    'rule__name', 'value', 'parent_uuid', 'created_by_id',
+    'created_by__first_name', 'created_by__last_name', 'created', 'last_updated',
+)
+
+DETAIL_FIELDS = (
+    'string_id', 'dimension_id', 'dimension__name', 'dimension_value_id',
+    'dimension_value__value', 'dimension_value__label',
+    'dimension_value_freetext', 'is_inherited',
+)
+
+
+class ProjectStringExportService:
+    """Streams project string exports without materializing the queryset."""
+
+    @staticmethod
+    def stream(project, platform, export_format: str, include_details: bool = False,
+               compress: bool = False, chunk_size: int = EXPORT_CHUNK_SIZE,
+               since: Optional[datetime] = None,
+               watermark: Optional[datetime] = None) -> Iterator[bytes]:
+        """
+        Yield the encoded export of a project platform's strings.
+
+        Args:
+            project: Project to export
+            platform: Platform within the project
+            export_format: One of EXPORT_FORMATS
+            include_details: Add dimension values (CSV: one column per dimension)
+            compress: gzip the output stream
+            chunk_size: Rows fetched (and details looked up) per query
+            since: Export only changes after this watermark, plus deletions
+            watermark: Watermark reported in JSON output (default: now)
+
+        Returns:
+            Iterator of bytes, suitable for StreamingHttpResponse
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {export_format}")
+
+        queryset = ProjectStringSyncService.changed_strings(
+            ProjectString.objects.for_workspace(project.workspace_id).filter(
+                project_id=project.id, platform_id=platform.id
+            ),
+            project.workspace_id, since
+        )
+        records = ProjectStringExportService.iter_records(
+            queryset, project.workspace_id, include_details, chunk_size)
+        deleted = None
+        if since is not None:
+            deleted = ProjectStringExportService.iter_deleted(
+                project, platform, since, chunk_size)
+
+        if export_format == 'csv':
+            dimensions = []
+            if include_details:
+                dimensions = ProjectStringExportService.detail_dimensions(
+                    queryset, project.workspace_id)
+            chunks = ProjectStringExportService._csv_chunks(
+                records, dimensions, chunk_size, deleted)
+        elif export_format == 'ndjson':
+            chunks = ProjectStringExportService._ndjson_chunks(
+                chain(records, deleted or ()), chunk_size)
+        else:
+            chunks = ProjectStringExportService._json_chunks(
+                records, project, platform, chunk_size,
+                deleted, since, watermark)
+
+        encoded = (chunk.encode('utf-8') for chunk in chunks)
+        if compress:
+            return ProjectStringExportService._gzip(encoded)
+        return encoded
+
+    @staticmethod
+    def iter_records(queryset, workspace_id: int, include_details: bool = False,
+                     chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+        """
+        Yield one dict per string, in (entity_level, value, id) order.
+
+        With include_details, each record gets a 'details' list; details are
+        loaded with one query per chunk of strings.
+        """
+        rows = queryset.order_by('entity_level', 'value', 'id').values(
+            *STRING_FIELDS).iterator(chunk_size=chunk_size)
+
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+
+            details: Dict[int, List[Dict[str, Any]]] = {}
+            if include_details:
+                for detail in ProjectStringDetail.objects.for_workspace(workspace_id).filter(
+                    string_id__in=[row['id'] for row in chunk]
+                ).order_by('dimension__name').values_list(*DETAIL_FIELDS):
+                    details.setdefault(detail[0], []).append(
+                        ProjectStringExportService._detail_record(detail))
+
+            for row in chunk:
+                record = ProjectStringExportService._string_record(row)
+                if include_details:
+                    record['details'] = details.get(row['id'], [])
+                yield record
+
+    @staticmethod
+    def iter_deleted(project, platform, since: datetime,
+                     chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+        """Yield tombstone records of strings deleted after `since`."""
+        for tombstone in ProjectStringSyncService.deleted_strings(
+            project, platform, since
+        ).values('string_id', 'string_uuid', 'deleted_at').iterator(chunk_size=chunk_size):
+            yield ProjectStringSyncService.tombstone_record(tombstone)
+
+    @staticmethod
+    def detail_dimensions(queryset, workspace_id: int) -> List[Tuple[int, str]]:
+        """Return (dimension_id, name) of every dimension used by the strings."""
+        return list(
+            ProjectStringDetail.objects.for_workspace(workspace_id).filter(
+                string_id__in=queryset.values('id')
+            ).values_list('dimension_id', 'dimension__name').distinct().order_by('dimension__name')
+        )
+
+    @staticmethod
+    def _string_record(row: Dict[str, Any]) -> Dict[str, Any]:
+        created_by_name = None
+        if row['created_by_id']:
+            created_by_name = (
+                f"{row['created_by__first_name']} {row['created_by__last_name']}".strip())
+        return {
+            'id': row['id'],
+            'string_uuid': row['string_uuid'],
+            'project_id': row['project_id'],
+            'project_name': row['project__name'],
+            'platform_id': row['platform_id'],
+            'platform_name': row['platform__name'],
+            'entity_id': row['entity_id'],
+            'entity_name': row['entity__name'],
+            'entity_level': row['entity_level'],
+            'rule_id': row['rule_id'],
+            'rule_name': row['rule__name'],
+            'value': row['value'],
+            'parent_uuid': row['parent_uuid'],
+            'created_by': row['created_by_id'],
+            'created_by_name': created_by_name,
+            'created': row['created'],
+            'last_updated': row['last_updated'],
+        }
+
+    @staticmethod
+    def _detail_record(detail: Tuple) -> Dict[str, Any]:
+        (_, dimension_id, dimension_name, dimension_value_id, value, label,
+         freetext, is_inherited) = detail
+        return {
+            'dimension': dimension_id,
+            'dimension_name': dimension_name,
+            'dimension_value_id': dimension_value_id,
+            'dimension_value_freetext': freetext,
+            'dimension_value_display': value if dimension_value_id else freetext,
+            'dimension_value_label': label if dimension_value_id else freetext,
+            'is_inherited': is_inherited,
+        }
+
+    @staticmethod
+    def _csv_chunks(records: Iterable[Dict[str, Any]], dimensions: List[Tuple[int, str]],
+                    chunk_size: int,
+                    deleted: Optional[Iterable[Dict[str, Any]]] = None) -> Iterator[str]:
+        """
+        Write CSV rows; with `deleted` (sync exports) a trailing Deleted column
+        is added and tombstones follow as rows carrying only ID and UUID.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        header = CSV_HEADER + [name for _, name in dimensions]
+        writer.writerow(header + ['Deleted'] if deleted is not None else header)
+
+        for count, record in enumerate(records, start=1):
+            row = [
+                record['id'],
+                str(record['string_uuid']),
+                record['project_name'],
+                record['platform_name'],
+                record['entity_name'],
+                record['entity_level'],
+                record['value'],
+                str(record['parent_uuid']) if record['parent_uuid'] else '',
+                record['rule_name'],
+                record['created_by_name'] or '',
+                record['created'].isoformat(),
+                record['last_updated'].isoformat(),
+            ]
+            if dimensions:
+                values = {
+                    detail['dimension']: detail['dimension_value_display']
+                    for detail in record['details']
+                }
+                row.extend(values.get(dimension_id) or '' for dimension_id, _ in dimensions)
+            if deleted is not None:
+                row.append('')
+            writer.writerow(row)
+
+            if count % chunk_size == 0:
+                yield ProjectStringExportService._drain(buffer)
+
+        for count, tombstone in enumerate(deleted or (), start=1):
+            row = [''] * len(header) + ['true']
+            row[0], row[1] = tombstone['id'], str(tombstone['string_uuid'])
+            writer.writerow(row)
+            if count % chunk_size == 0:
+                yield ProjectStringExportService._drain(buffer)
+        yield ProjectStringExportService._drain(buffer)
+
+    @staticmethod
+    def _ndjson_chunks(records: Iterable[Dict[str, Any]], chunk_size: int) -> Iterator[str]:
+        lines = []
+        for record in records:
+            lines.append(json.dumps(record, cls=DjangoJSONEncoder))
+            if len(lines) >= chunk_size:
+                yield '\n'.join(lines) + '\n'
+                lines = []
+        if lines:
+            yield '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _json_chunks(records: Iterable[Dict[str, Any]], project, platform, chunk_size: int,
+                     deleted: Optional[Iterable[Dict[str, Any]]] = None,
+                     since: Optional[datetime] = None,
+                     watermark: Optional[datetime] = None) -> Iterator[str]:
+        """
+        Stream {"project", "platform", "exported_at", "since", "watermark",
+        "strings": [...], "count"}, plus "deleted": [...] for sync exports.
+        """
+        exported_at = timezone.now()
+        header = json.dumps({
+            'project': {'id': project.id, 'name': project.name, 'slug': project.slug},
+            'platform': {'id': platform.id, 'name': platform.name},
+            'exported_at': exported_at.isoformat(),
+            'since': since.isoformat() if since else None,
+            'watermark': (watermark or exported_at).isoformat(),
+        })
+        # Open the document; "strings" is written element by element
+        yield header[:-1] + ', "strings": ['
+        count = yield from ProjectStringExportService._json_array_items(records, chunk_size)
+        # Counted while streaming instead of a separate COUNT(*)
+        yield f'], "count": {count}'
+
+        if deleted is not None:
+            yield ', "deleted": ['
+            yield from ProjectStringExportService._json_array_items(deleted, chunk_size)
+            yield ']'
+        yield '}'
+
+    @staticmethod
+    def _json_array_items(records: Iterable[Dict[str, Any]], chunk_size: int):
+        """Yield comma-separated JSON items in chunks; returns the item count."""
+        count = 0
+        items = []
+        for record in records:
+            items.append(json.dumps(record, cls=DjangoJSONEncoder))
+            count += 1
+            if len(items) >= chunk_size:
+                yield ('' if count == len(items) else ', ') + ', '.join(items)
+                items = []
+        if items:
+            yield ('' if count == len(items) else ', ') + ', '.join(items)
+        return count
+
+    @staticmethod
+    def _gzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+        compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+    @staticmethod
+    def _drain(buffer: io.StringIO) -> str:
+        value = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return value
+
+
+def parse_export_flag(value: Optional[str], default: bool) -> bool:
+    """Parse a boolean query parameter ('true'/'1'/'false'/'0')."""
+    if value is None or value == '':
+        return default
+    return value.lower() in ('1', 'true', 'yes')
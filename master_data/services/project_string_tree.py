@@ -0,0 +1,140 @@
+"""
+Full string hierarchy of a project platform.
+
+Loads every ProjectString of a project platform (optionally down to a
+maximum entity level) with one query, links the rows by parent_id in
+memory and streams the nested tree as JSON with per-node child counts.
+"""
+
+import json
+from typing import Any, Dict, Iterator, List, Optional
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from ..models import ProjectString
+from .constants import TREE_STREAM_BUFFER_SIZE
+
+NODE_FIELDS = (
+    'id', 'parent_id', 'string_uuid', 'parent_uuid', 'entity_id', 'entity__name',
+    'entity_level', 'value',
+)
+
+
+class ProjectStringTree:
+    """
+    In-memory tree of project strings keyed by id.
+
+    Strings whose parent was not loaded become roots. Children are kept in
+    the query order, (entity_level, value, id).
+    """
+
+    __slots__ = ('rows', 'children', 'roots')
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = {row['id']: row for row in rows}
+        self.children: Dict[int, List[int]] = {}
+        self.roots: List[int] = []
+        for row in rows:
+            if row['parent_id'] in self.rows:
+                self.children.setdefault(row['parent_id'], []).append(row['id'])
+            else:
+                self.roots.append(row['id'])
+
+    def __len__(self):
+        return len(self.rows)
+
+    def child_count(self, string_id: int) -> int:
+        """Number of direct children; includes unloaded children when counted in the query."""
+        row = self.rows[string_id]
+        if 'child_count' in row:
+            return row['child_count']
+        return len(self.children.get(string_id, ()))
+
+
+class ProjectStringTreeService:
+    """Loads and serializes project string trees."""
+
+    @staticmethod
+    def load(project, platform, max_level: Optional[int] = None) -> ProjectStringTree:
+        """
+        Load the strings of a project platform in one query.
+
+        With max_level, strings below that entity level are not loaded;
+        child_count then comes from a correlated count in the same query so
+        that nodes at the last level still report their (unloaded) children.
+        """
+        queryset = ProjectString.objects.for_workspace(project.workspace_id).filter(
+            project_id=project.id, platform_id=platform.id
+        )
+        fields = list(NODE_FIELDS)
+        if max_level is not None:
+            queryset = queryset.filter(entity_level__lte=max_level).annotate(
+                child_count=Coalesce(Subquery(
+                    ProjectString.objects.all_workspaces().filter(
+                        parent_id=OuterRef('pk')
+                    ).order_by().values('parent_id').annotate(
+                        total=Count('id')
+                    ).values('total'),
+                    output_field=IntegerField()
+                ), 0)
+            )
+            fields.append('child_count')
+
+        rows = list(queryset.order_by('entity_level', 'value', 'id').values(*fields))
+        return ProjectStringTree(rows)
+
+    @staticmethod
+    def node_record(tree: ProjectStringTree, string_id: int) -> Dict[str, Any]:
+        row = tree.rows[string_id]
+        return {
+            'id': row['id'],
+            'string_uuid': row['string_uuid'],
+            'parent_uuid': row['parent_uuid'],
+            'entity': row['entity_id'],
+            'entity_name': row['entity__name'],
+            'entity_level': row['entity_level'],
+            'value': row['value'],
+            'child_count': tree.child_count(string_id),
+        }
+
+    @staticmethod
+    def stream_json(tree: ProjectStringTree, header: Dict[str, Any]) -> Iterator[bytes]:
+        """
+        Stream {**header, "count": n, "roots": [node, ...]}, each node with
+        a nested "children" list.
+
+        Depth-first with an explicit stack, so deep trees do not hit the
+        recursion limit and no node dict outlives its own serialization.
+        """
+        opening = json.dumps({**header, 'count': len(tree)}, cls=DjangoJSONEncoder)
+        buffer = [opening[:-1], ', "roots": [']
+        size = 0
+
+        # Each entry iterates the children of one open "children" list
+        stack = [iter(tree.roots)]
+        first = True
+        while stack:
+            string_id = next(stack[-1], None)
+            if string_id is None:
+                stack.pop()
+                buffer.append(']}' if stack else ']')
+                first = False
+                continue
+
+            node = json.dumps(
+                ProjectStringTreeService.node_record(tree, string_id), cls=DjangoJSONEncoder)
+            piece = ('' if first else ', ') + node[:-1] + ', "children": ['
+            buffer.append(piece)
+            size += len(piece)
+            stack.append(iter(tree.children.get(string_id, ())))
+            first = True
+
+            if size >= TREE_STREAM_BUFFER_SIZE:
+                yield ''.join(buffer).encode('utf-8')
+                buffer = []
+                size = 0
+
+        buffer.append('}')
+        yield ''.join(buffer).encode('utf-8')
@@ -5,22 +5,26 @@ Handles impact analysis, propagation logic, and background processing.
 
 import uuid
 import logging
-from typing import Dict, List, Optional, Set, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple
 from django.db import transaction, models
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from django.conf import settings
 
 from ..models import (
-    String, StringDetail, StringModification, StringInheritanceUpdate
+    Entity, Rule, String, StringDetail, StringModification, StringInheritanceUpdate
 )
 from .constants import (
+    HIERARCHY_LOOKUP_CHUNK_SIZE,
     PROPAGATION_WARNING_THRESHOLD,
     PROPAGATION_HIGH_SEVERITY_THRESHOLD,
     BASE_TIME_PER_STRING_SECONDS,
     DEPTH_MULTIPLIER_PER_LEVEL,
     SECONDS_PER_MINUTE,
 )
+from .hierarchy_loader import HierarchyIndex, HierarchyLoader, HierarchyNode
+from .naming_template import NamingConventionError, get_naming_template
+from .workspace_value_index import get_workspace_value_index
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
@@ -63,41 +67,60 @@ class PropagationService:
             total_affected = 0
             max_actual_depth = 0
             
+            string_details = StringDetail.objects.filter(
+                workspace=workspace
+            ).select_related(
+                'string', 'dimension', 'dimension_value'
+            ).in_bulk([update['string_detail_id'] for update in string_detail_updates])
+
+            # Detect what fields would change for each update
+            detected_changes = []
             for update in string_detail_updates:
                 string_detail_id = update['string_detail_id']
-                
-                try:
-                    string_detail = StringDetail.objects.select_related(
-                        'string', 'string__field', 'dimension'
-                    ).get(id=string_detail_id, workspace=workspace)
-                    
-                    # Detect what fields would change
-                    changed_fields = PropagationService._detect_field_changes(
-                        string_detail, update
-                    )
-                    
-                    if not changed_fields:
-                        continue  # No actual changes
-                    
-                    # Analyze impact for this string's hierarchy
-                    impact = PropagationService._analyze_string_hierarchy_impact(
-                        string_detail.string, changed_fields, max_depth, workspace
-                    )
-                    
-                    affected_strings.extend(impact['affected_strings'])
-                    warnings.extend(impact['warnings'])
-                    conflicts.extend(impact['conflicts'])
-                    
-                    total_affected += len(impact['affected_strings'])
-                    max_actual_depth = max(max_actual_depth, impact['max_depth'])
-                    
-                except StringDetail.DoesNotExist:
+                string_detail = string_details.get(string_detail_id)
+
+                if string_detail is None:
                     warnings.append({
                         'type': 'not_found',
                         'message': f'StringDetail {string_detail_id} not found',
                         'severity': 'high'
                     })
-                    
+                    continue
+
+                changed_fields = PropagationService._detect_field_changes(
+                    string_detail, update
+                )
+
+                if changed_fields:
+                    detected_changes.append((string_detail.string, changed_fields))
+
+            # Load every affected subtree and its templates with a fixed number of queries
+            hierarchy = templates = None
+            if detected_changes:
+                hierarchy = HierarchyLoader.load(
+                    [string for string, _ in detected_changes], workspace, max_depth
+                )
+                templates = PropagationService._load_templates(hierarchy)
+
+            new_values: List[Tuple[HierarchyNode, str]] = []
+            for string, changed_fields in detected_changes:
+                # Analyze impact for this string's hierarchy
+                impact = PropagationService._analyze_string_hierarchy_impact(
+                    string, changed_fields, max_depth, workspace, hierarchy,
+                    templates, new_values
+                )
+
+                affected_strings.extend(impact['affected_strings'])
+                warnings.extend(impact['warnings'])
+
+                total_affected += len(impact['affected_strings'])
+                max_actual_depth = max(max_actual_depth, impact['max_depth'])
+
+            # Check every recomputed value against existing strings at once
+            conflicts.extend(
+                PropagationService._check_value_conflicts(new_values, workspace)
+            )
+
             # Generate processing estimates
             processing_estimates = PropagationService._estimate_processing_time(
                 total_affected, max_actual_depth
@@ -138,13 +161,21 @@ class PropagationService:
         # Check dimension_value change
         new_dimension_value_id = update.get('dimension_value')
         current_dimension_value_id = string_detail.dimension_value_id
+        dimension_name = string_detail.dimension.name
         
         if new_dimension_value_id != current_dimension_value_id:
+            new_display = None
+            if new_dimension_value_id is not None:
+                entry = get_workspace_value_index(string_detail.workspace_id).get_dimension(
+                    string_detail.dimension_id)
+                if entry is not None:
+                    new_display = entry.values_by_id.get(new_dimension_value_id)
             changed_fields['dimension_value'] = {
                 'old': current_dimension_value_id,
                 'new': new_dimension_value_id,
                 'old_display': string_detail.dimension_value.value if string_detail.dimension_value else None,
-                'new_display': None  # Will be resolved later
+                'new_display': new_display,
+                'dimension': dimension_name
             }
         
         # Check dimension_value_freetext change
@@ -154,7 +185,8 @@ class PropagationService:
         if new_freetext != current_freetext:
             changed_fields['dimension_value_freetext'] = {
                 'old': current_freetext,
-                'new': new_freetext
+                'new': new_freetext,
+                'dimension': dimension_name
             }
         
         return changed_fields
@@ -165,49 +197,83 @@ class PropagationService:
         changed_fields: Dict[str, Any],
         max_depth: int,
         workspace,
-        current_depth: int = 0,
-        visited: Optional[Set[int]] = None
+        hierarchy: Optional[HierarchyIndex] = None,
+        templates: Optional[Dict[Tuple[int, int], Any]] = None,
+        new_values: Optional[List[Tuple[HierarchyNode, str]]] = None
     ) -> Dict[str, Any]:
         """
         Analyze impact for a string hierarchy starting from root_string.
 
-        This is the main orchestrator that coordinates the analysis process.
-        Complexity reduced from 15+ to 4 by extracting focused helper methods.
-        """
-        # Initialize visited set
-        if visited is None:
-            visited = set()
-
-        # Guard clause: stop if already visited or max depth reached
-        if root_string.id in visited or current_depth >= max_depth:
-            return PropagationService._create_empty_impact_data(current_depth)
-
-        visited.add(root_string.id)
-
-        # Step 1: Create empty impact data structure
-        impact_data = PropagationService._create_empty_impact_data(current_depth)
-
-        # Step 2: Build and add current string's impact
-        string_impact = PropagationService._build_string_impact_record(
-            root_string, changed_fields, current_depth
-        )
-        PropagationService._add_new_value_and_check_conflicts(
-            root_string, changed_fields, workspace, string_impact, impact_data
-        )
-        impact_data['affected_strings'].append(string_impact)
-
-        # Step 3: Get children and check for large counts
-        children = PropagationService._get_children_with_large_count_warning(
-            root_string, workspace, impact_data
-        )
-
-        # Step 4: Recursively analyze each child
-        for child in children:
-            PropagationService._analyze_child_recursively(
-                child, changed_fields, max_depth, workspace,
-                current_depth, visited, string_impact, impact_data
+        The subtree is walked iteratively over an in-memory HierarchyIndex
+        and new values are rendered through preloaded naming templates
+        (both loaded here unless supplied), so the walk issues no queries.
+        Value conflicts are checked with one batched lookup at the end,
+        unless the caller collects new_values to check them itself.
+        """
+        if hierarchy is None:
+            hierarchy = HierarchyLoader.load([root_string], workspace, max_depth)
+        if templates is None:
+            templates = PropagationService._load_templates(hierarchy)
+
+        impact_data = PropagationService._create_empty_impact_data()
+        root = hierarchy.get(root_string.id)
+        if root is None or max_depth <= 0:
+            return impact_data
+
+        check_conflicts = new_values is None
+        if check_conflicts:
+            new_values = []
+        visited = {root.id}
+        stack = [(root, changed_fields, 0, None)]
+
+        while stack:
+            node, changes, level, parent_impact = stack.pop()
+            impact_data['max_depth'] = max(impact_data['max_depth'], level)
+            if parent_impact is not None:
+                parent_impact['children'].append(node.id)
+            if level >= max_depth:
+                continue
+
+            string_impact = PropagationService._build_string_impact_record(
+                node, changes, level
+            )
+            new_value = PropagationService._add_new_value(
+                node, changes, templates, string_impact, impact_data
+            )
+            # Only values that change can create a conflict
+            if new_value is not None and new_value != node.value:
+                new_values.append((node, new_value))
+            impact_data['affected_strings'].append(string_impact)
+
+            children = hierarchy.children(node.id)
+            PropagationService._add_large_child_count_warning(
+                node, len(children), impact_data
             )
 
+            # Push in reverse so children are analyzed in order
+            for child in reversed(children):
+                if child.id in visited:
+                    continue
+                try:
+                    inherited_changes = PropagationService._generate_inherited_changes(
+                        child, changes
+                    )
+                except Exception as e:
+                    impact_data['warnings'].append({
+                        'string_id': child.id,
+                        'type': 'child_analysis_error',
+                        'message': f'Error analyzing child: {str(e)}',
+                        'severity': 'medium'
+                    })
+                    continue
+                if inherited_changes:
+                    visited.add(child.id)
+                    stack.append((child, inherited_changes, level + 1, string_impact))
+
+        if check_conflicts:
+            impact_data['conflicts'].extend(
+                PropagationService._check_value_conflicts(new_values, workspace)
+            )
         return impact_data
 
     @staticmethod
@@ -226,7 +292,7 @@ class PropagationService:
 
     @staticmethod
     def _build_string_impact_record(
-        root_string: String,
+        node: HierarchyNode,
         changed_fields: Dict[str, Any],
         current_depth: int
     ) -> Dict[str, Any]:
@@ -236,11 +302,11 @@ class PropagationService:
         Single responsibility: Create impact record with metadata.
         """
         return {
-            'string_id': root_string.id,
-            'string_value': root_string.value,
+            'string_id': node.id,
+            'string_value': node.value,
             'new_value': None,  # Will be calculated
-            'entity_level': root_string.entity.entity_level,
-            'parent_id': root_string.parent_id,
+            'entity_level': node.entity_level,
+            'parent_id': node.parent_id,
             'level': current_depth,
             'change_type': 'direct' if current_depth == 0 else 'inherited',
             'changed_fields': list(changed_fields.keys()),
@@ -248,192 +314,173 @@ class PropagationService:
         }
 
     @staticmethod
-    def _add_new_value_and_check_conflicts(
-        root_string: String,
+    def _add_new_value(
+        node: HierarchyNode,
         changed_fields: Dict[str, Any],
-        workspace,
+        templates: Dict[Tuple[int, int], Any],
         string_impact: Dict[str, Any],
         impact_data: Dict[str, Any]
-    ) -> None:
+    ) -> Optional[str]:
         """
-        Calculate new value and check for conflicts.
+        Calculate the new value, recording a warning on failure.
 
-        Single responsibility: Value calculation and conflict detection.
+        Single responsibility: Value calculation.
         """
         try:
             new_value = PropagationService._calculate_new_string_value(
-                root_string, changed_fields
-            )
-            string_impact['new_value'] = new_value
-
-            # Check for conflicts
-            conflict = PropagationService._check_value_conflict(
-                root_string, new_value, workspace
+                node, changed_fields, templates
             )
-            if conflict:
-                impact_data['conflicts'].append(conflict)
-
         except Exception as e:
             impact_data['warnings'].append({
-                'string_id': root_string.id,
+                'string_id': node.id,
                 'type': 'calculation_error',
                 'message': f'Error calculating new value: {str(e)}',
                 'severity': 'high'
             })
+            return None
+
+        string_impact['new_value'] = new_value
+        return new_value
 
     @staticmethod
-    def _get_children_with_large_count_warning(
-        root_string: String,
-        workspace,
+    def _add_large_child_count_warning(
+        node: HierarchyNode,
+        child_count: int,
         impact_data: Dict[str, Any]
-    ):
+    ) -> None:
         """
-        Get children and warn if count is large.
+        Warn if a string has a large number of children.
 
-        Single responsibility: Child retrieval with performance warning.
+        Single responsibility: Performance warning.
         """
-        children = String.objects.filter(
-            parent=root_string,
-            workspace=workspace
-        ).select_related('entity')
-
-        # Check for large number of children
-        child_count = children.count()
         if child_count > PROPAGATION_WARNING_THRESHOLD:
             impact_data['warnings'].append({
-                'string_id': root_string.id,
+                'string_id': node.id,
                 'type': 'many_children',
                 'message': f'String has {child_count} children - large propagation impact',
                 'severity': 'medium' if child_count < PROPAGATION_HIGH_SEVERITY_THRESHOLD else 'high'
             })
 
-        return children
-
     @staticmethod
-    def _analyze_child_recursively(
-        child: String,
-        changed_fields: Dict[str, Any],
-        max_depth: int,
-        workspace,
-        current_depth: int,
-        visited: Set[int],
-        string_impact: Dict[str, Any],
-        impact_data: Dict[str, Any]
-    ) -> None:
+    def _load_templates(hierarchy: HierarchyIndex) -> Dict[Tuple[int, int], Any]:
         """
-        Recursively analyze a single child string.
+        Fetch the compiled naming template of every (rule, entity) in a hierarchy.
 
-        Single responsibility: Child analysis with error handling.
+        Values are NamingTemplate instances, or the NamingConventionError
+        raised while compiling so that affected strings can report it.
         """
-        try:
-            # Generate inherited changes for child
-            inherited_changes = PropagationService._generate_inherited_changes(
-                child, changed_fields
-            )
-
-            if inherited_changes:
-                child_impact = PropagationService._analyze_string_hierarchy_impact(
-                    child, inherited_changes, max_depth, workspace,
-                    current_depth + 1, visited.copy()
-                )
+        pairs = {(node.rule_id, node.entity_id) for node in hierarchy.nodes.values()}
+        rules = Rule.objects.all_workspaces().in_bulk({rule_id for rule_id, _ in pairs})
+        entities = Entity.objects.in_bulk({entity_id for _, entity_id in pairs})
 
-                # Merge child impact into parent
-                PropagationService._merge_child_impact_into_parent(
-                    impact_data, child_impact, string_impact, child.id
-                )
-
-        except Exception as e:
-            impact_data['warnings'].append({
-                'string_id': child.id,
-                'type': 'child_analysis_error',
-                'message': f'Error analyzing child: {str(e)}',
-                'severity': 'medium'
-            })
+        templates = {}
+        for rule_id, entity_id in pairs:
+            try:
+                templates[(rule_id, entity_id)] = get_naming_template(
+                    rules[rule_id], entities[entity_id])
+            except NamingConventionError as e:
+                templates[(rule_id, entity_id)] = e
+        return templates
 
     @staticmethod
-    def _merge_child_impact_into_parent(
-        parent_impact: Dict[str, Any],
-        child_impact: Dict[str, Any],
-        string_impact: Dict[str, Any],
-        child_id: int
-    ) -> None:
+    def _calculate_new_string_value(
+        node: HierarchyNode,
+        changed_fields: Dict[str, Any],
+        templates: Dict[Tuple[int, int], Any]
+    ) -> str:
         """
-        Merge child impact data into parent impact data.
+        Calculate what the new string value would be after property changes.
+
+        The changed dimension is replaced in the node's preloaded dimension
+        values wherever it still holds the old value, and the result is
+        rendered through the rule's compiled naming template. Nodes without
+        the old value keep their current value.
 
-        Single responsibility: Data merging.
+        Raises:
+            NamingConventionError: If the template is invalid or the node's
+                details do not cover it
         """
-        parent_impact['affected_strings'].extend(child_impact['affected_strings'])
-        parent_impact['warnings'].extend(child_impact['warnings'])
-        parent_impact['conflicts'].extend(child_impact['conflicts'])
-        parent_impact['max_depth'] = max(parent_impact['max_depth'], child_impact['max_depth'])
+        dimension_name, old_value, new_value = PropagationService._effective_value_change(
+            changed_fields
+        )
+        if (
+            dimension_name is None
+            or node.dimension_values.get(dimension_name) != old_value
+            or new_value == old_value
+        ):
+            return node.value
+
+        template = templates[(node.rule_id, node.entity_id)]
+        if isinstance(template, Exception):
+            raise template
 
-        # Add child to parent's children list
-        string_impact['children'].append(child_id)
+        dimension_values = dict(node.dimension_values)
+        dimension_values[dimension_name] = new_value
+        return template.render(dimension_values)
 
     @staticmethod
-    def _calculate_new_string_value(
-        string_obj: String, 
-        changed_fields: Dict[str, Any]
-    ) -> str:
+    def _effective_value_change(changed_fields: Dict[str, Any]) -> Tuple[Optional[str], Any, Any]:
         """
-        Calculate what the new string value would be after property changes.
+        Collapse detected field changes into (dimension name, old value, new value).
+
+        A detail holds either a dimension value or free text, so the
+        effective value is whichever of the two is set.
         """
-        # Get current dimension values
-        current_values = string_obj.get_dimension_values()
-        
-        # Apply changes (simplified - in real implementation would be more complex)
-        # This is a placeholder that would integrate with StringGenerationService
-        
-        # For now, just modify the current value based on changes
-        new_value = string_obj.value
-        
-        for field_key, change in changed_fields.items():
-            if field_key == 'dimension_value' and change.get('new_display'):
-                # Replace old dimension value with new one in string
-                old_display = change.get('old_display', '')
-                new_display = change.get('new_display', '')
-                if old_display and old_display in new_value:
-                    new_value = new_value.replace(old_display, new_display)
-            elif field_key == 'dimension_value_freetext':
-                # Handle freetext changes
-                old_freetext = change.get('old', '')
-                new_freetext = change.get('new', '')
-                if old_freetext and old_freetext in new_value:
-                    new_value = new_value.replace(old_freetext, new_freetext)
-        
-        return new_value
+        value_change = changed_fields.get('dimension_value', {})
+        freetext_change = changed_fields.get('dimension_value_freetext', {})
+        dimension_name = value_change.get('dimension') or freetext_change.get('dimension')
+
+        old_value = value_change.get('old_display')
+        if old_value is None:
+            old_value = freetext_change.get('old')
+        new_value = value_change.get('new_display')
+        if new_value is None:
+            new_value = freetext_change.get('new')
+
+        return dimension_name, old_value, new_value
 
     @staticmethod
-    def _check_value_conflict(
-        string_obj: String, 
-        new_value: str, 
+    def _check_value_conflicts(
+        new_values: List[Tuple[HierarchyNode, str]],
         workspace
-    ) -> Optional[Dict[str, Any]]:
+    ) -> List[Dict[str, Any]]:
         """
-        Check if the new string value would create conflicts.
+        Check whether new string values would create conflicts.
+
+        All candidate values are looked up together; a conflict is another
+        string with the same value in the same workspace/rule/entity.
         """
-        # Check for duplicate values in same workspace/rule/entity
-        existing = String.objects.filter(
-            workspace=workspace,
-            rule=string_obj.rule,
-            entity=string_obj.entity,
-            value=new_value
-        ).exclude(id=string_obj.id).first()
-        
-        if existing:
-            return {
-                'string_id': string_obj.id,
-                'type': 'duplicate_value',
-                'message': f'Value "{new_value}" already exists for another string',
-                'conflicting_string_id': existing.id,
-                'severity': 'high'
-            }
-        
-        return None
+        candidates = list(dict.fromkeys(value for _, value in new_values))
+        existing: Dict[Tuple[int, int, str], List[int]] = {}
+        for start in range(0, len(candidates), HIERARCHY_LOOKUP_CHUNK_SIZE):
+            rows = String.objects.filter(
+                workspace=workspace,
+                value__in=candidates[start:start + HIERARCHY_LOOKUP_CHUNK_SIZE]
+            ).order_by('id').values_list('id', 'rule_id', 'entity_id', 'value')
+            for string_id, rule_id, entity_id, value in rows:
+                existing.setdefault((rule_id, entity_id, value), []).append(string_id)
+
+        conflicts = []
+        for node, new_value in new_values:
+            conflicting_ids = [
+                string_id
+                for string_id in existing.get((node.rule_id, node.entity_id, new_value), ())
+                if string_id != node.id
+            ]
+            if conflicting_ids:
+                conflicts.append({
+                    'string_id': node.id,
+                    'type': 'duplicate_value',
+                    'message': f'Value "{new_value}" already exists for another string',
+                    'conflicting_string_id': conflicting_ids[0],
+                    'severity': 'high'
+                })
+
+        return conflicts
 
     @staticmethod
     def _generate_inherited_changes(
-        child_string: String, 
+        child_string: HierarchyNode,
         parent_changes: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
@@ -450,7 +497,7 @@ class PropagationService:
         return inherited_changes
 
     @staticmethod
-    def _should_inherit_field(child_string: String, field_key: str) -> bool:
+    def _should_inherit_field(child_string: HierarchyNode, field_key: str) -> bool:
         """
         Determine if a child string should inherit a specific property change.
         """
@@ -3,16 +3,16 @@ RuleCacheService: Manages caching for rule operations.
 
 This service handles cache invalidation and management for rule-related data,
 coordinating between multiple service caches (dimension catalog, inheritance matrix,
-field templates) and Django's cache framework.
+field templates) and the shared cache tier (see shared_cache).
 
 Part of the refactoring from God Class (Issue #13) to separate cache concerns
 from business logic.
 """
 
 from typing import List, Optional, Any
-from django.core.cache import cache
 import logging
 from .constants import CACHE_TIMEOUT_DEFAULT
+from .shared_cache import shared_cache
 
 logger = logging.getLogger(__name__)
 
@@ -39,46 +39,15 @@ class RuleCacheService:
         """
         Invalidate all caches for a rule across all services.
 
-        This method coordinates cache invalidation across:
-        - Dimension catalog caches
-        - Inheritance matrix caches
-        - Field template caches
-        - Complete rule data caches
-        - Django page caches
+        Dimension catalog, inheritance matrix, entity template and complete
+        rule data entries all live in the shared cache under the rule's
+        generation, so one generation bump invalidates them in every worker.
+        Compiled naming templates are invalidated as well.
 
         Args:
             rule: Rule instance or rule ID
-
-        Note:
-            This method requires coordination with the service layer.
-            In the facade pattern, the RuleService will handle this coordination.
         """
-        # Import here to avoid circular imports
-        from .dimension_catalog_service import DimensionCatalogService
-        from .inheritance_matrix_service import InheritanceMatrixService
-        from .entity_template_service import EntityTemplateService
-
-        # Get rule ID
-        rule_id = rule.id if hasattr(rule, 'id') else rule
-
-        # Invalidate individual service caches
-        dimension_service = DimensionCatalogService()
-        inheritance_service = InheritanceMatrixService()
-        template_service = EntityTemplateService()
-
-        dimension_service.invalidate_cache(rule_id)
-        inheritance_service.invalidate_cache(rule_id)
-        template_service.invalidate_cache(rule_id)
-
-        # Invalidate complete data cache
-        cache_key = f"complete_rule_data:{rule_id}"
-        cache.delete(cache_key)
-
-        # Clear Django's page cache for rule configuration endpoint
-        cache_key = f"views.decorators.cache.cache_page.{rule_id}.GET"
-        cache.delete(cache_key)
-
-        logger.info(f"Invalidated all caches for rule {rule_id}")
+        self.bulk_invalidate_caches([rule])
 
     def bulk_invalidate_caches(self, rules: List):
         """
@@ -87,11 +56,10 @@ class RuleCacheService:
         Args:
             rules: List of Rule instances or rule IDs
         """
-        for rule in rules:
-            self.invalidate_all_caches(rule)
+        from ..signals.cache_invalidation import CacheInvalidationHelper
 
         rule_ids = [r.id if hasattr(r, 'id') else r for r in rules]
-        logger.info(f"Bulk invalidated caches for {len(rules)} rules: {rule_ids}")
+        CacheInvalidationHelper.invalidate_rule_caches(rule_ids, "Rule caches invalidated")
 
     def clear_rule_configuration_cache(self, rule_id: int):
         """
@@ -123,7 +91,7 @@ class RuleCacheService:
         Returns:
             Cached data or None if not found
         """
-        return cache.get(cache_key)
+        return shared_cache.get(cache_key)
 
     def set_cached_data(self, cache_key: str, value: Any, timeout: Optional[int] = None):
         """
@@ -135,7 +103,7 @@ class RuleCacheService:
             timeout: Cache timeout in seconds (default: 30 minutes)
         """
         timeout = timeout or self.cache_timeout
-        cache.set(cache_key, value, timeout)
+        shared_cache.set(cache_key, value, timeout)
         logger.debug(f"Set cache for key {cache_key} with timeout {timeout}s")
 
     def delete_cache_key(self, cache_key: str):
@@ -145,7 +113,7 @@ class RuleCacheService:
         Args:
             cache_key: Cache key to delete
         """
-        cache.delete(cache_key)
+        shared_cache.delete(cache_key)
         logger.debug(f"Deleted cache key: {cache_key}")
 
     def delete_cache_keys(self, cache_keys: List[str]):
@@ -155,5 +123,5 @@ class RuleCacheService:
         Args:
             cache_keys: List of cache keys to delete
         """
-        cache.delete_many(cache_keys)
+        shared_cache.delete_many(cache_keys)
         logger.debug(f"Deleted {len(cache_keys)} cache keys")
@@ -0,0 +1,228 @@
+"""
+Proactive warming of rule configuration caches.
+
+An invalidated rule is rebuilt on the next request that needs it, which
+then pays for the catalog, template and configuration builds. The warmer
+does that work ahead of time:
+
+- After commit: InvalidationBuffer.flush() hands the invalidated rules to
+  schedule(), which rebuilds them on a background thread of the worker.
+- At startup: the warm_rule_caches management command and the gunicorn
+  post_worker_init hook warm the RULE_WARM_TOP_N most-used rules of every
+  workspace, ranked by the configuration accesses recorded with
+  record_access().
+
+Warming a rule fills the complete rule data and rule configuration
+payloads (and with them the catalog and template caches) and pre-renders
+the configuration response body, so the first request after a write is
+served from the response cache.
+
+Background warming is controlled by MASTER_DATA_CONFIG['WARM_RULE_CACHES'].
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set
+
+from django.conf import settings
+from django.db import connections
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+
+from .constants import (
+    RULE_ACCESS_COUNT_TIMEOUT,
+    RULE_ACCESS_FLUSH_SECONDS,
+    RULE_WARM_MAX_RULES,
+    RULE_WARM_TOP_N,
+)
+from .rule_response_cache import RuleResponseCache
+from .shared_cache import SharedCache, shared_cache
+
+logger = logging.getLogger(__name__)
+
+# RuleConfigurationView.cache_endpoint
+CONFIGURATION_ENDPOINT = 'configuration'
+
+
+def warming_enabled() -> bool:
+    """Whether rule caches are warmed in the background."""
+    return getattr(settings, 'MASTER_DATA_CONFIG', {}).get('WARM_RULE_CACHES', False)
+
+
+class RuleCacheWarmer:
+    """Record rule accesses and rebuild rule caches ahead of requests."""
+
+    # Workspace ID -> rule accesses not yet added to the shared cache
+    _access_counts: Dict[int, Counter] = {}
+    _last_access_flush = time.monotonic()
+    # Rules scheduled but not yet warmed by this worker
+    _queued: Set[int] = set()
+    _executor: Optional[ThreadPoolExecutor] = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def access_key(workspace_id: int) -> str:
+        """Shared key of a workspace's recorded rule access counts."""
+        return f"rule_access:w{workspace_id}"
+
+    @staticmethod
+    def record_access(workspace_id: int, rule_id: int) -> None:
+        """Count an access to a rule's configuration."""
+        with RuleCacheWarmer._lock:
+            RuleCacheWarmer._access_counts.setdefault(workspace_id, Counter())[rule_id] += 1
+            due = time.monotonic() - RuleCacheWarmer._last_access_flush >= RULE_ACCESS_FLUSH_SECONDS
+        if due:
+            RuleCacheWarmer.flush_access_counts()
+
+    @staticmethod
+    def flush_access_counts() -> None:
+        """
+        Add this worker's batched access counts to the shared cache.
+
+        Counts are merged with a read and a write; concurrent flushes of
+        the same workspace can lose a batch, which only affects ranking.
+        """
+        with RuleCacheWarmer._lock:
+            pending = RuleCacheWarmer._access_counts
+            RuleCacheWarmer._access_counts = {}
+            RuleCacheWarmer._last_access_flush = time.monotonic()
+
+        for workspace_id, counts in pending.items():
+            key = RuleCacheWarmer.access_key(workspace_id)
+            merged = Counter(shared_cache.get(key) or {})
+            merged.update(counts)
+            shared_cache.set(key, dict(merged), RULE_ACCESS_COUNT_TIMEOUT)
+
+    @staticmethod
+    def access_counts(workspace_id: int) -> Counter:
+        """Recorded access counts by rule ID, including this worker's unflushed ones."""
+        counts = Counter(shared_cache.get(RuleCacheWarmer.access_key(workspace_id)) or {})
+        with RuleCacheWarmer._lock:
+            counts.update(RuleCacheWarmer._access_counts.get(workspace_id, {}))
+        return counts
+
+    @staticmethod
+    def top_rules(workspace_id: int, limit: int = RULE_WARM_TOP_N) -> List[int]:
+        """
+        IDs of the most accessed rules of a workspace.
+
+        Fewer than `limit` recorded rules are topped up with the most recently
+        updated rules of the workspace.
+        """
+        from ..models import Rule
+
+        existing = set(Rule.objects.for_workspace(workspace_id).values_list('id', flat=True))
+        ranked = [rule_id for rule_id, _ in RuleCacheWarmer.access_counts(workspace_id).most_common()
+                  if rule_id in existing][:limit]
+        if len(ranked) < limit:
+            ranked += Rule.objects.for_workspace(workspace_id).exclude(
+                id__in=ranked
+            ).order_by('-last_updated').values_list('id', flat=True)[:limit - len(ranked)]
+        return ranked
+
+    @staticmethod
+    def warm_rule(rule_id: int, api_version: Optional[str] = None) -> None:
+        """Build the payloads and the configuration response of a rule."""
+        from .rule_service import RuleService
+
+        start_time = time.time()
+        service = RuleService()
+        service.lookup_complete_rule_data(rule_id)
+
+        api_version = api_version or api_settings.DEFAULT_VERSION
+        key = RuleResponseCache.key(CONFIGURATION_ENDPOINT, rule_id, api_version)
+        if RuleResponseCache.get(key) is not None:
+            return
+        lookup, serializer = service.serialize_rule_configuration(
+            rule_id, SharedCache.rule_workspace_id(rule_id), start_time)
+        if serializer.errors or lookup.stale:
+            return
+        RuleResponseCache.store(
+            key, JSONRenderer().render(serializer.validated_data), 'application/json')
+
+    @staticmethod
+    def warm_rules(rule_ids: Iterable[int]) -> int:
+        """Warm rules one by one, returning how many succeeded."""
+        warmed = 0
+        for rule_id in rule_ids:
+            with RuleCacheWarmer._lock:
+                RuleCacheWarmer._queued.discard(rule_id)
+            try:
+                RuleCacheWarmer.warm_rule(rule_id)
+                warmed += 1
+            except Exception as e:
+                logger.warning(f"Failed to warm caches of rule {rule_id}: {str(e)}")
+        return warmed
+
+    @staticmethod
+    def warm_workspaces(workspace_ids: Iterable[int], limit: int = RULE_WARM_TOP_N) -> int:
+        """Warm the most used rules of each workspace, returning how many were warmed."""
+        warmed = 0
+        for workspace_id in workspace_ids:
+            warmed += RuleCacheWarmer.warm_rules(RuleCacheWarmer.top_rules(workspace_id, limit))
+        return warmed
+
+    @staticmethod
+    def schedule(rule_ids: Iterable[int] = (), workspace_ids: Iterable[int] = ()) -> None:
+        """
+        Warm invalidated rules and workspaces on this worker's background thread.
+
+        Call after commit. Rules already queued are skipped; of more than
+        RULE_WARM_MAX_RULES rules only the first are warmed.
+        """
+        if not warming_enabled():
+            return
+        workspace_ids = list(workspace_ids)
+        with RuleCacheWarmer._lock:
+            rule_ids = [rule_id for rule_id in rule_ids if rule_id not in RuleCacheWarmer._queued]
+            rule_ids = rule_ids[:RULE_WARM_MAX_RULES]
+            RuleCacheWarmer._queued.update(rule_ids)
+        if rule_ids or workspace_ids:
+            RuleCacheWarmer._submit(RuleCacheWarmer._warm_in_background, rule_ids, workspace_ids)
+
+    @staticmethod
+    def warm_on_startup(limit: int = RULE_WARM_TOP_N) -> None:
+        """Warm the most used rules of every workspace on the background thread."""
+        if not warming_enabled():
+            return
+        RuleCacheWarmer._submit(RuleCacheWarmer._warm_in_background, [], None, limit)
+
+    @staticmethod
+    def _submit(fn, *args) -> None:
+        with RuleCacheWarmer._lock:
+            if RuleCacheWarmer._executor is None:
+                # One thread per worker: warming never competes with itself
+                RuleCacheWarmer._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='rule-cache-warmer')
+            executor = RuleCacheWarmer._executor
+        executor.submit(RuleCacheWarmer._run, fn, *args)
+
+    @staticmethod
+    def _run(fn, *args) -> None:
+        try:
+            fn(*args)
+        except Exception as e:
+            logger.warning(f"Rule cache warming failed: {str(e)}")
+        finally:
+            # The thread's connections (including the shared cache's) would
+            # otherwise stay open between batches
+            connections.close_all()
+
+    @staticmethod
+    def _warm_in_background(rule_ids: List[int], workspace_ids: Optional[List[int]],
+                            limit: int = RULE_WARM_TOP_N) -> None:
+        """Warm rules, then the most used rules of workspaces (None: all of them)."""
+        if workspace_ids is None:
+            from ..models import Workspace
+
+            workspace_ids = list(Workspace.objects.values_list('id', flat=True))
+
+        start = time.perf_counter()
+        warmed = RuleCacheWarmer.warm_rules(rule_ids)
+        warmed += RuleCacheWarmer.warm_workspaces(workspace_ids, limit)
+        logger.info(
+            f"Warmed caches of {warmed} rules in "
+            f"{round((time.perf_counter() - start) * 1000, 2)}ms")
@@ -0,0 +1,251 @@
+"""
+Two-level cache for expensive rule payloads.
+
+Rule configuration and complete rule payloads take the catalog, template
+and inheritance services to build. They are cached twice:
+
+1. In-process: a bounded LRU per worker, holding the pickled payload with
+   the versioned key it was built under. Reads skip the shared cache
+   round trip and the transfer of a large payload.
+2. Shared: the SHARED_CACHE_ALIAS cache, under a generation-versioned key
+   (see shared_cache), so an invalidation in any worker is seen by all.
+
+After an invalidation only one rebuild of a payload runs: threads of a
+worker share one build, and across workers the first one to add the
+rebuild lock to the shared cache builds. Everyone else serves the payload
+of the previous generation if there is one (stale-while-revalidate), or
+waits for the rebuild.
+
+The lock is an add() to the shared cache, which other workers see at
+once: the database cache backend writes through its own autocommit
+connection (see db_routers.SharedCacheRouter), not inside the request
+transaction.
+"""
+
+import pickle
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .constants import (
+    CACHE_TIMEOUT_DEFAULT,
+    PAYLOAD_CACHE_LOCAL_SIZE,
+    PAYLOAD_CACHE_LOCAL_TTL_SECONDS,
+    PAYLOAD_CACHE_LOCK_SECONDS,
+    PAYLOAD_CACHE_WAIT_SECONDS,
+)
+from .shared_cache import SharedCache, shared_cache
+
+# Where a payload came from
+SOURCE_LOCAL = 'local'
+SOURCE_SHARED = 'shared'
+SOURCE_STALE = 'stale'
+SOURCE_WAIT = 'wait'
+SOURCE_BUILD = 'build'
+
+# Interval between checks for another worker's rebuild
+_POLL_SECONDS = 0.05
+
+
+class PayloadLookup(NamedTuple):
+    """A rule payload, where it came from and how long the lookup took."""
+    value: Any
+    source: str
+    elapsed_ms: float
+
+    @property
+    def cached(self) -> bool:
+        return self.source != SOURCE_BUILD
+
+    @property
+    def stale(self) -> bool:
+        """Whether the payload was built for an older generation of the rule."""
+        return self.source == SOURCE_STALE
+
+
+class RulePayloadCache:
+    """In-process LRU in front of the shared cache, with single-flight rebuilds."""
+
+    # (name, rule_id) -> (versioned key, stored at, pickled payload)
+    _entries: 'OrderedDict[Tuple[str, int], Tuple[str, float, bytes]]' = OrderedDict()
+    # Versioned key -> event set when this worker's build of it finishes
+    _flights: Dict[str, threading.Event] = {}
+    # Source -> [lookups, total ms, max ms]
+    _timings: Dict[str, List[float]] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def latest_key(name: str, rule_id: int) -> str:
+        """Shared key pointing at the most recently built payload of a rule."""
+        return f"payload_latest:{name}:{rule_id}"
+
+    @staticmethod
+    def get_or_build(name: str, rule_id: int, build: Callable[[], Any]) -> PayloadLookup:
+        """
+        Return the payload `name` of a rule, calling build() on a miss.
+
+        The versioned key is read before build() runs, so a payload built
+        while the rule is being invalidated is stored under the old
+        generation and never served as current.
+        """
+        start = time.perf_counter()
+        key = SharedCache.rule_key(f'payload:{name}', rule_id)
+        value, source = RulePayloadCache._lookup(name, rule_id, key, build)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        RulePayloadCache._record(source, elapsed_ms)
+        return PayloadLookup(value, source, round(elapsed_ms, 2))
+
+    @staticmethod
+    def _lookup(name: str, rule_id: int, key: str, build: Callable[[], Any]) -> Tuple[Any, str]:
+        cached = RulePayloadCache._get_cached(name, rule_id, key)
+        if cached is not None:
+            return cached
+
+        with RulePayloadCache._lock:
+            flight = RulePayloadCache._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = RulePayloadCache._flights[key] = threading.Event()
+
+        if not leader:
+            # Another thread of this worker is already on it
+            stale = RulePayloadCache._get_stale(name, rule_id)
+            if stale is not None:
+                return stale, SOURCE_STALE
+            flight.wait(PAYLOAD_CACHE_WAIT_SECONDS)
+            cached = RulePayloadCache._get_cached(name, rule_id, key)
+            if cached is not None:
+                return cached[0], SOURCE_WAIT
+            return RulePayloadCache._build(name, rule_id, key, build), SOURCE_BUILD
+
+        try:
+            return RulePayloadCache._lead(name, rule_id, key, build)
+        finally:
+            with RulePayloadCache._lock:
+                RulePayloadCache._flights.pop(key, None)
+            flight.set()
+
+    @staticmethod
+    def _lead(name: str, rule_id: int, key: str, build: Callable[[], Any]) -> Tuple[Any, str]:
+        """Rebuild a missing payload, unless another worker holds the rebuild lock."""
+        lock_key = f"lock:{key}"
+        token = uuid.uuid4().hex
+        if shared_cache.add(lock_key, token, PAYLOAD_CACHE_LOCK_SECONDS):
+            try:
+                return RulePayloadCache._build(name, rule_id, key, build), SOURCE_BUILD
+            finally:
+                if shared_cache.get(lock_key) == token:
+                    shared_cache.delete(lock_key)
+
+        stale = RulePayloadCache._get_stale(name, rule_id)
+        if stale is not None:
+            return stale, SOURCE_STALE
+
+        deadline = time.monotonic() + PAYLOAD_CACHE_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(_POLL_SECONDS)
+            cached = RulePayloadCache._get_cached(name, rule_id, key)
+            if cached is not None:
+                return cached[0], SOURCE_WAIT
+        # The other worker is too slow (or died): build it ourselves
+        return RulePayloadCache._build(name, rule_id, key, build), SOURCE_BUILD
+
+    @staticmethod
+    def _build(name: str, rule_id: int, key: str, build: Callable[[], Any]) -> Any:
+        value = build()
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        shared_cache.set_many({
+            key: data,
+            RulePayloadCache.latest_key(name, rule_id): key,
+        }, CACHE_TIMEOUT_DEFAULT)
+        RulePayloadCache._set_local(name, rule_id, key, data)
+        return value
+
+    @staticmethod
+    def _get_cached(name: str, rule_id: int, key: str) -> Optional[Tuple[Any, str]]:
+        """Payload under the current key, from this worker or the shared cache."""
+        entry = RulePayloadCache._get_local(name, rule_id)
+        if entry is not None and entry[0] == key:
+            return pickle.loads(entry[2]), SOURCE_LOCAL
+        data = shared_cache.get(key)
+        if data is not None:
+            RulePayloadCache._set_local(name, rule_id, key, data)
+            return pickle.loads(data), SOURCE_SHARED
+        return None
+
+    @staticmethod
+    def _get_stale(name: str, rule_id: int) -> Optional[Any]:
+        """Payload of an older generation of the rule, if one is still cached."""
+        entry = RulePayloadCache._get_local(name, rule_id)
+        if entry is not None:
+            return pickle.loads(entry[2])
+        latest = shared_cache.get(RulePayloadCache.latest_key(name, rule_id))
+        if latest is not None:
+            data = shared_cache.get(latest)
+            if data is not None:
+                return pickle.loads(data)
+        return None
+
+    @staticmethod
+    def _get_local(name: str, rule_id: int) -> Optional[Tuple[str, float, bytes]]:
+        with RulePayloadCache._lock:
+            entry = RulePayloadCache._entries.get((name, rule_id))
+            if entry is None:
+                return None
+            if time.monotonic() - entry[1] > PAYLOAD_CACHE_LOCAL_TTL_SECONDS:
+                del RulePayloadCache._entries[(name, rule_id)]
+                return None
+            RulePayloadCache._entries.move_to_end((name, rule_id))
+            return entry
+
+    @staticmethod
+    def _set_local(name: str, rule_id: int, key: str, data: bytes) -> None:
+        with RulePayloadCache._lock:
+            RulePayloadCache._entries[(name, rule_id)] = (key, time.monotonic(), data)
+            RulePayloadCache._entries.move_to_end((name, rule_id))
+            while len(RulePayloadCache._entries) > PAYLOAD_CACHE_LOCAL_SIZE:
+                RulePayloadCache._entries.popitem(last=False)
+
+    @staticmethod
+    def _record(source: str, elapsed_ms: float) -> None:
+        with RulePayloadCache._lock:
+            timing = RulePayloadCache._timings.setdefault(source, [0, 0.0, 0.0])
+            timing[0] += 1
+            timing[1] += elapsed_ms
+            timing[2] = max(timing[2], elapsed_ms)
+
+    @staticmethod
+    def stats() -> Dict:
+        """Lookup counts and timings of this worker, by source."""
+        with RulePayloadCache._lock:
+            timings = {
+                source: {
+                    'count': int(count),
+                    'total_ms': round(total, 2),
+                    'avg_ms': round(total / count, 2),
+                    'max_ms': round(longest, 2),
+                }
+                for source, (count, total, longest) in RulePayloadCache._timings.items()
+            }
+            entries = len(RulePayloadCache._entries)
+
+        lookups = sum(timing['count'] for timing in timings.values())
+        hits = sum(timings.get(source, {}).get('count', 0)
+                   for source in (SOURCE_LOCAL, SOURCE_SHARED))
+        return {
+            'lookups': lookups,
+            'hit_ratio': round(hits / lookups, 4) if lookups else 0.0,
+            'local_entries': entries,
+            'local_max_entries': PAYLOAD_CACHE_LOCAL_SIZE,
+            'local_ttl_seconds': PAYLOAD_CACHE_LOCAL_TTL_SECONDS,
+            'timings': timings,
+        }
+
+    @staticmethod
+    def clear() -> None:
+        """Drop this worker's payloads and statistics."""
+        with RulePayloadCache._lock:
+            RulePayloadCache._entries.clear()
+            RulePayloadCache._timings.clear()
@@ -0,0 +1,61 @@
+"""
+Pre-rendered response cache for rule read endpoints.
+
+Rule configuration responses are polled constantly by the frontend and
+change only when the rule, its details or the values of its dimensions
+change. Rendered response bodies are stored in the shared cache under
+(endpoint, rule id, rule generation, API version), together with a strong
+ETag computed from the bytes. Any signal that invalidates the rule bumps
+its generation, so the next request renders a fresh body with a new ETag;
+until then clients revalidating with If-None-Match get a 304.
+"""
+
+import hashlib
+from typing import NamedTuple, Optional
+
+from django.utils.http import parse_etags
+
+from .constants import CACHE_TIMEOUT_DEFAULT
+from .shared_cache import SharedCache, shared_cache
+
+
+class CachedResponse(NamedTuple):
+    """A rendered response body and its strong ETag."""
+    content: bytes
+    content_type: str
+    etag: str
+
+
+class RuleResponseCache:
+    """Store and look up rendered rule responses by rule generation."""
+
+    @staticmethod
+    def key(endpoint: str, rule_id: int, api_version: Optional[str]) -> str:
+        return SharedCache.rule_key(f'rule_response:{endpoint}', rule_id, api_version or 'v1')
+
+    @staticmethod
+    def get(key: str) -> Optional[CachedResponse]:
+        entry = shared_cache.get(key)
+        return CachedResponse(*entry) if entry is not None else None
+
+    @staticmethod
+    def store(key: str, content: bytes, content_type: str) -> CachedResponse:
+        """
+        Cache a rendered body and return it with its ETag.
+
+        key must be computed before the body is built, so that a body built
+        while the rule was being invalidated is stored under the old
+        generation and never served.
+        """
+        entry = CachedResponse(
+            content, content_type, f'"{hashlib.sha256(content).hexdigest()[:32]}"')
+        shared_cache.set(key, tuple(entry), CACHE_TIMEOUT_DEFAULT)
+        return entry
+
+    @staticmethod
+    def is_not_modified(entry: CachedResponse, if_none_match: Optional[str]) -> bool:
+        """Whether an If-None-Match header matches the cached body (weak comparison)."""
+        if not if_none_match:
+            return False
+        etags = [etag[2:] if etag.startswith('W/') else etag for etag in parse_etags(if_none_match)]
+        return '*' in etags or entry.etag in etags
@@ -1,4 +1,5 @@
-from typing import Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from django.core.cache import cache
 from django.utils import timezone
 import logging
@@ -8,6 +9,7 @@ from .entity_template_service import EntityTemplateService
 from .rule_cache_service import RuleCacheService
 from .rule_validation_service import RuleValidationService
 from .rule_metrics_service import RuleMetricsService
+from .rule_payload_cache import PayloadLookup, RulePayloadCache
 from .constants import CACHE_TIMEOUT_DEFAULT
 from ..models import Rule, Entity
 
@@ -72,7 +74,7 @@ class RuleService:
             raise ValueError(f"Rule with id {rule.id} does not exist")
 
         # Get basic entity template info
-        entity_templates = self.entity_template.get_templates_for_rule(rule.id)
+        entity_templates = self.entity_template.get_templates_for_rule(rule)
 
         return {
             'id': rule.id,
@@ -90,7 +92,7 @@ class RuleService:
 
             # Summary information
             'total_entities': len(entity_templates),
-            'entities_with_rules': [{'id': e['entity'], 'name': e['entity_name'], 'entity_level': e['entity_level']} for e in entity_templates],
+            'entities_with_rules': [{'id': e['entity'].id, 'name': e['entity_name'], 'entity_level': e['entity_level']} for e in entity_templates],
             'can_generate_count': sum(1 for e in entity_templates if e.get('can_generate', False)),
             'configuration_errors': rule.validate_configuration() if hasattr(rule, 'validate_configuration') else [],
         }
@@ -185,11 +187,42 @@ class RuleService:
         """
         self.cache.clear_rule_configuration_cache(rule_id)
 
+    def get_performance_metrics(self, rule_id: int) -> Dict:
+        """
+        Get this worker's rule payload cache statistics and timings.
+
+        Args:
+            rule_id: Rule ID
+
+        Returns:
+            Dictionary matching PerformanceMetricsSerializer
+        """
+        return {
+            'rule': rule_id,
+            'cache_status': RulePayloadCache.stats(),
+            'services_initialized': {
+                'dimension_catalog': self.dimension_catalog is not None,
+                'inheritance_matrix': self.inheritance_matrix is not None,
+                'entity_template': self.entity_template is not None,
+            },
+            'timestamp': timezone.now().isoformat(),
+        }
+
     def get_complete_rule_data(self, rule: Rule) -> Dict:
         """
         Get complete rule data with optimized lookup tables for O(1) access patterns.
         This provides comprehensive lookup structures for maximum performance.
         """
+        return self.lookup_complete_rule_data(rule).value
+
+    def lookup_complete_rule_data(self, rule: Rule) -> PayloadLookup:
+        """Get complete rule data through RulePayloadCache, with its cache source."""
+        rule_id = rule if isinstance(rule, int) else rule.id
+        return RulePayloadCache.get_or_build(
+            'complete_rule_data', rule_id, lambda: self._build_complete_rule_data(rule_id))
+
+    def _build_complete_rule_data(self, rule: Rule) -> Dict:
+        """Build complete rule data (on a payload cache miss)."""
         try:
             # Convert rule ID to Rule instance if needed
             if isinstance(rule, int):
@@ -272,6 +305,42 @@ class RuleService:
         Get rule configuration data that matches the structure of rule_configuration.json.
         This method returns the exact structure shown in the redocs documentation.
         """
+        return self.lookup_rule_configuration_data(rule_id).value
+
+    def lookup_rule_configuration_data(self, rule_id: int) -> PayloadLookup:
+        """Get rule configuration data through RulePayloadCache, with its cache source."""
+        return RulePayloadCache.get_or_build(
+            'rule_configuration', rule_id, lambda: self._build_rule_configuration_data(rule_id))
+
+    def serialize_rule_configuration(self, rule_id: int, workspace_id: int,
+                                     start_time: float) -> Tuple[PayloadLookup, Any]:
+        """
+        Get rule configuration data with performance metrics, validated for the API.
+
+        Shared by RuleConfigurationView and RuleCacheWarmer so that warmed
+        response bodies match rendered ones.
+
+        Returns:
+            (payload lookup, RuleConfigurationSerializer after is_valid())
+        """
+        from ..serializers import RuleConfigurationSerializer
+
+        lookup = self.lookup_rule_configuration_data(rule_id)
+        configuration_data = lookup.value
+
+        # Add performance metrics
+        configuration_data['performance_metrics'] = {
+            'generation_time_ms': round((time.time() - start_time) * 1000, 2),
+            'cached': lookup.cached,
+            'workspace': workspace_id
+        }
+
+        serializer = RuleConfigurationSerializer(data=configuration_data)
+        serializer.is_valid()
+        return lookup, serializer
+
+    def _build_rule_configuration_data(self, rule_id: int) -> Dict:
+        """Build rule configuration data (on a payload cache miss)."""
         try:
             # Get rule with related data
             rule = Rule.objects.select_related(
@@ -0,0 +1,211 @@
+"""
+Cross-process cache tier with generation-based invalidation.
+
+Rule payloads (dimension catalogs, entity templates, inheritance matrices,
+rendered configurations) are cached in the SHARED_CACHE_ALIAS cache, which
+every worker process reads and writes. Keys embed a per-workspace and a
+per-rule generation counter:
+
+    dimension_catalog:42:<workspace generation>.<rule generation>
+
+Invalidating a rule is a single atomic incr() of its generation counter;
+invalidating every rule of a workspace is a single incr() of the workspace
+counter. Entries under older generations are never read again and expire
+on their own, so no worker has to know (or guess) the keys to delete.
+
+Counters are created from the clock in microseconds rather than 0, so a
+counter that is evicted or lost never falls back to a value that was
+already used for cached entries.
+
+In-process caches read the counters through a SharedGenerationMemo, which
+re-reads a counter at most every SHARED_GENERATION_CHECK_SECONDS.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+
+from .constants import (
+    CACHE_TIMEOUT_DEFAULT,
+    SHARED_CACHE_ALIAS,
+    SHARED_GENERATION_CHECK_SECONDS,
+)
+
+
+def get_shared_cache():
+    """Return the cache shared by all worker processes."""
+    if SHARED_CACHE_ALIAS in settings.CACHES:
+        return caches[SHARED_CACHE_ALIAS]
+    return caches[DEFAULT_CACHE_ALIAS]
+
+
+class _SharedCacheProxy:
+    """Module-level handle that resolves the shared cache on each access."""
+
+    def __getattr__(self, name):
+        return getattr(get_shared_cache(), name)
+
+
+shared_cache = _SharedCacheProxy()
+
+
+class SharedCache:
+    """Generation counters and versioned keys for the shared cache tier."""
+
+    # Rules never move between workspaces, so the mapping is safe to keep
+    # for the life of the process
+    _rule_workspaces: Dict[int, int] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def generation_key(scope: str, object_id: int) -> str:
+        """Key of the generation counter of a workspace or rule."""
+        return f"generation:{scope}:{object_id}"
+
+    @staticmethod
+    def get_generations(keys: List[str]) -> List[int]:
+        """Read several generation counters in one round trip, creating missing ones."""
+        cache = get_shared_cache()
+        values = cache.get_many(keys)
+        for key in keys:
+            if key not in values:
+                initial = time.time_ns() // 1000
+                if not cache.add(key, initial, timeout=None):
+                    initial = cache.get(key, initial)
+                values[key] = initial
+        return [values[key] for key in keys]
+
+    @staticmethod
+    def bump(key: str) -> int:
+        """Atomically advance a generation counter."""
+        cache = get_shared_cache()
+        try:
+            return cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns() // 1000, timeout=None)
+            return cache.incr(key)
+
+    @staticmethod
+    def rule_workspace_id(rule_id: int) -> int:
+        """Workspace of a rule (0 for a rule that no longer exists)."""
+        workspace_id = SharedCache._rule_workspaces.get(rule_id)
+        if workspace_id is None:
+            from ..models import Rule
+
+            workspace_id = Rule.objects.all_workspaces().filter(
+                id=rule_id
+            ).values_list('workspace_id', flat=True).first()
+            if workspace_id is None:
+                return 0
+            with SharedCache._lock:
+                SharedCache._rule_workspaces[rule_id] = workspace_id
+        return workspace_id
+
+    @staticmethod
+    def rule_generation(rule_id: int) -> Tuple[int, int]:
+        """Return (workspace generation, rule generation) of a rule."""
+        workspace_id = SharedCache.rule_workspace_id(rule_id)
+        workspace_generation, rule_generation = SharedCache.get_generations([
+            SharedCache.generation_key('workspace', workspace_id),
+            SharedCache.generation_key('rule', rule_id),
+        ])
+        return workspace_generation, rule_generation
+
+    @staticmethod
+    def rule_key(name: str, rule_id: int, *parts: Any) -> str:
+        """Versioned key for data derived from a rule."""
+        workspace_generation, rule_generation = SharedCache.rule_generation(rule_id)
+        key = f"{name}:{rule_id}:{workspace_generation}.{rule_generation}"
+        return ':'.join([key, *map(str, parts)])
+
+    @staticmethod
+    def workspace_key(name: str, workspace_id: int, *parts: Any) -> str:
+        """Versioned key for data derived from a whole workspace."""
+        generation, = SharedCache.get_generations([
+            SharedCache.generation_key('workspace', workspace_id)])
+        key = f"{name}:w{workspace_id}:{generation}"
+        return ':'.join([key, *map(str, parts)])
+
+    @staticmethod
+    def values_generation(workspace_id: int) -> int:
+        """Generation of the dimensions and dimension values of a workspace."""
+        generation, = SharedCache.get_generations([
+            SharedCache.generation_key('values', workspace_id)])
+        return generation
+
+    @staticmethod
+    def bump_rule_generations(rule_ids: Iterable[int]) -> None:
+        """Invalidate every shared entry derived from these rules."""
+        # Sorted so that concurrent bumps lock counters in the same order
+        for rule_id in sorted(set(rule_ids)):
+            SharedCache.bump(SharedCache.generation_key('rule', rule_id))
+            rule_generations.forget(rule_id)
+
+    @staticmethod
+    def bump_workspace_generation(workspace_id: int) -> int:
+        """Invalidate every shared entry derived from a workspace or its rules."""
+        generation = SharedCache.bump(SharedCache.generation_key('workspace', workspace_id))
+        # Rule generations include their workspace's
+        rule_generations.forget()
+        return generation
+
+    @staticmethod
+    def bump_values_generation(workspace_id: int) -> int:
+        """Invalidate every worker's value index of a workspace."""
+        generation = SharedCache.bump(SharedCache.generation_key('values', workspace_id))
+        values_generations.forget(workspace_id)
+        return generation
+
+    @staticmethod
+    def get(key: str, default: Optional[Any] = None) -> Any:
+        return get_shared_cache().get(key, default)
+
+    @staticmethod
+    def set(key: str, value: Any, timeout: int = CACHE_TIMEOUT_DEFAULT) -> None:
+        get_shared_cache().set(key, value, timeout)
+
+
+class SharedGenerationMemo:
+    """
+    Per-process copy of shared generation counters for in-process caches.
+
+    A counter is re-read from the shared cache at most every `ttl` seconds,
+    so a hot lookup path does not pay a shared cache round trip per call
+    and sees another worker's committed change within `ttl`. Bumps made by
+    this process drop its copy right away.
+    """
+
+    def __init__(self, read: Callable[[int], Any], ttl: float = SHARED_GENERATION_CHECK_SECONDS):
+        self._read = read
+        self.ttl = ttl
+        # Object ID -> (read at, generation)
+        self._values: Dict[int, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, object_id: int) -> Any:
+        """Return the shared generation of an object, re-reading it when expired."""
+        now = time.monotonic()
+        entry = self._values.get(object_id)
+        if entry is not None and now - entry[0] < self.ttl:
+            return entry[1]
+        generation = self._read(object_id)
+        with self._lock:
+            self._values[object_id] = (now, generation)
+        return generation
+
+    def forget(self, object_id: Optional[int] = None) -> None:
+        """Drop the copy of one object's generation, or of all of them."""
+        with self._lock:
+            if object_id is None:
+                self._values.clear()
+            else:
+                self._values.pop(object_id, None)
+
+
+# (workspace generation, rule generation) by rule ID
+rule_generations = SharedGenerationMemo(SharedCache.rule_generation)
+# Dimension value generation by workspace ID
+values_generations = SharedGenerationMemo(SharedCache.values_generation)
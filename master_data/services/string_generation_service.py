@@ -4,15 +4,13 @@ Handles string generation, validation, and naming conventions.
 """
 
 import uuid
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from django.core.exceptions import ValidationError
 from django.db import transaction
-from ..models import String, StringDetail, Rule, RuleDetail, DimensionValue
-
-
-class NamingConventionError(Exception):
-    """Custom exception for naming convention errors."""
-    pass
+from ..models import String, StringDetail, Rule, RuleDetail
+from .naming_template import NamingConventionError, get_naming_template
+from .string_search import StringSearchService
+from .workspace_value_index import get_workspace_value_index
 
 
 class StringGenerationService:
@@ -40,119 +38,151 @@ class StringGenerationService:
             NamingConventionError: If generation fails due to missing values or invalid config
         """
         try:
-            # Get rule details for this entity, ordered by dimension_order
-            rule_details = RuleDetail.objects.filter(
-                rule=rule,
-                entity=entity
-            ).select_related('dimension').order_by('dimension_order')
-
-            if not rule_details.exists():
-                raise NamingConventionError(
-                    f"No rule details found for rule '{rule.name}' and entity '{entity.name}'"
-                )
-
-            # Validate dimension order sequence to ensure data integrity
-            orders = [detail.dimension_order for detail in rule_details]
-            expected_orders = list(range(1, len(orders) + 1))
-            if sorted(orders) != expected_orders:
-                raise NamingConventionError(
-                    f"Invalid dimension order sequence for rule '{rule.name}' entity '{entity.name}': "
-                    f"expected {expected_orders}, got {sorted(orders)}"
-                )
+            # Compiled once per (rule, entity) and reused until the rule changes
+            template = get_naming_template(rule, entity)
+            return template.render(dimension_values)
 
-            parts = []
+        except Exception as e:
+            raise NamingConventionError(f"String generation failed: {str(e)}")
 
-            for detail in rule_details:
-                dimension_name = detail.dimension.name
+    @staticmethod
+    def generate_many(rule: Rule, entity, rows, validate_values: bool = True) -> Dict[str, Any]:
+        """
+        Generate string values for many rows against one preloaded rule snapshot.
 
-                # Get the value for this dimension
-                if dimension_name not in dimension_values:
-                    raise NamingConventionError(
-                        f"Missing value for required dimension '{dimension_name}'"
-                    )
+        Args:
+            rule: The naming rule to apply
+            entity: The entity the strings belong to
+            rows: Either a list of dicts mapping dimension names to values, or a
+                  columnar dict mapping dimension names to equal-length lists
+            validate_values: Whether to check list-type values against the
+                  dimension's DimensionValue set
 
-                value = dimension_values[dimension_name]
+        Returns:
+            Dict with 'values' (one entry per row, None for failed rows),
+            'errors' (list of {'row', 'errors'}) and success/error counts
 
-                # Apply prefix and suffix
-                formatted_value = StringGenerationService._format_dimension_value(
-                    value, detail.prefix, detail.suffix
-                )
+        Raises:
+            NamingConventionError: If the rule/entity template is invalid or
+                the rows are malformed
+        """
+        rows = StringGenerationService._normalize_rows(rows)
+        snapshot = StringGenerationService._load_generation_snapshot(
+            rule, entity, validate_values
+        )
+        template = snapshot['template']
 
-                parts.append(formatted_value)
+        values = []
+        errors = []
 
-                # Add delimiter if it exists (including for the last part)
-                if detail.delimiter:
-                    parts.append(detail.delimiter)
+        for index, row in enumerate(rows):
+            row_errors = StringGenerationService._validate_row(row, snapshot)
+            if row_errors:
+                values.append(None)
+                errors.append({'row': index, 'errors': row_errors})
+                continue
 
-            # Join all parts (values + delimiters)
-            return ''.join(parts)
+            values.append(template.render(row))
 
-        except Exception as e:
-            raise NamingConventionError(f"String generation failed: {str(e)}")
+        return {
+            'values': values,
+            'errors': errors,
+            'total_count': len(rows),
+            'success_count': len(rows) - len(errors),
+            'error_count': len(errors),
+        }
 
     @staticmethod
-    def _format_dimension_value(value: str, prefix: Optional[str], suffix: Optional[str]) -> str:
-        """Format a dimension value with optional prefix and suffix."""
-        formatted = value
-        if prefix:
-            formatted = f"{prefix}{formatted}"
-        if suffix:
-            formatted = f"{formatted}{suffix}"
-        return formatted
+    def _normalize_rows(rows) -> List[Dict[str, str]]:
+        """Convert list-of-dicts or columnar dict-of-lists input to a list of dicts."""
+        if isinstance(rows, dict):
+            columns = {name: list(column) for name, column in rows.items()}
+            lengths = {len(column) for column in columns.values()}
+            if len(lengths) > 1:
+                raise NamingConventionError(
+                    "Columnar rows must have the same length for every dimension"
+                )
+            row_count = lengths.pop() if lengths else 0
+            names = list(columns.keys())
+            return [
+                {name: columns[name][i] for name in names}
+                for i in range(row_count)
+            ]
+
+        if not all(isinstance(row, dict) for row in rows):
+            raise NamingConventionError(
+                "Rows must be a list of dimension-value objects or a columnar object of lists"
+            )
+        return list(rows)
 
     @staticmethod
-    def validate_dimension_values(rule: Rule, entity, dimension_values: Dict[str, str]) -> List[str]:
+    def _load_generation_snapshot(rule: Rule, entity, validate_values: bool = True) -> Dict[str, Any]:
         """
-        Validate that all required dimension values are provided and valid.
+        Load everything needed to validate and render rows for a rule/entity.
 
-        Returns:
-            List of validation error messages (empty if valid)
+        Both the compiled template and the workspace value index are cached,
+        so a warm snapshot costs no queries.
         """
-        errors = []
+        try:
+            template = get_naming_template(rule, entity)
+        except NamingConventionError:
+            raise
+        except Exception as e:
+            raise NamingConventionError(f"String generation failed: {str(e)}")
 
-        # Get required dimensions for this rule and entity
-        required_dimensions = RuleDetail.objects.filter(
-            rule=rule, entity=entity
-        ).values_list('dimension__name', flat=True)
+        return {
+            'template': template,
+            'value_index': (
+                get_workspace_value_index(rule.workspace_id) if validate_values else None
+            ),
+        }
 
-        # Check for missing dimensions
-        for dimension_name in required_dimensions:
-            if dimension_name not in dimension_values:
+    @staticmethod
+    def _validate_row(row: Dict[str, str], snapshot: Dict[str, Any]) -> List[str]:
+        """Validate a single row against a preloaded snapshot without queries."""
+        errors = []
+        value_index = snapshot['value_index']
+
+        for dimension_name in snapshot['template'].dimension_names:
+            if dimension_name not in row:
                 errors.append(f"Missing required dimension: {dimension_name}")
                 continue
 
-            value = dimension_values[dimension_name]
-            if not value or not value.strip():
+            value = row[dimension_name]
+            if value is None or not str(value).strip():
                 errors.append(f"Empty value for dimension: {dimension_name}")
+                continue
 
-        # Validate dimension values exist in the system
-        for dimension_name, value in dimension_values.items():
-            if not StringGenerationService._is_valid_dimension_value(dimension_name, value):
+            if value_index is None:
+                continue
+            entry = value_index.by_name.get(dimension_name)
+            if entry is not None and entry.is_list and value not in entry.values:
                 errors.append(
                     f"Invalid value '{value}' for dimension '{dimension_name}'")
 
         return errors
 
     @staticmethod
-    def _is_valid_dimension_value(dimension_name: str, value: str) -> bool:
-        """Check if a dimension value is valid (exists in DimensionValue table)."""
-        from ..models import Dimension, DimensionValue
-
-        try:
-            dimension = Dimension.objects.get(name=dimension_name)
+    def validate_dimension_values(rule: Rule, entity, dimension_values: Dict[str, str]) -> List[str]:
+        """
+        Validate that all required dimension values are provided and valid.
 
-            # For LIST type dimensions, check if value exists
-            if dimension.type == 'list':
-                return DimensionValue.objects.filter(
-                    dimension=dimension,
-                    value=value
-                ).exists()
+        Runs in memory against the compiled template and the rule
+        workspace's value index.
 
-            # For FREE_TEXT type, any non-empty value is valid
-            return bool(value and value.strip())
+        Returns:
+            List of validation error messages (empty if valid)
+        """
+        try:
+            required_dimensions = get_naming_template(rule, entity).dimension_names
+        except NamingConventionError:
+            # Fall back to the raw rule details when the template is invalid
+            required_dimensions = RuleDetail.objects.filter(
+                rule=rule, entity=entity
+            ).values_list('dimension__name', flat=True)
 
-        except Dimension.DoesNotExist:
-            return False
+        value_index = get_workspace_value_index(rule.workspace_id)
+        return value_index.validate(required_dimensions, dimension_values)
 
     @staticmethod
     def check_naming_conflicts(rule: Rule, entity, proposed_value: str, exclude_string: Optional[int] = None) -> List[str]:
@@ -172,25 +202,22 @@ class StringGenerationService:
         )
 
         if exclude_string:
-            existing_query = existing_query.exclude(id=exclude_string.id)
+            existing_query = existing_query.exclude(id=getattr(exclude_string, 'id', exclude_string))
 
         if existing_query.exists():
             conflicts.append(
                 f"String value '{proposed_value}' already exists for this rule and entity")
 
-        # Check for similar strings (optional - for warnings)
-        similar_strings = String.objects.filter(
-            rule=rule,
-            entity=entity,
-            value__icontains=proposed_value[:10]  # Check first 10 chars
+        # Check for similar strings (optional - for warnings); trigram
+        # similarity served by the search index, 3 best examples
+        similar_strings = StringSearchService.search(
+            String, rule.workspace_id, proposed_value, mode='similar', limit=3,
+            exclude_ids=[getattr(exclude_string, 'id', exclude_string)] if exclude_string else (),
+            rule_id=rule.id, entity_id=entity.id
         )
 
-        if exclude_string:
-            similar_strings = similar_strings.exclude(id=exclude_string.id)
-
-        if similar_strings.exists():
-            # Limit to 3 examples
-            similar_values = [s.value for s in similar_strings[:3]]
+        if similar_strings:
+            similar_values = [match.value for match in similar_strings]
             conflicts.append(
                 f"Similar strings exist: {', '.join(similar_values)}")
 
@@ -243,29 +270,24 @@ class StringGenerationService:
             string_uuid=uuid.uuid4()
         )
 
-        # Create StringDetails for each dimension
+        # Create StringDetails for each dimension, resolving values in memory
+        value_index = get_workspace_value_index(rule.workspace_id)
         for dimension_name, value in dimension_values.items():
-            dimension = rule.rule_details.filter(
-                entity=entity,
-                dimension__name=dimension_name
-            ).first().dimension
+            entry = value_index.by_name[dimension_name]
 
             # Get DimensionValue if it's a list type
-            dimension_value = None
+            dimension_value_id = None
             dimension_value_freetext = None
 
-            if dimension.type == 'list':
-                dimension_value = DimensionValue.objects.filter(
-                    dimension=dimension,
-                    value=value
-                ).first()
+            if entry.is_list:
+                dimension_value_id = entry.value_ids_by_value.get(value)
             else:
                 dimension_value_freetext = value
 
             StringDetail.objects.create(
                 string=string,
-                dimension=dimension,
-                dimension_value=dimension_value,
+                dimension_id=entry.id,
+                dimension_value_id=dimension_value_id,
                 dimension_value_freetext=dimension_value_freetext
             )
 
@@ -0,0 +1,371 @@
+"""
+Substring and similarity search over String and ProjectString values.
+
+On PostgreSQL, searches run against pg_trgm GIN indexes on value (see
+migration 0006): ILIKE substring filters and the % similarity operator both
+use them, and matches are ranked by trigram similarity. On other backends an
+in-process NgramIndex per workspace answers the same queries: it is built
+with one query, maps each trigram to the IDs of the values containing it,
+and is rebuilt when the workspace's strings change (version based, like the
+workspace value index).
+
+Trigrams follow pg_trgm: values are lower-cased, split into alphanumeric
+words, and each word is padded with two spaces in front and one behind, so
+rankings agree between the two implementations.
+"""
+
+import heapq
+import re
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from django.db import connections, transaction
+
+from .constants import (
+    STRING_SEARCH_DEFAULT_LIMIT,
+    STRING_SEARCH_INDEX_CACHE_SIZE,
+    STRING_SEARCH_MAX_FILTER_IDS,
+    STRING_SEARCH_SIMILARITY_THRESHOLD,
+)
+
+SEARCH_MODES = ('substring', 'similar')
+
+# Non-alphanumeric runs separate words (as in pg_trgm)
+_WORD_SEPARATOR = re.compile(r"[\W_]+")
+
+# Attribute fields kept per row so index searches can be filtered
+INDEXED_FIELDS = {
+    'master_data.String': ('rule_id', 'entity_id'),
+    'master_data.ProjectString': ('project_id', 'platform_id', 'rule_id', 'entity_id'),
+}
+
+
+def _words(text: str) -> List[str]:
+    return [word for word in _WORD_SEPARATOR.split(text.lower()) if word]
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """Return the pg_trgm trigram set of a text."""
+    result = set()
+    for word in _words(text):
+        padded = f'  {word} '
+        result.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(result)
+
+
+def substring_trigrams(text: str) -> FrozenSet[str]:
+    """
+    Trigrams every value containing `text` must have.
+
+    Only windows inside a word are used: word boundaries of the query need
+    not be word boundaries of the value.
+    """
+    result = set()
+    for word in _words(text):
+        result.update(word[i:i + 3] for i in range(len(word) - 2))
+    return frozenset(result)
+
+
+def similarity(left: FrozenSet[str], right: FrozenSet[str]) -> float:
+    """pg_trgm similarity: shared trigrams over distinct trigrams of both."""
+    if not left or not right:
+        return 0.0
+    shared = len(left & right)
+    return shared / (len(left) + len(right) - shared)
+
+
+class SearchMatch(NamedTuple):
+    """One ranked search result."""
+    id: int
+    value: str
+    score: float
+
+
+class NgramIndex:
+    """
+    Immutable trigram index over the values of one model in one workspace.
+
+    Attributes:
+        label: Model label ('master_data.String' or 'master_data.ProjectString')
+        workspace_id: ID of the indexed workspace
+        version: Version the index was built against
+    """
+
+    __slots__ = ('label', 'workspace_id', 'version', 'fields', 'values', 'attrs',
+                 'sizes', 'postings')
+
+    def __init__(self, label: str, workspace_id: int, version: int,
+                 rows: Iterable[Sequence]):
+        self.label = label
+        self.workspace_id = workspace_id
+        self.version = version
+        self.fields = INDEXED_FIELDS[label]
+        self.values: Dict[int, str] = {}
+        self.attrs: Dict[int, tuple] = {}
+        self.sizes: Dict[int, int] = {}
+        self.postings: Dict[str, List[int]] = {}
+
+        for row in rows:
+            row_id, value = row[0], row[1]
+            self.values[row_id] = value
+            self.attrs[row_id] = tuple(row[2:])
+            grams = trigrams(value)
+            self.sizes[row_id] = len(grams)
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(row_id)
+
+    def __repr__(self):
+        return (
+            f"NgramIndex({self.label}, workspace={self.workspace_id}, "
+            f"version={self.version}, values={len(self.values)})"
+        )
+
+    def __len__(self):
+        return len(self.values)
+
+    @classmethod
+    def build(cls, model, workspace_id: int, version: int = 0) -> 'NgramIndex':
+        """Build the index for a workspace with a single query."""
+        label = model._meta.label
+        rows = model.objects.for_workspace(workspace_id).values_list(
+            'id', 'value', *INDEXED_FIELDS[label]).order_by().iterator()
+        return cls(label, workspace_id, version, rows)
+
+    def _matches_filters(self, row_id: int, filters: Dict[str, object],
+                         exclude_ids: FrozenSet[int]) -> bool:
+        if row_id in exclude_ids:
+            return False
+        attrs = self.attrs[row_id]
+        return all(attrs[self.fields.index(field)] == value for field, value in filters.items())
+
+    def _check_filters(self, filters: Dict[str, object]):
+        unknown = set(filters) - set(self.fields)
+        if unknown:
+            raise ValueError(f"Cannot filter index search on: {', '.join(sorted(unknown))}")
+
+    def substring_ids(self, query: str, filters: Optional[Dict[str, object]] = None,
+                      exclude_ids: Iterable[int] = ()) -> List[int]:
+        """IDs of values containing query (case-insensitive), in ID order."""
+        filters = filters or {}
+        self._check_filters(filters)
+        exclude_ids = frozenset(exclude_ids)
+        needle = query.lower()
+
+        grams = substring_trigrams(query)
+        if grams:
+            # Intersect the shortest posting lists first
+            postings = sorted((self.postings.get(gram, ()) for gram in grams), key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates.intersection_update(posting)
+                if not candidates:
+                    break
+        else:
+            candidates = self.values.keys()
+
+        return sorted(
+            row_id for row_id in candidates
+            if needle in self.values[row_id].lower()
+            and self._matches_filters(row_id, filters, exclude_ids)
+        )
+
+    def search(self, query: str, mode: str = 'substring', limit: int = STRING_SEARCH_DEFAULT_LIMIT,
+               threshold: float = STRING_SEARCH_SIMILARITY_THRESHOLD,
+               filters: Optional[Dict[str, object]] = None,
+               exclude_ids: Iterable[int] = ()) -> List[SearchMatch]:
+        """
+        Return the top `limit` matches, best first.
+
+        substring: values containing query, ranked by similarity.
+        similar: values whose similarity to query is at least threshold.
+        """
+        filters = filters or {}
+        self._check_filters(filters)
+        exclude_ids = frozenset(exclude_ids)
+        query_grams = trigrams(query)
+
+        if mode == 'substring':
+            scored = (
+                (similarity(query_grams, trigrams(self.values[row_id])), row_id)
+                for row_id in self.substring_ids(query, filters, exclude_ids)
+            )
+        else:
+            shared = Counter()
+            for gram in query_grams:
+                shared.update(self.postings.get(gram, ()))
+            scored = (
+                (count / (len(query_grams) + self.sizes[row_id] - count), row_id)
+                for row_id, count in shared.items()
+                if self._matches_filters(row_id, filters, exclude_ids)
+            )
+            scored = ((score, row_id) for score, row_id in scored if score >= threshold)
+
+        best = heapq.nsmallest(
+            limit, scored, key=lambda item: (-item[0], self.values[item[1]], item[1]))
+        return [SearchMatch(row_id, self.values[row_id], score) for score, row_id in best]
+
+
+class NgramIndexCache:
+    """
+    Bounded, thread-safe LRU of n-gram indexes keyed by (model label, workspace ID).
+
+    Invalidation is version based and process-local, like the workspace
+    value index cache.
+    """
+
+    def __init__(self, maxsize: int = STRING_SEARCH_INDEX_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._indexes: 'OrderedDict[Tuple[str, int], NgramIndex]' = OrderedDict()
+        self._versions: Dict[Tuple[str, int], int] = {}
+        self._lock = threading.Lock()
+
+    def get_version(self, label: str, workspace_id: int) -> int:
+        return self._versions.get((label, workspace_id), 0)
+
+    def bump_version(self, label: str, workspace_id: int) -> int:
+        """Invalidate the index of a model in a workspace."""
+        key = (label, workspace_id)
+        with self._lock:
+            version = self._versions.get(key, 0) + 1
+            self._versions[key] = version
+            self._indexes.pop(key, None)
+            return version
+
+    def get_index(self, model, workspace_id: int) -> NgramIndex:
+        """Return the index for a model in a workspace, building on miss."""
+        key = (model._meta.label, workspace_id)
+        version = self.get_version(*key)
+
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None and index.version == version:
+                self._indexes.move_to_end(key)
+                return index
+
+        index = NgramIndex.build(model, workspace_id, version)
+
+        with self._lock:
+            if self._versions.get(key, 0) == version:
+                self._indexes[key] = index
+                self._indexes.move_to_end(key)
+                while len(self._indexes) > self.maxsize:
+                    self._indexes.popitem(last=False)
+
+        return index
+
+    def clear(self):
+        """Drop all indexes."""
+        with self._lock:
+            self._indexes.clear()
+
+    def __len__(self):
+        return len(self._indexes)
+
+
+# Process-wide n-gram index cache
+ngram_index_cache = NgramIndexCache()
+
+
+def bump_search_index_version(model, workspace_id: int) -> int:
+    """
+    Invalidate the n-gram index of a model in a workspace.
+
+    Bumps now and again on commit, so an index rebuilt from data read
+    before the writing transaction committed is not kept.
+    """
+    if StringSearchService.uses_trigram_index(model):
+        return 0
+    label = model._meta.label
+    transaction.on_commit(lambda: ngram_index_cache.bump_version(label, workspace_id))
+    return ngram_index_cache.bump_version(label, workspace_id)
+
+
+class StringSearchService:
+    """Substring and similarity search over string values."""
+
+    @staticmethod
+    def uses_trigram_index(model) -> bool:
+        """Whether searches on model run in the database (pg_trgm)."""
+        return connections[model.objects.db].vendor == 'postgresql'
+
+    @staticmethod
+    def search(model, workspace_id: int, query: str, mode: str = 'substring',
+               limit: int = STRING_SEARCH_DEFAULT_LIMIT,
+               threshold: float = STRING_SEARCH_SIMILARITY_THRESHOLD,
+               exclude_ids: Iterable[int] = (), **filters) -> List[SearchMatch]:
+        """
+        Return the top `limit` matches for query, best first.
+
+        Args:
+            model: String or ProjectString
+            workspace_id: Workspace to search in
+            query: Search text
+            mode: 'substring' (values containing query) or 'similar'
+                (trigram similarity of at least threshold)
+            limit: Maximum number of matches
+            threshold: Minimum similarity in 'similar' mode
+            exclude_ids: IDs to leave out
+            **filters: Equality filters on INDEXED_FIELDS (e.g. rule_id=3)
+
+        Returns:
+            List of SearchMatch(id, value, score)
+        """
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unsupported search mode: {mode}")
+        if not query:
+            return []
+
+        if StringSearchService.uses_trigram_index(model):
+            return StringSearchService._search_database(
+                model, workspace_id, query, mode, limit, threshold, exclude_ids, filters)
+
+        index = ngram_index_cache.get_index(model, workspace_id)
+        return index.search(
+            query, mode=mode, limit=limit, threshold=threshold,
+            filters=filters, exclude_ids=exclude_ids)
+
+    @staticmethod
+    def filter_queryset(queryset, workspace_id: int, query: str):
+        """
+        Restrict a String/ProjectString queryset to values containing query.
+
+        PostgreSQL's trigram index serves ILIKE directly; elsewhere matching
+        IDs come from the n-gram index, falling back to icontains when there
+        are too many to pass as parameters.
+        """
+        model = queryset.model
+        if not query or StringSearchService.uses_trigram_index(model):
+            return queryset.filter(value__icontains=query) if query else queryset
+
+        ids = ngram_index_cache.get_index(model, workspace_id).substring_ids(query)
+        if len(ids) > STRING_SEARCH_MAX_FILTER_IDS:
+            return queryset.filter(value__icontains=query)
+        return queryset.filter(id__in=ids)
+
+    @staticmethod
+    def _search_database(model, workspace_id, query, mode, limit, threshold,
+                         exclude_ids, filters) -> List[SearchMatch]:
+        from django.contrib.postgres.search import TrigramSimilarity
+
+        queryset = model.objects.for_workspace(workspace_id).filter(**filters)
+        if exclude_ids:
+            queryset = queryset.exclude(id__in=list(exclude_ids))
+
+        if mode == 'substring':
+            queryset = queryset.filter(value__icontains=query)
+        else:
+            # The % operator is what the GIN index serves; its threshold is
+            # pg_trgm.similarity_threshold, so re-check ours on the score
+            queryset = queryset.filter(value__trigram_similar=query)
+
+        queryset = queryset.annotate(
+            score=TrigramSimilarity('value', query)
+        ).order_by('-score', 'value', 'id')
+        if mode == 'similar':
+            queryset = queryset.filter(score__gte=threshold)
+
+        return [
+            SearchMatch(row_id, value, score)
+            for row_id, value, score in queryset.values_list('id', 'value', 'score')[:limit]
+        ]
@@ -0,0 +1,237 @@
+"""
+Per-workspace index of dimensions and their valid values.
+
+A WorkspaceValueIndex is built with a single query per workspace and maps
+every dimension (by name and by ID) to its type and the frozensets of its
+valid values and value IDs. Validation of single strings and whole batches
+runs against it in memory instead of querying per dimension.
+
+Indexes are versioned per workspace: the cache invalidation signals bump
+the workspace version whenever a Dimension or DimensionValue changes, and
+stale indexes are rebuilt on next access. A version combines a
+process-local counter, bumped as soon as this process writes, with the
+workspace's shared values generation, bumped on commit so that every
+worker rebuilds.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from ..constants import DimensionTypeChoices
+from .constants import WORKSPACE_VALUE_INDEX_CACHE_SIZE
+from .shared_cache import values_generations
+
+# (process-local version, shared values generation)
+Version = Tuple[int, int]
+
+
+class DimensionIndexEntry(NamedTuple):
+    """Indexed dimension with its valid values."""
+    id: int
+    name: str
+    type: str
+    values: frozenset
+    value_ids: frozenset
+    value_ids_by_value: Dict[str, int]
+    values_by_id: Dict[int, str]
+
+    @property
+    def is_list(self) -> bool:
+        return self.type == DimensionTypeChoices.LIST
+
+
+class WorkspaceValueIndex:
+    """
+    Immutable snapshot of a workspace's dimensions and dimension values.
+
+    Attributes:
+        workspace_id: ID of the indexed workspace
+        version: Workspace version the index was built against
+    """
+
+    __slots__ = ('workspace_id', 'version', 'by_name', 'by_id')
+
+    def __init__(self, workspace_id: int, version: Version, entries: Iterable[DimensionIndexEntry]):
+        self.workspace_id = workspace_id
+        self.version = version
+        self.by_id: Dict[int, DimensionIndexEntry] = {}
+        self.by_name: Dict[str, DimensionIndexEntry] = {}
+        for entry in entries:
+            self.by_id[entry.id] = entry
+            self.by_name[entry.name] = entry
+
+    def __repr__(self):
+        return (
+            f"WorkspaceValueIndex(workspace={self.workspace_id}, "
+            f"version={self.version}, dimensions={len(self.by_id)})"
+        )
+
+    @classmethod
+    def build(cls, workspace_id: int, version: Version = (0, 0)) -> 'WorkspaceValueIndex':
+        """Build the index for a workspace with a single query."""
+        from ..models import Dimension
+
+        dimensions: Dict[int, dict] = {}
+        rows = Dimension.objects.for_workspace(workspace_id).values_list(
+            'id', 'name', 'type', 'dimension_values__id', 'dimension_values__value'
+        ).order_by()
+
+        for dimension_id, name, dimension_type, value_id, value in rows:
+            dimension = dimensions.get(dimension_id)
+            if dimension is None:
+                dimension = dimensions[dimension_id] = {
+                    'name': name, 'type': dimension_type, 'values': {},
+                }
+            if value_id is not None:
+                dimension['values'][value] = value_id
+
+        entries = [
+            DimensionIndexEntry(
+                id=dimension_id,
+                name=dimension['name'],
+                type=dimension['type'],
+                values=frozenset(dimension['values']),
+                value_ids=frozenset(dimension['values'].values()),
+                value_ids_by_value=dimension['values'],
+                values_by_id={
+                    value_id: value for value, value_id in dimension['values'].items()
+                },
+            )
+            for dimension_id, dimension in dimensions.items()
+        ]
+        return cls(workspace_id, version, entries)
+
+    def get_dimension(self, dimension: Union[int, str]) -> Optional[DimensionIndexEntry]:
+        """Return the entry for a dimension ID or name."""
+        if isinstance(dimension, int):
+            return self.by_id.get(dimension)
+        return self.by_name.get(dimension)
+
+    def is_valid_value(self, dimension: Union[int, str], value: str) -> bool:
+        """
+        Check a value against a dimension.
+
+        List dimensions accept only their DimensionValue values; free-text
+        dimensions accept any non-empty value. Unknown dimensions are invalid.
+        """
+        entry = self.get_dimension(dimension)
+        if entry is None:
+            return False
+        if entry.is_list:
+            return value in entry.values
+        return bool(value and str(value).strip())
+
+    def is_valid_value_id(self, dimension: Union[int, str], value_id: int) -> bool:
+        """Check that a DimensionValue ID belongs to a dimension."""
+        entry = self.get_dimension(dimension)
+        return entry is not None and value_id in entry.value_ids
+
+    def validate(self, required_dimensions: Iterable[str], dimension_values: Dict[str, str]) -> List[str]:
+        """
+        Validate one set of dimension values in memory.
+
+        Args:
+            required_dimensions: Dimension names the rule requires
+            dimension_values: Dict mapping dimension names to values
+
+        Returns:
+            List of validation error messages (empty if valid)
+        """
+        errors = []
+
+        for dimension_name in required_dimensions:
+            if dimension_name not in dimension_values:
+                errors.append(f"Missing required dimension: {dimension_name}")
+                continue
+
+            value = dimension_values[dimension_name]
+            if value is None or not str(value).strip():
+                errors.append(f"Empty value for dimension: {dimension_name}")
+
+        for dimension_name, value in dimension_values.items():
+            if not self.is_valid_value(dimension_name, value):
+                errors.append(
+                    f"Invalid value '{value}' for dimension '{dimension_name}'")
+
+        return errors
+
+    def validate_many(self, required_dimensions: Iterable[str], rows: Iterable[Dict[str, str]]) -> List[List[str]]:
+        """Validate many sets of dimension values; returns one error list per row."""
+        required_dimensions = tuple(required_dimensions)
+        return [self.validate(required_dimensions, row) for row in rows]
+
+
+class WorkspaceValueIndexCache:
+    """
+    Bounded, thread-safe LRU of value indexes keyed by workspace ID.
+
+    Like the naming template cache, invalidation is version based. The
+    shared part of a version is re-read at most every
+    SHARED_GENERATION_CHECK_SECONDS, so a value committed by another
+    worker is indexed within that interval.
+    """
+
+    def __init__(self, maxsize: int = WORKSPACE_VALUE_INDEX_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._indexes: 'OrderedDict[int, WorkspaceValueIndex]' = OrderedDict()
+        self._versions: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def get_version(self, workspace_id: int) -> Version:
+        """Return the current version for a workspace."""
+        return self._versions.get(workspace_id, 0), values_generations.get(workspace_id)
+
+    def bump_workspace_version(self, workspace_id: int) -> int:
+        """Invalidate the value index for a workspace in this process."""
+        with self._lock:
+            version = self._versions.get(workspace_id, 0) + 1
+            self._versions[workspace_id] = version
+            return version
+
+    def get_index(self, workspace_id: int) -> WorkspaceValueIndex:
+        """Return the value index for a workspace, building on miss."""
+        version = self.get_version(workspace_id)
+
+        with self._lock:
+            index = self._indexes.get(workspace_id)
+            if index is not None and index.version == version:
+                self._indexes.move_to_end(workspace_id)
+                return index
+
+        index = WorkspaceValueIndex.build(workspace_id, version)
+
+        with self._lock:
+            if self._versions.get(workspace_id, 0) == version[0]:
+                self._indexes[workspace_id] = index
+                self._indexes.move_to_end(workspace_id)
+                while len(self._indexes) > self.maxsize:
+                    self._indexes.popitem(last=False)
+
+        return index
+
+    def peek(self, workspace_id: int) -> Optional[WorkspaceValueIndex]:
+        """Return a cached index without building or touching LRU order."""
+        return self._indexes.get(workspace_id)
+
+    def clear(self):
+        """Drop all indexes."""
+        with self._lock:
+            self._indexes.clear()
+
+    def __len__(self):
+        return len(self._indexes)
+
+
+# Process-wide value index cache
+workspace_value_index_cache = WorkspaceValueIndexCache()
+
+
+def get_workspace_value_index(workspace_id: int) -> WorkspaceValueIndex:
+    """Return the value index for a workspace."""
+    return workspace_value_index_cache.get_index(workspace_id)
+
+
+def bump_workspace_version(workspace_id: int) -> int:
+    """Invalidate the value index for a workspace in this process."""
+    return workspace_value_index_cache.bump_workspace_version(workspace_id)
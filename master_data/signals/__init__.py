@@ -4,13 +4,41 @@ Signal handlers for master_data app.
 
 # Import signal handlers to ensure they are registered
 from .string_propagation import (
-    capture_stringdetail_pre_save_state,
-    enhanced_auto_regenerate_string_on_detail_update
+    enhanced_auto_regenerate_string_on_detail_update,
+    RegenerationBuffer,
+    regeneration_buffer,
+    suspend_regeneration,
+    resume_regeneration,
+    regeneration_suspended
 )
 
 # Import cache invalidation signals
 from .cache_invalidation import (
     CacheInvalidationHelper,
+    InvalidationBuffer,
+    invalidation_buffer,
+    suspend_invalidation,
+    resume_invalidation,
+    invalidation_suspended,
     invalidate_caches_on_rule_detail_save,
     invalidate_caches_on_rule_detail_delete
-)
\ No newline at end of file
+)
+
+# Import project statistics signals
+from .project_stats import (
+    create_project_stats,
+    count_created_project_string,
+    count_deleted_project_string,
+    count_created_project_member,
+    count_deleted_project_member,
+    count_project_platforms,
+    record_project_activity,
+    recount_project_activity
+)
+
+# Import project string sync signals
+from .project_strings import (
+    record_project_string_tombstone,
+    touch_project_string_on_detail_delete,
+    sync_project_string_entity_level
+)
@@ -1,36 +1,224 @@
 """
 Cache invalidation signal handlers for master_data app.
+
+Rule payload caches live in the shared cache tier and are invalidated by
+bumping generation counters (see services.shared_cache), so an edit handled
+by one worker process is seen by all of them.
+
+Invalidations are not applied by the signal handlers themselves: they are
+recorded in a per-thread InvalidationBuffer and applied once, deduplicated,
+when the surrounding transaction commits, then handed to RuleCacheWarmer to
+be rebuilt in the background.
 """
 
 import logging
+import threading
+from contextlib import contextmanager
+from typing import Iterable, Set
+
+from django.db import transaction
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from django.core.cache import cache
 
-from ..models import Rule, RuleDetail, DimensionValue, DimensionConstraint, Entity, Platform, Workspace
+from ..models import (
+    Rule, RuleDetail, Dimension, DimensionValue, DimensionConstraint, Entity, Platform, Workspace,
+    String, ProjectString
+)
+from ..services.naming_template import bump_rule_generation
+from ..services.rule_cache_warmer import RuleCacheWarmer
+from ..services.shared_cache import SharedCache
+from ..services.workspace_value_index import bump_workspace_version
+from ..services.string_search import bump_search_index_version
 
 logger = logging.getLogger(__name__)
 
 
+class InvalidationBuffer:
+    """
+    Per-thread set of rule, dimension and workspace cache invalidations.
+
+    Writes record what they invalidate; the set is flushed once when the
+    surrounding transaction commits, so a bulk write of thousands of rows
+    bumps each affected shared generation counter once. Rules using a
+    changed dimension are looked up at flush time, in one query for all
+    recorded dimensions. Outside a transaction the flush runs immediately,
+    as on_commit does.
+
+    Process-local generations (compiled naming templates, name parsers and
+    workspace value indexes) are cheap to bump and are bumped both when a
+    change is recorded, so the writing request generates, parses and
+    validates with its own changes, and again at flush, retiring anything
+    built from pre-commit data meanwhile.
+
+    Readers of shared payloads inside the writing transaction keep seeing
+    the cached payloads from before the write until it commits. Payloads
+    other workers build meanwhile are stored under the old generations,
+    which the flush retires.
+
+    Invalidation can be suspended (e.g. by bulk endpoints): changes are still
+    recorded, but only flushed after the last resume().
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _pending(self, name: str) -> Set[int]:
+        if not hasattr(self._local, name):
+            setattr(self._local, name, set())
+        return getattr(self._local, name)
+
+    @property
+    def rule_ids(self) -> Set[int]:
+        """Rule IDs awaiting invalidation on this thread."""
+        return self._pending('rule_ids')
+
+    @property
+    def dimension_ids(self) -> Set[int]:
+        """IDs of dimensions whose rules await invalidation on this thread."""
+        return self._pending('dimension_ids')
+
+    @property
+    def workspace_ids(self) -> Set[int]:
+        """Workspace IDs awaiting invalidation on this thread."""
+        return self._pending('workspace_ids')
+
+    @property
+    def value_workspace_ids(self) -> Set[int]:
+        """IDs of workspaces whose value indexes await invalidation on this thread."""
+        return self._pending('value_workspace_ids')
+
+    @property
+    def has_pending(self) -> bool:
+        return bool(self.rule_ids or self.dimension_ids or self.workspace_ids
+                    or self.value_workspace_ids)
+
+    @property
+    def is_suspended(self) -> bool:
+        return getattr(self._local, 'suspended', 0) > 0
+
+    def suspend(self) -> None:
+        """Hold back flushes on this thread until resume()."""
+        self._local.suspended = getattr(self._local, 'suspended', 0) + 1
+
+    def resume(self) -> None:
+        """Undo one suspend() call, scheduling a flush after the last one."""
+        self._local.suspended = max(getattr(self._local, 'suspended', 0) - 1, 0)
+        if not self.is_suspended and self.has_pending:
+            transaction.on_commit(self.flush)
+
+    @contextmanager
+    def suspended(self):
+        """Context manager form of suspend()/resume()."""
+        self.suspend()
+        try:
+            yield
+        finally:
+            self.resume()
+
+    def add_rules(self, rule_ids: Iterable[int], reason: str = "") -> None:
+        """Record rules whose caches must be invalidated, bumping local generations now."""
+        rule_ids = set(rule_ids)
+        if not rule_ids:
+            return
+        for rule_id in rule_ids:
+            bump_rule_generation(rule_id)
+        self.rule_ids.update(rule_ids)
+        self._schedule(reason)
+
+    def add_dimension(self, dimension_id: int, reason: str = "") -> None:
+        """Record a dimension whose rules' caches must be invalidated."""
+        self.dimension_ids.add(dimension_id)
+        self._schedule(reason)
+
+    def add_workspace(self, workspace_id: int, reason: str = "") -> None:
+        """Record a workspace whose caches (and all its rules') must be invalidated."""
+        self.workspace_ids.add(workspace_id)
+        self._schedule(reason)
+
+    def add_values(self, workspace_id: int, reason: str = "") -> None:
+        """Record a workspace whose value index must be rebuilt, bumping its local version now."""
+        bump_workspace_version(workspace_id)
+        self.value_workspace_ids.add(workspace_id)
+        self._schedule(reason)
+
+    def _schedule(self, reason: str) -> None:
+        logger.debug(f"Cache invalidation recorded - {reason}")
+        if self.is_suspended:
+            return
+        # Registered per change: callbacks of rolled-back savepoints are
+        # discarded, and the first surviving callback drains the buffer.
+        transaction.on_commit(self.flush)
+
+    def clear(self) -> None:
+        """Drop pending invalidations without applying them."""
+        self.rule_ids.clear()
+        self.dimension_ids.clear()
+        self.workspace_ids.clear()
+        self.value_workspace_ids.clear()
+
+    def flush(self) -> None:
+        """Apply every pending invalidation once."""
+        if self.is_suspended or not self.has_pending:
+            return
+        rule_ids = set(self.rule_ids)
+        dimension_ids = set(self.dimension_ids)
+        workspace_ids = set(self.workspace_ids)
+        value_workspace_ids = set(self.value_workspace_ids)
+        self.clear()
+
+        if dimension_ids:
+            rule_ids.update(Rule.objects.all_workspaces().filter(
+                rule_details__dimension_id__in=dimension_ids
+            ).values_list('id', flat=True).distinct())
+
+        for workspace_id in workspace_ids:
+            SharedCache.bump_workspace_generation(workspace_id)
+
+        # Every worker rebuilds its value index of these workspaces
+        for workspace_id in value_workspace_ids:
+            SharedCache.bump_values_generation(workspace_id)
+            bump_workspace_version(workspace_id)
+
+        if rule_ids:
+            # Shared entries are keyed by rule generation: one increment per
+            # rule invalidates them in every worker
+            SharedCache.bump_rule_generations(rule_ids)
+
+            # Compiled naming templates are versioned by rule generation; bumped
+            # again in case this worker compiled pre-commit data meanwhile
+            for rule_id in rule_ids:
+                bump_rule_generation(rule_id)
+
+        logger.info(
+            f"Invalidated caches for {len(rule_ids)} rules and {len(workspace_ids)} workspaces")
+        logger.debug(
+            f"Invalidated rules: {sorted(rule_ids)}; workspaces: {sorted(workspace_ids)}")
+
+        # Rebuild the invalidated payloads before the next request needs them
+        RuleCacheWarmer.schedule(rule_ids, workspace_ids)
+
+
+invalidation_buffer = InvalidationBuffer()
+
+
+def suspend_invalidation() -> None:
+    """Hold back cache invalidation on this thread."""
+    invalidation_buffer.suspend()
+
+
+def resume_invalidation() -> None:
+    """Resume cache invalidation on this thread."""
+    invalidation_buffer.resume()
+
+
+def invalidation_suspended():
+    """Context manager that holds back cache invalidation until it exits."""
+    return invalidation_buffer.suspended()
+
+
 class CacheInvalidationHelper:
     """Helper class for managing cache invalidation"""
 
-    @staticmethod
-    def get_cache_keys_for_rule(rule_id):
-        """Get all cache keys related to a specific rule"""
-        return [
-            f"dimension_catalog:{rule_id}",
-            f"optimized_dimension_catalog:{rule_id}",
-            f"complete_rule_data:{rule_id}",
-            f"field_templates:{rule_id}",
-            f"inheritance_matrix:{rule_id}",
-            # Django page cache key for rule configuration endpoint
-            # Try multiple possible formats
-            f"views.decorators.cache.cache_page.GET.rule_id.{rule_id}.configuration",
-            f"views.decorators.cache.cache_page.{rule_id}.GET",
-            f"views.decorators.cache.cache_page.GET.rule_id.{rule_id}",
-        ]
-
     @staticmethod
     def get_rules_for_workspace(workspace):
         """Get all rule IDs in a workspace"""
@@ -53,45 +241,32 @@ class CacheInvalidationHelper:
 
     @staticmethod
     def get_rules_for_platform(platform):
-        """Get all rule IDs for a specific platform"""
+        """Get all rule IDs for a specific platform, across workspaces"""
         if hasattr(platform, 'id'):
             platform_id = platform.id
         else:
             platform_id = platform
-        return Rule.objects.filter(platform_id=platform_id).values_list('id', flat=True)
+        return Rule.objects.all_workspaces().filter(platform_id=platform_id).values_list('id', flat=True)
 
     @staticmethod
     def invalidate_rule_caches(rule_ids, reason=""):
-        """Invalidate all caches for given rule IDs"""
-        if not rule_ids:
-            return
-
-        cache_keys_to_delete = []
-        for rule_id in rule_ids:
-            cache_keys_to_delete.extend(
-                CacheInvalidationHelper.get_cache_keys_for_rule(rule_id)
-            )
+        """Invalidate all caches for given rule IDs when the transaction commits"""
+        invalidation_buffer.add_rules(rule_ids, reason)
 
-        # Log cache invalidation for monitoring
-        logger.info(
-            f"Invalidating {len(cache_keys_to_delete)} cache keys for rules {list(rule_ids)}")
-        logger.info(f"Cache keys to delete: {cache_keys_to_delete}")
-
-        # Delete all cache keys
-        cache.delete_many(cache_keys_to_delete)
+    @staticmethod
+    def invalidate_dimension_caches(dimension_id, reason=""):
+        """Invalidate all caches of rules using a dimension when the transaction commits"""
+        invalidation_buffer.add_dimension(dimension_id, reason)
 
-        logger.info(
-            f"Invalidated caches for {len(rule_ids)} rules: {list(rule_ids)} - {reason}")
+    @staticmethod
+    def invalidate_workspace_caches(workspace_id, reason=""):
+        """Invalidate the shared caches of a workspace and of all its rules"""
+        invalidation_buffer.add_workspace(workspace_id, reason)
 
-        # Also invalidate model-level caches if they exist
-        for rule_id in rule_ids:
-            try:
-                rule = Rule.objects.get(id=rule_id)
-                if hasattr(rule, 'needs_inheritance_refresh'):
-                    rule.needs_inheritance_refresh = True
-                    rule.save(update_fields=['needs_inheritance_refresh'])
-            except Rule.DoesNotExist:
-                pass
+    @staticmethod
+    def invalidate_value_index(workspace_id, reason=""):
+        """Invalidate the workspace value index now and in every worker on commit"""
+        invalidation_buffer.add_values(workspace_id, reason)
 
 
 # =============================================================================
@@ -144,6 +319,73 @@ def invalidate_caches_on_rule_delete(sender, instance, **kwargs):
     CacheInvalidationHelper.invalidate_rule_caches(rule_ids, reason)
 
 
+# =============================================================================
+# WORKSPACE SIGNALS
+# =============================================================================
+
+@receiver(post_save, sender=Workspace)
+def invalidate_caches_on_workspace_save(sender, instance, created, **kwargs):
+    """Invalidate cached rule payloads, which embed the workspace name"""
+    if not created:
+        CacheInvalidationHelper.invalidate_workspace_caches(
+            instance.id, f"Workspace updated: {instance.name}")
+
+
+# =============================================================================
+# PLATFORM AND ENTITY SIGNALS
+# =============================================================================
+
+@receiver(post_save, sender=Platform)
+def invalidate_caches_on_platform_save(sender, instance, created, **kwargs):
+    """Invalidate rules of a platform whose name or slug changed"""
+    if created:  # New platforms have no rules yet
+        return
+
+    rule_ids = CacheInvalidationHelper.get_rules_for_platform(instance)
+
+    CacheInvalidationHelper.invalidate_rule_caches(
+        rule_ids, f"Platform updated: {instance.name}")
+
+
+@receiver(post_save, sender=Entity)
+@receiver(post_delete, sender=Entity)
+def invalidate_caches_on_entity_change(sender, instance, **kwargs):
+    """Invalidate rules of the platform whose entity hierarchy changed"""
+    rule_ids = CacheInvalidationHelper.get_rules_for_platform(instance.platform_id)
+
+    CacheInvalidationHelper.invalidate_rule_caches(
+        rule_ids, f"Entity changed: {instance.name} (platform: {instance.platform_id})")
+
+
+# =============================================================================
+# DIMENSION SIGNALS
+# =============================================================================
+
+@receiver(post_save, sender=Dimension)
+def invalidate_caches_on_dimension_save(sender, instance, created, **kwargs):
+    """Invalidate caches when a dimension used by rules is renamed or retyped"""
+    action = "created" if created else "updated"
+    reason = f"Dimension {action}: {instance.name} (workspace: {instance.workspace_id})"
+
+    CacheInvalidationHelper.invalidate_value_index(instance.workspace_id, reason)
+
+    if created:  # New dimensions are not referenced by any rule yet
+        return
+
+    # Templates embed dimension names: the rules are needed now to bump their
+    # process-local generations (dimension updates are rare)
+    rule_ids = CacheInvalidationHelper.get_rules_for_dimension(instance)
+
+    CacheInvalidationHelper.invalidate_rule_caches(rule_ids, reason)
+
+
+@receiver(post_delete, sender=Dimension)
+def invalidate_value_index_on_dimension_delete(sender, instance, **kwargs):
+    """Invalidate the workspace value index when a dimension is deleted"""
+    CacheInvalidationHelper.invalidate_value_index(
+        instance.workspace_id, f"Dimension deleted: {instance.name} (workspace: {instance.workspace_id})")
+
+
 # =============================================================================
 # DIMENSION VALUE SIGNALS
 # =============================================================================
@@ -151,26 +393,25 @@ def invalidate_caches_on_rule_delete(sender, instance, **kwargs):
 @receiver(post_save, sender=DimensionValue)
 def invalidate_caches_on_dimension_value_save(sender, instance, created, **kwargs):
     """Invalidate caches when a dimension value is created or updated"""
-    # Get all rules that use this dimension
-    rule_ids = CacheInvalidationHelper.get_rules_for_dimension(
-        instance.dimension)
-
     action = "created" if created else "updated"
-    reason = f"DimensionValue {action}: {instance.dimension.name}={instance.value} (workspace: {instance.workspace.name})"
+    reason = f"DimensionValue {action}: dimension {instance.dimension_id}={instance.value} (workspace: {instance.workspace_id})"
 
-    CacheInvalidationHelper.invalidate_rule_caches(rule_ids, reason)
+    CacheInvalidationHelper.invalidate_value_index(instance.workspace_id, reason)
+
+    # Rules using the dimension are looked up once, when the buffer is flushed;
+    # values do not change naming templates, and name parsers are keyed by the
+    # workspace value index version
+    CacheInvalidationHelper.invalidate_dimension_caches(instance.dimension_id, reason)
 
 
 @receiver(post_delete, sender=DimensionValue)
 def invalidate_caches_on_dimension_value_delete(sender, instance, **kwargs):
     """Invalidate caches when a dimension value is deleted"""
-    # Get all rules that use this dimension
-    rule_ids = CacheInvalidationHelper.get_rules_for_dimension(
-        instance.dimension)
+    reason = f"DimensionValue deleted: dimension {instance.dimension_id}={instance.value} (workspace: {instance.workspace_id})"
 
-    reason = f"DimensionValue deleted: {instance.dimension.name}={instance.value} (workspace: {instance.workspace.name})"
+    CacheInvalidationHelper.invalidate_value_index(instance.workspace_id, reason)
 
-    CacheInvalidationHelper.invalidate_rule_caches(rule_ids, reason)
+    CacheInvalidationHelper.invalidate_dimension_caches(instance.dimension_id, reason)
 
 
 # ─── DIMENSION CONSTRAINT CACHE INVALIDATION ────────────────────────────────
@@ -202,3 +443,16 @@ def invalidate_constraint_cache_on_delete(sender, instance, **kwargs):
 
     # Clear the constraint cache for this dimension
     ConstraintValidatorService.clear_constraint_cache(instance.dimension.id)
+
+
+# =============================================================================
+# STRING SEARCH INDEX SIGNALS
+# =============================================================================
+
+@receiver(post_save, sender=String)
+@receiver(post_delete, sender=String)
+@receiver(post_save, sender=ProjectString)
+@receiver(post_delete, sender=ProjectString)
+def invalidate_search_index_on_string_change(sender, instance, **kwargs):
+    """Invalidate the workspace's in-process n-gram search index"""
+    bump_search_index_version(sender, instance.workspace_id)
@@ -0,0 +1,73 @@
+"""
+Project statistics signal handlers for master_data app.
+
+Keep the denormalized ProjectStats row of a project in step with its
+strings, members, platforms and activity. Rows deleted because their whole
+project (or workspace) is deleted are not counted down: the statistics row
+goes with the project.
+"""
+
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from ..models import Project, ProjectActivity, ProjectMember, ProjectStats, ProjectString
+from ..models.base import deletion_origin_label
+
+
+def _cascades_from_project(origin):
+    """Whether a delete() cascade started at a project or workspace."""
+    return deletion_origin_label(origin) in ('master_data.Project', 'master_data.Workspace')
+
+
+@receiver(post_save, sender=Project)
+def create_project_stats(sender, instance, created, **kwargs):
+    """Create the (empty) statistics row of a new project."""
+    if created:
+        ProjectStats.objects.get_or_create(project_id=instance.pk)
+
+
+@receiver(post_save, sender=ProjectString)
+def count_created_project_string(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        ProjectStats.objects.adjust(instance.project_id, total_strings=1)
+
+
+@receiver(post_delete, sender=ProjectString)
+def count_deleted_project_string(sender, instance, origin=None, **kwargs):
+    if not _cascades_from_project(origin):
+        ProjectStats.objects.adjust(instance.project_id, total_strings=-1)
+
+
+@receiver(post_save, sender=ProjectMember)
+def count_created_project_member(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        ProjectStats.objects.adjust(instance.project_id, team_members_count=1)
+
+
+@receiver(post_delete, sender=ProjectMember)
+def count_deleted_project_member(sender, instance, origin=None, **kwargs):
+    if not _cascades_from_project(origin):
+        ProjectStats.objects.adjust(instance.project_id, team_members_count=-1)
+
+
+@receiver(m2m_changed, sender=Project.platforms.through)
+def count_project_platforms(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    # platform.projects.clear() does not report the projects; the
+    # reconcile command repairs those counts
+    project_ids = pk_set if reverse else [instance.pk]
+    for project_id in project_ids or ():
+        ProjectStats.objects.recount(project_id, 'platforms_count')
+
+
+@receiver(post_save, sender=ProjectActivity)
+def record_project_activity(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        ProjectStats.objects.record_activity(instance.project_id, instance.created)
+
+
+@receiver(post_delete, sender=ProjectActivity)
+def recount_project_activity(sender, instance, origin=None, **kwargs):
+    if not _cascades_from_project(origin):
+        ProjectStats.objects.recount(instance.project_id, 'last_activity')
@@ -0,0 +1,49 @@
+"""
+Project string sync signal handlers for master_data app.
+
+Keep what "changed since" sync exports read in step with deletes and
+entity edits: tombstones for deleted strings, last_updated for strings
+that lost a detail, and the denormalized ProjectString.entity_level.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from ..models import Entity, ProjectString, ProjectStringDetail, ProjectStringTombstone
+from ..models.base import deletion_origin_label
+
+
+@receiver(post_delete, sender=ProjectString)
+def record_project_string_tombstone(sender, instance, origin=None, **kwargs):
+    """Record deleted strings unless their whole project/platform/workspace goes too."""
+    if deletion_origin_label(origin) in (
+        'master_data.Workspace', 'master_data.Project', 'master_data.Platform'
+    ):
+        return
+    ProjectStringTombstone.objects.create(
+        workspace_id=instance.workspace_id,
+        project_id=instance.project_id,
+        platform_id=instance.platform_id,
+        string_id=instance.id,
+        string_uuid=instance.string_uuid,
+    )
+
+
+@receiver(post_delete, sender=ProjectStringDetail)
+def touch_project_string_on_detail_delete(sender, instance, origin=None, **kwargs):
+    """Mark the string as changed when one of its details is deleted on its own."""
+    if deletion_origin_label(origin) != ProjectStringDetail._meta.label:
+        return
+    ProjectString.objects.all_workspaces().filter(pk=instance.string_id).update(
+        last_updated=timezone.now())
+
+
+@receiver(post_save, sender=Entity)
+def sync_project_string_entity_level(sender, instance, created, **kwargs):
+    """Keep ProjectString.entity_level in step when an entity's level changes."""
+    if created:
+        return
+    ProjectString.objects.all_workspaces().filter(entity=instance).exclude(
+        entity_level=instance.entity_level
+    ).update(entity_level=instance.entity_level, last_updated=timezone.now())
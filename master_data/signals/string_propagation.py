@@ -4,9 +4,11 @@ Enhanced signal handlers for string propagation.
 
 import uuid
 import logging
-from typing import Dict, Any, Optional
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional
 
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.conf import settings
 from django.db import transaction
@@ -18,37 +20,149 @@ from ..services.propagation_service import PropagationService, PropagationError
 logger = logging.getLogger('master_data.string_propagation')
 
 
-# Store pre-save state for change detection
-_pre_save_state = {}
+class RegenerationBuffer:
+    """
+    Per-thread buffer of StringDetail changes awaiting string regeneration.
 
+    Changes are recorded per detail (keeping the state from before the first
+    change) and flushed once when the surrounding transaction commits: each
+    affected String is regenerated and propagated to its children once, no
+    matter how many of its details changed. Outside a transaction the flush
+    runs immediately, as on_commit does.
 
-@receiver(pre_save, sender=StringDetail)
-def capture_stringdetail_pre_save_state(sender, instance, **kwargs):
-    """
-    Capture the state of StringDetail before save for change detection.
+    At flush time the current details are re-read in one query and compared
+    with the recorded state, so changes that were rolled back or reverted
+    within the transaction are dropped.
+
+    With MASTER_DATA_CONFIG['STRICT_AUTO_REGENERATION'] each change is
+    flushed as soon as it is recorded, inside the writing transaction: a
+    failed regeneration rolls the detail change back with it, and the
+    caller sees the regenerated value before its response is rendered.
+    Strict mode therefore regenerates a String once per changed detail.
+
+    Buffering can be suspended (e.g. by bulk paths that regenerate strings
+    themselves); detail saves made while suspended are not regenerated.
     """
-    if instance.pk:  # Only for existing records
+
+    def __init__(self):
+        self._local = threading.local()
+
+    @property
+    def pending(self) -> Dict[int, Dict[str, Any]]:
+        """Recorded pre-change state by StringDetail ID for this thread."""
+        if not hasattr(self._local, 'pending'):
+            self._local.pending = {}
+        return self._local.pending
+
+    @property
+    def is_suspended(self) -> bool:
+        return getattr(self._local, 'suspended', 0) > 0
+
+    def suspend(self) -> None:
+        """Stop buffering detail changes on this thread until resume()."""
+        self._local.suspended = getattr(self._local, 'suspended', 0) + 1
+
+    def resume(self) -> None:
+        """Undo one suspend() call."""
+        self._local.suspended = max(getattr(self._local, 'suspended', 0) - 1, 0)
+
+    @contextmanager
+    def suspended(self):
+        """Context manager form of suspend()/resume()."""
+        self.suspend()
         try:
-            original = StringDetail.objects.get(pk=instance.pk)
-            _pre_save_state[instance.pk] = {
-                'dimension_value_id': original.dimension_value_id,
-                'dimension_value_freetext': original.dimension_value_freetext,
-                'string_id': original.string_id,
-                'dimension_id': original.dimension_id
-            }
-        except StringDetail.DoesNotExist:
-            pass
+            yield
+        finally:
+            self.resume()
+
+    def add(self, detail_id: int, original_state: Optional[Dict[str, Any]]) -> None:
+        """Record a changed detail and schedule a flush on commit (strict mode: flush now)."""
+        self.pending.setdefault(detail_id, original_state or {})
+        if _strict_regeneration():
+            # Errors propagate to the writer and roll its transaction back
+            self.flush()
+            return
+        # Registered per change: callbacks of rolled-back savepoints are
+        # discarded, and the first surviving callback drains the buffer.
+        transaction.on_commit(self.flush)
+
+    def clear(self) -> None:
+        """Drop pending changes without regenerating."""
+        self.pending.clear()
+
+    def flush(self) -> None:
+        """Regenerate and propagate every string with pending detail changes."""
+        pending = self.pending
+        if not pending:
+            return
+        self._local.pending = {}
+
+        config = getattr(settings, 'MASTER_DATA_CONFIG', {})
+        details = StringDetail.objects.all_workspaces().select_related(
+            'string', 'dimension_value'
+        ).in_bulk(list(pending))
+
+        changes_by_string: Dict[int, List[Dict[str, Any]]] = {}
+        strings: Dict[int, String] = {}
+        for detail_id, original_state in pending.items():
+            detail = details.get(detail_id)
+            if detail is None:
+                continue
+            changed_fields = _detect_stringdetail_changes(detail, original_state)
+            if changed_fields:
+                logger.info(
+                    f"Detected changes in StringDetail {detail.id}: {list(changed_fields.keys())}"
+                )
+                changes_by_string.setdefault(detail.string_id, []).append(changed_fields)
+                strings[detail.string_id] = detail.string
+
+        # Saves made while regenerating must not be buffered again
+        with self.suspended():
+            for string_id, detail_changes in changes_by_string.items():
+                try:
+                    _execute_enhanced_propagation(strings[string_id], detail_changes, config)
+                except Exception as e:
+                    logger.error(
+                        f"Enhanced auto-regeneration failed for String {string_id}: {str(e)}")
+                    _log_propagation_error(
+                        None, str(e), 'auto_regeneration_error', string_id=string_id)
+                    if _strict_regeneration():
+                        raise
+
+
+def _strict_regeneration() -> bool:
+    """Whether regeneration runs inside the writing transaction and raises."""
+    return getattr(settings, 'MASTER_DATA_CONFIG', {}).get('STRICT_AUTO_REGENERATION', False)
+
+
+regeneration_buffer = RegenerationBuffer()
+
+
+def suspend_regeneration() -> None:
+    """Suspend buffered string regeneration on this thread."""
+    regeneration_buffer.suspend()
+
+
+def resume_regeneration() -> None:
+    """Resume buffered string regeneration on this thread."""
+    regeneration_buffer.resume()
+
+
+def regeneration_suspended():
+    """Context manager that suspends buffered string regeneration."""
+    return regeneration_buffer.suspended()
 
 
 @receiver(post_save, sender=StringDetail)
 def enhanced_auto_regenerate_string_on_detail_update(sender, instance, created, **kwargs):
     """
     Enhanced automatic string regeneration when StringDetail is updated.
-    Uses the new PropagationService for better change detection and propagation.
+
+    The change is recorded in the regeneration buffer; the parent string is
+    regenerated and propagated once when the transaction commits, or right
+    away in STRICT_AUTO_REGENERATION mode.
     """
     if created:
-        # Clean up any stored state for new records
-        _pre_save_state.pop(instance.pk, None)
         return
     
     # Get configuration
@@ -58,56 +172,31 @@ def enhanced_auto_regenerate_string_on_detail_update(sender, instance, created,
         logger.debug(f"Auto-regeneration disabled globally, skipping StringDetail {instance.id}")
         return
     
-    # Prevent infinite recursion
-    if getattr(instance, '_regenerating', False):
-        logger.debug(f"Recursion guard active for StringDetail {instance.id}, skipping")
+    if regeneration_buffer.is_suspended:
+        logger.debug(f"Regeneration suspended, skipping StringDetail {instance.id}")
         return
     
-    try:
-        # Mark to prevent recursion
-        instance._regenerating = True
-        
-        # Detect what changed
-        changed_fields = _detect_stringdetail_changes(instance)
-        
-        if not changed_fields:
-            logger.debug(f"No significant changes detected for StringDetail {instance.id}")
+    # Compare against the values loaded from the database; instances that
+    # were not loaded (e.g. built by hand) fall back to "everything changed"
+    original_state = None
+    if instance.has_loaded_values:
+        if not instance.changed_fields():
             return
-        
-        logger.info(
-            f"Detected changes in StringDetail {instance.id}: {list(changed_fields.keys())}"
-        )
-        
-        # Execute enhanced propagation
-        _execute_enhanced_propagation(instance, changed_fields, config)
-        
-    except Exception as e:
-        logger.error(f"Enhanced auto-regeneration failed for StringDetail {instance.id}: {str(e)}")
-        
-        # Create error record
-        _log_propagation_error(instance, str(e), 'auto_regeneration_error')
-        
-        # Re-raise exception if strict mode is enabled
-        if config.get('STRICT_AUTO_REGENERATION', False):
-            raise
-    finally:
-        # Clean up
-        _pre_save_state.pop(instance.pk, None)
-        if hasattr(instance, '_regenerating'):
-            delattr(instance, '_regenerating')
+        original_state = instance.loaded_values
+
+    regeneration_buffer.add(instance.pk, original_state)
 
 
-def _detect_stringdetail_changes(instance: StringDetail) -> Dict[str, Any]:
+def _detect_stringdetail_changes(instance: StringDetail, original_state: Dict[str, Any]) -> Dict[str, Any]:
     """
     Detect what fields changed in a StringDetail update.
     """
     changed_fields = {}
-    original_state = _pre_save_state.get(instance.pk, {})
     
     if not original_state:
         # If we don't have original state, assume all fields changed
-        # This is a fallback for cases where pre_save didn't capture state
-        logger.warning(f"No pre-save state found for StringDetail {instance.id}, assuming all fields changed")
+        # This is a fallback for instances that were not loaded from the database
+        logger.warning(f"No loaded state found for StringDetail {instance.id}, assuming all fields changed")
         return {
             'dimension_value': {
                 'old': None,
@@ -153,14 +242,18 @@ def _detect_stringdetail_changes(instance: StringDetail) -> Dict[str, Any]:
 
 
 def _execute_enhanced_propagation(
-    instance: StringDetail, 
-    changed_fields: Dict[str, Any], 
+    string_obj: String,
+    detail_changes: List[Dict[str, Any]],
     config: Dict[str, Any]
 ) -> None:
     """
-    Execute enhanced propagation using PropagationService.
+    Regenerate a string once and propagate all of its detail changes.
+
+    Args:
+        string_obj: String whose details changed
+        detail_changes: Changed fields of each changed detail
+        config: MASTER_DATA_CONFIG settings
     """
-    string_obj = instance.string
     batch_id = uuid.uuid4()
     
     logger.info(f"Starting enhanced propagation for String {string_obj.id} (batch: {batch_id})")
@@ -180,7 +273,7 @@ def _execute_enhanced_propagation(
             # Handle inheritance propagation if enabled (simplified version)
             if config.get('ENABLE_INHERITANCE_PROPAGATION', True):
                 try:
-                    _propagate_to_children_simplified(string_obj, changed_fields, config)
+                    _propagate_to_children_simplified(string_obj, detail_changes, config)
                 except Exception as propagation_error:
                     logger.error(f"Child propagation failed: {str(propagation_error)}")
                     # Don't fail the parent regeneration due to child propagation errors
@@ -268,11 +361,14 @@ def _propagate_with_enhanced_service(
 
 def _propagate_to_children_simplified(
     parent_string: String,
-    changed_fields: Dict[str, Any],
+    detail_changes: List[Dict[str, Any]],
     config: Dict[str, Any]
 ) -> None:
     """
     Simplified child propagation that properly inherits parent changes.
+
+    Each child applies all of the parent's detail changes and is then
+    regenerated once.
     """
     max_depth = config.get('MAX_INHERITANCE_DEPTH', 5)
     
@@ -284,7 +380,10 @@ def _propagate_to_children_simplified(
             old_value = child.value
             
             # Apply inherited changes to child's StringDetails
-            inherited_changes_applied = _apply_inheritance_to_child(child, changed_fields)
+            inherited_changes_applied = False
+            for changed_fields in detail_changes:
+                if _apply_inheritance_to_child(child, changed_fields):
+                    inherited_changes_applied = True
             
             if inherited_changes_applied:
                 # Only regenerate if we actually inherited some changes
@@ -297,7 +396,7 @@ def _propagate_to_children_simplified(
             if max_depth > 1:
                 child_config = config.copy()
                 child_config['MAX_INHERITANCE_DEPTH'] = max_depth - 1
-                _propagate_to_children_simplified(child, changed_fields, child_config)
+                _propagate_to_children_simplified(child, detail_changes, child_config)
                 
         except Exception as child_error:
             logger.error(f"Failed to propagate to child string {child.id}: {str(child_error)}")
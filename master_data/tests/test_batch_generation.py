@@ -0,0 +1,156 @@
+"""
+Tests for batch string generation.
+
+These tests verify that many rows are validated and rendered against a
+single preloaded rule snapshot, with per-row errors instead of failing
+the whole batch.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from master_data import models
+from master_data.constants import DimensionTypeChoices
+from master_data.services import StringGenerationService, NamingConventionError
+from users.models import WorkspaceUser
+
+User = get_user_model()
+
+
+class BatchGenerationTestCase(APITestCase):
+    """Test StringGenerationService.generate_many and its endpoint."""
+
+    def setUp(self):
+        """Set up a list dimension and a free text dimension on one rule."""
+        self.client = APIClient()
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            first_name='Test',
+            last_name='User'
+        )
+        WorkspaceUser.objects.create(
+            user=self.user,
+            workspace=self.workspace,
+            role='admin'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.entity = models.Entity.objects.create(
+            name="Database",
+            entity_level=1,
+            platform=self.platform
+        )
+        self.dim_env = models.Dimension.objects.create(
+            name="Environment",
+            type=DimensionTypeChoices.LIST,
+            workspace=self.workspace
+        )
+        self.dim_name = models.Dimension.objects.create(
+            name="Name",
+            type=DimensionTypeChoices.FREE_TEXT,
+            workspace=self.workspace
+        )
+        for value in ('prod', 'dev'):
+            models.DimensionValue.objects.create(
+                dimension=self.dim_env,
+                value=value,
+                label=value.title(),
+                utm=value,
+                workspace=self.workspace
+            )
+        self.rule = models.Rule.objects.create(
+            name="Test Rule",
+            platform=self.platform,
+            workspace=self.workspace
+        )
+        models.RuleDetail.objects.create(
+            rule=self.rule,
+            entity=self.entity,
+            dimension=self.dim_env,
+            dimension_order=1,
+            delimiter="_",
+            workspace=self.workspace
+        )
+        models.RuleDetail.objects.create(
+            rule=self.rule,
+            entity=self.entity,
+            dimension=self.dim_name,
+            dimension_order=2,
+            delimiter="",
+            workspace=self.workspace
+        )
+
+    def test_generate_many_from_row_dicts(self):
+        """Test that valid rows render and invalid rows report errors."""
+        result = StringGenerationService.generate_many(self.rule, self.entity, [
+            {'Environment': 'prod', 'Name': 'sales'},
+            {'Environment': 'staging', 'Name': 'sales'},
+            {'Environment': 'dev'},
+        ])
+
+        self.assertEqual(result['values'], ['prod_sales', None, None])
+        self.assertEqual(result['success_count'], 1)
+        self.assertEqual([error['row'] for error in result['errors']], [1, 2])
+        self.assertIn("Invalid value 'staging'", result['errors'][0]['errors'][0])
+        self.assertIn("Missing required dimension: Name", result['errors'][1]['errors'][0])
+
+    def test_generate_many_from_columns(self):
+        """Test that columnar input is equivalent to row input."""
+        result = StringGenerationService.generate_many(self.rule, self.entity, {
+            'Environment': ['prod', 'dev'],
+            'Name': ['a', 'b'],
+        })
+        self.assertEqual(result['values'], ['prod_a', 'dev_b'])
+
+        with self.assertRaises(NamingConventionError):
+            StringGenerationService.generate_many(self.rule, self.entity, {
+                'Environment': ['prod'],
+                'Name': ['a', 'b'],
+            })
+
+    def test_query_count_is_independent_of_row_count(self):
+        """Test that validation uses one preloaded snapshot."""
+        rows = [{'Environment': 'prod', 'Name': f'n{i}'} for i in range(500)]
+        StringGenerationService.generate_many(self.rule, self.entity, rows[:1])
+
+        with CaptureQueriesContext(connection) as context:
+            result = StringGenerationService.generate_many(self.rule, self.entity, rows)
+
+        self.assertEqual(result['success_count'], 500)
+        self.assertLessEqual(len(context.captured_queries), 2)
+
+    def test_batch_endpoint(self):
+        """Test the batch generation endpoint."""
+        url = f'/api/v1/workspaces/{self.workspace.id}/rules/generation-batch/'
+        response = self.client.post(url, {
+            'rule_id': self.rule.id,
+            'entity_id': self.entity.id,
+            'rows': [{'Environment': 'dev', 'Name': 'x'}],
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['values'], ['dev_x'])
+        self.assertEqual(response.data['error_count'], 0)
+
+    def test_batch_endpoint_rejects_ragged_columns(self):
+        """Test that ragged columnar input is rejected by the serializer."""
+        url = f'/api/v1/workspaces/{self.workspace.id}/rules/generation-batch/'
+        response = self.client.post(url, {
+            'rule_id': self.rule.id,
+            'entity_id': self.entity.id,
+            'rows': {'Environment': ['dev'], 'Name': []},
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,190 @@
+"""
+Tests for bulk string ingestion.
+
+These tests verify that String.objects.bulk_ingest() validates batches with
+set-based queries, resolves parents inside and outside the batch, rejects
+duplicates, and creates details without per-row save().
+"""
+
+import uuid
+
+from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from master_data import models
+from master_data.constants import DimensionTypeChoices, FREETEXT_LENGTH, STRING_VALUE_LENGTH
+
+
+class BulkIngestTestCase(TestCase):
+    """Test String and StringDetail bulk ingestion."""
+
+    def setUp(self):
+        """Set up a two-level rule with one list and one free-text dimension."""
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.database = models.Entity.objects.create(
+            name="Database",
+            entity_level=1,
+            platform=self.platform
+        )
+        self.schema = models.Entity.objects.create(
+            name="Schema",
+            entity_level=2,
+            platform=self.platform
+        )
+        self.dim_env = models.Dimension.objects.create(
+            name="Environment",
+            type=DimensionTypeChoices.LIST,
+            workspace=self.workspace
+        )
+        self.dim_name = models.Dimension.objects.create(
+            name="Name",
+            type=DimensionTypeChoices.FREE_TEXT,
+            workspace=self.workspace
+        )
+        self.prod = models.DimensionValue.objects.create(
+            dimension=self.dim_env,
+            value="prod",
+            label="Production",
+            utm="prod",
+            workspace=self.workspace
+        )
+        self.rule = models.Rule.objects.create(
+            name="Test Rule",
+            platform=self.platform,
+            workspace=self.workspace
+        )
+        for entity in (self.database, self.schema):
+            for order, dimension in enumerate([self.dim_env, self.dim_name], start=1):
+                models.RuleDetail.objects.create(
+                    rule=self.rule,
+                    entity=entity,
+                    dimension=dimension,
+                    dimension_order=order,
+                    delimiter="_" if order == 1 else "",
+                    workspace=self.workspace
+                )
+
+    def _details(self, name):
+        return [
+            {'dimension': self.dim_env.id, 'dimension_value': self.prod.id},
+            {'dimension': self.dim_name.id, 'dimension_value_freetext': name},
+        ]
+
+    def test_bulk_ingest_with_in_batch_parents(self):
+        """Test that children referencing batch parents are linked after insert."""
+        parent_uuid = uuid.uuid4()
+        rows = [
+            {
+                'rule': self.rule.id, 'entity': self.schema.id,
+                'parent_uuid': parent_uuid, 'details': self._details('sales'),
+            },
+            {
+                'rule': self.rule, 'entity': self.database, 'string_uuid': parent_uuid,
+                'details': self._details('warehouse'),
+            },
+        ]
+
+        result = models.String.objects.bulk_ingest(self.workspace, rows)
+
+        self.assertEqual(result.errors, [])
+        self.assertEqual(result.details_created, 4)
+        child, parent = result.created
+        self.assertEqual(parent.value, 'prod_warehouse')
+        child.refresh_from_db()
+        self.assertEqual(child.parent_id, parent.id)
+        self.assertEqual(child.parent_uuid, parent_uuid)
+        self.assertEqual((child.ancestor_path, child.depth), (f"/{parent.id}/", 1))
+        self.assertEqual(child.get_dimension_values(), {'Environment': 'prod', 'Name': 'sales'})
+
+    def test_bulk_ingest_rejects_invalid_rows(self):
+        """Test that duplicates, bad values and missing parents are reported per row."""
+        models.String.objects.bulk_ingest(self.workspace, [
+            {'rule': self.rule.id, 'entity': self.database.id, 'value': 'prod_existing'},
+        ])
+
+        result = models.String.objects.bulk_ingest(self.workspace, [
+            {'rule': self.rule.id, 'entity': self.database.id, 'value': 'prod_existing'},
+            {'rule': self.rule.id, 'entity': self.database.id, 'value': 'prod_new'},
+            {'rule': self.rule.id, 'entity': self.database.id, 'value': 'prod_new'},
+            {'rule': self.rule.id, 'entity': self.database.id, 'value': 'x',
+             'parent_uuid': uuid.uuid4()},
+            {'rule': self.rule.id, 'entity': self.database.id,
+             'details': [{'dimension': self.dim_env.id, 'dimension_value': 999999}]},
+        ])
+
+        self.assertEqual(result.created_count, 1)
+        self.assertEqual([error['index'] for error in result.errors], [0, 2, 3, 4])
+        self.assertIn("exists in this workspace", result.errors[0]['errors'][0])
+        self.assertIn("in batch", result.errors[1]['errors'][0])
+        self.assertIn("not found", result.errors[2]['errors'][0])
+        self.assertIn("does not belong", result.errors[3]['errors'][0])
+
+    def test_over_long_values_are_rejected_by_index(self):
+        """Test that values longer than their columns are rejected per row, not by the insert."""
+        result = models.String.objects.bulk_ingest(self.workspace, [
+            {'rule': self.rule.id, 'entity': self.database.id, 'value': 'prod_ok'},
+            {'rule': self.rule.id, 'entity': self.database.id,
+             'value': 'x' * (STRING_VALUE_LENGTH + 1)},
+            {'rule': self.rule.id, 'entity': self.database.id,
+             'details': self._details('n' * (FREETEXT_LENGTH + 1))},
+        ])
+
+        self.assertEqual(result.created_count, 1)
+        self.assertEqual([error['index'] for error in result.errors], [1, 2])
+        self.assertIn("cannot be longer than", result.errors[0]['errors'][0])
+        self.assertIn("cannot be longer than", result.errors[1]['errors'][0])
+
+        detail_result = models.StringDetail.objects.bulk_ingest(self.workspace, [
+            {'string': result.created[0].id, 'dimension': self.dim_name.id,
+             'dimension_value_freetext': 'n' * (FREETEXT_LENGTH + 1)},
+        ])
+        self.assertEqual(detail_result.created_count, 0)
+        self.assertEqual(detail_result.errors[0]['index'], 0)
+
+    def test_query_count_is_independent_of_batch_size(self):
+        """Test that validation does not issue per-row queries."""
+        models.String.objects.bulk_ingest(self.workspace, [
+            {'rule': self.rule.id, 'entity': self.database.id, 'details': self._details('warm')},
+        ])
+
+        def ingest(count, prefix):
+            rows = [
+                {'rule': self.rule.id, 'entity': self.database.id,
+                 'details': self._details(f'{prefix}{i}')}
+                for i in range(count)
+            ]
+            with CaptureQueriesContext(connection) as context:
+                result = models.String.objects.bulk_ingest(self.workspace, rows, chunk_size=1000)
+            self.assertEqual(result.created_count, count)
+            # INSERT batches are capped by the backend's parameter limit
+            return len([
+                query for query in context.captured_queries
+                if not query['sql'].startswith('INSERT')
+            ])
+
+        self.assertEqual(ingest(10, 'a'), ingest(500, 'b'))
+
+    def test_string_detail_bulk_ingest(self):
+        """Test the StringDetail bulk path against existing strings."""
+        result = models.String.objects.bulk_ingest(self.workspace, [
+            {'rule': self.rule.id, 'entity': self.database.id, 'value': 'prod_a'},
+        ])
+        string = result.created[0]
+
+        detail_result = models.StringDetail.objects.bulk_ingest(self.workspace, [
+            {'string': string.id, 'dimension': self.dim_env.id, 'dimension_value': self.prod.id},
+            {'string': string.id, 'dimension': self.dim_name.id, 'dimension_value_freetext': 'a'},
+            {'string': string.id, 'dimension': self.dim_name.id, 'dimension_value_freetext': 'b'},
+        ])
+
+        self.assertEqual(detail_result.created_count, 2)
+        self.assertEqual(detail_result.errors[0]['index'], 2)
+        self.assertEqual(string.string_details.count(), 2)
@@ -0,0 +1,244 @@
+"""
+Tests for background bulk string jobs.
+
+These tests verify that bulk endpoints queue a job when asked to run
+asynchronously, that the run_bulk_string_jobs worker commits the rows in
+chunks (parents before children) with per-row results and errors mapped to
+payload indexes, that jobs can be cancelled and that multi-operation jobs
+keep their all-or-nothing contract.
+
+Jobs are processed through BulkJobService inside the test transaction; the
+command itself manages its database connection between jobs and is tested
+separately, without a wrapping transaction.
+"""
+
+import uuid
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from rest_framework.test import APITestCase, APITransactionTestCase, APIClient
+from rest_framework import status
+
+from master_data import models
+from master_data.constants import DimensionTypeChoices
+from master_data.services.bulk_job_service import BulkJobService
+from users.models import WorkspaceUser
+
+User = get_user_model()
+
+
+class BulkStringJobSetupMixin:
+    """Project with a two-level platform shared by the job test cases."""
+
+    def setUp(self):
+        """Set up a project with a two-level platform."""
+        self.client = APIClient()
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            first_name='Test',
+            last_name='User'
+        )
+        WorkspaceUser.objects.create(
+            user=self.user,
+            workspace=self.workspace,
+            role='admin'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.database = models.Entity.objects.create(
+            name="Database", entity_level=1, platform=self.platform)
+        self.schema = models.Entity.objects.create(
+            name="Schema", entity_level=2, platform=self.platform)
+        self.dim_name = models.Dimension.objects.create(
+            name="Name",
+            type=DimensionTypeChoices.FREE_TEXT,
+            workspace=self.workspace
+        )
+        self.rule = models.Rule.objects.create(
+            name="Test Rule",
+            platform=self.platform,
+            workspace=self.workspace
+        )
+        self.project = models.Project.objects.create(
+            name="Project",
+            workspace=self.workspace,
+            owner=self.user
+        )
+        self.project.platforms.add(self.platform)
+        models.ProjectMember.objects.create(
+            project=self.project, user=self.user, role='owner')
+
+        self.strings_url = (
+            f'/api/v1/workspaces/{self.workspace.id}/projects/{self.project.id}'
+            f'/platforms/{self.platform.id}/strings'
+        )
+        self.jobs_url = f'/api/v1/workspaces/{self.workspace.id}/bulk-jobs'
+
+    def _row(self, entity, value, string_uuid=None, parent_uuid=None):
+        row = {
+            'entity': entity.id,
+            'value': value,
+            'details': [{'dimension': self.dim_name.id, 'dimension_value_freetext': value}],
+        }
+        if string_uuid:
+            row['string_uuid'] = str(string_uuid)
+        if parent_uuid:
+            row['parent_uuid'] = str(parent_uuid)
+        return row
+
+
+class BulkStringJobTestCase(BulkStringJobSetupMixin, APITestCase):
+    """Test BulkJobService and BulkStringJobViewSet."""
+
+    def _run_worker(self):
+        """Process every queued job, as one run of the worker command does."""
+        while True:
+            job = BulkJobService.claim_next('test-worker')
+            if job is None:
+                break
+            BulkJobService.run(job)
+
+    def test_bulk_create_job_commits_chunks_parents_first(self):
+        """Test that children listed before their parent still resolve across chunks."""
+        root = uuid.uuid4()
+        rows = [
+            self._row(self.schema, 'sales', parent_uuid=root),
+            self._row(self.schema, 'finance', parent_uuid=root),
+            self._row(self.schema, 'sales', parent_uuid=root),  # duplicate value
+            self._row(self.database, 'db', string_uuid=root),
+            self._row(self.schema, 'hr', parent_uuid=root),
+        ]
+        response = self.client.post(
+            f'{self.strings_url}/bulk?async=true',
+            {'rule': self.rule.id, 'strings': rows}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data['status'], 'pending')
+        self.assertEqual(response.data['total_rows'], 5)
+        self.assertTrue(response.data['url'].endswith(
+            f"/bulk-jobs/{response.data['job_id']}/"))
+        self.assertFalse(models.ProjectString.objects.filter(project=self.project).exists())
+
+        job = models.BulkStringJob.objects.get(job_id=response.data['job_id'])
+        models.BulkStringJob.objects.filter(id=job.id).update(chunk_size=2)
+        self._run_worker()
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'partial_failure')
+        self.assertEqual((job.processed_rows, job.failed_rows, job.next_row), (4, 1, 5))
+        self.assertEqual(job.chunks.count(), 3)
+
+        strings = models.ProjectString.objects.filter(project=self.project)
+        self.assertEqual(
+            sorted(strings.filter(parent__isnull=False).values_list('value', flat=True)),
+            ['finance', 'hr', 'sales'])
+
+        response = self.client.get(f'{self.jobs_url}/{job.job_id}/results/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['job']['status'], 'partial_failure')
+        results = [item for chunk in response.data['results'] for item in chunk['results']]
+        errors = [item for chunk in response.data['results'] for item in chunk['errors']]
+        self.assertEqual(sorted(item['index'] for item in results), [0, 1, 3, 4])
+        self.assertEqual([error['index'] for error in errors], [2])
+
+    def test_bulk_update_job(self):
+        """Test an update job and the per-row error of an unknown string."""
+        result = models.ProjectString.objects.bulk_ingest(
+            self.project, self.platform, self.rule,
+            [self._row(self.database, name) for name in ('a', 'b', 'c')])
+        a, b, c = result.created
+
+        response = self.client.put(
+            f'{self.strings_url}/bulk-update?async=1',
+            {'updates': [
+                {'id': a.id, 'value': 'a2'},
+                {'id': 999999, 'value': 'missing'},
+                {'id': c.id, 'value': 'c2'},
+            ]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        job = models.BulkStringJob.objects.get(job_id=response.data['job_id'])
+        self.assertEqual(job.operation, 'project_strings_update')
+        models.BulkStringJob.objects.filter(id=job.id).update(chunk_size=2)
+        self._run_worker()
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'partial_failure')
+        self.assertEqual(
+            list(models.ProjectString.objects.filter(id__in=[a.id, b.id, c.id])
+                 .order_by('id').values_list('value', flat=True)),
+            ['a2', 'b', 'c2'])
+        errors = [error for chunk in job.chunks.all() for error in chunk.errors]
+        self.assertEqual(errors, [{'index': 1, 'string_id': 999999, 'errors': ['String not found']}])
+        self.assertTrue(models.ProjectActivity.objects.filter(
+            project=self.project, metadata__job_id=str(job.job_id)).exists())
+
+    def test_cancelled_job_is_not_processed(self):
+        """Test cancelling a pending job and cancelling it twice."""
+        response = self.client.post(
+            f'{self.strings_url}/bulk?async=true',
+            {'rule': self.rule.id, 'strings': [self._row(self.database, 'db')]}, format='json')
+        job_id = response.data['job_id']
+
+        response = self.client.post(f'{self.jobs_url}/{job_id}/cancel/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], 'cancelled')
+        response = self.client.post(f'{self.jobs_url}/{job_id}/cancel/')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self._run_worker()
+        self.assertFalse(models.ProjectString.objects.filter(project=self.project).exists())
+        self.assertIsNone(BulkJobService.claim_next('test-worker'))
+
+    def test_multi_operations_job_is_all_or_nothing(self):
+        """Test that a failing operation fails the whole multi-operation job."""
+        response = self.client.post(
+            f'/api/v1/workspaces/{self.workspace.id}/multi-operations/execute/?async=true',
+            {'operations': [
+                {'type': 'delete_string', 'data': {'id': 999999}},
+            ]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self._run_worker()
+
+        job = models.BulkStringJob.objects.get(job_id=response.data['job_id'])
+        self.assertEqual(job.status, 'failed')
+        self.assertIn('Operation 0', job.error_message)
+        self.assertEqual(job.chunks.count(), 0)
+
+    def test_unknown_rule_is_rejected_before_queueing(self):
+        """Test that an async request for a rule outside the workspace is a 400."""
+        response = self.client.post(
+            f'{self.strings_url}/bulk?async=true',
+            {'rule': 999999, 'strings': [self._row(self.database, 'db')]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(models.BulkStringJob.objects.all_workspaces().exists())
+
+
+class RunBulkStringJobsCommandTestCase(BulkStringJobSetupMixin, APITransactionTestCase):
+    """Test the run_bulk_string_jobs worker command."""
+
+    def test_once_processes_the_queue_and_exits(self):
+        """Test that --once processes queued jobs and stops when the queue is empty."""
+        response = self.client.post(
+            f'{self.strings_url}/bulk?async=true',
+            {'rule': self.rule.id, 'strings': [self._row(self.database, 'db')]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        stdout = StringIO()
+        call_command('run_bulk_string_jobs', '--once', '--worker-name', 'test-worker', stdout=stdout)
+
+        job = models.BulkStringJob.objects.get(job_id=response.data['job_id'])
+        self.assertEqual((job.status, job.worker), ('completed', 'test-worker'))
+        self.assertIn(f"Job {job.job_id} completed: 1 applied, 0 rejected", stdout.getvalue())
+        self.assertEqual(
+            list(models.ProjectString.objects.filter(project=self.project)
+                 .values_list('value', flat=True)),
+            ['db'])
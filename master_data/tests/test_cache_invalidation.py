@@ -0,0 +1,115 @@
+"""
+Tests for transaction-scoped cache invalidation.
+
+These tests verify that writes record invalidations instead of applying
+them, that the recorded set is applied once and deduplicated when the
+transaction commits, and that bulk paths can hold back invalidation
+explicitly.
+"""
+
+from unittest import mock
+
+from django.test import TestCase
+
+from master_data import models
+from master_data.constants import DimensionTypeChoices
+from master_data.services.naming_template import naming_template_cache
+from master_data.services.shared_cache import SharedCache
+from master_data.signals import invalidation_buffer, invalidation_suspended
+
+
+class InvalidationBufferTestCase(TestCase):
+    """Test InvalidationBuffer recording, flushing and suspension."""
+
+    def setUp(self):
+        """Set up two rules using one dimension and an empty buffer."""
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.entity = models.Entity.objects.create(
+            name="Database", entity_level=1, platform=self.platform)
+        self.dimension = models.Dimension.objects.create(
+            name="Environment",
+            type=DimensionTypeChoices.LIST,
+            workspace=self.workspace
+        )
+        self.rules = []
+        for name in ("Rule A", "Rule B"):
+            rule = models.Rule.objects.create(
+                name=name, platform=self.platform, workspace=self.workspace)
+            models.RuleDetail.objects.create(
+                rule=rule,
+                entity=self.entity,
+                dimension=self.dimension,
+                dimension_order=1,
+                workspace=self.workspace
+            )
+            self.rules.append(rule)
+        invalidation_buffer.clear()
+
+    def create_values(self, count):
+        for i in range(count):
+            models.DimensionValue.objects.create(
+                dimension=self.dimension, value=f'v{i}', label=f'v{i}', utm=f'v{i}',
+                workspace=self.workspace)
+
+    def test_bulk_write_invalidates_each_rule_once_on_commit(self):
+        """Test that many value writes bump each rule generation once, after commit."""
+        key = SharedCache.rule_key('payload', self.rules[0].id)
+
+        with mock.patch.object(SharedCache, 'bump_rule_generations',
+                               wraps=SharedCache.bump_rule_generations) as bump:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.create_values(20)
+                # Nothing is applied inside the transaction
+                self.assertEqual(key, SharedCache.rule_key('payload', self.rules[0].id))
+                self.assertEqual(invalidation_buffer.dimension_ids, {self.dimension.id})
+
+        bump.assert_called_once()
+        self.assertEqual(set(bump.call_args[0][0]), {rule.id for rule in self.rules})
+        self.assertNotEqual(key, SharedCache.rule_key('payload', self.rules[0].id))
+        self.assertFalse(invalidation_buffer.has_pending)
+
+    def test_local_generations_are_bumped_before_commit(self):
+        """Test that the writing transaction sees its own rule changes."""
+        rule = self.rules[0]
+        generation = naming_template_cache.get_generation(rule.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            rule.save()
+            self.assertNotEqual(naming_template_cache.get_generation(rule.id), generation)
+            generation = naming_template_cache.get_generation(rule.id)
+
+        # And again on commit
+        self.assertNotEqual(naming_template_cache.get_generation(rule.id), generation)
+
+    def test_suspended_invalidation_is_flushed_on_resume(self):
+        """Test that invalidations recorded while suspended wait for resume."""
+        key = SharedCache.rule_key('payload', self.rules[0].id)
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with invalidation_suspended():
+                self.create_values(3)
+        # Only the resume registered a flush
+        self.assertEqual(len(callbacks), 1)
+        self.assertNotEqual(key, SharedCache.rule_key('payload', self.rules[0].id))
+
+    def test_flush_while_suspended_keeps_pending(self):
+        """Test that a commit during suspension does not drop invalidations."""
+        invalidation_buffer.suspend()
+        try:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                self.rules[0].save()
+            self.assertEqual(callbacks, [])
+            invalidation_buffer.flush()
+            self.assertEqual(invalidation_buffer.rule_ids, {self.rules[0].id})
+        finally:
+            with self.captureOnCommitCallbacks(execute=True):
+                invalidation_buffer.resume()
+
+        self.assertFalse(invalidation_buffer.has_pending)
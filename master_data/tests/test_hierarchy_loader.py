@@ -0,0 +1,225 @@
+"""
+Tests for whole-subtree loading and impact analysis over it.
+
+These tests verify that the recursive and materialized-path loaders return
+the same subtree with dimension values, and that propagation and
+inheritance impact analysis run with a fixed number of queries.
+"""
+
+import uuid
+
+from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from master_data import models
+from master_data.constants import DimensionTypeChoices
+from master_data.services import HierarchyLoader
+from master_data.services.inheritance_service import InheritanceService
+from master_data.services.propagation_service import PropagationService
+
+
+class HierarchyLoaderTestCase(TestCase):
+    """Test HierarchyLoader and the impact analyzers built on it."""
+
+    def setUp(self):
+        """Set up a three-level rule with one free-text dimension."""
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.entities = [
+            models.Entity.objects.create(
+                name=name, entity_level=level, platform=self.platform)
+            for level, name in enumerate(["Database", "Schema", "Table"], start=1)
+        ]
+        self.dim_name = models.Dimension.objects.create(
+            name="Name",
+            type=DimensionTypeChoices.FREE_TEXT,
+            workspace=self.workspace
+        )
+        self.rule = models.Rule.objects.create(
+            name="Test Rule",
+            platform=self.platform,
+            workspace=self.workspace
+        )
+        for entity in self.entities:
+            models.RuleDetail.objects.create(
+                rule=self.rule,
+                entity=entity,
+                dimension=self.dim_name,
+                dimension_order=1,
+                delimiter="",
+                workspace=self.workspace
+            )
+
+    def _tree(self, name, children, grandchildren):
+        """Ingest root -> children -> grandchildren and return the root."""
+        root_uuid = uuid.uuid4()
+        rows = [self._row(0, name, string_uuid=root_uuid)]
+        for i in range(children):
+            child_uuid = uuid.uuid4()
+            rows.append(self._row(1, f"{name}{i}", string_uuid=child_uuid, parent_uuid=root_uuid))
+            rows.extend(
+                self._row(2, f"{name}{i}_{j}", parent_uuid=child_uuid)
+                for j in range(grandchildren)
+            )
+        result = models.String.objects.bulk_ingest(self.workspace, rows)
+        self.assertEqual(result.errors, [])
+        return result.created[0]
+
+    def _row(self, level, name, **kwargs):
+        return {
+            'rule': self.rule.id,
+            'entity': self.entities[level].id,
+            'details': [{'dimension': self.dim_name.id, 'dimension_value_freetext': name}],
+            **kwargs
+        }
+
+    def test_recursive_and_path_loaders_agree(self):
+        """Test that both strategies load the same subtree and values."""
+        root = self._tree("acme", 2, 3)
+        self._tree("other", 1, 1)
+
+        indexes = {}
+        for recursive, expected_queries in ((True, 2), (False, 3)):
+            with CaptureQueriesContext(connection) as context:
+                indexes[recursive] = HierarchyLoader.load(
+                    [root], self.workspace, recursive=recursive)
+            self.assertEqual(len(context.captured_queries), expected_queries)
+
+        for index in indexes.values():
+            self.assertEqual(len(index), 9)
+            self.assertEqual(
+                [child.value for child in index.children(root.id)], ["acme0", "acme1"])
+            self.assertEqual(index.get(root.id).dimension_values, {'Name': 'acme'})
+        self.assertEqual(set(indexes[True].nodes), set(indexes[False].nodes))
+
+        levels = [level for _, level in indexes[True].walk(root.id, max_depth=1)]
+        self.assertEqual(levels, [0, 1, 1])
+
+    def test_propagation_impact_uses_fixed_queries(self):
+        """Test that impact analysis does not query per node."""
+        def analyze(name, children, grandchildren):
+            root = self._tree(name, children, grandchildren)
+            detail = root.string_details.get()
+            with CaptureQueriesContext(connection) as context:
+                impact = PropagationService.analyze_impact(
+                    [{'string_detail_id': detail.id, 'dimension_value_freetext': 'globex'}],
+                    self.workspace
+                )
+            return impact, len(context.captured_queries)
+
+        small, small_queries = analyze("acme", 1, 1)
+        large, large_queries = analyze("initech", 5, 20)
+
+        self.assertEqual(small_queries, large_queries)
+        self.assertEqual(large['summary']['total_affected'], 106)
+        self.assertEqual(large['summary']['max_depth'], 2)
+        root_record = large['affected_strings'][0]
+        self.assertEqual(root_record['change_type'], 'direct')
+        self.assertEqual(len(root_record['children']), 5)
+        self.assertEqual(root_record['new_value'], 'globex')
+        # Children hold their own Name value, so rendering leaves them unchanged
+        self.assertEqual(large['affected_strings'][1]['new_value'], 'initech0')
+
+    def test_new_values_are_rendered_from_details(self):
+        """Test that repeated values are recomputed per dimension, not replaced textually."""
+        dim_team = models.Dimension.objects.create(
+            name="Team",
+            type=DimensionTypeChoices.LIST,
+            workspace=self.workspace
+        )
+        values = {
+            value: models.DimensionValue.objects.create(
+                dimension=dim_team, value=value, label=value, utm=value,
+                workspace=self.workspace)
+            for value in ("acme", "globex")
+        }
+        models.RuleDetail.objects.filter(rule=self.rule).update(delimiter="_")
+        for entity in self.entities:
+            models.RuleDetail.objects.create(
+                rule=self.rule,
+                entity=entity,
+                dimension=dim_team,
+                dimension_order=2,
+                delimiter="",
+                workspace=self.workspace
+            )
+
+        def details(name, team):
+            return [
+                {'dimension': self.dim_name.id, 'dimension_value_freetext': name},
+                {'dimension': dim_team.id, 'dimension_value': values[team].id},
+            ]
+
+        root_uuid = uuid.uuid4()
+        result = models.String.objects.bulk_ingest(self.workspace, [
+            {'rule': self.rule.id, 'entity': self.entities[0].id,
+             'string_uuid': root_uuid, 'details': details('acme', 'acme')},
+            {'rule': self.rule.id, 'entity': self.entities[1].id,
+             'parent_uuid': root_uuid, 'details': details('sales', 'acme')},
+            {'rule': self.rule.id, 'entity': self.entities[1].id,
+             'parent_uuid': root_uuid, 'details': details('ops', 'globex')},
+        ])
+        root = result.created[0]
+        self.assertEqual(root.value, 'acme_acme')
+        detail = root.string_details.get(dimension=dim_team)
+
+        with CaptureQueriesContext(connection) as context:
+            impact = PropagationService.analyze_impact(
+                [{'string_detail_id': detail.id, 'dimension_value': values['globex'].id}],
+                self.workspace
+            )
+
+        new_values = {
+            record['string_value']: record['new_value'] for record in impact['affected_strings']
+        }
+        self.assertEqual(new_values, {
+            'acme_acme': 'acme_globex',
+            'sales_acme': 'sales_globex',
+            'ops_globex': 'ops_globex',
+        })
+        self.assertEqual(impact['conflicts'], [])
+        # Detail, roots, subtree, details, rules, entities, conflicts (templates are cached)
+        self.assertEqual(len(context.captured_queries), 7)
+
+    def test_propagation_impact_reports_conflicts_and_depth_limit(self):
+        """Test batched conflict detection and max_depth handling."""
+        root = self._tree("acme", 2, 1)
+        # Existing database string that the renamed root would collide with
+        self._tree("globex", 0, 0)
+        detail = root.string_details.get()
+
+        impact = PropagationService.analyze_impact(
+            [{'string_detail_id': detail.id, 'dimension_value_freetext': 'globex'}],
+            self.workspace,
+            max_depth=2
+        )
+
+        self.assertEqual(
+            [conflict['string_id'] for conflict in impact['conflicts']], [root.id])
+        self.assertEqual(impact['summary']['total_affected'], 3)
+        self.assertEqual(impact['summary']['max_depth'], 2)
+
+    def test_inheritance_impact(self):
+        """Test inheritance analysis over the loaded hierarchy."""
+        root = self._tree("acme", 3, 2)
+
+        with CaptureQueriesContext(connection) as context:
+            impact = InheritanceService.analyze_inheritance_impact(
+                [root],
+                [{'string_id': root.id, 'field_updates': {'owner': 'x', 'local_note': 'y'}}]
+            )
+
+        self.assertEqual(len(context.captured_queries), 2)
+        self.assertEqual(len(impact['affected_strings']), 10)
+        self.assertEqual(impact['max_depth'], 2)
+        child = impact['affected_strings'][1]
+        self.assertEqual(child['parent_string_id'], root.id)
+        self.assertEqual(child['affected_fields'], ['owner'])
+        self.assertEqual(len(child['children']), 2)
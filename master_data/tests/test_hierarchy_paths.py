@@ -0,0 +1,178 @@
+"""
+Tests for materialized hierarchy paths on String and ProjectString.
+
+These tests verify that ancestor paths are maintained on insert, parent
+resolution and reparent (and only looked up when the parent changed), that
+ancestors/descendants/subtree counts are single queries, and that the
+backfill command repairs stale paths.
+"""
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from io import StringIO
+from unittest import mock
+
+from master_data import models
+from master_data.models.base import HierarchyPathMixin
+
+User = get_user_model()
+
+
+class HierarchyPathTestCase(TestCase):
+    """Test ancestor path maintenance and tree queries."""
+
+    def setUp(self):
+        """Set up a three-level String tree: db -> schema -> table."""
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.entities = [
+            models.Entity.objects.create(
+                name=name, entity_level=level, platform=self.platform)
+            for level, name in enumerate(["Database", "Schema", "Table"], start=1)
+        ]
+        self.rule = models.Rule.objects.create(
+            name="Test Rule",
+            platform=self.platform,
+            workspace=self.workspace
+        )
+        self.db = self._string("db", 0)
+        self.schema = self._string("schema", 1, parent=self.db)
+        self.table = self._string("table", 2, parent=self.schema)
+
+    def _string(self, value, level, parent=None, **kwargs):
+        return models.String.objects.create(
+            workspace=self.workspace,
+            rule=self.rule,
+            entity=self.entities[level],
+            value=value,
+            parent=parent,
+            **kwargs
+        )
+
+    def test_paths_are_set_on_insert(self):
+        """Test that ancestor_path and depth follow the parent chain."""
+        self.assertEqual((self.db.ancestor_path, self.db.depth), ("/", 0))
+        self.assertEqual(self.schema.ancestor_path, f"/{self.db.id}/")
+        self.table.refresh_from_db()
+        self.assertEqual(self.table.ancestor_path, f"/{self.db.id}/{self.schema.id}/")
+        self.assertEqual(self.table.depth, 2)
+
+    def test_parent_uuid_resolution_sets_path(self):
+        """Test that the parent_uuid post_save link also sets the path."""
+        child = self._string("schema_b", 1, parent_uuid=self.db.string_uuid)
+
+        child.refresh_from_db()
+        self.assertEqual(child.parent_id, self.db.id)
+        self.assertEqual((child.ancestor_path, child.depth), (f"/{self.db.id}/", 1))
+
+    def test_tree_queries_are_single_queries(self):
+        """Test ancestors, descendants and subtree counts."""
+        with CaptureQueriesContext(connection) as context:
+            ancestors = list(self.table.get_ancestors())
+            descendants = set(self.db.get_descendants())
+            count = self.db.get_subtree_count()
+
+        self.assertEqual(len(context.captured_queries), 3)
+        self.assertEqual(ancestors, [self.db, self.schema])
+        self.assertEqual(descendants, {self.schema, self.table})
+        self.assertEqual(count, 2)
+        self.assertEqual(self.table.get_hierarchy_path(), [self.db, self.schema, self.table])
+
+    def test_reparent_rewrites_subtree(self):
+        """Test that moving a node rewrites its descendants' paths."""
+        other_db = self._string("other_db", 0)
+
+        self.schema.parent = other_db
+        self.schema.save()
+
+        self.table.refresh_from_db()
+        self.assertEqual(self.table.ancestor_path, f"/{other_db.id}/{self.schema.id}/")
+        self.assertEqual(self.db.get_subtree_count(), 0)
+        self.assertEqual(other_db.get_subtree_count(), 2)
+
+        self.schema.parent = None
+        self.schema.save(update_fields=['parent'])
+        self.table.refresh_from_db()
+        self.assertEqual((self.table.ancestor_path, self.table.depth), (f"/{self.schema.id}/", 1))
+
+    def test_save_without_reparent_skips_path_lookup(self):
+        """Test that the loaded snapshot spares the parent path lookup."""
+        table = models.String.objects.get(pk=self.table.pk)
+        refresh = HierarchyPathMixin._refresh_hierarchy_path
+        with mock.patch.object(
+            models.String, '_refresh_hierarchy_path', autospec=True, side_effect=refresh
+        ) as refresh_mock:
+            table.value = "table_renamed"
+            table.save()
+            refresh_mock.assert_not_called()
+
+            table.parent = self.db
+            table.save()
+            refresh_mock.assert_called_once()
+
+        table.refresh_from_db()
+        self.assertEqual((table.ancestor_path, table.depth), (f"/{self.db.id}/", 1))
+
+    def test_reparent_under_descendant_is_rejected(self):
+        """Test that cycles are rejected."""
+        self.db.parent = self.table
+        with self.assertRaises(ValidationError):
+            self.db.save(update_fields=['parent'])
+
+    def test_backfill_command_repairs_stale_paths(self):
+        """Test that the backfill command recomputes paths level by level."""
+        models.String.objects.all_workspaces().update(ancestor_path="/", depth=0)
+        self.table.refresh_from_db()
+        self.assertFalse(self.table.is_hierarchy_materialized)
+        self.assertEqual(list(self.table.get_ancestors()), [self.db, self.schema])
+
+        out = StringIO()
+        call_command('backfill_hierarchy_paths', '--model', 'string', '--chunk-size', '1', stdout=out)
+
+        self.assertIn("2 of 3 rows updated", out.getvalue())
+        self.table.refresh_from_db()
+        self.assertEqual(self.table.ancestor_path, f"/{self.db.id}/{self.schema.id}/")
+        self.assertEqual(self.table.depth, 2)
+
+    def test_project_string_hierarchy_path(self):
+        """Test ProjectString paths and the serialized hierarchy path."""
+        owner = User.objects.create_user(
+            email='owner@example.com',
+            password='testpass123',
+            first_name='Owner',
+            last_name='User'
+        )
+        project = models.Project.objects.create(
+            name="Project",
+            workspace=self.workspace,
+            owner=owner
+        )
+        project.platforms.add(self.platform)
+        parent = None
+        for level, value in enumerate(["db", "schema", "table"]):
+            parent = models.ProjectString.objects.create(
+                workspace=self.workspace,
+                project=project,
+                platform=self.platform,
+                rule=self.rule,
+                entity=self.entities[level],
+                value=value,
+                parent=parent,
+                parent_uuid=parent.string_uuid if parent else None
+            )
+
+        self.assertEqual(parent.depth, 2)
+        self.assertEqual(
+            [(item['value'], item['entity_level']) for item in parent.get_hierarchy_path()],
+            [("db", 1), ("schema", 2), ("table", 3)]
+        )
@@ -0,0 +1,166 @@
+"""
+Tests for keyset (cursor) pagination.
+
+These tests verify that ListProjectStringsView and StandardResultsSetPagination
+walk large lists with opaque cursors in a stable order, without COUNT(*)
+queries unless an estimate is requested, and that the denormalized
+ProjectString.entity_level follows its entity.
+"""
+
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from master_data import models
+from master_data.constants import DimensionTypeChoices
+from master_data.pagination import (
+    decode_cursor, encode_cursor, InvalidCursor, StandardResultsSetPagination
+)
+from master_data.views import DimensionValueViewSet
+from users.models import WorkspaceUser
+
+User = get_user_model()
+
+
+class KeysetPaginationTestCase(APITestCase):
+    """Test cursor mode of project string and viewset pagination."""
+
+    def setUp(self):
+        """Set up a project with strings on two entity levels."""
+        self.client = APIClient()
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            first_name='Test',
+            last_name='User'
+        )
+        WorkspaceUser.objects.create(
+            user=self.user,
+            workspace=self.workspace,
+            role='admin'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.database = models.Entity.objects.create(
+            name="Database", entity_level=1, platform=self.platform)
+        self.schema = models.Entity.objects.create(
+            name="Schema", entity_level=2, platform=self.platform)
+        self.rule = models.Rule.objects.create(
+            name="Test Rule",
+            platform=self.platform,
+            workspace=self.workspace
+        )
+        self.project = models.Project.objects.create(
+            name="Project",
+            workspace=self.workspace,
+            owner=self.user
+        )
+        self.project.platforms.add(self.platform)
+
+        rows = [
+            {'entity': entity.id, 'value': value}
+            for entity, values in (
+                (self.schema, ['b', 'a', 'c']),
+                (self.database, ['z', 'm', 'y', 'n']),
+            )
+            for value in values
+        ]
+        result = models.ProjectString.objects.bulk_ingest(
+            self.project, self.platform, self.rule, rows)
+        self.assertEqual(result.errors, [])
+        self.url = (
+            f'/api/v1/workspaces/{self.workspace.id}/projects/{self.project.id}'
+            f'/platforms/{self.platform.id}/strings'
+        )
+
+    def test_cursor_round_trip(self):
+        """Test that cursors are opaque and validated."""
+        cursor = encode_cursor([2, 'sales', 41])
+        self.assertEqual(decode_cursor(cursor, 3), [2, 'sales', 41])
+        with self.assertRaises(InvalidCursor):
+            decode_cursor(cursor, 2)
+        with self.assertRaises(InvalidCursor):
+            decode_cursor('not-a-cursor', 3)
+
+    def test_project_strings_keyset_walk(self):
+        """Test that cursor pages cover the list in (entity_level, value, id) order."""
+        values = []
+        params = {'pagination': 'cursor', 'page_size': 3}
+        while True:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertFalse(any('COUNT(' in query['sql'] for query in context.captured_queries))
+            self.assertNotIn('count', response.data)
+            values += [item['value'] for item in response.data['results']]
+            if not response.data['next']:
+                break
+            params = {'cursor': response.data['next'], 'page_size': 3}
+
+        self.assertEqual(values, ['m', 'n', 'y', 'z', 'a', 'b', 'c'])
+
+        response = self.client.get(self.url, {'page_size': 50})
+        self.assertEqual([item['value'] for item in response.data['results']], values)
+
+        response = self.client.get(self.url, {'cursor': 'garbage'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(
+            self.url, {'pagination': 'cursor', 'entity': self.schema.id, 'estimate_count': 'true'})
+        self.assertEqual(response.data['count'], 3)
+        self.assertFalse(response.data['count_is_estimate'])
+
+    def test_entity_level_follows_entity(self):
+        """Test that changing an entity's level updates its project strings."""
+        self.database.entity_level = 3
+        self.database.save()
+
+        self.assertEqual(
+            set(models.ProjectString.objects.filter(
+                entity=self.database).values_list('entity_level', flat=True)),
+            {3}
+        )
+        response = self.client.get(self.url, {'pagination': 'cursor'})
+        self.assertEqual(
+            [item['value'] for item in response.data['results']],
+            ['a', 'b', 'c', 'm', 'n', 'y', 'z']
+        )
+
+    # Production settings use StandardResultsSetPagination as the default
+    @mock.patch.object(DimensionValueViewSet, 'pagination_class', StandardResultsSetPagination)
+    def test_standard_pagination_cursor_mode(self):
+        """Test cursor mode of StandardResultsSetPagination on a viewset."""
+        dimension = models.Dimension.objects.create(
+            name="Environment",
+            type=DimensionTypeChoices.LIST,
+            workspace=self.workspace
+        )
+        for value in ('prod', 'dev', 'qa'):
+            models.DimensionValue.objects.create(
+                dimension=dimension, value=value, label=value, utm=value,
+                workspace=self.workspace)
+        url = f'/api/v1/workspaces/{self.workspace.id}/dimension-values/'
+
+        response = self.client.get(url, {'pagination': 'cursor', 'page_size': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['value'] for item in response.data['results']], ['dev', 'prod'])
+        self.assertIn('cursor=', response.data['next'])
+
+        response = self.client.get(response.data['next'])
+        self.assertEqual([item['value'] for item in response.data['results']], ['qa'])
+        self.assertIsNone(response.data['next'])
+
+        response = self.client.get(url, {'page': 1, 'page_size': 2})
+        self.assertEqual(response.data['count'], 3)
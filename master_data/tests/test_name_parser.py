@@ -0,0 +1,209 @@
+"""
+Tests for reverse parsing of names into dimension values.
+
+These tests verify longest-match resolution of list values, delimiting of
+free-text values, ambiguity reporting, bounded work on names that do not
+parse, and parser reuse across calls until the rule or the workspace's
+dimension values change.
+"""
+
+from unittest import mock
+
+from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from master_data import models
+from master_data.constants import DimensionTypeChoices
+from master_data.services import StringGenerationService, get_name_parser
+from master_data.services.name_parser import NameParser, name_parser_cache
+from master_data.services.shared_cache import SharedCache, values_generations
+
+
+class NameParserTestCase(TestCase):
+    """Test NameParser decomposition and caching."""
+
+    def setUp(self):
+        """Set up Region (list) + Campaign (text) + Channel (list) rule."""
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.platform = models.Platform.objects.create(
+            name="Meta",
+            slug="meta"
+        )
+        self.entity = models.Entity.objects.create(
+            name="Campaign",
+            entity_level=1,
+            platform=self.platform
+        )
+        self.dim_region = models.Dimension.objects.create(
+            name="Region",
+            type=DimensionTypeChoices.LIST,
+            workspace=self.workspace
+        )
+        self.dim_campaign = models.Dimension.objects.create(
+            name="Campaign",
+            type=DimensionTypeChoices.FREE_TEXT,
+            workspace=self.workspace
+        )
+        self.dim_channel = models.Dimension.objects.create(
+            name="Channel",
+            type=DimensionTypeChoices.LIST,
+            workspace=self.workspace
+        )
+        self.values = {}
+        for dimension, values in (
+            (self.dim_region, ['us', 'us_east', 'eu']),
+            (self.dim_channel, ['fb', 'ig']),
+        ):
+            for value in values:
+                self.values[value] = models.DimensionValue.objects.create(
+                    dimension=dimension,
+                    value=value,
+                    label=value,
+                    utm=value,
+                    workspace=self.workspace
+                )
+        self.rule = models.Rule.objects.create(
+            name="Campaign Rule",
+            platform=self.platform,
+            workspace=self.workspace
+        )
+        for order, (dimension, prefix, suffix, delimiter) in enumerate([
+            (self.dim_region, "", "", "_"),
+            (self.dim_campaign, "[", "]", "_"),
+            (self.dim_channel, "", "", ""),
+        ], start=1):
+            models.RuleDetail.objects.create(
+                rule=self.rule,
+                entity=self.entity,
+                dimension=dimension,
+                dimension_order=order,
+                prefix=prefix,
+                suffix=suffix,
+                delimiter=delimiter,
+                workspace=self.workspace
+            )
+
+    def test_round_trip_with_generated_names(self):
+        """Test that generated names parse back to their dimension values."""
+        values = {'Region': 'us_east', 'Campaign': 'spring_sale', 'Channel': 'ig'}
+        name = StringGenerationService.generate_string_value(
+            self.rule, self.entity, values)
+
+        result = get_name_parser(self.rule, self.entity).parse(name)
+
+        self.assertEqual(result.values, values)
+        self.assertFalse(result.ambiguous)
+        self.assertEqual(result.details[0]['dimension_value'], self.values['us_east'].id)
+        self.assertEqual(result.details[1]['dimension_value_freetext'], 'spring_sale')
+        self.assertAlmostEqual(result.confidence, (1 + 0.75 + 1) / 3, places=3)
+
+    def test_longest_match_falls_back_on_failure(self):
+        """Test that a shorter list value is used when the longest cannot continue."""
+        result = get_name_parser(self.rule, self.entity).parse("us_[east]_fb")
+
+        self.assertEqual(result.values['Region'], 'us')
+        self.assertEqual(result.values['Campaign'], 'east')
+
+    def test_unmatched_name_reports_error(self):
+        """Test that a name outside the pattern is rejected."""
+        result = get_name_parser(self.rule, self.entity).parse("apac_[x]_fb")
+
+        self.assertFalse(result.is_valid)
+        self.assertEqual(result.confidence, 0.0)
+        self.assertIsNotNone(result.error)
+
+    def test_long_unmatched_name_is_rejected_quickly(self):
+        """Test that failed free-text splits are not retried for every combination."""
+        rule = models.Rule.objects.create(
+            name="Free Text Rule",
+            platform=self.platform,
+            workspace=self.workspace
+        )
+        dimensions = [
+            models.Dimension.objects.create(
+                name=f"Text {number}",
+                type=DimensionTypeChoices.FREE_TEXT,
+                workspace=self.workspace
+            )
+            for number in range(4)
+        ] + [self.dim_channel]
+        for order, dimension in enumerate(dimensions, start=1):
+            models.RuleDetail.objects.create(
+                rule=rule,
+                entity=self.entity,
+                dimension=dimension,
+                dimension_order=order,
+                delimiter="_" if dimension != self.dim_channel else "",
+                workspace=self.workspace
+            )
+        parser = get_name_parser(rule, self.entity)
+        # Every split of the free text fails on the unknown channel
+        name = "_".join(["x"] * 60) + "_tv"
+
+        with mock.patch.object(
+            NameParser, '_search', autospec=True, side_effect=NameParser._search
+        ) as search:
+            result = parser.parse(name)
+
+        self.assertFalse(result.is_valid)
+        # Trying every combination would take C(60, 4) steps
+        self.assertLess(search.call_count, len(dimensions) * len(name) ** 2)
+
+    def test_ambiguous_name_reports_alternatives(self):
+        """Test that a name with several decompositions is flagged."""
+        models.RuleDetail.objects.filter(
+            rule=self.rule, dimension=self.dim_campaign
+        ).update(prefix="", suffix="")
+        models.RuleDetail.objects.get(
+            rule=self.rule, dimension=self.dim_campaign).save()
+
+        result = get_name_parser(self.rule, self.entity).parse("us_east_x_fb")
+
+        self.assertTrue(result.ambiguous)
+        self.assertEqual(result.values, {'Region': 'us_east', 'Campaign': 'x', 'Channel': 'fb'})
+        self.assertEqual(result.alternatives, [{'Region': 'us', 'Campaign': 'east_x', 'Channel': 'fb'}])
+        self.assertLess(result.confidence, 0.5)
+
+    def test_parser_is_reused_and_invalidated(self):
+        """Test that the parser is cached and rebuilt after value changes."""
+        parser = get_name_parser(self.rule, self.entity)
+        with CaptureQueriesContext(connection) as context:
+            self.assertIs(get_name_parser(self.rule, self.entity), parser)
+            list(parser.parse_many(["eu_[x]_fb"] * 100))
+        self.assertEqual(len(context.captured_queries), 0)
+
+        models.DimensionValue.objects.create(
+            dimension=self.dim_region,
+            value='apac',
+            label='apac',
+            utm='apac',
+            workspace=self.workspace
+        )
+
+        self.assertIsNot(get_name_parser(self.rule, self.entity), parser)
+        self.assertTrue(
+            get_name_parser(self.rule, self.entity).parse("apac_[x]_fb").is_valid)
+        self.assertIsNotNone(name_parser_cache.peek(self.rule.id, self.entity.id))
+
+    def test_value_committed_by_another_worker_is_parsed(self):
+        """Test that the parser follows the workspace value index version."""
+        parser = get_name_parser(self.rule, self.entity)
+
+        # Another worker added the value: no signal reaches this process
+        models.DimensionValue.objects.bulk_create([models.DimensionValue(
+            dimension=self.dim_region,
+            value='apac',
+            label='apac',
+            utm='apac',
+            workspace=self.workspace
+        )])
+        SharedCache.bump(SharedCache.generation_key('values', self.workspace.id))
+        values_generations.forget(self.workspace.id)
+
+        self.assertIsNot(get_name_parser(self.rule, self.entity), parser)
+        self.assertTrue(
+            get_name_parser(self.rule, self.entity).parse("apac_[x]_fb").is_valid)
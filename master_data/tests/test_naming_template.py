@@ -0,0 +1,171 @@
+"""
+Tests for compiled naming templates.
+
+These tests verify that string generation renders from a compiled
+(rule, entity) template without per-call queries, and that templates
+are recompiled after rule configuration changes.
+"""
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from master_data import models
+from master_data.constants import DimensionTypeChoices
+from master_data.services import StringGenerationService, NamingConventionError
+from master_data.services.naming_template import (
+    NamingTemplateCache,
+    naming_template_cache,
+)
+from master_data.services.shared_cache import SharedCache, rule_generations
+
+User = get_user_model()
+
+
+class NamingTemplateTestCase(TestCase):
+    """Test compiled naming template rendering and invalidation."""
+
+    def setUp(self):
+        """Set up a two-dimension rule for a single entity."""
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            first_name='Test',
+            last_name='User'
+        )
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.entity = models.Entity.objects.create(
+            name="Database",
+            entity_level=1,
+            platform=self.platform
+        )
+        self.dim_env = models.Dimension.objects.create(
+            name="Environment",
+            type=DimensionTypeChoices.LIST,
+            workspace=self.workspace
+        )
+        self.dim_region = models.Dimension.objects.create(
+            name="Region",
+            type=DimensionTypeChoices.LIST,
+            workspace=self.workspace
+        )
+        self.rule = models.Rule.objects.create(
+            name="Test Rule",
+            platform=self.platform,
+            workspace=self.workspace
+        )
+        self.detail_env = models.RuleDetail.objects.create(
+            rule=self.rule,
+            entity=self.entity,
+            dimension=self.dim_env,
+            dimension_order=1,
+            prefix="[",
+            suffix="]",
+            delimiter="_",
+            workspace=self.workspace
+        )
+        models.RuleDetail.objects.create(
+            rule=self.rule,
+            entity=self.entity,
+            dimension=self.dim_region,
+            dimension_order=2,
+            delimiter="",
+            workspace=self.workspace
+        )
+
+    def test_render_matches_rule_configuration(self):
+        """Test that the compiled template applies prefix, suffix and delimiters."""
+        value = StringGenerationService.generate_string_value(
+            self.rule, self.entity, {'Environment': 'prod', 'Region': 'eu'}
+        )
+        self.assertEqual(value, "[prod]_eu")
+
+    def test_repeated_generation_issues_no_queries(self):
+        """Test that generation after the first call does not touch the DB."""
+        values = {'Environment': 'prod', 'Region': 'eu'}
+        StringGenerationService.generate_string_value(self.rule, self.entity, values)
+
+        with CaptureQueriesContext(connection) as context:
+            for _ in range(100):
+                StringGenerationService.generate_string_value(
+                    self.rule, self.entity, values)
+
+        self.assertEqual(len(context.captured_queries), 0)
+
+    def test_rule_detail_change_recompiles_template(self):
+        """Test that saving a RuleDetail invalidates the compiled template."""
+        values = {'Environment': 'prod', 'Region': 'eu'}
+        StringGenerationService.generate_string_value(self.rule, self.entity, values)
+
+        self.detail_env.delimiter = "-"
+        # Takes effect before commit, within the writing transaction
+        self.detail_env.save()
+
+        value = StringGenerationService.generate_string_value(
+            self.rule, self.entity, values)
+        self.assertEqual(value, "[prod]-eu")
+
+    def test_change_committed_by_another_worker_recompiles_template(self):
+        """Test that a shared generation bump invalidates this worker's template."""
+        values = {'Environment': 'prod', 'Region': 'eu'}
+        StringGenerationService.generate_string_value(self.rule, self.entity, values)
+
+        # Another worker saved the detail: no signal reaches this process
+        models.RuleDetail.objects.filter(id=self.detail_env.id).update(delimiter="-")
+        SharedCache.bump(SharedCache.generation_key('rule', self.rule.id))
+        self.assertEqual(
+            StringGenerationService.generate_string_value(self.rule, self.entity, values),
+            "[prod]_eu")
+
+        # Once the memoized shared generation expires
+        rule_generations.forget(self.rule.id)
+        self.assertEqual(
+            StringGenerationService.generate_string_value(self.rule, self.entity, values),
+            "[prod]-eu")
+
+    def test_missing_dimension_raises(self):
+        """Test that a missing dimension value raises NamingConventionError."""
+        with self.assertRaises(NamingConventionError):
+            StringGenerationService.generate_string_value(
+                self.rule, self.entity, {'Environment': 'prod'}
+            )
+
+    def test_cache_is_bounded(self):
+        """Test that the LRU evicts the least recently used template."""
+        cache = NamingTemplateCache(maxsize=1)
+        other_entity = models.Entity.objects.create(
+            name="Schema",
+            entity_level=2,
+            platform=self.platform
+        )
+        models.RuleDetail.objects.create(
+            rule=self.rule,
+            entity=other_entity,
+            dimension=self.dim_env,
+            dimension_order=1,
+            workspace=self.workspace
+        )
+
+        cache.get_template(self.rule, self.entity)
+        cache.get_template(self.rule, other_entity)
+
+        self.assertEqual(len(cache), 1)
+        self.assertIsNone(cache.peek(self.rule.id, self.entity.id))
+        self.assertIsNotNone(cache.peek(self.rule.id, other_entity.id))
+
+    def test_shared_cache_used_by_rule_preview(self):
+        """Test that Rule.get_preview routes through the shared template cache."""
+        preview = self.rule.get_preview(
+            self.entity, {'Environment': 'dev', 'Region': 'us'})
+
+        self.assertEqual(preview, "[dev]_us")
+        self.assertIsNotNone(
+            naming_template_cache.peek(self.rule.id, self.entity.id))
@@ -0,0 +1,124 @@
+"""
+Tests for the project detail sections.
+
+These tests verify that the project detail returns bounded section
+summaries, that ?include= and ?fields= shape the response, and that the
+strings and activities sub-resources page through every row.
+"""
+
+from django.contrib.auth import get_user_model
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from master_data import models
+from users.models import WorkspaceUser
+
+User = get_user_model()
+
+
+class ProjectDetailSectionsTestCase(APITestCase):
+    """Test ProjectDetailSerializer sections and the project sub-resources."""
+
+    def setUp(self):
+        """Set up a project with 30 strings and 3 activities."""
+        self.client = APIClient()
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            first_name='Test',
+            last_name='User'
+        )
+        WorkspaceUser.objects.create(
+            user=self.user,
+            workspace=self.workspace,
+            role='admin'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.database = models.Entity.objects.create(
+            name="Database", entity_level=1, platform=self.platform)
+        self.rule = models.Rule.objects.create(
+            name="Test Rule",
+            platform=self.platform,
+            workspace=self.workspace
+        )
+        self.project = models.Project.objects.create(
+            name="Project",
+            workspace=self.workspace,
+            owner=self.user
+        )
+        self.project.platforms.add(self.platform)
+        result = models.ProjectString.objects.bulk_ingest(
+            self.project, self.platform, self.rule,
+            [{'entity': self.database.id, 'value': f'db_{i:02d}'} for i in range(30)])
+        self.assertEqual(result.errors, [])
+        for i in range(3):
+            models.ProjectActivity.objects.create(
+                project=self.project, user=self.user,
+                type='project_updated', description=f'update {i}')
+        self.url = f'/api/v1/workspaces/{self.workspace.id}/projects/{self.project.id}/'
+
+    def test_default_detail_has_section_summaries(self):
+        """Test that strings and activities are summaries by default."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['strings']['count'], 30)
+        self.assertNotIn('results', response.data['strings'])
+        self.assertTrue(response.data['strings']['url'].endswith(f'{self.url}strings/'))
+        self.assertEqual(response.data['activities']['count'], 3)
+        self.assertTrue(response.data['activities']['url'].endswith(f'{self.url}activities/'))
+
+    def test_include_and_fields(self):
+        """Test embedding section previews and selecting fields."""
+        response = self.client.get(self.url, {'include': 'strings,activities', 'fields': 'name,strings'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data), {'id', 'name', 'strings'})
+        self.assertEqual(len(response.data['strings']['results']), 20)
+        self.assertEqual(response.data['strings']['results'][0]['value'], 'db_00')
+        self.assertIsNotNone(response.data['strings']['next_cursor'])
+
+        response = self.client.get(self.url, {'include': 'activities'})
+        self.assertEqual(
+            [item['description'] for item in response.data['activities']['results']],
+            ['update 2', 'update 1', 'update 0'])
+        self.assertIsNone(response.data['activities']['next_cursor'])
+
+        response = self.client.get(self.url, {'include': 'everything'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_strings_sub_resource_pages_through_all_rows(self):
+        """Test following next_cursor from the detail preview to the last page."""
+        preview = self.client.get(self.url, {'include': 'strings'}).data['strings']
+        values = [item['value'] for item in preview['results']]
+
+        response = self.client.get(
+            preview['url'], {'cursor': preview['next_cursor'], 'page_size': 7})
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            values.extend(item['value'] for item in response.data['results'])
+            if not response.data['next']:
+                break
+            response = self.client.get(response.data['next'])
+        self.assertEqual(values, [f'db_{i:02d}' for i in range(30)])
+
+        response = self.client.get(f'{self.url}strings/', {'platform': 0})
+        self.assertEqual(response.data['results'], [])
+
+    def test_activities_sub_resource(self):
+        """Test the activities sub-resource ordering and paging."""
+        response = self.client.get(f'{self.url}activities/', {'page_size': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item['description'] for item in response.data['results']], ['update 2', 'update 1'])
+        response = self.client.get(response.data['next'])
+        self.assertEqual(
+            [item['description'] for item in response.data['results']], ['update 0'])
+        self.assertIsNone(response.data['next'])
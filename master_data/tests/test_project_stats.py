@@ -0,0 +1,140 @@
+"""
+Tests for denormalized project statistics.
+
+These tests verify that ProjectStats follows string, member, platform and
+activity writes, that reconcile repairs drift, and that the project list
+reads statistics without per-project count queries.
+"""
+
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from master_data import models
+from users.models import WorkspaceUser
+
+User = get_user_model()
+
+
+class ProjectStatsTestCase(APITestCase):
+    """Test ProjectStats maintenance and the project list statistics."""
+
+    def setUp(self):
+        """Set up a workspace, a platform with an entity and a rule."""
+        self.client = APIClient()
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            first_name='Test',
+            last_name='User'
+        )
+        WorkspaceUser.objects.create(
+            user=self.user,
+            workspace=self.workspace,
+            role='admin'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.database = models.Entity.objects.create(
+            name="Database", entity_level=1, platform=self.platform)
+        self.rule = models.Rule.objects.create(
+            name="Test Rule",
+            platform=self.platform,
+            workspace=self.workspace
+        )
+        self.url = f'/api/v1/workspaces/{self.workspace.id}/projects/'
+
+    def _create_project(self, name, strings=0):
+        project = models.Project.objects.create(
+            name=name,
+            workspace=self.workspace,
+            owner=self.user
+        )
+        project.platforms.add(self.platform)
+        models.ProjectMember.objects.create(project=project, user=self.user, role='owner')
+        if strings:
+            result = models.ProjectString.objects.bulk_ingest(
+                project, self.platform, self.rule,
+                [{'entity': self.database.id, 'value': f'{name}_{i}'} for i in range(strings)])
+            self.assertEqual(result.errors, [])
+        return project
+
+    def _stats(self, project):
+        return models.ProjectStats.objects.get(project_id=project.id).as_dict()
+
+    def test_counters_follow_writes(self):
+        """Test string, member, platform and activity changes."""
+        project = self._create_project('alpha', strings=3)
+        self.assertEqual(self._stats(project), {
+            'total_strings': 3,
+            'platforms_count': 1,
+            'team_members_count': 1,
+            'last_activity': None,
+        })
+
+        models.ProjectString.objects.filter(project=project).first().delete()
+        project.platforms.remove(self.platform)
+        models.ProjectMember.objects.filter(project=project).delete()
+        activity = models.ProjectActivity.objects.create(
+            project=project, user=self.user, type='project_created', description='Created')
+        self.assertEqual(self._stats(project), {
+            'total_strings': 2,
+            'platforms_count': 0,
+            'team_members_count': 0,
+            'last_activity': activity.created,
+        })
+
+        activity.delete()
+        self.assertIsNone(self._stats(project)['last_activity'])
+
+    def test_reconcile_repairs_drift(self):
+        """Test reconcile and the reconcile_project_stats command."""
+        project = self._create_project('alpha', strings=2)
+        models.ProjectStats.objects.filter(project_id=project.id).update(
+            total_strings=40, team_members_count=0)
+
+        out = StringIO()
+        call_command('reconcile_project_stats', '--dry-run', stdout=out)
+        self.assertIn('1 projects', out.getvalue())
+        self.assertEqual(self._stats(project)['total_strings'], 40)
+
+        call_command('reconcile_project_stats', stdout=StringIO())
+        self.assertEqual(self._stats(project)['total_strings'], 2)
+        self.assertEqual(self._stats(project)['team_members_count'], 1)
+        self.assertEqual(models.ProjectStats.objects.reconcile(), 0)
+
+        # Missing rows are recreated
+        models.ProjectStats.objects.filter(project_id=project.id).delete()
+        self.assertEqual(models.ProjectStats.objects.reconcile(), 1)
+        self.assertEqual(self._stats(project)['total_strings'], 2)
+
+    def test_project_list_query_count_is_constant(self):
+        """Test that more projects and strings do not add list queries."""
+        self._create_project('alpha', strings=2)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        baseline = len(context.captured_queries)
+
+        for name in ('beta', 'gamma', 'delta'):
+            self._create_project(name, strings=5)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+        self.assertEqual(len(context.captured_queries), baseline)
+
+        results = response.data['results'] if 'results' in response.data else response.data
+        self.assertEqual(
+            sorted(item['stats']['total_strings'] for item in results), [2, 5, 5, 5])
@@ -0,0 +1,196 @@
+"""
+Tests for set-based bulk creation of project strings.
+
+These tests verify that the bulk create endpoint resolves parents inside
+and outside the batch, computes is_inherited without per-detail queries,
+rejects conflicts with both partial unique constraints, and issues a
+number of queries independent of the batch size.
+"""
+
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from master_data import models
+from master_data.constants import DimensionTypeChoices, STRING_VALUE_LENGTH
+from users.models import WorkspaceUser
+
+User = get_user_model()
+
+
+class BulkProjectStringCreateTestCase(APITestCase):
+    """Test BulkProjectStringCreateSerializer and ProjectString.objects.bulk_ingest."""
+
+    def setUp(self):
+        """Set up a project with one platform and a two-level rule."""
+        self.client = APIClient()
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            first_name='Test',
+            last_name='User'
+        )
+        WorkspaceUser.objects.create(
+            user=self.user,
+            workspace=self.workspace,
+            role='admin'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.database = models.Entity.objects.create(
+            name="Database", entity_level=1, platform=self.platform)
+        self.schema = models.Entity.objects.create(
+            name="Schema", entity_level=2, platform=self.platform)
+        self.dim_env = models.Dimension.objects.create(
+            name="Environment",
+            type=DimensionTypeChoices.LIST,
+            workspace=self.workspace
+        )
+        self.dim_name = models.Dimension.objects.create(
+            name="Name",
+            type=DimensionTypeChoices.FREE_TEXT,
+            workspace=self.workspace
+        )
+        self.prod = models.DimensionValue.objects.create(
+            dimension=self.dim_env,
+            value="prod",
+            label="Production",
+            utm="prod",
+            workspace=self.workspace
+        )
+        self.rule = models.Rule.objects.create(
+            name="Test Rule",
+            platform=self.platform,
+            workspace=self.workspace
+        )
+        self.project = models.Project.objects.create(
+            name="Project",
+            workspace=self.workspace,
+            owner=self.user
+        )
+        self.project.platforms.add(self.platform)
+        models.ProjectMember.objects.create(
+            project=self.project, user=self.user, role='owner')
+        self.url = (
+            f'/api/v1/workspaces/{self.workspace.id}/projects/{self.project.id}'
+            f'/platforms/{self.platform.id}/strings/bulk'
+        )
+
+    def _string(self, entity, name, string_uuid=None, parent_uuid=None):
+        return {
+            'entity': entity.id,
+            'string_uuid': str(string_uuid or uuid.uuid4()),
+            'parent_uuid': str(parent_uuid) if parent_uuid else None,
+            'value': f'prod_{name}',
+            'details': [
+                {'dimension': self.dim_env.id, 'dimension_value': self.prod.id},
+                {'dimension': self.dim_name.id, 'dimension_value_freetext': name},
+            ],
+        }
+
+    def _post(self, strings):
+        return self.client.post(self.url, {
+            'rule': self.rule.id,
+            'starting_entity': self.database.id,
+            'strings': strings,
+        }, format='json')
+
+    def test_bulk_create_with_in_batch_and_existing_parents(self):
+        """Test parent resolution, paths and is_inherited."""
+        parent_uuid = uuid.uuid4()
+        response = self._post([
+            self._string(self.schema, 'sales', parent_uuid=parent_uuid),
+            self._string(self.database, 'warehouse', string_uuid=parent_uuid),
+        ])
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(response.data['created_count'], 2)
+        child_data = response.data['strings'][0]
+        self.assertEqual(
+            {detail['dimension_name']: detail['is_inherited'] for detail in child_data['details']},
+            {'Environment': True, 'Name': False}
+        )
+
+        parent = models.ProjectString.objects.get(string_uuid=parent_uuid)
+        child = models.ProjectString.objects.get(value='prod_sales')
+        self.assertEqual(child.parent_id, parent.id)
+        self.assertEqual((child.ancestor_path, child.depth), (f"/{parent.id}/", 1))
+        self.assertTrue(models.ProjectActivity.objects.filter(
+            project=self.project, type='strings_generated').exists())
+
+        # Existing parent from an earlier submission
+        response = self._post([self._string(self.schema, 'ops', parent_uuid=parent_uuid)])
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        detail = models.ProjectStringDetail.objects.get(
+            string__value='prod_ops', dimension=self.dim_env)
+        self.assertTrue(detail.is_inherited)
+
+    def test_conflicts_reject_the_whole_batch(self):
+        """Test both partial unique constraints and missing parents."""
+        parent_uuid = uuid.uuid4()
+        self._post([
+            self._string(self.database, 'warehouse', string_uuid=parent_uuid),
+            self._string(self.schema, 'sales', parent_uuid=parent_uuid),
+        ])
+
+        response = self._post([
+            self._string(self.database, 'warehouse'),
+            self._string(self.schema, 'sales', parent_uuid=parent_uuid),
+            self._string(self.schema, 'other', parent_uuid=uuid.uuid4()),
+            self._string(self.database, 'new'),
+        ])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.json()['strings']
+        self.assertEqual(sorted(errors), ['0', '1', '2'])
+        self.assertIn("exists in this project", errors['0'][0])
+        self.assertIn("exists in this project", errors['1'][0])
+        self.assertIn("not found", errors['2'][0])
+        self.assertFalse(models.ProjectString.objects.filter(value='prod_new').exists())
+
+    def test_over_long_value_is_rejected_by_index(self):
+        """Test that a value longer than the column is a row error, not a failed insert."""
+        too_long = self._string(self.database, 'long')
+        too_long['value'] = 'x' * (STRING_VALUE_LENGTH + 1)
+
+        result = models.ProjectString.objects.bulk_ingest(
+            self.project, self.platform, self.rule,
+            [self._string(self.database, 'ok'), too_long])
+
+        self.assertEqual([string.value for string in result.created], ['prod_ok'])
+        self.assertEqual([error['index'] for error in result.errors], [1])
+        self.assertIn("cannot be longer than", result.errors[0]['errors'][0])
+
+    def test_query_count_is_independent_of_batch_size(self):
+        """Test that validation and inserts are set-based."""
+        def ingest(count, prefix):
+            parent_uuid = uuid.uuid4()
+            rows = [self._string(self.database, f'{prefix}root', string_uuid=parent_uuid)]
+            rows += [
+                self._string(self.schema, f'{prefix}{i}', parent_uuid=parent_uuid)
+                for i in range(count)
+            ]
+            with CaptureQueriesContext(connection) as context:
+                result = models.ProjectString.objects.bulk_ingest(
+                    self.project, self.platform, self.rule, rows, created_by=self.user)
+            self.assertEqual(result.errors, [])
+            self.assertEqual(result.details_created, 2 * (count + 1))
+            return len([
+                query for query in context.captured_queries
+                if not query['sql'].startswith('INSERT')
+            ])
+
+        ingest(1, 'warm')
+        self.assertEqual(ingest(5, 'a'), ingest(300, 'b'))
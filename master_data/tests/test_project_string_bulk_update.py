@@ -0,0 +1,183 @@
+"""
+Tests for set-based bulk updates of project strings.
+
+These tests verify that the bulk update endpoint replaces values and
+details, recomputes is_inherited against the parent's new details, rejects
+invalid and conflicting updates per row, and issues a number of queries
+independent of the batch size.
+"""
+
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from master_data import models
+from master_data.constants import DimensionTypeChoices
+from users.models import WorkspaceUser
+
+User = get_user_model()
+
+
+class BulkProjectStringUpdateTestCase(APITestCase):
+    """Test BulkUpdateProjectStringsView and ProjectString.objects.bulk_edit."""
+
+    def setUp(self):
+        """Set up a project with one database string and two schema strings below it."""
+        self.client = APIClient()
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            first_name='Test',
+            last_name='User'
+        )
+        WorkspaceUser.objects.create(
+            user=self.user,
+            workspace=self.workspace,
+            role='admin'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.database = models.Entity.objects.create(
+            name="Database", entity_level=1, platform=self.platform)
+        self.schema = models.Entity.objects.create(
+            name="Schema", entity_level=2, platform=self.platform)
+        self.dim_env = models.Dimension.objects.create(
+            name="Environment",
+            type=DimensionTypeChoices.LIST,
+            workspace=self.workspace
+        )
+        self.dim_name = models.Dimension.objects.create(
+            name="Name",
+            type=DimensionTypeChoices.FREE_TEXT,
+            workspace=self.workspace
+        )
+        self.prod, self.dev = [
+            models.DimensionValue.objects.create(
+                dimension=self.dim_env, value=value, label=value, utm=value,
+                workspace=self.workspace)
+            for value in ('prod', 'dev')
+        ]
+        self.rule = models.Rule.objects.create(
+            name="Test Rule",
+            platform=self.platform,
+            workspace=self.workspace
+        )
+        self.project = models.Project.objects.create(
+            name="Project",
+            workspace=self.workspace,
+            owner=self.user
+        )
+        self.project.platforms.add(self.platform)
+        models.ProjectMember.objects.create(
+            project=self.project, user=self.user, role='owner')
+
+        root = uuid.uuid4()
+        result = models.ProjectString.objects.bulk_ingest(
+            self.project, self.platform, self.rule, [
+                {'entity': self.database.id, 'value': 'prod_db', 'string_uuid': root,
+                 'details': [{'dimension': self.dim_env.id, 'dimension_value': self.prod.id}]},
+            ] + [
+                {'entity': self.schema.id, 'value': f'prod_{name}', 'parent_uuid': root,
+                 'details': [
+                     {'dimension': self.dim_env.id, 'dimension_value': self.prod.id},
+                     {'dimension': self.dim_name.id, 'dimension_value_freetext': name},
+                 ]}
+                for name in ('sales', 'finance')
+            ])
+        self.assertEqual(result.errors, [])
+        self.root, self.sales, self.finance = result.created
+        self.url = (
+            f'/api/v1/workspaces/{self.workspace.id}/projects/{self.project.id}'
+            f'/platforms/{self.platform.id}/strings/bulk-update'
+        )
+
+    def _details(self, string):
+        return {
+            detail.dimension_id: (detail.dimension_value_id, detail.dimension_value_freetext,
+                                  detail.is_inherited)
+            for detail in models.ProjectStringDetail.objects.filter(string=string)
+        }
+
+    def test_values_and_details_are_replaced(self):
+        """Test a rename, a detail change on the parent and a detail removal."""
+        dev_details = [{'dimension': self.dim_env.id, 'dimension_value': self.dev.id}]
+        response = self.client.put(self.url, {'updates': [
+            {'id': self.root.id, 'value': 'dev_db', 'details': dev_details},
+            {'id': self.sales.id, 'value': 'dev_sales', 'details': dev_details},
+            {'id': self.finance.id, 'details': [
+                {'dimension': self.dim_name.id, 'dimension_value_freetext': 'fin'}]},
+        ]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated_count'], 3)
+        self.assertEqual(
+            [(item['id'], item['value']) for item in response.data['updated_strings']],
+            [(self.root.id, 'dev_db'), (self.sales.id, 'dev_sales'), (self.finance.id, 'prod_finance')])
+
+        self.assertEqual(
+            models.ProjectString.objects.get(id=self.sales.id).value, 'dev_sales')
+        # Inherited from the parent's new environment value
+        self.assertEqual(self._details(self.sales), {self.dim_env.id: (self.dev.id, None, True)})
+        self.assertEqual(self._details(self.finance), {self.dim_name.id: (None, 'fin', False)})
+        self.assertEqual(self._details(self.root), {self.dim_env.id: (self.dev.id, None, False)})
+
+    def test_invalid_rows_are_reported_per_id(self):
+        """Test that rejected rows leave the other updates applied."""
+        response = self.client.put(self.url, {'updates': [
+            {'id': self.sales.id, 'value': 'prod_finance'},
+            {'id': self.finance.id, 'value': 'prod_accounts'},
+            {'id': 999999, 'value': 'missing'},
+            {'value': 'no id'},
+            {'id': self.root.id, 'details': [{'dimension': self.dim_env.id}]},
+        ]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated_count'], 1)
+        errors = {error['index']: error for error in response.data['errors']}
+        self.assertEqual(sorted(errors), [0, 2, 3, 4])
+        self.assertIn("exists in this project and platform", errors[0]['errors'][0])
+        self.assertEqual(errors[2], {'index': 2, 'string_id': 999999, 'errors': ['String not found']})
+        self.assertEqual(
+            models.ProjectString.objects.get(id=self.finance.id).value, 'prod_accounts')
+        self.assertEqual(models.ProjectString.objects.get(id=self.sales.id).value, 'prod_sales')
+
+        # Two rows renaming onto the same value
+        result = models.ProjectString.objects.bulk_edit(
+            self.project, self.platform,
+            [{'id': self.sales.id, 'value': 'prod_x'}, {'id': self.finance.id, 'value': 'prod_x'}],
+            partial=False)
+        self.assertEqual(result.updated, [])
+        self.assertIn("in batch", result.errors[0]['errors'][0])
+
+    def test_query_count_is_independent_of_batch_size(self):
+        """Test that 2 and 40 updates issue the same number of queries."""
+        result = models.ProjectString.objects.bulk_ingest(
+            self.project, self.platform, self.rule, [
+                {'entity': self.schema.id, 'value': f'prod_t{i}', 'parent_uuid': self.root.string_uuid,
+                 'details': [{'dimension': self.dim_name.id, 'dimension_value_freetext': f't{i}'}]}
+                for i in range(40)
+            ])
+        strings = result.created
+
+        def run(batch, suffix):
+            with CaptureQueriesContext(connection) as context:
+                result = models.ProjectString.objects.bulk_edit(self.project, self.platform, [
+                    {'id': string.id, 'value': f'{string.value}_{suffix}', 'details': [
+                        {'dimension': self.dim_env.id, 'dimension_value': self.prod.id},
+                        {'dimension': self.dim_name.id, 'dimension_value_freetext': suffix}]}
+                    for string in batch
+                ])
+            self.assertEqual(result.errors, [])
+            return len(context.captured_queries)
+
+        self.assertEqual(run(strings[:2], 'a'), run(strings, 'b'))
@@ -0,0 +1,197 @@
+"""
+Tests for streaming project string exports.
+
+These tests verify that ExportProjectStringsView streams CSV, NDJSON and
+JSON exports with optional detail columns and gzip compression, and that
+the number of queries does not grow with the number of strings.
+"""
+
+import csv
+import gzip
+import io
+import json
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from master_data import models
+from master_data.constants import DimensionTypeChoices
+from master_data.services import ProjectStringExportService
+from users.models import WorkspaceUser
+
+User = get_user_model()
+
+
+class ProjectStringExportTestCase(APITestCase):
+    """Test ExportProjectStringsView and ProjectStringExportService."""
+
+    def setUp(self):
+        """Set up a project with a parent and a child string."""
+        self.client = APIClient()
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            first_name='Test',
+            last_name='User'
+        )
+        WorkspaceUser.objects.create(
+            user=self.user,
+            workspace=self.workspace,
+            role='admin'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.database = models.Entity.objects.create(
+            name="Database", entity_level=1, platform=self.platform)
+        self.schema = models.Entity.objects.create(
+            name="Schema", entity_level=2, platform=self.platform)
+        self.dim_env = models.Dimension.objects.create(
+            name="Environment",
+            type=DimensionTypeChoices.LIST,
+            workspace=self.workspace
+        )
+        self.dim_name = models.Dimension.objects.create(
+            name="Name",
+            type=DimensionTypeChoices.FREE_TEXT,
+            workspace=self.workspace
+        )
+        self.prod = models.DimensionValue.objects.create(
+            dimension=self.dim_env,
+            value="prod",
+            label="Production",
+            utm="prod",
+            workspace=self.workspace
+        )
+        self.rule = models.Rule.objects.create(
+            name="Test Rule",
+            platform=self.platform,
+            workspace=self.workspace
+        )
+        self.project = models.Project.objects.create(
+            name="Project",
+            workspace=self.workspace,
+            owner=self.user
+        )
+        self.project.platforms.add(self.platform)
+        self.url = (
+            f'/api/v1/workspaces/{self.workspace.id}/projects/{self.project.id}'
+            f'/platforms/{self.platform.id}/strings/export'
+        )
+        self._ingest(1)
+
+    def _ingest(self, count):
+        rows = []
+        if not models.ProjectString.objects.filter(entity=self.database).exists():
+            self.parent_uuid = uuid.uuid4()
+            rows.append({
+                'entity': self.database.id, 'value': 'prod_warehouse',
+                'string_uuid': self.parent_uuid,
+                'details': [
+                    {'dimension': self.dim_env.id, 'dimension_value': self.prod.id},
+                    {'dimension': self.dim_name.id, 'dimension_value_freetext': 'warehouse'},
+                ],
+            })
+        offset = models.ProjectString.objects.filter(entity=self.schema).count()
+        rows += [
+            {
+                'entity': self.schema.id, 'value': f'prod_sales{offset + i}',
+                'parent_uuid': self.parent_uuid,
+                'details': [
+                    {'dimension': self.dim_name.id, 'dimension_value_freetext': f'sales{offset + i}'},
+                ],
+            }
+            for i in range(count)
+        ]
+        result = models.ProjectString.objects.bulk_ingest(
+            self.project, self.platform, self.rule, rows, created_by=self.user)
+        self.assertEqual(result.errors, [])
+
+    def _content(self, response):
+        return b''.join(response.streaming_content)
+
+    def test_csv_export(self):
+        """Test the default CSV export and per-dimension detail columns."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        rows = list(csv.reader(io.StringIO(self._content(response).decode())))
+        self.assertEqual(rows[0][:3], ['String ID', 'UUID', 'Project'])
+        self.assertEqual(len(rows[0]), 12)
+        self.assertEqual([row[6] for row in rows[1:]], ['prod_warehouse', 'prod_sales0'])
+        self.assertEqual(rows[1][9], 'Test User')
+
+        response = self.client.get(self.url, {'format': 'csv', 'details': 'true'})
+        rows = list(csv.reader(io.StringIO(self._content(response).decode())))
+        self.assertEqual(rows[0][12:], ['Environment', 'Name'])
+        self.assertEqual(rows[1][12:], ['prod', 'warehouse'])
+        self.assertEqual(rows[2][12:], ['', 'sales0'])
+
+    def test_ndjson_and_json_exports(self):
+        """Test NDJSON lines and the streamed JSON document."""
+        response = self.client.get(self.url, {'format': 'ndjson'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lines = [json.loads(line) for line in self._content(response).decode().splitlines()]
+        self.assertEqual([line['value'] for line in lines], ['prod_warehouse', 'prod_sales0'])
+        self.assertEqual(
+            {detail['dimension_name']: detail['dimension_value_display']
+             for detail in lines[0]['details']},
+            {'Environment': 'prod', 'Name': 'warehouse'}
+        )
+        self.assertEqual(lines[1]['parent_uuid'], str(lines[0]['string_uuid']))
+
+        response = self.client.get(self.url, {'format': 'json', 'details': 'false'})
+        document = json.loads(self._content(response))
+        self.assertEqual(document['project']['id'], self.project.id)
+        self.assertEqual(document['count'], 2)
+        self.assertEqual([item['value'] for item in document['strings']],
+                         ['prod_warehouse', 'prod_sales0'])
+        self.assertNotIn('details', document['strings'][0])
+
+        response = self.client.get(self.url, {'format': 'xml'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_gzip_export(self):
+        """Test on-the-fly gzip compression."""
+        response = self.client.get(self.url, {'format': 'ndjson', 'compress': 'true'})
+        self.assertEqual(response['Content-Type'], 'application/gzip')
+        self.assertIn('.ndjson.gz', response['Content-Disposition'])
+        lines = gzip.decompress(self._content(response)).decode().splitlines()
+        self.assertEqual(len(lines), 2)
+
+    def test_query_count_is_independent_of_size(self):
+        """Test that details are loaded per chunk, not per string."""
+        def count_queries():
+            with CaptureQueriesContext(connection) as context:
+                chunks = list(ProjectStringExportService.stream(
+                    self.project, self.platform, 'json',
+                    include_details=True, chunk_size=100))
+            document = json.loads(b''.join(chunks))
+            return len(context.captured_queries), document['count']
+
+        self.assertEqual(count_queries(), (2, 2))
+        self._ingest(50)
+        self.assertEqual(count_queries(), (2, 52))
+
+        # Chunks of 20 strings: one string query and one detail query per chunk
+        with CaptureQueriesContext(connection) as context:
+            output = b''.join(ProjectStringExportService.stream(
+                self.project, self.platform, 'json', include_details=True, chunk_size=20))
+        self.assertEqual(json.loads(output)['count'], 52)
+        self.assertEqual(
+            len([query for query in context.captured_queries
+                 if 'master_data_projectstringdetail' in query['sql']]),
+            3
+        )
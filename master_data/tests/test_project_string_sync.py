@@ -0,0 +1,169 @@
+"""
+Tests for incremental ("changed since") project string sync.
+
+These tests verify that the export and list endpoints return only strings
+changed after a `since` watermark, report deletions through tombstones,
+reject malformed or expired watermarks, and hand back a new watermark.
+"""
+
+import io
+import json
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from master_data import models
+from master_data.constants import DimensionTypeChoices
+from users.models import WorkspaceUser
+
+User = get_user_model()
+
+
+class ProjectStringSyncTestCase(APITestCase):
+    """Test `since` on ExportProjectStringsView and ListProjectStringsView."""
+
+    def setUp(self):
+        """Set up a project with three strings last changed an hour ago."""
+        self.client = APIClient()
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            first_name='Test',
+            last_name='User'
+        )
+        WorkspaceUser.objects.create(
+            user=self.user,
+            workspace=self.workspace,
+            role='admin'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.database = models.Entity.objects.create(
+            name="Database", entity_level=1, platform=self.platform)
+        self.dim_name = models.Dimension.objects.create(
+            name="Name",
+            type=DimensionTypeChoices.FREE_TEXT,
+            workspace=self.workspace
+        )
+        self.rule = models.Rule.objects.create(
+            name="Test Rule",
+            platform=self.platform,
+            workspace=self.workspace
+        )
+        self.project = models.Project.objects.create(
+            name="Project",
+            workspace=self.workspace,
+            owner=self.user
+        )
+        self.project.platforms.add(self.platform)
+        result = models.ProjectString.objects.bulk_ingest(
+            self.project, self.platform, self.rule, [
+                {'entity': self.database.id, 'value': name,
+                 'details': [{'dimension': self.dim_name.id, 'dimension_value_freetext': name}]}
+                for name in ('sales', 'finance', 'ops')
+            ])
+        self.assertEqual(result.errors, [])
+        self.strings = {string.value: string for string in result.created}
+
+        an_hour_ago = timezone.now() - timedelta(hours=1)
+        models.ProjectString.objects.update(last_updated=an_hour_ago)
+        models.ProjectStringDetail.objects.update(last_updated=an_hour_ago)
+        self.since = (timezone.now() - timedelta(minutes=30)).isoformat()
+
+        base = (
+            f'/api/v1/workspaces/{self.workspace.id}/projects/{self.project.id}'
+            f'/platforms/{self.platform.id}/strings'
+        )
+        self.list_url = base
+        self.export_url = f'{base}/export'
+
+    def _make_changes(self):
+        """Rename 'sales', edit a detail of 'finance' and delete 'ops'."""
+        sales = models.ProjectString.objects.get(pk=self.strings['sales'].pk)
+        sales.value = 'sales_v2'
+        sales.save()
+        detail = models.ProjectStringDetail.objects.get(string=self.strings['finance'])
+        detail.dimension_value_freetext = 'finance_v2'
+        detail.save()
+        models.ProjectString.objects.get(pk=self.strings['ops'].pk).delete()
+
+    def test_export_since_returns_changes_and_deletions(self):
+        """Test the JSON and NDJSON delta exports."""
+        response = self.client.get(self.export_url, {'format': 'json', 'since': self.since})
+        document = json.loads(b''.join(response.streaming_content))
+        self.assertEqual((document['count'], document['deleted']), (0, []))
+        self.assertEqual(document['watermark'], response['X-Sync-Watermark'])
+
+        self._make_changes()
+
+        response = self.client.get(self.export_url, {'format': 'json', 'since': self.since})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        document = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(
+            sorted(item['value'] for item in document['strings']), ['finance', 'sales_v2'])
+        self.assertEqual(
+            [item['string_uuid'] for item in document['deleted']],
+            [str(self.strings['ops'].string_uuid)]
+        )
+
+        response = self.client.get(self.export_url, {'format': 'ndjson', 'since': self.since})
+        lines = [json.loads(line) for line in
+                 b''.join(response.streaming_content).decode().splitlines()]
+        self.assertEqual([line.get('deleted', False) for line in lines], [False, False, True])
+
+        # A full export still lists every remaining string
+        response = self.client.get(self.export_url, {'format': 'json'})
+        self.assertEqual(json.loads(b''.join(response.streaming_content))['count'], 2)
+
+    def test_list_since(self):
+        """Test the delta list with deletions and watermark."""
+        self._make_changes()
+
+        response = self.client.get(self.list_url, {'since': self.since})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(len(response.data['deleted']), 1)
+        self.assertIn('watermark', response.data)
+
+        response = self.client.get(
+            self.list_url, {'since': self.since, 'pagination': 'cursor', 'page_size': 1})
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(len(response.data['deleted']), 1)
+        response = self.client.get(
+            self.list_url, {'since': self.since, 'cursor': response.data['next'], 'page_size': 1})
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertNotIn('deleted', response.data)
+
+    def test_invalid_and_expired_watermarks(self):
+        """Test that bad watermarks are rejected before any export."""
+        response = self.client.get(self.export_url, {'since': 'yesterday'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        expired = (timezone.now() - timedelta(days=365)).isoformat()
+        response = self.client.get(self.list_url, {'since': expired})
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+
+    def test_tombstones_lifecycle(self):
+        """Test that project deletion skips tombstones and old ones are purged."""
+        self.strings['ops'].delete()
+        self.assertEqual(models.ProjectStringTombstone.objects.count(), 1)
+
+        models.ProjectStringTombstone.objects.update(
+            deleted_at=timezone.now() - timedelta(days=400))
+        call_command('purge_project_string_tombstones', stdout=io.StringIO())
+        self.assertEqual(models.ProjectStringTombstone.objects.count(), 0)
+
+        self.project.delete()
+        self.assertEqual(models.ProjectStringTombstone.objects.count(), 0)
@@ -0,0 +1,126 @@
+"""
+Tests for the project string tree endpoint.
+
+These tests verify that ProjectStringTreeView loads a platform's strings
+with one query, nests them by parent, reports child counts, and honours
+max_level.
+"""
+
+import json
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from master_data import models
+from master_data.services import ProjectStringTreeService
+from users.models import WorkspaceUser
+
+User = get_user_model()
+
+
+class ProjectStringTreeTestCase(APITestCase):
+    """Test ProjectStringTreeView and ProjectStringTreeService."""
+
+    def setUp(self):
+        """Set up two databases, two schemas below one of them and a table."""
+        self.client = APIClient()
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            first_name='Test',
+            last_name='User'
+        )
+        WorkspaceUser.objects.create(
+            user=self.user,
+            workspace=self.workspace,
+            role='admin'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.database, self.schema, self.table = [
+            models.Entity.objects.create(
+                name=name, entity_level=level, platform=self.platform)
+            for level, name in enumerate(["Database", "Schema", "Table"], start=1)
+        ]
+        self.rule = models.Rule.objects.create(
+            name="Test Rule",
+            platform=self.platform,
+            workspace=self.workspace
+        )
+        self.project = models.Project.objects.create(
+            name="Project",
+            workspace=self.workspace,
+            owner=self.user
+        )
+        self.project.platforms.add(self.platform)
+
+        warehouse, sales = uuid.uuid4(), uuid.uuid4()
+        result = models.ProjectString.objects.bulk_ingest(
+            self.project, self.platform, self.rule, [
+                {'entity': self.database.id, 'value': 'warehouse', 'string_uuid': warehouse},
+                {'entity': self.database.id, 'value': 'archive'},
+                {'entity': self.schema.id, 'value': 'sales', 'string_uuid': sales,
+                 'parent_uuid': warehouse},
+                {'entity': self.schema.id, 'value': 'finance', 'parent_uuid': warehouse},
+                {'entity': self.table.id, 'value': 'orders', 'parent_uuid': sales},
+            ])
+        self.assertEqual(result.errors, [])
+        self.url = (
+            f'/api/v1/workspaces/{self.workspace.id}/projects/{self.project.id}'
+            f'/platforms/{self.platform.id}/strings/tree'
+        )
+
+    def _get(self, params=None):
+        response = self.client.get(self.url, params or {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return json.loads(b''.join(response.streaming_content))
+
+    @staticmethod
+    def _shape(nodes):
+        return [(node['value'], node['child_count'], ProjectStringTreeTestCase._shape(
+            node['children'])) for node in nodes]
+
+    def test_full_tree(self):
+        """Test nesting, ordering and child counts."""
+        document = self._get()
+        self.assertEqual(document['count'], 5)
+        self.assertEqual(self._shape(document['roots']), [
+            ('archive', 0, []),
+            ('warehouse', 2, [
+                ('finance', 0, []),
+                ('sales', 1, [('orders', 0, [])]),
+            ]),
+        ])
+
+    def test_max_level_keeps_child_counts(self):
+        """Test that the last loaded level still reports its children."""
+        document = self._get({'max_level': 2})
+        self.assertEqual(document['count'], 4)
+        self.assertEqual(self._shape(document['roots'])[1], ('warehouse', 2, [
+            ('finance', 0, []),
+            ('sales', 1, []),
+        ]))
+
+        response = self.client.get(self.url, {'max_level': 'deep'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_single_query(self):
+        """Test that the tree is loaded with one query, with or without max_level."""
+        for max_level in (None, 2):
+            with CaptureQueriesContext(connection) as context:
+                tree = ProjectStringTreeService.load(
+                    self.project, self.platform, max_level=max_level)
+                b''.join(ProjectStringTreeService.stream_json(tree, {}))
+            self.assertEqual(len(context.captured_queries), 1)
@@ -0,0 +1,115 @@
+"""
+Tests for proactive rule cache warming.
+
+These tests verify that configuration accesses are recorded and ranked,
+that rules invalidated by a commit are rebuilt (including their rendered
+configuration response) without a request, and that the management
+command warms the most used rules of a workspace.
+"""
+
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from master_data import models
+from master_data.constants import DimensionTypeChoices
+from master_data.services.rule_cache_warmer import RuleCacheWarmer
+from master_data.services.rule_payload_cache import RulePayloadCache
+from master_data.services.rule_response_cache import RuleResponseCache
+from master_data.services.shared_cache import shared_cache
+from master_data.signals import invalidation_buffer
+
+
+def run_inline(fn, *args):
+    """Stand-in for RuleCacheWarmer._submit that warms on the test thread."""
+    fn(*args)
+
+
+@override_settings(MASTER_DATA_CONFIG={'WARM_RULE_CACHES': True})
+@mock.patch.object(RuleCacheWarmer, '_submit', staticmethod(run_inline))
+class RuleCacheWarmerTestCase(TestCase):
+    """Test access ranking, after-commit warming and the warm command."""
+
+    def setUp(self):
+        """Set up two one-entity rules in a workspace."""
+        RulePayloadCache.clear()
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.entity = models.Entity.objects.create(
+            name="Database", entity_level=1, platform=self.platform)
+        self.dimension = models.Dimension.objects.create(
+            name="Environment",
+            type=DimensionTypeChoices.LIST,
+            workspace=self.workspace
+        )
+        self.rules = []
+        for name in ("Rule A", "Rule B"):
+            rule = models.Rule.objects.create(
+                name=name, platform=self.platform, workspace=self.workspace)
+            models.RuleDetail.objects.create(
+                rule=rule,
+                entity=self.entity,
+                dimension=self.dimension,
+                dimension_order=1,
+                workspace=self.workspace
+            )
+            self.rules.append(rule)
+        invalidation_buffer.clear()
+        shared_cache.delete(RuleCacheWarmer.access_key(self.workspace.id))
+
+    def response_key(self, rule):
+        return RuleResponseCache.key('configuration', rule.id, 'v1')
+
+    def test_top_rules_are_ranked_by_recorded_access(self):
+        """Test ranking across flushed and unflushed counts, topped up by recency."""
+        rule_a, rule_b = self.rules
+        # Rules without recorded accesses still fill the list
+        self.assertEqual(len(RuleCacheWarmer.top_rules(self.workspace.id, 5)), 2)
+
+        RuleCacheWarmer.record_access(self.workspace.id, rule_b.id)
+        RuleCacheWarmer.flush_access_counts()
+        RuleCacheWarmer.record_access(self.workspace.id, rule_b.id)
+        RuleCacheWarmer.record_access(self.workspace.id, rule_a.id)
+
+        self.assertEqual(RuleCacheWarmer.access_counts(self.workspace.id)[rule_b.id], 2)
+        self.assertEqual(RuleCacheWarmer.top_rules(self.workspace.id, 1), [rule_b.id])
+        self.assertEqual(RuleCacheWarmer.top_rules(self.workspace.id, 5), [rule_b.id, rule_a.id])
+        RuleCacheWarmer.flush_access_counts()
+
+    def test_invalidated_rule_is_warmed_after_commit(self):
+        """Test that a committed rule edit re-renders the configuration response."""
+        rule = self.rules[0]
+        rule.name = "Renamed Rule"
+        with self.captureOnCommitCallbacks(execute=True):
+            rule.save()
+            self.assertIsNone(RuleResponseCache.get(self.response_key(rule)))
+
+        entry = RuleResponseCache.get(self.response_key(rule))
+        self.assertIsNotNone(entry)
+        self.assertIn(b'"Renamed Rule"', entry.content)
+        self.assertEqual(
+            RulePayloadCache.get_or_build('complete_rule_data', rule.id, dict).source,
+            'local')
+
+    @override_settings(MASTER_DATA_CONFIG={'WARM_RULE_CACHES': False})
+    def test_nothing_is_warmed_when_disabled(self):
+        """Test that WARM_RULE_CACHES turns after-commit warming off."""
+        rule = self.rules[0]
+        with self.captureOnCommitCallbacks(execute=True):
+            rule.save()
+        self.assertIsNone(RuleResponseCache.get(self.response_key(rule)))
+
+    def test_warm_command(self):
+        """Test that the command warms the workspace's rules."""
+        call_command('warm_rule_caches', workspace_id=self.workspace.id, limit=1, stdout=mock.Mock())
+
+        warmed = [rule for rule in self.rules
+                  if RuleResponseCache.get(self.response_key(rule)) is not None]
+        self.assertEqual(len(warmed), 1)
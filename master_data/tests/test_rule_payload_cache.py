@@ -0,0 +1,260 @@
+"""
+Tests for the two-level rule payload cache.
+
+These tests verify that rule payloads are served from the in-process LRU
+and then the shared cache, that only the holder of the rebuild lock
+rebuilds a payload while other workers get the previous one (also with
+concurrent workers on their own database connections), and that lookup
+timings are exposed on the metrics endpoint.
+"""
+
+import json
+import threading
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.test import TestCase, TransactionTestCase
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from master_data import models
+from master_data.constants import DimensionTypeChoices
+from master_data.services import RuleService
+from master_data.services.rule_payload_cache import RulePayloadCache
+from master_data.services.shared_cache import SharedCache, shared_cache
+from users.models import WorkspaceUser
+
+User = get_user_model()
+
+
+class RulePayloadCacheTestCase(TestCase):
+    """Test RulePayloadCache lookups, single-flight and stale serving."""
+
+    def setUp(self):
+        """Set up a rule and an empty in-process cache."""
+        RulePayloadCache.clear()
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.rule = models.Rule.objects.create(
+            name="Test Rule",
+            platform=self.platform,
+            workspace=self.workspace
+        )
+        self.builds = 0
+
+    def build(self):
+        self.builds += 1
+        return {'build': self.builds}
+
+    def lookup(self):
+        return RulePayloadCache.get_or_build('payload', self.rule.id, self.build)
+
+    def hold_rebuild_lock(self):
+        """Act as another worker that is rebuilding the current generation."""
+        key = SharedCache.rule_key('payload:payload', self.rule.id)
+        self.assertTrue(shared_cache.add(f"lock:{key}", 'other-worker', 30))
+
+    def test_local_then_shared_then_rebuild(self):
+        """Test lookup sources across a local eviction and a generation bump."""
+        lookup = self.lookup()
+        self.assertEqual((lookup.value, lookup.source), ({'build': 1}, 'build'))
+        self.assertFalse(lookup.cached)
+
+        lookup = self.lookup()
+        self.assertEqual((lookup.value, lookup.source), ({'build': 1}, 'local'))
+        # Callers get their own copy of a cached payload
+        lookup.value['build'] = 99
+        self.assertEqual(self.lookup().value, {'build': 1})
+
+        RulePayloadCache.clear()
+        lookup = self.lookup()
+        self.assertEqual((lookup.value, lookup.source), ({'build': 1}, 'shared'))
+
+        SharedCache.bump_rule_generations([self.rule.id])
+        lookup = self.lookup()
+        self.assertEqual((lookup.value, lookup.source), ({'build': 2}, 'build'))
+        self.assertEqual(self.builds, 2)
+
+    def test_stale_payload_is_served_while_another_worker_rebuilds(self):
+        """Test that a lookup without the rebuild lock gets the previous payload."""
+        self.lookup()
+        SharedCache.bump_rule_generations([self.rule.id])
+        self.hold_rebuild_lock()
+
+        lookup = self.lookup()
+        self.assertEqual((lookup.value, lookup.source), ({'build': 1}, 'stale'))
+        self.assertTrue(lookup.stale)
+
+        # From the shared cache too, for a worker that never had it locally
+        RulePayloadCache.clear()
+        self.assertEqual(self.lookup().source, 'stale')
+        self.assertEqual(self.builds, 1)
+
+    @mock.patch('master_data.services.rule_payload_cache.PAYLOAD_CACHE_WAIT_SECONDS', 0.1)
+    def test_waits_then_builds_without_a_previous_payload(self):
+        """Test that a lookup with nothing to serve builds after the wait times out."""
+        self.hold_rebuild_lock()
+
+        lookup = self.lookup()
+        self.assertEqual((lookup.value, lookup.source), ({'build': 1}, 'build'))
+        self.assertGreaterEqual(lookup.elapsed_ms, 100)
+
+    def test_stats(self):
+        """Test lookup counts, hit ratio and timings by source."""
+        self.lookup()
+        self.lookup()
+        stats = RulePayloadCache.stats()
+        self.assertEqual(stats['lookups'], 2)
+        self.assertEqual(stats['hit_ratio'], 0.5)
+        self.assertEqual(stats['local_entries'], 1)
+        self.assertEqual(set(stats['timings']), {'build', 'local'})
+        self.assertEqual(stats['timings']['build']['count'], 1)
+
+
+
+class RulePayloadCacheConcurrencyTestCase(TransactionTestCase):
+    """Test single-flight rebuilds across workers with their own connections."""
+
+    def setUp(self):
+        """Set up a rule and an empty in-process cache."""
+        RulePayloadCache.clear()
+        workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.rule = models.Rule.objects.create(
+            name="Test Rule",
+            platform=platform,
+            workspace=workspace
+        )
+
+    def test_only_one_worker_rebuilds(self):
+        """Test that a second worker waits for the lock holder's build."""
+        key = SharedCache.rule_key('payload:payload', self.rule.id)
+        waiting = threading.Event()
+        builds = []
+        results = {}
+
+        def build():
+            builds.append(threading.current_thread().name)
+            # Keep the lock until the other worker has found it taken
+            waiting.wait(5)
+            return {'build': len(builds)}
+
+        def get_stale(name, rule_id):
+            waiting.set()
+            return None
+
+        def worker():
+            # Each thread stands for a worker: no in-process flight is shared
+            try:
+                results[threading.current_thread().name] = RulePayloadCache._lead(
+                    'payload', self.rule.id, key, build)
+            finally:
+                connections.close_all()
+
+        with mock.patch.object(RulePayloadCache, '_get_stale', side_effect=get_stale):
+            first = threading.Thread(target=worker, name='first')
+            first.start()
+            while not builds and first.is_alive():
+                first.join(0.01)
+            second = threading.Thread(target=worker, name='second')
+            second.start()
+            first.join(10)
+            second.join(10)
+
+        self.assertEqual(builds, ['first'])
+        self.assertEqual(results['first'], ({'build': 1}, 'build'))
+        self.assertEqual(results['second'], ({'build': 1}, 'wait'))
+
+
+class RulePayloadCacheEndpointTestCase(APITestCase):
+    """Test the payload cache through the configuration and metrics endpoints."""
+
+    def setUp(self):
+        """Set up a one-entity rule and an authenticated workspace admin."""
+        RulePayloadCache.clear()
+        self.client = APIClient()
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            first_name='Test',
+            last_name='User'
+        )
+        WorkspaceUser.objects.create(
+            user=self.user,
+            workspace=self.workspace,
+            role='admin'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.entity = models.Entity.objects.create(
+            name="Database", entity_level=1, platform=self.platform)
+        self.dimension = models.Dimension.objects.create(
+            name="Environment",
+            type=DimensionTypeChoices.LIST,
+            workspace=self.workspace
+        )
+        self.rule = models.Rule.objects.create(
+            name="Test Rule",
+            platform=self.platform,
+            workspace=self.workspace,
+            created_by=self.user
+        )
+        models.RuleDetail.objects.create(
+            rule=self.rule,
+            entity=self.entity,
+            dimension=self.dimension,
+            dimension_order=1,
+            workspace=self.workspace
+        )
+        self.url = f'/api/v1/workspaces/{self.workspace.id}/rules/{self.rule.id}/configuration/'
+
+    def test_stale_configuration_is_not_cached_as_current(self):
+        """Test that a stale configuration is sent without an ETag."""
+        response = self.client.get(self.url)
+        self.assertIn('ETag', response)
+
+        self.rule.name = "Renamed Rule"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.rule.save()
+        key = SharedCache.rule_key('payload:rule_configuration', self.rule.id)
+        shared_cache.add(f"lock:{key}", 'other-worker', 30)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(response.content)['name'], "Test Rule")
+        self.assertNotIn('ETag', response)
+
+        shared_cache.delete(f"lock:{key}")
+        response = self.client.get(self.url)
+        self.assertEqual(json.loads(response.content)['name'], "Renamed Rule")
+        self.assertIn('ETag', response)
+
+    def test_metrics_endpoint_exposes_timings(self):
+        """Test that the metrics endpoint returns the payload cache statistics."""
+        RuleService().get_complete_rule_data(self.rule)
+        url = f'/api/v1/workspaces/{self.workspace.id}/rules/{self.rule.id}/metrics/'
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['rule'], self.rule.id)
+        self.assertEqual(response.data['cache_status']['timings']['build']['count'], 1)
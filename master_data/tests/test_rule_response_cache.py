@@ -0,0 +1,139 @@
+"""
+Tests for the rule configuration response cache.
+
+These tests verify that the configuration and lightweight endpoints send
+strong ETags, answer a matching If-None-Match with 304, serve a new body
+as soon as the rule, its details or its dimension values change, and
+still check workspace access before serving a cached body.
+"""
+
+import json
+
+from django.contrib.auth import get_user_model
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from master_data import models
+from master_data.constants import DimensionTypeChoices
+from users.models import WorkspaceUser
+
+User = get_user_model()
+
+
+class RuleResponseCacheTestCase(APITestCase):
+    """Test CachedRuleResponseMixin on RuleConfigurationView and LightweightRuleView."""
+
+    def setUp(self):
+        """Set up a one-entity rule with a list dimension."""
+        self.client = APIClient()
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            first_name='Test',
+            last_name='User'
+        )
+        WorkspaceUser.objects.create(
+            user=self.user,
+            workspace=self.workspace,
+            role='admin'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.entity = models.Entity.objects.create(
+            name="Database", entity_level=1, platform=self.platform)
+        self.dim_env = models.Dimension.objects.create(
+            name="Environment",
+            type=DimensionTypeChoices.LIST,
+            workspace=self.workspace
+        )
+        models.DimensionValue.objects.create(
+            dimension=self.dim_env, value='prod', label='prod', utm='prod',
+            workspace=self.workspace)
+        self.rule = models.Rule.objects.create(
+            name="Test Rule",
+            description="Rule under test",
+            platform=self.platform,
+            workspace=self.workspace,
+            created_by=self.user
+        )
+        self.detail = models.RuleDetail.objects.create(
+            rule=self.rule,
+            entity=self.entity,
+            dimension=self.dim_env,
+            dimension_order=1,
+            delimiter="_",
+            workspace=self.workspace
+        )
+        self.url = f'/api/v1/workspaces/{self.workspace.id}/rules/{self.rule.id}/configuration/'
+
+    def test_matching_etag_gets_304(self):
+        """Test ETag, 304 on revalidation and 200 for a stale ETag."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+        self.assertTrue(etag.startswith('"'))
+        self.assertEqual(json.loads(response.content)['id'], self.rule.id)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH='"stale"')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_rule_and_value_changes_change_the_etag(self):
+        """Test that detail and dimension value writes invalidate the cached body."""
+        etag = self.client.get(self.url)['ETag']
+
+        self.detail.delimiter = "-"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.detail.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        item = json.loads(response.content)['entities'][0]['entity_items'][0]
+        self.assertEqual(item['delimiter'], "-")
+        etag = response['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            models.DimensionValue.objects.create(
+                dimension=self.dim_env, value='dev', label='dev', utm='dev',
+                workspace=self.workspace)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        values = json.loads(response.content)['dimension_values'][str(self.dim_env.id)]
+        self.assertEqual(sorted(value['value'] for value in values), ['dev', 'prod'])
+
+    def test_access_is_checked_before_the_cache(self):
+        """Test that a cached body is not served to a user outside the workspace."""
+        etag = self.client.get(self.url)['ETag']
+
+        outsider = User.objects.create_user(
+            email='outsider@example.com',
+            password='testpass123',
+            first_name='Out',
+            last_name='Sider'
+        )
+        self.client.force_authenticate(user=outsider)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_lightweight_endpoint(self):
+        """Test that the lightweight endpoint is cached with its own ETag."""
+        url = f'/api/v1/workspaces/{self.workspace.id}/rules/{self.rule.id}/lightweight/'
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(response.content)['name'], "Test Rule")
+        self.assertNotEqual(response['ETag'], self.client.get(self.url)['ETag'])
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
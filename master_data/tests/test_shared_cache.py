@@ -0,0 +1,159 @@
+"""
+Tests for the shared cache tier.
+
+These tests verify that rule payloads are cached in the cross-process
+cache under generation-versioned keys, that rule and workspace changes
+invalidate them by bumping a generation counter, and that the database
+cache backend used as the local stand-in increments atomically and is
+routed to its own autocommit connection when one is configured.
+"""
+
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import caches
+from django.test import TestCase
+
+from master_data import models
+from master_data.cache_backends import DatabaseCache
+from master_data.constants import DimensionTypeChoices
+from master_data.db_routers import SharedCacheRouter
+from master_data.services import DimensionCatalogService
+from master_data.services.constants import SHARED_CACHE_DATABASE
+from master_data.services.shared_cache import (
+    SharedCache, SharedGenerationMemo, get_shared_cache, rule_generations
+)
+
+
+class SharedCacheTestCase(TestCase):
+    """Test SharedCache keys, generation counters and invalidation signals."""
+
+    def setUp(self):
+        """Set up two rules in one workspace."""
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.entity = models.Entity.objects.create(
+            name="Database",
+            entity_level=1,
+            platform=self.platform
+        )
+        self.dim_env = models.Dimension.objects.create(
+            name="Environment",
+            type=DimensionTypeChoices.LIST,
+            workspace=self.workspace
+        )
+        self.rule, self.other_rule = [
+            models.Rule.objects.create(
+                name=name,
+                platform=self.platform,
+                workspace=self.workspace
+            )
+            for name in ("Rule A", "Rule B")
+        ]
+        models.RuleDetail.objects.create(
+            rule=self.rule,
+            entity=self.entity,
+            dimension=self.dim_env,
+            dimension_order=1,
+            workspace=self.workspace
+        )
+
+    def test_rule_generation_bump_changes_only_that_rule(self):
+        """Test that bumping a rule's generation leaves other rules' keys alone."""
+        key = SharedCache.rule_key('payload', self.rule.id, 'v1')
+        other_key = SharedCache.rule_key('payload', self.other_rule.id, 'v1')
+        self.assertEqual(key, SharedCache.rule_key('payload', self.rule.id, 'v1'))
+        self.assertTrue(key.startswith(f'payload:{self.rule.id}:'))
+        self.assertTrue(key.endswith(':v1'))
+
+        SharedCache.bump_rule_generations([self.rule.id])
+        self.assertNotEqual(key, SharedCache.rule_key('payload', self.rule.id, 'v1'))
+        self.assertEqual(other_key, SharedCache.rule_key('payload', self.other_rule.id, 'v1'))
+
+    def test_workspace_save_invalidates_all_rules_of_the_workspace(self):
+        """Test that one workspace generation bump changes every rule key."""
+        keys = [SharedCache.rule_key('payload', rule.id) for rule in (self.rule, self.other_rule)]
+        workspace_key = SharedCache.workspace_key('values', self.workspace.id)
+
+        self.workspace.name = "Renamed Workspace"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.workspace.save()
+
+        self.assertNotEqual(workspace_key, SharedCache.workspace_key('values', self.workspace.id))
+        for rule, key in zip((self.rule, self.other_rule), keys):
+            self.assertNotEqual(key, SharedCache.rule_key('payload', rule.id))
+
+    def test_rule_detail_change_is_visible_through_the_shared_cache(self):
+        """Test that a cached catalog is replaced after a rule detail is added."""
+        service = DimensionCatalogService()
+        catalog = service.get_optimized_catalog_for_rule(self.rule.id)
+        key = SharedCache.rule_key('optimized_dimension_catalog', self.rule.id)
+        self.assertEqual(get_shared_cache().get(key), catalog)
+
+        dim_region = models.Dimension.objects.create(
+            name="Region",
+            type=DimensionTypeChoices.LIST,
+            workspace=self.workspace
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            models.RuleDetail.objects.create(
+                rule=self.rule,
+                entity=self.entity,
+                dimension=dim_region,
+                dimension_order=2,
+                workspace=self.workspace
+            )
+
+        self.assertNotEqual(key, SharedCache.rule_key('optimized_dimension_catalog', self.rule.id))
+        catalog = service.get_optimized_catalog_for_rule(self.rule.id)
+        self.assertEqual(len(catalog['dimensions']), 2)
+
+    def test_generation_memo_rereads_after_ttl(self):
+        """Test that another worker's bump is seen once the memo expires."""
+        memo = SharedGenerationMemo(SharedCache.rule_generation, ttl=60)
+        generation = memo.get(self.rule.id)
+
+        # Another worker's bump does not drop this process's copy
+        SharedCache.bump(SharedCache.generation_key('rule', self.rule.id))
+        self.assertEqual(memo.get(self.rule.id), generation)
+
+        memo.ttl = 0
+        self.assertNotEqual(memo.get(self.rule.id), generation)
+
+    def test_own_bump_drops_memoized_rule_generation(self):
+        """Test that bumps made by this process are seen immediately."""
+        generation = rule_generations.get(self.rule.id)
+        SharedCache.bump_rule_generations([self.rule.id])
+        self.assertNotEqual(rule_generations.get(self.rule.id), generation)
+
+    def test_database_cache_incr(self):
+        """Test the stand-in backend's locked incr and missing-key error."""
+        cache = caches['shared']
+        self.assertIsInstance(cache, DatabaseCache)
+
+        cache.set('counter', 41, timeout=None)
+        self.assertEqual(cache.incr('counter'), 42)
+        self.assertEqual(cache.incr('counter', 8), 50)
+        self.assertEqual(cache.get('counter'), 50)
+        with self.assertRaises(ValueError):
+            cache.incr('missing-counter')
+
+    def test_database_cache_uses_its_own_connection_when_configured(self):
+        """Test that the router sends only cache rows to the autocommit alias."""
+        router = SharedCacheRouter()
+        cache_model = caches['shared'].cache_model_class
+        # Tests keep the stand-in on "default"
+        self.assertIsNone(router.db_for_write(cache_model))
+
+        with mock.patch.dict(settings.DATABASES, {
+            SHARED_CACHE_DATABASE: {**settings.DATABASES['default'], 'ATOMIC_REQUESTS': False},
+        }):
+            self.assertEqual(router.db_for_read(cache_model), SHARED_CACHE_DATABASE)
+            self.assertEqual(router.db_for_write(cache_model), SHARED_CACHE_DATABASE)
+            self.assertIsNone(router.db_for_write(models.Rule))
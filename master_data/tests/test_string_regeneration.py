@@ -0,0 +1,239 @@
+"""
+Tests for transaction-deferred string regeneration.
+
+These tests verify that StringDetail changes are detected from the values
+loaded from the database, buffered per transaction, regenerate each String
+once on commit, propagate to children, and are skipped while regeneration is
+suspended. In strict mode they regenerate inside the writing transaction.
+"""
+
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from master_data import models
+from master_data.constants import DimensionTypeChoices
+from master_data.signals import regeneration_buffer, regeneration_suspended
+
+User = get_user_model()
+
+
+class StringRegenerationBufferTestCase(TestCase):
+    """Test the StringDetail regeneration buffer."""
+
+    def setUp(self):
+        """Set up a parent and child string with Environment and Name details."""
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.entities = [
+            models.Entity.objects.create(
+                name=name, entity_level=level, platform=self.platform)
+            for level, name in enumerate(["Database", "Schema"], start=1)
+        ]
+        self.dim_env = models.Dimension.objects.create(
+            name="Environment",
+            type=DimensionTypeChoices.LIST,
+            workspace=self.workspace
+        )
+        self.dim_name = models.Dimension.objects.create(
+            name="Name",
+            type=DimensionTypeChoices.FREE_TEXT,
+            workspace=self.workspace
+        )
+        self.envs = {
+            value: models.DimensionValue.objects.create(
+                dimension=self.dim_env, value=value, label=value, utm=value,
+                workspace=self.workspace)
+            for value in ("dev", "prod")
+        }
+        self.rule = models.Rule.objects.create(
+            name="Test Rule",
+            platform=self.platform,
+            workspace=self.workspace
+        )
+        for entity in self.entities:
+            for order, dimension in enumerate([self.dim_env, self.dim_name], start=1):
+                models.RuleDetail.objects.create(
+                    rule=self.rule,
+                    entity=entity,
+                    dimension=dimension,
+                    dimension_order=order,
+                    delimiter="_" if order == 1 else "",
+                    workspace=self.workspace
+                )
+
+        result = models.String.objects.bulk_ingest(self.workspace, [
+            {'rule': self.rule.id, 'entity': self.entities[0].id,
+             'details': self._details('dev', 'sales')},
+        ])
+        self.parent = result.created[0]
+        result = models.String.objects.bulk_ingest(self.workspace, [
+            {'rule': self.rule.id, 'entity': self.entities[1].id,
+             'parent_uuid': self.parent.string_uuid, 'details': self._details('dev', 'orders')},
+        ])
+        self.child = result.created[0]
+
+    def tearDown(self):
+        regeneration_buffer.clear()
+
+    def _details(self, env, name):
+        return [
+            {'dimension': self.dim_env.id, 'dimension_value': self.envs[env].id},
+            {'dimension': self.dim_name.id, 'dimension_value_freetext': name},
+        ]
+
+    def _update(self, string, env=None, name=None):
+        for detail in string.string_details.all():
+            if detail.dimension_id == self.dim_env.id and env:
+                detail.dimension_value = self.envs[env]
+                detail.save()
+            elif detail.dimension_id == self.dim_name.id and name:
+                detail.dimension_value_freetext = name
+                detail.save()
+
+    def test_changes_regenerate_once_on_commit(self):
+        """Test that several detail saves regenerate the string once, after commit."""
+        regenerate = models.String.regenerate_value
+        with mock.patch.object(
+            models.String, 'regenerate_value', autospec=True, side_effect=regenerate
+        ) as regenerate_mock:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                self._update(self.parent, name='marketing')
+                self._update(self.parent, name='finance')
+                self._update(self.parent, env='prod')
+                self.assertEqual(regenerate_mock.call_count, 0)
+
+        self.assertGreaterEqual(len(callbacks), 1)
+        self.assertEqual(
+            [call.args[0].id for call in regenerate_mock.call_args_list],
+            [self.parent.id, self.child.id]
+        )
+        self.parent.refresh_from_db()
+        self.child.refresh_from_db()
+        self.assertEqual(self.parent.value, 'prod_finance')
+        # Environment is inherited by the child, its own Name is kept
+        self.assertEqual(self.child.value, 'prod_orders')
+
+    def test_reverted_changes_are_dropped(self):
+        """Test that a change reverted in the same transaction regenerates nothing."""
+        with mock.patch.object(models.String, 'regenerate_value') as regenerate_mock:
+            with self.captureOnCommitCallbacks(execute=True):
+                self._update(self.parent, env='prod')
+                self._update(self.parent, env='dev')
+
+        regenerate_mock.assert_not_called()
+
+    def test_detail_save_does_not_reload_the_row(self):
+        """Test that change detection uses the loaded snapshot instead of a query."""
+        detail = self.parent.string_details.get(dimension=self.dim_name)
+        self.assertEqual(detail.changed_fields(), {})
+
+        detail.dimension_value_freetext = 'marketing'
+        self.assertEqual(
+            detail.changed_fields(), {'dimension_value_freetext': ('sales', 'marketing')})
+
+        with mock.patch.object(regeneration_buffer, 'add') as add_mock:
+            with CaptureQueriesContext(connection) as context:
+                detail.save()
+
+        self.assertEqual(
+            [query['sql'].split()[0] for query in context.captured_queries], ['UPDATE'])
+        add_mock.assert_called_once_with(detail.pk, mock.ANY)
+        self.assertEqual(add_mock.call_args.args[1]['dimension_value_freetext'], 'sales')
+        # The saved state becomes the new baseline
+        self.assertEqual(detail.changed_fields(), {})
+        self.assertEqual(detail.loaded_values['dimension_value_freetext'], 'marketing')
+
+        # Saving without changes does not buffer anything
+        with mock.patch.object(regeneration_buffer, 'add') as add_mock:
+            detail.save()
+        add_mock.assert_not_called()
+
+    def test_project_string_detail_tracks_changes(self):
+        """Test changed_fields() on ProjectStringDetail."""
+        owner = User.objects.create_user(
+            email='owner@example.com',
+            password='testpass123',
+            first_name='Owner',
+            last_name='User'
+        )
+        project = models.Project.objects.create(
+            name="Project",
+            workspace=self.workspace,
+            owner=owner
+        )
+        project.platforms.add(self.platform)
+        project_string = models.ProjectString.objects.create(
+            workspace=self.workspace,
+            project=project,
+            platform=self.platform,
+            rule=self.rule,
+            entity=self.entities[0],
+            value="dev_sales"
+        )
+        new_detail = models.ProjectStringDetail(
+            workspace=self.workspace,
+            string=project_string,
+            dimension=self.dim_env,
+            dimension_value=self.envs['dev']
+        )
+        self.assertFalse(new_detail.has_loaded_values)
+        new_detail.save()
+
+        detail = models.ProjectStringDetail.objects.get(pk=new_detail.pk)
+        detail.dimension_value = self.envs['prod']
+        detail.is_inherited = True
+        self.assertEqual(detail.changed_fields(), {
+            'dimension_value_id': (self.envs['dev'].id, self.envs['prod'].id),
+            'is_inherited': (False, True),
+        })
+        detail.refresh_from_db()
+        self.assertEqual(detail.changed_fields(), {})
+
+    def test_suspended_changes_are_not_buffered(self):
+        """Test that saves made while suspended are skipped."""
+        with mock.patch.object(models.String, 'regenerate_value') as regenerate_mock:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                with regeneration_suspended():
+                    self._update(self.parent, name='marketing')
+
+        self.assertEqual(callbacks, [])
+        self.assertEqual(regeneration_buffer.pending, {})
+        regenerate_mock.assert_not_called()
+        self.parent.refresh_from_db()
+        self.assertEqual(self.parent.value, 'dev_sales')
+
+    @override_settings(MASTER_DATA_CONFIG={'STRICT_AUTO_REGENERATION': True})
+    def test_strict_mode_regenerates_before_commit(self):
+        """Test that strict mode regenerates inside the writing transaction."""
+        with self.captureOnCommitCallbacks() as callbacks:
+            self._update(self.parent, name='marketing')
+            self.parent.refresh_from_db()
+            self.assertEqual(self.parent.value, 'dev_marketing')
+
+        # Other on_commit work (e.g. search index bumps) may still be registered
+        self.assertNotIn(regeneration_buffer.flush, callbacks)
+        self.assertEqual(regeneration_buffer.pending, {})
+
+    @override_settings(MASTER_DATA_CONFIG={'STRICT_AUTO_REGENERATION': True})
+    def test_strict_mode_failure_rolls_back_the_change(self):
+        """Test that a failed strict regeneration undoes the detail change."""
+        with mock.patch.object(
+            models.String, 'regenerate_value', side_effect=ValueError("broken rule")
+        ):
+            with self.assertRaises(ValueError):
+                with transaction.atomic():
+                    self._update(self.parent, name='marketing')
+
+        detail = self.parent.string_details.get(dimension=self.dim_name)
+        self.assertEqual(detail.dimension_value_freetext, 'sales')
+        self.assertEqual(regeneration_buffer.pending, {})
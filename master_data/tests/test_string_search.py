@@ -0,0 +1,146 @@
+"""
+Tests for string value search.
+
+These tests verify pg_trgm-compatible trigram extraction, substring and
+similarity search through the in-process n-gram index (the test database is
+SQLite), index invalidation on writes, and the project string search and
+list endpoints.
+"""
+
+from django.contrib.auth import get_user_model
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from master_data import models
+from master_data.services import StringGenerationService, StringSearchService
+from master_data.services.string_search import ngram_index_cache, similarity, trigrams
+from users.models import WorkspaceUser
+
+User = get_user_model()
+
+
+class StringSearchTestCase(APITestCase):
+    """Test StringSearchService and ProjectStringSearchView."""
+
+    def setUp(self):
+        """Set up a project platform with a handful of strings."""
+        ngram_index_cache.clear()
+        self.client = APIClient()
+        self.workspace = models.Workspace.objects.create(
+            name="Test Workspace",
+            slug="test-workspace"
+        )
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            first_name='Test',
+            last_name='User'
+        )
+        WorkspaceUser.objects.create(
+            user=self.user,
+            workspace=self.workspace,
+            role='admin'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.database = models.Entity.objects.create(
+            name="Database", entity_level=1, platform=self.platform)
+        self.rule = models.Rule.objects.create(
+            name="Test Rule",
+            platform=self.platform,
+            workspace=self.workspace
+        )
+        self.project = models.Project.objects.create(
+            name="Project",
+            workspace=self.workspace,
+            owner=self.user
+        )
+        self.project.platforms.add(self.platform)
+        self.values = ['prod_sales_eu', 'prod_sales_us', 'dev_sales', 'prod_finance', 'marketing']
+        result = models.ProjectString.objects.bulk_ingest(
+            self.project, self.platform, self.rule,
+            [{'entity': self.database.id, 'value': value} for value in self.values])
+        self.assertEqual(result.errors, [])
+        self.base_url = (
+            f'/api/v1/workspaces/{self.workspace.id}/projects/{self.project.id}'
+            f'/platforms/{self.platform.id}/strings'
+        )
+
+    def test_trigrams_follow_pg_trgm(self):
+        """Test word splitting, padding and similarity."""
+        self.assertEqual(trigrams('Cat'), frozenset({'  c', ' ca', 'cat', 'at '}))
+        self.assertEqual(trigrams('a_b'), frozenset({'  a', ' a ', '  b', ' b '}))
+        self.assertEqual(similarity(trigrams('sales'), trigrams('sales')), 1.0)
+        self.assertEqual(similarity(trigrams('sales'), trigrams('')), 0.0)
+
+    def test_substring_and_similar_search(self):
+        """Test ranked results from the n-gram index."""
+        matches = StringSearchService.search(
+            models.ProjectString, self.workspace.id, 'SALES')
+        self.assertEqual(
+            sorted(match.value for match in matches),
+            ['dev_sales', 'prod_sales_eu', 'prod_sales_us'])
+        self.assertEqual(matches[0].value, 'dev_sales')
+        scores = [match.score for match in matches]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+        # Short queries without a full trigram still match
+        matches = StringSearchService.search(models.ProjectString, self.workspace.id, 'ke')
+        self.assertEqual([match.value for match in matches], ['marketing'])
+
+        matches = StringSearchService.search(
+            models.ProjectString, self.workspace.id, 'prod_finanse', mode='similar', limit=1)
+        self.assertEqual([match.value for match in matches], ['prod_finance'])
+
+        self.assertEqual(StringSearchService.search(
+            models.ProjectString, self.workspace.id, 'sales', platform_id=0), [])
+
+    def test_index_follows_writes(self):
+        """Test that creates and deletes invalidate the n-gram index."""
+        self.assertEqual(len(StringSearchService.search(
+            models.ProjectString, self.workspace.id, 'sales')), 3)
+
+        models.ProjectString.objects.bulk_ingest(
+            self.project, self.platform, self.rule,
+            [{'entity': self.database.id, 'value': 'qa_sales'}])
+        self.assertEqual(len(StringSearchService.search(
+            models.ProjectString, self.workspace.id, 'sales')), 4)
+
+        models.ProjectString.objects.get(value='dev_sales').delete()
+        self.assertEqual(len(StringSearchService.search(
+            models.ProjectString, self.workspace.id, 'sales')), 3)
+
+    def test_search_and_list_endpoints(self):
+        """Test the search endpoint and the list view's search filter."""
+        response = self.client.get(f'{self.base_url}/search', {'q': 'sales', 'limit': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertEqual(response.data['results'][0]['value'], 'dev_sales')
+
+        response = self.client.get(
+            f'{self.base_url}/search', {'q': 'marketting', 'mode': 'similar'})
+        self.assertEqual([item['value'] for item in response.data['results']], ['marketing'])
+
+        response = self.client.get(f'{self.base_url}/search', {'q': 'x', 'mode': 'regex'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(self.base_url, {'search': 'sales_'})
+        self.assertEqual(
+            sorted(item['value'] for item in response.data['results']),
+            ['prod_sales_eu', 'prod_sales_us'])
+
+    def test_naming_conflicts_report_similar_strings(self):
+        """Test the similar-strings warning of check_naming_conflicts."""
+        for value in ('prod_sales_eu', 'prod_sales_us', 'marketing'):
+            models.String.objects.create(
+                workspace=self.workspace, rule=self.rule, entity=self.database, value=value)
+
+        conflicts = StringGenerationService.check_naming_conflicts(
+            self.rule, self.database, 'prod_sales_uk')
+        self.assertEqual(len(conflicts), 1)
+        self.assertTrue(conflicts[0].startswith("Similar strings exist: prod_sales_"))
+        self.assertNotIn('marketing', conflicts[0])
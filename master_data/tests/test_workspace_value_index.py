@@ -0,0 +1,183 @@
+"""
+Tests for the per-workspace dimension value index.
+
+These tests verify that the index is built with one query, scoped to a
+single workspace, invalidated on DimensionValue changes in this and in
+other worker processes, and that string validation runs against it
+without per-dimension queries.
+"""
+
+from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from master_data import models
+from master_data.constants import DimensionTypeChoices
+from master_data.services import StringGenerationService
+from master_data.services.shared_cache import SharedCache, values_generations
+from master_data.services.workspace_value_index import (
+    WorkspaceValueIndex,
+    get_workspace_value_index,
+    workspace_value_index_cache,
+)
+
+
+class WorkspaceValueIndexTestCase(TestCase):
+    """Test WorkspaceValueIndex building, scoping and invalidation."""
+
+    def setUp(self):
+        """Set up two workspaces sharing a dimension name."""
+        self.workspace = models.Workspace.objects.create(
+            name="Workspace A",
+            slug="workspace-a"
+        )
+        self.other_workspace = models.Workspace.objects.create(
+            name="Workspace B",
+            slug="workspace-b"
+        )
+        self.platform = models.Platform.objects.create(
+            name="Snowflake",
+            slug="snowflake"
+        )
+        self.entity = models.Entity.objects.create(
+            name="Database",
+            entity_level=1,
+            platform=self.platform
+        )
+        self.dim_env = models.Dimension.objects.create(
+            name="Environment",
+            type=DimensionTypeChoices.LIST,
+            workspace=self.workspace
+        )
+        self.dim_owner = models.Dimension.objects.create(
+            name="Owner",
+            type=DimensionTypeChoices.FREE_TEXT,
+            workspace=self.workspace
+        )
+        self.prod = models.DimensionValue.objects.create(
+            dimension=self.dim_env,
+            value="prod",
+            label="Production",
+            utm="prod",
+            workspace=self.workspace
+        )
+        other_env = models.Dimension.objects.create(
+            name="Environment",
+            type=DimensionTypeChoices.LIST,
+            workspace=self.other_workspace
+        )
+        models.DimensionValue.objects.create(
+            dimension=other_env,
+            value="qa",
+            label="QA",
+            utm="qa",
+            workspace=self.other_workspace
+        )
+        self.rule = models.Rule.objects.create(
+            name="Test Rule",
+            platform=self.platform,
+            workspace=self.workspace
+        )
+        for order, dimension in enumerate([self.dim_env, self.dim_owner], start=1):
+            models.RuleDetail.objects.create(
+                rule=self.rule,
+                entity=self.entity,
+                dimension=dimension,
+                dimension_order=order,
+                workspace=self.workspace
+            )
+
+    def test_build_uses_single_query(self):
+        """Test that the index is built with one query."""
+        with CaptureQueriesContext(connection) as context:
+            index = WorkspaceValueIndex.build(self.workspace.id)
+
+        self.assertEqual(len(context.captured_queries), 1)
+        entry = index.get_dimension("Environment")
+        self.assertEqual(entry.values, frozenset({"prod"}))
+        self.assertEqual(entry.value_ids, frozenset({self.prod.id}))
+        self.assertIs(index.get_dimension(self.dim_owner.id).is_list, False)
+        self.assertEqual(index.get_dimension(self.dim_owner.id).values, frozenset())
+
+    def test_index_is_scoped_to_workspace(self):
+        """Test that same-named dimensions in other workspaces are not mixed in."""
+        index = get_workspace_value_index(self.workspace.id)
+
+        self.assertTrue(index.is_valid_value("Environment", "prod"))
+        self.assertFalse(index.is_valid_value("Environment", "qa"))
+
+    def test_dimension_value_changes_bump_version(self):
+        """Test that creating and deleting values invalidates the index."""
+        index = get_workspace_value_index(self.workspace.id)
+
+        staging = models.DimensionValue.objects.create(
+            dimension=self.dim_env,
+            value="staging",
+            label="Staging",
+            utm="staging",
+            workspace=self.workspace
+        )
+        self.assertIsNot(get_workspace_value_index(self.workspace.id), index)
+        self.assertTrue(
+            get_workspace_value_index(self.workspace.id).is_valid_value("Environment", "staging"))
+
+        staging.delete()
+        self.assertFalse(
+            get_workspace_value_index(self.workspace.id).is_valid_value("Environment", "staging"))
+
+    def test_committed_value_change_bumps_shared_generation(self):
+        """Test that the commit of a value change invalidates every worker's index."""
+        generation = SharedCache.values_generation(self.workspace.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            models.DimensionValue.objects.create(
+                dimension=self.dim_env,
+                value="staging",
+                label="Staging",
+                utm="staging",
+                workspace=self.workspace
+            )
+            self.assertEqual(SharedCache.values_generation(self.workspace.id), generation)
+
+        self.assertNotEqual(SharedCache.values_generation(self.workspace.id), generation)
+
+    def test_value_committed_by_another_worker_is_indexed(self):
+        """Test that a shared generation bump rebuilds this worker's index."""
+        index = get_workspace_value_index(self.workspace.id)
+
+        # Another worker added the value: no signal reaches this process
+        models.DimensionValue.objects.bulk_create([models.DimensionValue(
+            dimension=self.dim_env,
+            value="staging",
+            label="Staging",
+            utm="staging",
+            workspace=self.workspace
+        )])
+        SharedCache.bump(SharedCache.generation_key('values', self.workspace.id))
+        self.assertIs(get_workspace_value_index(self.workspace.id), index)
+
+        # Once the memoized shared generation expires
+        values_generations.forget(self.workspace.id)
+        self.assertTrue(
+            get_workspace_value_index(self.workspace.id).is_valid_value("Environment", "staging"))
+
+    def test_validation_runs_in_memory(self):
+        """Test that validate_dimension_values issues no queries once warm."""
+        values = {'Environment': 'prod', 'Owner': 'data-team'}
+        StringGenerationService.validate_dimension_values(self.rule, self.entity, values)
+        self.assertIsNotNone(workspace_value_index_cache.peek(self.workspace.id))
+
+        with CaptureQueriesContext(connection) as context:
+            for _ in range(50):
+                errors = StringGenerationService.validate_dimension_values(
+                    self.rule, self.entity, values)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(context.captured_queries), 0)
+
+        errors = StringGenerationService.validate_dimension_values(
+            self.rule, self.entity, {'Environment': 'qa'})
+        self.assertEqual(errors, [
+            "Missing required dimension: Owner",
+            "Invalid value 'qa' for dimension 'Environment'",
+        ])
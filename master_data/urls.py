@@ -16,6 +16,8 @@ from .views import (
     EntitySpecificRuleView,
     RuleValidationView,
     GenerationPreviewView,
+    BatchGenerationView,
+    NameParseView,
     CacheManagementView,
     RuleConfigurationView,
     # Version views
@@ -27,6 +29,8 @@ from .views import (
     PropagationErrorViewSet,
     EnhancedStringDetailViewSet,
     PropagationSettingsViewSet,
+    # Bulk job views
+    BulkStringJobViewSet,
 )
 
 router = routers.DefaultRouter()
@@ -90,7 +94,24 @@ router.register(
     basename="propagation-settings"
 )
 
+# Background bulk string jobs (workspace-scoped)
+router.register(
+    r"workspaces/(?P<workspace_id>\d+)/bulk-jobs",
+    BulkStringJobViewSet,
+    basename="bulk-job"
+)
+
 urlpatterns = [
+    # Static paths under rules/ must precede the router, whose rules/<pk>/
+    # pattern would otherwise match them
+    path("workspaces/<int:workspace_id>/rules/generation-batch/",
+         BatchGenerationView.as_view(),
+         name="rule-generation-batch"),
+
+    path("workspaces/<int:workspace_id>/rules/name-parse/",
+         NameParseView.as_view(),
+         name="rule-name-parse"),
+
     path("", include(router.urls)),
 
     # Main RESTful API endpoints for strings and string details
@@ -17,6 +17,8 @@ from .views import (
     ProjectStringUnlockView,
     BulkUpdateProjectStringsView,
     ExportProjectStringsView,
+    ProjectStringTreeView,
+    ProjectStringSearchView,
 )
 
 
@@ -50,6 +52,20 @@ urlpatterns += [
         name='project-strings-list'
     ),
 
+    # Full string tree for a platform
+    path(
+        'workspaces/<int:workspace_id>/projects/<int:project_id>/platforms/<int:platform_id>/strings/tree',
+        ProjectStringTreeView.as_view(),
+        name='project-strings-tree'
+    ),
+
+    # Ranked search over string values
+    path(
+        'workspaces/<int:workspace_id>/projects/<int:project_id>/platforms/<int:platform_id>/strings/search',
+        ProjectStringSearchView.as_view(),
+        name='project-strings-search'
+    ),
+
     # Get expanded string details
     path(
         'workspaces/<int:workspace_id>/projects/<int:project_id>/platforms/<int:platform_id>/strings/<int:string_id>/expanded',
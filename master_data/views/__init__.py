@@ -8,6 +8,8 @@ from .rule_configuration_views import (
     EntitySpecificRuleView,
     RuleValidationView,
     GenerationPreviewView,
+    BatchGenerationView,
+    NameParseView,
     CacheManagementView,
     RuleConfigurationView,
 )
@@ -19,6 +21,7 @@ from .propagation_views import (
     PropagationSettingsViewSet,
 )
 from .project_views import ProjectViewSet
+from .bulk_job_views import BulkStringJobViewSet
 from .project_string_views import (
     BulkCreateProjectStringsView,
     ListProjectStringsView,
@@ -28,6 +31,8 @@ from .project_string_views import (
     ProjectStringUnlockView,
     BulkUpdateProjectStringsView,
     ExportProjectStringsView,
+    ProjectStringTreeView,
+    ProjectStringSearchView,
 )
 
 __all__ = [
@@ -45,6 +50,8 @@ __all__ = [
     'EntitySpecificRuleView',
     'RuleValidationView',
     'GenerationPreviewView',
+    'BatchGenerationView',
+    'NameParseView',
     'CacheManagementView',
     'RuleConfigurationView',
     # Version views
@@ -58,6 +65,7 @@ __all__ = [
     'PropagationSettingsViewSet',
     # Project views
     'ProjectViewSet',
+    'BulkStringJobViewSet',
     'BulkCreateProjectStringsView',
     'ListProjectStringsView',
     'ProjectStringExpandedView',
@@ -66,6 +74,8 @@ __all__ = [
     'ProjectStringUnlockView',
     'BulkUpdateProjectStringsView',
     'ExportProjectStringsView',
+    'ProjectStringTreeView',
+    'ProjectStringSearchView',
 ]
 
 
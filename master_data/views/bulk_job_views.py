@@ -0,0 +1,103 @@
+"""
+Views for background bulk string jobs.
+"""
+
+from django.urls import reverse
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+
+from ..models import BulkStringJob
+from ..pagination import KeysetPagination
+from ..serializers import BulkStringJobSerializer, BulkStringJobChunkSerializer
+from ..services.bulk_job_service import BulkJobService
+from ..services.constants import BULK_JOB_RESULTS_PAGE_SIZE
+from .mixins import WorkspaceValidationMixin
+
+
+def queued_job_response(request, job):
+    """202 response for a request that was queued as a bulk job."""
+    path = reverse('bulk-job-detail', kwargs={
+        'version': request.version or 'v1',
+        'workspace_id': job.workspace_id,
+        'job_id': job.job_id,
+    })
+    return Response(
+        {**BulkJobService.job_summary(job), 'url': request.build_absolute_uri(path)},
+        status=status.HTTP_202_ACCEPTED
+    )
+
+
+@extend_schema(tags=['Bulk Jobs'])
+class BulkStringJobViewSet(WorkspaceValidationMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    Status, progress and results of background bulk string jobs.
+
+    Jobs are created by the bulk create, bulk update and multi-operation
+    endpoints when called with ?async=true or with more rows than
+    BULK_JOB_AUTO_ASYNC_ROWS; they answer 202 with the job_id.
+
+    Supports:
+    - List jobs (GET /workspaces/{workspace_id}/bulk-jobs/?status=)
+    - Get job status (GET /workspaces/{workspace_id}/bulk-jobs/{job_id}/)
+    - Page through committed results (GET /workspaces/{workspace_id}/bulk-jobs/{job_id}/results/)
+    - Cancel (POST /workspaces/{workspace_id}/bulk-jobs/{job_id}/cancel/)
+    """
+
+    serializer_class = BulkStringJobSerializer
+    permission_classes = [IsAuthenticated]
+    lookup_field = 'job_id'
+
+    def get_queryset(self):
+        """Get jobs of the workspace in the URL."""
+        queryset = BulkStringJob.objects.for_workspace(
+            self.kwargs.get('workspace_id')
+        ).select_related('triggered_by')
+
+        status_filter = self.request.query_params.get('status')
+        if status_filter:
+            queryset = queryset.filter(status=status_filter)
+        return queryset
+
+    @extend_schema(
+        tags=['Bulk Jobs'],
+        summary='List Bulk Job Results',
+        description=(
+            'Per-row results and errors of the chunks committed so far, one page of '
+            'chunks at a time. Error indexes refer to the rows of the submitted payload.'
+        ),
+        parameters=[
+            OpenApiParameter(
+                name='cursor',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Cursor of the next page (next_cursor of the previous page)',
+                required=False
+            ),
+        ]
+    )
+    @action(detail=True, methods=['get'])
+    def results(self, request, workspace_id=None, job_id=None, version=None):
+        """Page through the committed chunks of a job."""
+        job = self.get_object()
+        paginator = KeysetPagination(('position',), page_size=BULK_JOB_RESULTS_PAGE_SIZE)
+        chunks = paginator.paginate_queryset(job.chunks.all(), request)
+        response = paginator.get_paginated_response(
+            BulkStringJobChunkSerializer(chunks, many=True).data)
+        response.data['job'] = BulkStringJobSerializer(job).data
+        return response
+
+    @extend_schema(tags=['Bulk Jobs'], summary='Cancel Bulk Job')
+    @action(detail=True, methods=['post'])
+    def cancel(self, request, workspace_id=None, job_id=None, version=None):
+        """Cancel a pending or running job; chunks already committed are kept."""
+        job = self.get_object()
+        if not BulkJobService.cancel(job):
+            return Response(
+                {'error': f'Job is already {job.status}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        job.refresh_from_db()
+        return Response(BulkStringJobSerializer(job).data)
@@ -16,6 +16,7 @@ from drf_spectacular.utils import extend_schema, OpenApiParameter
 from .. import serializers
 from .. import models
 from ..permissions import IsAuthenticatedOrDebugReadOnly
+from ..signals import invalidation_suspended
 from .mixins import WorkspaceValidationMixin, QueryParamMixin
 
 logger = logging.getLogger(__name__)
@@ -292,6 +293,8 @@ class DimensionValueViewSet(WorkspaceValidationMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticatedOrDebugReadOnly]
     filter_backends = [DjangoFilterBackend]
     filterset_class = DimensionValueFilter
+    # Row order in cursor pagination mode
+    keyset_ordering = ('dimension_id', 'value', 'id')
 
     @extend_schema(tags=["Dimensions"])
     def list(self, request, *args, **kwargs):
@@ -425,7 +428,8 @@ class DimensionValueViewSet(WorkspaceValidationMixin, viewsets.ModelViewSet):
             v['workspace'] = workspace_obj
 
         try:
-            with transaction.atomic():
+            # Rule caches are invalidated once for the whole batch
+            with transaction.atomic(), invalidation_suspended():
                 results, errors = [], []
                 for i, data in enumerate(values_data):
                     try:
@@ -510,7 +514,7 @@ class DimensionValueViewSet(WorkspaceValidationMixin, viewsets.ModelViewSet):
         assignments = serializer.validated_data['assignments']
 
         try:
-            with transaction.atomic():
+            with transaction.atomic(), invalidation_suspended():
                 updated_values = []
                 errors = []
 
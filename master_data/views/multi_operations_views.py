@@ -12,7 +12,10 @@ from rest_framework.permissions import IsAuthenticated
 from django.db import transaction
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 
+from ..models import BulkStringJobOperationChoices
 from ..serializers.batch_operations import MultiOperationSerializer
+from ..services.bulk_job_service import BulkJobService
+from .bulk_job_views import queued_job_response
 from .mixins import WorkspaceValidationMixin
 
 logger = logging.getLogger(__name__)
@@ -213,6 +216,17 @@ class MultiOperationsViewSet(WorkspaceValidationMixin, viewsets.ViewSet):
     @transaction.atomic
     def execute(self, request, *args, **kwargs):
         """Execute multiple operations atomically."""
+        operations = request.data.get('operations')
+        if isinstance(operations, list) and BulkJobService.wants_async(
+            request.query_params, len(operations)
+        ):
+            # Queued as a bulk job; the worker validates and executes the
+            # operations in one transaction, keeping the all-or-nothing contract
+            job = BulkJobService.enqueue(
+                request.workspace_id, BulkStringJobOperationChoices.MULTI_OPERATIONS,
+                request.data, len(operations), user=request.user)
+            return queued_job_response(request, job)
+
         try:
             serializer = MultiOperationSerializer(
                 data=request.data,
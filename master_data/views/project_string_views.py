@@ -7,15 +7,14 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
 from django.core.paginator import Paginator
-from django.db.models import Q
-from django.http import HttpResponse
+from django.db.models import Q, prefetch_related_objects
+from django.http import StreamingHttpResponse
 from django.utils import timezone
-import csv
-import json
 
 from ..models import (
     Project, ProjectString,
-    ProjectMember, Workspace, Platform
+    ProjectMember, Workspace, Platform, Rule,
+    BulkStringJobOperationChoices
 )
 from ..serializers import (
     BulkProjectStringCreateSerializer,
@@ -23,14 +22,53 @@ from ..serializers import (
     ProjectStringExpandedSerializer,
     ProjectStringUpdateSerializer,
 )
+from ..pagination import (
+    InvalidCursor, StandardResultsSetPagination, estimate_count, paginate_keyset
+)
+from ..services import (
+    ProjectStringExportService, ProjectStringSyncService, ProjectStringTreeService,
+    StringSearchService, SyncWatermarkError
+)
+from ..services.constants import STRING_SEARCH_DEFAULT_LIMIT, STRING_SEARCH_MAX_LIMIT
+from ..services.string_search import SEARCH_MODES
+from ..services.project_string_export import (
+    EXPORT_CONTENT_TYPES, EXPORT_FORMATS, parse_export_flag
+)
+from ..services.bulk_job_service import BulkJobService
+from .bulk_job_views import queued_job_response
 from .mixins import WorkspaceValidationMixin
 
 
+def parse_sync_watermark(request):
+    """
+    Read the optional `since` watermark of a sync request.
+
+    Returns (since, error_response); since is None when not requested.
+    """
+    value = request.query_params.get('since')
+    if not value:
+        return None, None
+    try:
+        return ProjectStringSyncService.parse_since(value), None
+    except SyncWatermarkError as e:
+        return None, Response(
+            {'error': str(e)},
+            status=status.HTTP_410_GONE if e.expired else status.HTTP_400_BAD_REQUEST
+        )
+
+
 class BulkCreateProjectStringsView(WorkspaceValidationMixin, views.APIView):
     """
     Bulk create project strings for a specific platform within a project.
 
     Endpoint: POST /workspaces/{workspace_id}/projects/{project_id}/platforms/{platform_id}/strings/bulk
+
+    Query Parameters:
+    - async: true queues the request as a bulk job and answers 202 with its
+      job_id; false forces inline processing. By default requests with more
+      than BULK_JOB_AUTO_ASYNC_ROWS strings are queued. Jobs commit chunk
+      by chunk: valid rows are kept and rejected rows are reported per
+      chunk, instead of the all-or-nothing inline behaviour.
     """
     permission_classes = [IsAuthenticated]
 
@@ -57,6 +95,10 @@ class BulkCreateProjectStringsView(WorkspaceValidationMixin, views.APIView):
                 status=status.HTTP_403_FORBIDDEN
             )
 
+        strings = request.data.get('strings')
+        if isinstance(strings, list) and BulkJobService.wants_async(request.query_params, len(strings)):
+            return self.queue_job(request, workspace, project, platform, strings)
+
         # Validate and create strings
         serializer = BulkProjectStringCreateSerializer(
             data=request.data,
@@ -72,6 +114,8 @@ class BulkCreateProjectStringsView(WorkspaceValidationMixin, views.APIView):
 
         # Create strings
         created_strings = serializer.save()
+        prefetch_related_objects(
+            created_strings, 'details__dimension', 'details__dimension_value')
 
         # Return created strings
         return Response({
@@ -79,6 +123,28 @@ class BulkCreateProjectStringsView(WorkspaceValidationMixin, views.APIView):
             'strings': ProjectStringReadSerializer(created_strings, many=True).data
         }, status=status.HTTP_201_CREATED)
 
+    def queue_job(self, request, workspace, project, platform, strings):
+        """Queue the request as a bulk job; rows are validated by the worker."""
+        rule_id = request.data.get('rule')
+        if not Rule.objects.for_workspace(workspace.id).filter(
+            id=rule_id if isinstance(rule_id, int) else None
+        ).exists():
+            return Response(
+                {'error': f'Rule with id {rule_id} does not exist'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not all(isinstance(row, dict) for row in strings):
+            return Response(
+                {'error': 'strings must be a list of objects'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        job = BulkJobService.enqueue(
+            workspace.id, BulkStringJobOperationChoices.PROJECT_STRINGS_CREATE,
+            {'rule': rule_id, 'strings': strings}, len(strings),
+            user=request.user, project=project, platform=platform)
+        return queued_job_response(request, job)
+
     def can_create_strings(self, user, project):
         """Check if user can create strings for this project."""
         if user.is_superuser:
@@ -105,8 +171,15 @@ class ListProjectStringsView(WorkspaceValidationMixin, views.APIView):
     - search: Search by string value
     - page: Page number (default: 1)
     - page_size: Items per page (default: 50)
+    - pagination=cursor / cursor: Keyset mode ordered by (entity_level, value, id);
+      returns next_cursor instead of page numbers and skips COUNT(*)
+    - estimate_count: In keyset mode, include the planner's row estimate as count
+    - since: Sync watermark (ISO 8601); only strings changed after it are
+      listed, the first page adds tombstones of strings deleted after it as
+      'deleted', and every page carries the next 'watermark'
     """
     permission_classes = [IsAuthenticated]
+    keyset_ordering = ('entity_level', 'value', 'id')
 
     def get(self, request, workspace_id, project_id, platform_id, version=None):
         """List project strings with filtering and pagination."""
@@ -124,6 +197,11 @@ class ListProjectStringsView(WorkspaceValidationMixin, views.APIView):
         # Validate platform exists
         platform = get_object_or_404(Platform, id=platform_id)
 
+        since, error_response = parse_sync_watermark(request)
+        if error_response:
+            return error_response
+        watermark = ProjectStringSyncService.new_watermark()
+
         # Base queryset
         queryset = ProjectString.objects.filter(
             project=project,
@@ -131,6 +209,7 @@ class ListProjectStringsView(WorkspaceValidationMixin, views.APIView):
         ).select_related(
             'project', 'platform', 'entity', 'rule', 'created_by'
         ).prefetch_related('details')
+        queryset = ProjectStringSyncService.changed_strings(queryset, workspace.id, since)
 
         # Apply filters
         entity_id = request.query_params.get('entity')
@@ -147,14 +226,23 @@ class ListProjectStringsView(WorkspaceValidationMixin, views.APIView):
 
         search = request.query_params.get('search')
         if search:
-            queryset = queryset.filter(value__icontains=search)
+            queryset = StringSearchService.filter_queryset(queryset, workspace.id, search)
+
+        page_size = int(request.query_params.get('page_size', 50))
+
+        if 'cursor' in request.query_params or request.query_params.get('pagination') == 'cursor':
+            response = self.get_keyset_page(request, queryset, page_size)
+            if since is not None and response.status_code == status.HTTP_200_OK:
+                self.add_sync_data(
+                    response.data, project, platform, since, watermark,
+                    first_page='cursor' not in request.query_params)
+            return response
 
         # Order by entity level and value
-        queryset = queryset.order_by('entity__entity_level', 'value')
+        queryset = queryset.order_by(*self.keyset_ordering)
 
         # Pagination
         page = int(request.query_params.get('page', 1))
-        page_size = int(request.query_params.get('page_size', 50))
 
         paginator = Paginator(queryset, page_size)
         page_obj = paginator.get_page(page)
@@ -162,11 +250,173 @@ class ListProjectStringsView(WorkspaceValidationMixin, views.APIView):
         # Serialize results
         serializer = ProjectStringReadSerializer(page_obj.object_list, many=True)
 
-        return Response({
+        response_data = {
             'count': paginator.count,
             'next': page_obj.next_page_number() if page_obj.has_next() else None,
             'previous': page_obj.previous_page_number() if page_obj.has_previous() else None,
             'results': serializer.data
+        }
+        if since is not None:
+            self.add_sync_data(
+                response_data, project, platform, since, watermark,
+                first_page=page_obj.number == 1)
+        return Response(response_data)
+
+    def add_sync_data(self, response_data, project, platform, since, watermark, first_page):
+        """Add the next watermark and, on the first page, deletion tombstones."""
+        response_data['watermark'] = ProjectStringSyncService.format_watermark(watermark)
+        if first_page:
+            response_data['deleted'] = [
+                ProjectStringSyncService.tombstone_record(tombstone)
+                for tombstone in ProjectStringSyncService.deleted_strings(
+                    project, platform, since
+                ).values('string_id', 'string_uuid', 'deleted_at')
+            ]
+
+    def get_keyset_page(self, request, queryset, page_size):
+        """Return one keyset page; the cursor is opaque to clients."""
+        page_size = max(1, min(page_size, StandardResultsSetPagination.max_page_size))
+        try:
+            rows, next_cursor = paginate_keyset(
+                queryset, self.keyset_ordering, request.query_params.get('cursor'), page_size)
+        except InvalidCursor:
+            return Response(
+                {'error': 'Invalid cursor'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        response_data = {
+            'next': next_cursor,
+            'previous': None,
+            'results': ProjectStringReadSerializer(rows, many=True).data
+        }
+        if request.query_params.get('estimate_count', '').lower() in ('1', 'true'):
+            response_data['count'], response_data['count_is_estimate'] = estimate_count(queryset)
+        return Response(response_data)
+
+
+class ProjectStringTreeView(WorkspaceValidationMixin, views.APIView):
+    """
+    Full string hierarchy of a platform within a project.
+
+    Loads all strings with one query and streams them as a nested tree, so
+    the grid can open a project with one request instead of one
+    parent_uuid listing per expanded node.
+
+    Endpoint: GET /workspaces/{workspace_id}/projects/{project_id}/platforms/{platform_id}/strings/tree
+
+    Query Parameters:
+    - max_level: Only load strings up to this entity level; child_count of
+      the last level still counts the children that were not loaded
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, workspace_id, project_id, platform_id, version=None):
+        """Stream the project string tree."""
+        # Validate workspace access
+        workspace = get_object_or_404(Workspace, id=workspace_id)
+        if not request.user.has_workspace_access(workspace_id):
+            return Response(
+                {'error': 'Access denied to this workspace'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        # Validate project exists and belongs to workspace
+        project = get_object_or_404(Project, id=project_id, workspace=workspace)
+
+        # Validate platform exists
+        platform = get_object_or_404(Platform, id=platform_id)
+
+        max_level = request.query_params.get('max_level')
+        if max_level is not None:
+            try:
+                max_level = int(max_level)
+            except ValueError:
+                return Response(
+                    {'error': 'max_level must be an integer'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        tree = ProjectStringTreeService.load(project, platform, max_level=max_level)
+        header = {
+            'project': {'id': project.id, 'name': project.name},
+            'platform': {'id': platform.id, 'name': platform.name},
+            'max_level': max_level,
+        }
+        return StreamingHttpResponse(
+            ProjectStringTreeService.stream_json(tree, header),
+            content_type='application/json'
+        )
+
+
+class ProjectStringSearchView(WorkspaceValidationMixin, views.APIView):
+    """
+    Ranked search over the string values of a platform within a project.
+
+    Served by pg_trgm GIN indexes on PostgreSQL and by an in-process n-gram
+    index elsewhere; matches are ranked by trigram similarity.
+
+    Endpoint: GET /workspaces/{workspace_id}/projects/{project_id}/platforms/{platform_id}/strings/search
+
+    Query Parameters:
+    - q: Search text (required)
+    - mode: substring (values containing q) or similar (fuzzy match) (default: substring)
+    - limit: Number of matches (default: 20, max: 200)
+    - entity: Filter by entity ID
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, workspace_id, project_id, platform_id, version=None):
+        """Return the top matches for a search."""
+        # Validate workspace access
+        workspace = get_object_or_404(Workspace, id=workspace_id)
+        if not request.user.has_workspace_access(workspace_id):
+            return Response(
+                {'error': 'Access denied to this workspace'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        # Validate project exists and belongs to workspace
+        project = get_object_or_404(Project, id=project_id, workspace=workspace)
+
+        # Validate platform exists
+        platform = get_object_or_404(Platform, id=platform_id)
+
+        query = request.query_params.get('q', '').strip()
+        mode = request.query_params.get('mode', 'substring')
+        if not query:
+            return Response(
+                {'error': 'q is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if mode not in SEARCH_MODES:
+            return Response(
+                {'error': f"Invalid mode. Supported modes: {', '.join(SEARCH_MODES)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            limit = int(request.query_params.get('limit', STRING_SEARCH_DEFAULT_LIMIT))
+            filters = {}
+            if request.query_params.get('entity'):
+                filters['entity_id'] = int(request.query_params['entity'])
+        except ValueError:
+            return Response(
+                {'error': 'limit and entity must be integers'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        limit = max(1, min(limit, STRING_SEARCH_MAX_LIMIT))
+
+        matches = StringSearchService.search(
+            ProjectString, workspace.id, query, mode=mode, limit=limit,
+            project_id=project.id, platform_id=platform.id, **filters
+        )
+        return Response({
+            'query': query,
+            'mode': mode,
+            'results': [
+                {'id': match.id, 'value': match.value, 'score': round(match.score, 4)}
+                for match in matches
+            ]
         })
 
 
@@ -438,17 +688,27 @@ class BulkUpdateProjectStringsView(WorkspaceValidationMixin, views.APIView):
     """
     Bulk update multiple project strings.
 
+    All targeted strings and their details are loaded and validated as one
+    set and written with bulk_update / bulk_create, so the number of queries
+    does not grow with the number of updates.
+
     Endpoint: PUT /workspaces/{workspace_id}/projects/{project_id}/platforms/{platform_id}/strings/bulk-update
 
-    Request body: List of string updates
+    Request body: {"updates": [{"id": 1, "value": "...", "details": [...]}, ...]}
+    value and details are optional; details replaces the string's details.
+
+    Response: updated_strings holds {id, value, last_updated} per updated
+    string; errors holds {index, string_id, errors} per rejected update.
+
+    Query Parameters:
+    - async: true queues the request as a bulk job and answers 202 with its
+      job_id; false forces inline processing. By default requests with more
+      than BULK_JOB_AUTO_ASYNC_ROWS updates are queued.
     """
     permission_classes = [IsAuthenticated]
 
     def put(self, request, workspace_id, project_id, platform_id, version=None):
         """Bulk update project strings."""
-        from django.db import transaction
-        from ..serializers import ProjectStringUpdateSerializer
-
         # Validate workspace access
         workspace = get_object_or_404(Workspace, id=workspace_id)
         if not request.user.has_workspace_access(workspace_id):
@@ -478,52 +738,21 @@ class BulkUpdateProjectStringsView(WorkspaceValidationMixin, views.APIView):
                 {'error': 'No updates provided'},
                 status=status.HTTP_400_BAD_REQUEST
             )
+        if not isinstance(updates, list) or not all(isinstance(row, dict) for row in updates):
+            return Response(
+                {'error': 'updates must be a list of objects'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if BulkJobService.wants_async(request.query_params, len(updates)):
+            job = BulkJobService.enqueue(
+                workspace.id, BulkStringJobOperationChoices.PROJECT_STRINGS_UPDATE,
+                {'updates': updates}, len(updates),
+                user=request.user, project=project, platform=platform)
+            return queued_job_response(request, job)
 
-        updated_strings = []
-        errors = []
-
-        with transaction.atomic():
-            for update_data in updates:
-                string_id = update_data.get('id')
-
-                if not string_id:
-                    errors.append({'error': 'Missing string ID', 'data': update_data})
-                    continue
-
-                try:
-                    # Get string
-                    project_string = ProjectString.objects.get(
-                        id=string_id,
-                        project=project,
-                        platform=platform
-                    )
-
-                    # Update string
-                    serializer = ProjectStringUpdateSerializer(
-                        project_string,
-                        data=update_data,
-                        partial=True
-                    )
-
-                    if serializer.is_valid():
-                        updated_string = serializer.save()
-                        updated_strings.append(updated_string)
-                    else:
-                        errors.append({
-                            'string_id': string_id,
-                            'errors': serializer.errors
-                        })
-
-                except ProjectString.DoesNotExist:
-                    errors.append({
-                        'string_id': string_id,
-                        'error': 'String not found'
-                    })
-                except Exception as e:
-                    errors.append({
-                        'string_id': string_id,
-                        'error': str(e)
-                    })
+        result = ProjectString.objects.bulk_edit(
+            project, platform, updates, updated_by=request.user)
 
         # Create activity
         from ..models import ProjectActivity
@@ -531,20 +760,19 @@ class BulkUpdateProjectStringsView(WorkspaceValidationMixin, views.APIView):
             project=project,
             user=request.user,
             type='strings_generated',
-            description=f"bulk updated {len(updated_strings)} strings for {platform.name}",
+            description=f"bulk updated {result.updated_count} strings for {platform.name}",
             metadata={
                 'platform_id': platform.id,
-                'updated_count': len(updated_strings),
-                'error_count': len(errors)
+                'updated_count': result.updated_count,
+                'error_count': result.error_count
             }
         )
 
-        from ..serializers import ProjectStringReadSerializer
         return Response({
-            'updated_count': len(updated_strings),
-            'error_count': len(errors),
-            'updated_strings': ProjectStringReadSerializer(updated_strings, many=True).data,
-            'errors': errors
+            'updated_count': result.updated_count,
+            'error_count': result.error_count,
+            'updated_strings': result.updated,
+            'errors': result.errors
         })
 
     def can_update_strings(self, user, project):
@@ -564,13 +792,27 @@ class ExportProjectStringsView(WorkspaceValidationMixin, views.APIView):
     """
     Export project strings in various formats.
 
+    The export is streamed: strings are read in chunks through a values()
+    projection and written to the response as they are encoded, so memory
+    use does not grow with the size of the project.
+
     Endpoint: GET /workspaces/{workspace_id}/projects/{project_id}/platforms/{platform_id}/strings/export
 
     Query Parameters:
-    - format: csv, json (default: csv)
+    - format: csv, ndjson, json (default: csv)
+    - details: include dimension values; one column per dimension in CSV
+      (default: false for csv, true for ndjson/json)
+    - compress: gzip the output (default: false)
+    - since: Sync watermark (ISO 8601); export only strings changed after
+      it, followed by tombstones of strings deleted after it. The next
+      watermark is returned in the X-Sync-Watermark header (and in JSON).
     """
     permission_classes = [IsAuthenticated]
 
+    def perform_content_negotiation(self, request, force=False):
+        # 'format' selects the export format here, not a DRF renderer
+        return super().perform_content_negotiation(request, force=True)
+
     def get(self, request, workspace_id, project_id, platform_id, version=None):
         """Export project strings."""
         # Validate workspace access
@@ -587,84 +829,36 @@ class ExportProjectStringsView(WorkspaceValidationMixin, views.APIView):
         # Validate platform exists
         platform = get_object_or_404(Platform, id=platform_id)
 
-        # Get strings
-        strings = ProjectString.objects.filter(
-            project=project,
-            platform=platform
-        ).select_related(
-            'project', 'platform', 'entity', 'rule', 'created_by'
-        ).prefetch_related('details__dimension', 'details__dimension_value')
-
         # Get export format
         export_format = request.query_params.get('format', 'csv').lower()
-
-        if export_format == 'csv':
-            return self.export_csv(project, platform, strings)
-        elif export_format == 'json':
-            return self.export_json(project, platform, strings)
-        else:
+        if export_format not in EXPORT_FORMATS:
             return Response(
-                {'error': 'Invalid format. Supported formats: csv, json'},
+                {'error': f"Invalid format. Supported formats: {', '.join(EXPORT_FORMATS)}"},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-    def export_csv(self, project, platform, strings):
-        """Export strings as CSV."""
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = f'attachment; filename="project_{project.id}_platform_{platform.id}_strings.csv"'
-
-        writer = csv.writer(response)
-
-        # Write header
-        writer.writerow([
-            'String ID', 'UUID', 'Project', 'Platform', 'Entity', 'Entity Level',
-            'Value', 'Parent UUID', 'Rule', 'Created By', 'Created', 'Last Updated'
-        ])
-
-        # Write data
-        for string in strings:
-            writer.writerow([
-                string.id,
-                str(string.string_uuid),
-                string.project.name,
-                string.platform.name,
-                string.entity.name,
-                string.entity.entity_level,
-                string.value,
-                str(string.parent_uuid) if string.parent_uuid else '',
-                string.rule.name,
-                string.created_by.get_full_name() if string.created_by else '',
-                string.created.isoformat(),
-                string.last_updated.isoformat()
-            ])
-
-        return response
-
-    def export_json(self, project, platform, strings):
-        """Export strings as JSON."""
-        from ..serializers import ProjectStringReadSerializer
-
-        serializer = ProjectStringReadSerializer(strings, many=True)
-
-        export_data = {
-            'project': {
-                'id': project.id,
-                'name': project.name,
-                'slug': project.slug
-            },
-            'platform': {
-                'id': platform.id,
-                'name': platform.name
-            },
-            'exported_at': timezone.now().isoformat(),
-            'count': strings.count(),
-            'strings': serializer.data
-        }
-
-        response = HttpResponse(
-            json.dumps(export_data, indent=2),
-            content_type='application/json'
+        include_details = parse_export_flag(
+            request.query_params.get('details'), default=export_format != 'csv')
+        compress = parse_export_flag(request.query_params.get('compress'), default=False)
+
+        since, error_response = parse_sync_watermark(request)
+        if error_response:
+            return error_response
+        watermark = ProjectStringSyncService.new_watermark()
+
+        filename = f"project_{project.id}_platform_{platform.id}_strings.{export_format}"
+        content_type = EXPORT_CONTENT_TYPES[export_format]
+        if compress:
+            filename += '.gz'
+            content_type = 'application/gzip'
+
+        response = StreamingHttpResponse(
+            ProjectStringExportService.stream(
+                project, platform, export_format,
+                include_details=include_details, compress=compress,
+                since=since, watermark=watermark),
+            content_type=content_type
         )
-        response['Content-Disposition'] = f'attachment; filename="project_{project.id}_platform_{platform.id}_strings.json"'
-
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        response['X-Sync-Watermark'] = ProjectStringSyncService.format_watermark(watermark)
         return response
@@ -15,11 +15,14 @@ from ..models import (
     Project, ProjectMember,
     ProjectActivity, ApprovalHistory, Workspace
 )
+from ..pagination import KeysetPagination
 from ..serializers import (
     ProjectListSerializer, ProjectDetailSerializer,
     ProjectCreateSerializer, ProjectUpdateSerializer,
-    SubmitForApprovalSerializer, ApproveSerializer, RejectSerializer
+    SubmitForApprovalSerializer, ApproveSerializer, RejectSerializer,
+    ProjectActivitySerializer, ProjectStringReadSerializer
 )
+from ..services.constants import PROJECT_SECTION_PAGE_SIZE
 from .mixins import WorkspaceValidationMixin
 
 
@@ -37,6 +40,8 @@ class ProjectViewSet(WorkspaceValidationMixin, viewsets.ModelViewSet):
     - Submit for approval (POST /workspaces/{workspace_id}/projects/{id}/submit-for-approval/)
     - Approve project (POST /workspaces/{workspace_id}/projects/{id}/approve/)
     - Reject project (POST /workspaces/{workspace_id}/projects/{id}/reject/)
+    - List project strings (GET /workspaces/{workspace_id}/projects/{id}/strings/)
+    - List project activities (GET /workspaces/{workspace_id}/projects/{id}/activities/)
     """
 
     permission_classes = [IsAuthenticated]
@@ -59,12 +64,11 @@ class ProjectViewSet(WorkspaceValidationMixin, viewsets.ModelViewSet):
                 Q(name__icontains=search) | Q(description__icontains=search)
             )
 
-        # Prefetch related data for better performance
-        queryset = queryset.select_related('workspace', 'owner').prefetch_related(
+        # Stats come from the ProjectStats join; strings and activities are
+        # loaded by the detail serializer only
+        queryset = queryset.select_related('workspace', 'owner', 'stats').prefetch_related(
             'platforms',
             'team_members__user',
-            'activities',
-            'strings'
         )
 
         return queryset
@@ -122,7 +126,11 @@ class ProjectViewSet(WorkspaceValidationMixin, viewsets.ModelViewSet):
     @extend_schema(
         tags=['Projects'],
         summary='Get Project Detail',
-        description='Get detailed information about a specific project including strings, activities, and approval history.',
+        description=(
+            'Get detailed information about a specific project. Strings and activities are '
+            'returned as section summaries (count and sub-resource URL); use include to embed '
+            'their first rows and fields to select the returned fields.'
+        ),
         parameters=[
             OpenApiParameter(
                 name='workspace_id',
@@ -138,6 +146,20 @@ class ProjectViewSet(WorkspaceValidationMixin, viewsets.ModelViewSet):
                 description='Project ID',
                 required=True
             ),
+            OpenApiParameter(
+                name='include',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Comma-separated sections to embed the first rows of (strings, activities)',
+                required=False
+            ),
+            OpenApiParameter(
+                name='fields',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Comma-separated fields to return (id is always returned)',
+                required=False
+            ),
         ]
     )
     def retrieve(self, request, *args, **kwargs):
@@ -528,6 +550,96 @@ class ProjectViewSet(WorkspaceValidationMixin, viewsets.ModelViewSet):
             'rejection_reason': project.rejection_reason
         })
 
+    @extend_schema(
+        tags=['Projects'],
+        summary='List Project Strings',
+        description='Keyset-paginated strings of a project, ordered by platform, entity level and value.',
+        parameters=[
+            OpenApiParameter(
+                name='workspace_id',
+                type=int,
+                location=OpenApiParameter.PATH,
+                description='Workspace ID',
+                required=True
+            ),
+            OpenApiParameter(
+                name='id',
+                type=int,
+                location=OpenApiParameter.PATH,
+                description='Project ID',
+                required=True
+            ),
+            OpenApiParameter(
+                name='platform',
+                type=int,
+                location=OpenApiParameter.QUERY,
+                description='Filter by platform ID',
+                required=False
+            ),
+            OpenApiParameter(
+                name='cursor',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Cursor of the next page (next_cursor of the previous page)',
+                required=False
+            ),
+        ]
+    )
+    @action(detail=True, methods=['get'])
+    def strings(self, request, workspace_id=None, id=None, version=None):
+        """List the strings of a project, one keyset page at a time."""
+        project = self.get_object()
+        queryset = ProjectDetailSerializer.strings_queryset(project)
+
+        platform_id = request.query_params.get('platform')
+        if platform_id:
+            queryset = queryset.filter(platform_id=platform_id)
+
+        paginator = KeysetPagination(
+            ProjectDetailSerializer.STRINGS_ORDERING, page_size=PROJECT_SECTION_PAGE_SIZE)
+        rows = paginator.paginate_queryset(queryset, request)
+        return paginator.get_paginated_response(
+            ProjectStringReadSerializer(rows, many=True).data)
+
+    @extend_schema(
+        tags=['Projects'],
+        summary='List Project Activities',
+        description='Keyset-paginated activities of a project, newest first.',
+        parameters=[
+            OpenApiParameter(
+                name='workspace_id',
+                type=int,
+                location=OpenApiParameter.PATH,
+                description='Workspace ID',
+                required=True
+            ),
+            OpenApiParameter(
+                name='id',
+                type=int,
+                location=OpenApiParameter.PATH,
+                description='Project ID',
+                required=True
+            ),
+            OpenApiParameter(
+                name='cursor',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Cursor of the next page (next_cursor of the previous page)',
+                required=False
+            ),
+        ]
+    )
+    @action(detail=True, methods=['get'])
+    def activities(self, request, workspace_id=None, id=None, version=None):
+        """List the activities of a project, one keyset page at a time."""
+        project = self.get_object()
+        paginator = KeysetPagination(
+            ProjectDetailSerializer.ACTIVITIES_ORDERING, page_size=PROJECT_SECTION_PAGE_SIZE)
+        rows = paginator.paginate_queryset(
+            ProjectDetailSerializer.activities_queryset(project), request)
+        return paginator.get_paginated_response(
+            ProjectActivitySerializer(rows, many=True).data)
+
     def can_submit_for_approval(self, project):
         """Check if user can submit project for approval."""
         user = self.request.user
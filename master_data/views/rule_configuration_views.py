@@ -2,25 +2,28 @@ import time
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status, permissions
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from rest_framework.renderers import JSONRenderer
 from django.utils import timezone
-from django.core.cache import cache
 from django.core.exceptions import PermissionDenied
-from django.http import Http404
+from django.http import Http404, HttpResponse, HttpResponseNotModified
 from django.conf import settings
 import logging
 
 from drf_spectacular.openapi import AutoSchema
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample
 
-from ..models import Rule
+from ..models import Entity, Rule
 from ..services import (
     DimensionCatalogService,
     InheritanceMatrixService,
     EntityTemplateService,
-    RuleService
+    RuleService,
+    StringGenerationService,
+    NamingConventionError,
+    get_name_parser,
 )
+from ..services.rule_cache_warmer import RuleCacheWarmer
+from ..services.rule_response_cache import RuleResponseCache
 from ..serializers import (
     LightweightRuleSerializer,
     EntitySpecificDataSerializer,
@@ -28,6 +31,8 @@ from ..serializers import (
     ValidationSummarySerializer,
     PerformanceMetricsSerializer,
     GenerationPreviewRequestSerializer,
+    BatchGenerationRequestSerializer,
+    NameParseRequestSerializer,
     CacheInvalidationRequestSerializer,
     CompleteRuleSerializer,
     RuleConfigurationSerializer
@@ -79,7 +84,40 @@ class WorkspaceScopedRuleViewMixin:
         return rule, workspace_id
 
 
-class LightweightRuleView(APIView, WorkspaceScopedRuleViewMixin):
+class CachedRuleResponseMixin:
+    """
+    Serve a rule endpoint from the pre-rendered response cache.
+
+    Bodies are cached per (cache_endpoint, rule, rule generation, API
+    version) and sent with a strong ETag; a matching If-None-Match gets a
+    304 without a body. Call cached_rule_response() after the access
+    checks: build() runs only on a cache miss, and only 200 responses are
+    cached. A response built from a stale payload (marked with
+    response.stale) is sent as is, without caching or an ETag.
+    """
+    cache_endpoint = None
+
+    def cached_rule_response(self, request, rule_id, build):
+        key = RuleResponseCache.key(self.cache_endpoint, rule_id, request.version)
+        entry = RuleResponseCache.get(key)
+        if entry is None:
+            response = build()
+            if response.status_code != status.HTTP_200_OK or getattr(response, 'stale', False):
+                return response
+            entry = RuleResponseCache.store(
+                key, JSONRenderer().render(response.data), 'application/json')
+
+        if RuleResponseCache.is_not_modified(entry, request.headers.get('If-None-Match')):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(entry.content, content_type=entry.content_type)
+        response['ETag'] = entry.etag
+        # Clients keep the body but must revalidate it on every use
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+
+
+class LightweightRuleView(CachedRuleResponseMixin, APIView, WorkspaceScopedRuleViewMixin):
     """
     Lightweight endpoint for rule list views and basic operations.
     
@@ -87,13 +125,12 @@ class LightweightRuleView(APIView, WorkspaceScopedRuleViewMixin):
     """
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = LightweightRuleSerializer
+    cache_endpoint = 'lightweight'
 
     def __init__(self):
         super().__init__()
         self.rule_service = RuleService()
 
-    # 15 minutes cache for lightweight data
-    @method_decorator(cache_page(15 * 60))
     @extend_schema(tags=["Rule Configuration"])
     def get(self, request, workspace_id, rule_id, version=None):
         """Get lightweight rule data"""
@@ -104,22 +141,8 @@ class LightweightRuleView(APIView, WorkspaceScopedRuleViewMixin):
             rule, workspace_id = self.validate_workspace_and_rule(
                 request, rule_id, workspace_id
             )
-
-            lightweight_data = self.rule_service.get_lightweight_rule_data(
-                rule_id)
-
-            # Add minimal performance metrics
-            lightweight_data['performance_metrics'] = {
-                'generation_time_ms': (time.time() - start_time) * 1000,
-                'cached': True,
-                'workspace': workspace_id
-            }
-
-            serializer = LightweightRuleSerializer(data=lightweight_data)
-            if serializer.is_valid():
-                return Response(serializer.validated_data)
-            else:
-                return Response({'error': 'Serialization error', 'details': serializer.errors}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            return self.cached_rule_response(
+                request, rule_id, lambda: self.build_response(rule, workspace_id, start_time))
 
         except PermissionDenied as e:
             return Response({'error': str(e)}, status=status.HTTP_403_FORBIDDEN)
@@ -151,6 +174,23 @@ class LightweightRuleView(APIView, WorkspaceScopedRuleViewMixin):
             )
             return Response({'error': 'Failed to retrieve rule data. Please try again or contact support.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    def build_response(self, rule, workspace_id, start_time):
+        """Render the lightweight data of a rule (on a response cache miss)."""
+        lightweight_data = self.rule_service.get_lightweight_rule_data(rule)
+
+        # Add minimal performance metrics
+        lightweight_data['performance_metrics'] = {
+            'generation_time_ms': (time.time() - start_time) * 1000,
+            'cached': True,
+            'workspace': workspace_id
+        }
+
+        serializer = LightweightRuleSerializer(data=lightweight_data)
+        if serializer.is_valid():
+            return Response(serializer.validated_data)
+        else:
+            return Response({'error': 'Serialization error', 'details': serializer.errors}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
 
 class EntitySpecificRuleView(APIView, WorkspaceScopedRuleViewMixin):
     """
@@ -376,6 +416,143 @@ class GenerationPreviewView(APIView, WorkspaceScopedRuleViewMixin):
             return Response({'error': 'Failed to generate preview. Please try again or contact support.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+class BatchGenerationView(APIView, WorkspaceScopedRuleViewMixin):
+    """
+    Endpoint for generating many string values in one request.
+
+    URL: /api/v1/workspaces/{workspace_id}/rules/generation-batch/
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    @extend_schema(tags=["Rule Configuration"], request=BatchGenerationRequestSerializer)
+    def post(self, request, workspace_id, version=None):
+        """Generate string values for many rows against a single rule snapshot"""
+        start_time = time.time()
+
+        request_serializer = BatchGenerationRequestSerializer(data=request.data)
+        if not request_serializer.is_valid():
+            return Response(request_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        rule_id = request_serializer.validated_data['rule_id']
+        entity_id = request_serializer.validated_data['entity_id']
+        rows = request_serializer.validated_data['rows']
+        validate_values = request_serializer.validated_data['validate_values']
+
+        try:
+            rule, workspace_id = self.validate_workspace_and_rule(
+                request, rule_id, workspace_id
+            )
+
+            try:
+                entity = Entity.objects.get(id=entity_id, platform_id=rule.platform_id)
+            except Entity.DoesNotExist:
+                return Response({'error': f'Entity {entity_id} not found for this rule'}, status=status.HTTP_404_NOT_FOUND)
+
+            result = StringGenerationService.generate_many(
+                rule, entity, rows, validate_values=validate_values)
+
+            result['performance_metrics'] = {
+                'generation_time_ms': (time.time() - start_time) * 1000,
+                'workspace': workspace_id
+            }
+            return Response(result)
+
+        except PermissionDenied as e:
+            return Response({'error': str(e)}, status=status.HTTP_403_FORBIDDEN)
+        except Http404 as e:
+            return Response({'error': str(e)}, status=status.HTTP_404_NOT_FOUND)
+        except NamingConventionError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            # SECURITY: Log detailed error but return generic message
+            logger.error(
+                f"Error in {self.__class__.__name__}: {str(e)}",
+                exc_info=True,
+                extra={
+                    'user_id': request.user.id if request.user.is_authenticated else None,
+                    'workspace_id': workspace_id,
+                    'rule_id': rule_id,
+                    'entity_id': entity_id
+                }
+            )
+            return Response({'error': 'Failed to generate strings. Please try again or contact support.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class NameParseView(APIView, WorkspaceScopedRuleViewMixin):
+    """
+    Endpoint for decomposing existing names back into dimension values.
+
+    URL: /api/v1/workspaces/{workspace_id}/rules/name-parse/
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    @extend_schema(tags=["Rule Configuration"], request=NameParseRequestSerializer)
+    def post(self, request, workspace_id, version=None):
+        """Parse names into dimension values with confidence and ambiguity"""
+        start_time = time.time()
+
+        request_serializer = NameParseRequestSerializer(data=request.data)
+        if not request_serializer.is_valid():
+            return Response(request_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        rule_id = request_serializer.validated_data['rule_id']
+        entity_id = request_serializer.validated_data['entity_id']
+        names = request_serializer.validated_data['names']
+
+        try:
+            rule, workspace_id = self.validate_workspace_and_rule(
+                request, rule_id, workspace_id
+            )
+
+            try:
+                entity = Entity.objects.get(id=entity_id, platform_id=rule.platform_id)
+            except Entity.DoesNotExist:
+                return Response({'error': f'Entity {entity_id} not found for this rule'}, status=status.HTTP_404_NOT_FOUND)
+
+            parser = get_name_parser(rule, entity)
+            results = []
+            ambiguous_count = 0
+            error_count = 0
+            for result in parser.parse_many(names):
+                if not result.is_valid:
+                    error_count += 1
+                elif result.ambiguous:
+                    ambiguous_count += 1
+                results.append(result.as_dict())
+
+            return Response({
+                'results': results,
+                'total_count': len(results),
+                'success_count': len(results) - error_count,
+                'ambiguous_count': ambiguous_count,
+                'error_count': error_count,
+                'performance_metrics': {
+                    'parse_time_ms': (time.time() - start_time) * 1000,
+                    'workspace': workspace_id
+                }
+            })
+
+        except PermissionDenied as e:
+            return Response({'error': str(e)}, status=status.HTTP_403_FORBIDDEN)
+        except Http404 as e:
+            return Response({'error': str(e)}, status=status.HTTP_404_NOT_FOUND)
+        except NamingConventionError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            # SECURITY: Log detailed error but return generic message
+            logger.error(
+                f"Error in {self.__class__.__name__}: {str(e)}",
+                exc_info=True,
+                extra={
+                    'user_id': request.user.id if request.user.is_authenticated else None,
+                    'workspace_id': workspace_id,
+                    'rule_id': rule_id,
+                    'entity_id': entity_id
+                }
+            )
+            return Response({'error': 'Failed to parse names. Please try again or contact support.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
 class CacheManagementView(APIView, WorkspaceScopedRuleViewMixin):
     """
     Endpoint for cache management operations.
@@ -481,14 +658,18 @@ class CacheManagementView(APIView, WorkspaceScopedRuleViewMixin):
             return Response({'error': 'Failed to retrieve metrics. Please try again or contact support.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class RuleConfigurationView(APIView, WorkspaceScopedRuleViewMixin):
+class RuleConfigurationView(CachedRuleResponseMixin, APIView, WorkspaceScopedRuleViewMixin):
     """
     Complete rule configuration endpoint with all data.
     
     URL: /api/v1/workspaces/{workspace_id}/rules/{rule_id}/configuration/
+
+    Responses carry an ETag; send it back in If-None-Match to get a 304
+    while the rule is unchanged.
     """
     permission_classes = [IsAuthenticatedOrDebugReadOnly]
     serializer_class = RuleConfigurationSerializer
+    cache_endpoint = 'configuration'
 
     def __init__(self):
         super().__init__()
@@ -612,7 +793,6 @@ class RuleConfigurationView(APIView, WorkspaceScopedRuleViewMixin):
         ],
         tags=["Rules"]
     )
-    @method_decorator(cache_page(15 * 60))  # 15 minutes cache
     def get(self, request, workspace_id, rule_id, version=None):
         """Get complete rule configuration data"""
         start_time = time.time()
@@ -622,33 +802,10 @@ class RuleConfigurationView(APIView, WorkspaceScopedRuleViewMixin):
             rule, workspace_id = self.validate_workspace_and_rule(
                 request, rule_id, workspace_id
             )
-
-            # Get configuration data from service
-            configuration_data = self.rule_service.get_rule_configuration_data(
-                rule_id)
-
-            # Add performance metrics
-            configuration_data['performance_metrics'] = {
-                'generation_time_ms': round((time.time() - start_time) * 1000, 2),
-                'cached': True,
-                'workspace': workspace_id
-            }
-
-            # Validate and serialize response
-            serializer = RuleConfigurationSerializer(data=configuration_data)
-            if not serializer.is_valid():
-                logger.error(
-                    f"RuleConfigurationSerializer validation failed for rule {rule_id}: {serializer.errors}")
-
-                # Clear cache if there's a serialization error
-                self.rule_service.clear_rule_configuration_cache(rule_id)
-
-                return Response(
-                    {'error': 'Serialization error', 'details': serializer.errors},
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
-                )
-
-            return Response(serializer.validated_data)
+            # Ranks the rule for cache warming at startup
+            RuleCacheWarmer.record_access(workspace_id, rule_id)
+            return self.cached_rule_response(
+                request, rule_id, lambda: self.build_response(rule_id, workspace_id, start_time))
 
         except PermissionDenied as e:
             return Response({'error': str(e)}, status=status.HTTP_403_FORBIDDEN)
@@ -690,6 +847,27 @@ class RuleConfigurationView(APIView, WorkspaceScopedRuleViewMixin):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    def build_response(self, rule_id, workspace_id, start_time):
+        """Render the configuration of a rule (on a response cache miss)."""
+        # Get validated configuration data from service
+        lookup, serializer = self.rule_service.serialize_rule_configuration(
+            rule_id, workspace_id, start_time)
+        if serializer.errors:
+            logger.error(
+                f"RuleConfigurationSerializer validation failed for rule {rule_id}: {serializer.errors}")
+
+            # Clear cache if there's a serialization error
+            self.rule_service.clear_rule_configuration_cache(rule_id)
+
+            return Response(
+                {'error': 'Serialization error', 'details': serializer.errors},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        response = Response(serializer.validated_data)
+        # Served while another worker rebuilds it: not cached as current
+        response.stale = lookup.stale
+        return response
 
     def force_clear_cache(self, rule_id: int):
         """Force clear cache for testing purposes"""
@@ -58,6 +58,8 @@ class StringDetailViewSet(WorkspaceValidationMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticatedOrDebugReadOnly]
     filter_backends = [DjangoFilterBackend]
     filterset_class = StringDetailWorkspaceFilter
+    # Row order in cursor pagination mode
+    keyset_ordering = ('id',)
 
     def get_queryset(self):
         """Get workspace-filtered string details with optimized prefetch."""
@@ -247,6 +249,8 @@ class StringDetailNestedViewSet(WorkspaceValidationMixin, viewsets.ModelViewSet)
     permission_classes = [IsAuthenticatedOrDebugReadOnly]
     filter_backends = [DjangoFilterBackend]
     filterset_class = StringDetailWorkspaceFilter
+    # Row order in cursor pagination mode
+    keyset_ordering = ('id',)
 
     def get_serializer_class(self):
         """Use different serializers for read and write operations."""
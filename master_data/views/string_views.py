@@ -57,6 +57,8 @@ class StringViewSet(WorkspaceValidationMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticatedOrDebugReadOnly]
     filter_backends = [DjangoFilterBackend]
     filterset_class = StringWorkspaceFilter
+    # Row order in cursor pagination mode
+    keyset_ordering = ('id',)
     http_method_names = ['get', 'post', 'delete',
                          'head', 'options']  # No PUT/PATCH
 